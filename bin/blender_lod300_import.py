@@ -15,21 +15,32 @@ Flow:
 6. Mark objects as "placed": true
 7. Verify hash total
 
+Objects of the same object_type share one mesh datablock (linked duplicates);
+pass --unique-meshes for one mesh per placed object.
+
 No AI - pure geometry processing
 """
 
 import bpy
-import json
 import sys
 import os
 import math
-import numpy as np
 from mathutils import Vector, Euler
 from datetime import datetime
 
 # Add core directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'core'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'blender'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'tools'))
 from database_geometry_fetcher import DatabaseGeometryFetcher
+from final_json_stream import dump_final_json, read_final_json
+from library_gate import check_object_types
+from geometry_generators import OrientedBoxGenerator
+from mesh_builder import BlenderMeshBackend, build_mesh
+from mesh_instancing import MeshInstanceCache
+
+# Bulk mesh writer (foreach_set from NumPy buffers)
+MESH_BACKEND = BlenderMeshBackend(bpy)
 
 
 def clear_scene():
@@ -51,96 +62,14 @@ def create_mesh_from_geometry(name, geometry_data, base_rotation=(0.0, 0.0, 0.0)
     Returns:
         bpy.types.Mesh object
     """
-    vertices = geometry_data['vertices'].copy()  # CRITICAL: Copy to avoid modifying shared geometry
-    faces = geometry_data['faces']
-
-    # Apply base rotation to vertices (if needed)
+    # Base rotation is applied to a copy inside the builder - shared geometry untouched
     base_x, base_y, base_z = base_rotation
     if base_x != 0.0 or base_y != 0.0 or base_z != 0.0:
         print(f"      [DEBUG] Applying vertex rotation: ({math.degrees(base_x):.0f}°, {math.degrees(base_y):.0f}°, {math.degrees(base_z):.0f}°)")
-        # Convert vertices to numpy for matrix multiplication
-        verts_array = np.array(vertices)
-        print(f"      [DEBUG] Pre-rotation vertex count: {len(vertices)}")
-
-        # Build rotation matrices
-        # X-axis rotation
-        if base_x != 0.0:
-            cos_x, sin_x = math.cos(base_x), math.sin(base_x)
-            rot_x = np.array([
-                [1, 0, 0],
-                [0, cos_x, -sin_x],
-                [0, sin_x, cos_x]
-            ])
-            verts_array = verts_array @ rot_x.T
-
-        # Y-axis rotation
-        if base_y != 0.0:
-            cos_y, sin_y = math.cos(base_y), math.sin(base_y)
-            rot_y = np.array([
-                [cos_y, 0, sin_y],
-                [0, 1, 0],
-                [-sin_y, 0, cos_y]
-            ])
-            verts_array = verts_array @ rot_y.T
-
-        # Z-axis rotation
-        if base_z != 0.0:
-            cos_z, sin_z = math.cos(base_z), math.sin(base_z)
-            rot_z = np.array([
-                [cos_z, -sin_z, 0],
-                [sin_z, cos_z, 0],
-                [0, 0, 1]
-            ])
-            verts_array = verts_array @ rot_z.T
-
-        vertices = verts_array.tolist()
-        print(f"      [DEBUG] Post-rotation vertex count: {len(vertices)}")
-        print(f"      [DEBUG] First rotated vertex: {vertices[0]}")
-
-    # Create mesh
-    mesh = bpy.data.meshes.new(name=f"{name}_mesh")
-
-    # Vertices as list of tuples
-    verts = [tuple(v) for v in vertices]
-
-    # DEBUG: Confirm vertices being passed to Blender
-    if len(verts) < 100 and 'toilet_paper' in name:
-        print(f"      [DEBUG] Passing {len(verts)} vertices to from_pydata, first={verts[0]}")
-
-    # Faces as list of tuples
-    face_indices = [tuple(f) for f in faces]
-
-    # Create mesh from vertices and faces
-    mesh.from_pydata(verts, [], face_indices)
-
-    # DEBUG: Check what Blender actually stored
-    if len(verts) < 100 and 'toilet_paper' in name:
-        actual_verts = [v.co for v in mesh.vertices]
-        print(f"      [DEBUG] After from_pydata, Blender mesh has {len(actual_verts)} vertices")
-        print(f"      [DEBUG] First vertex in Blender mesh: {tuple(actual_verts[0])}")
-
-    # Calculate normals if not provided
-    if geometry_data.get('normals') is not None:
-        # Use provided normals (optional - Blender can auto-calculate)
-        pass
-
-    mesh.update()
-    mesh.validate()
-
-    # DEBUG: Check after update/validate
-    if len(verts) < 100 and 'toilet_paper' in name:
-        actual_verts = [v.co for v in mesh.vertices]
-        print(f"      [DEBUG] ALL {len(actual_verts)} vertices in final mesh:")
-        for i in range(len(actual_verts)):
-            print(f"        [{i}]: ({actual_verts[i].x:.4f}, {actual_verts[i].y:.4f}, {actual_verts[i].z:.4f})")
-        xs = [v.x for v in actual_verts]
-        ys = [v.y for v in actual_verts]
-        zs = [v.z for v in actual_verts]
-        print(f"      [DEBUG] Spans: X={max(xs)-min(xs):.3f}, Y={max(ys)-min(ys):.3f}, Z={max(zs)-min(zs):.3f}")
-        print(f"      [DEBUG] Min/Max: X=[{min(xs):.3f}, {max(xs):.3f}], Y=[{min(ys):.3f}, {max(ys):.3f}], Z=[{min(zs):.3f}, {max(zs):.3f}]")
-        tallest = max(max(xs)-min(xs), max(ys)-min(ys), max(zs)-min(zs))
-        axis = 'X' if (max(xs)-min(xs)) == tallest else ('Y' if (max(ys)-min(ys)) == tallest else 'Z')
-        print(f"      [DEBUG] Tallest axis: {axis} = {tallest:.3f}m")
+
+    # Create mesh: vertices/loops/polygons written with foreach_set
+    mesh, _ = build_mesh(MESH_BACKEND, f"{name}_mesh",
+                         geometry_data['vertices'], geometry_data['faces'], base_rotation)
 
     return mesh
 
@@ -180,7 +109,7 @@ def create_object_from_mesh(name, mesh, position, orientation=0.0, base_rotation
     return obj
 
 
-def create_roof_from_geometry(name, geometry_data, position, end_point, dimensions):
+def create_roof_from_geometry(name, geometry_data, position, end_point, dimensions, mesh_cache=None):
     """
     Create sloped roof object from start to end point
 
@@ -193,17 +122,20 @@ def create_roof_from_geometry(name, geometry_data, position, end_point, dimensio
         position: Start position [x, y, z] (eave position)
         end_point: End position [x, y, z] (ridge position)
         dimensions: [width, slope_length, thickness] from JSON
+        mesh_cache: MeshInstanceCache to share the roof mesh (None = new mesh)
 
     Returns:
         bpy.types.Object
     """
-    import numpy as np
-
     # Get base rotation from geometry if any
     base_rotation = geometry_data.get('base_rotation', (0.0, 0.0, 0.0))
 
     # Create mesh from geometry (roof tile is already sloped)
-    mesh = create_mesh_from_geometry(name, geometry_data, base_rotation)
+    if mesh_cache is not None:
+        object_type = geometry_data.get('metadata', {}).get('object_type', name)
+        mesh = mesh_cache.get(object_type, geometry_data, base_rotation, name=name)
+    else:
+        mesh = create_mesh_from_geometry(name, geometry_data, base_rotation)
 
     # Calculate roof orientation
     start = Vector(position)
@@ -266,17 +198,14 @@ def create_wall_from_geometry(name, geometry_data, position, end_point, thicknes
     length = direction.length
     mid_point = (start + end) / 2
 
-    # Create simple box for wall (ignore base geometry for walls)
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(mid_point[0], mid_point[1], height / 2)
-    )
+    # Simple box for wall (ignore base geometry for walls), generated at full
+    # size around the object origin - no operators, no scale on the object
+    box = OrientedBoxGenerator.generate(length, thickness, height, 0.0, 0.0, -height / 2, 0.0)
+    mesh, _ = build_mesh(MESH_BACKEND, f"{name}_mesh", box.vertices, box.faces)
 
-    obj = bpy.context.active_object
-    obj.name = name
-
-    # Scale to wall dimensions
-    obj.scale = (length / 2, thickness / 2, height / 2)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    obj.location = (mid_point[0], mid_point[1], height / 2)
 
     # Rotate to align with wall direction
     angle = math.atan2(direction[1], direction[0])
@@ -285,13 +214,14 @@ def create_wall_from_geometry(name, geometry_data, position, end_point, thicknes
     return obj
 
 
-def import_lod300_geometry(json_file, database_path):
+def import_lod300_geometry(json_file, database_path, instancing=True):
     """
     Import objects from JSON using LOD300 geometry from database
 
     Args:
         json_file: Path to extraction output JSON
         database_path: Path to Ifc_Object_Library.db
+        instancing: Share one mesh per (object_type, base_rotation)
 
     Returns:
         dict: Import statistics
@@ -300,9 +230,8 @@ def import_lod300_geometry(json_file, database_path):
     print(f"   Input: {json_file}")
     print(f"   Database: {database_path}")
 
-    # Load extraction JSON
-    with open(json_file) as f:
-        data = json.load(f)
+    # Load extraction JSON (header now, objects streamed from disk on each pass)
+    data = read_final_json(json_file)
 
     objects = data.get('objects', [])
     summary = data.get('summary', {})
@@ -314,6 +243,13 @@ def import_lod300_geometry(json_file, database_path):
     object_types = list(set(obj.get('object_type') for obj in objects if obj.get('object_type')))
     print(f"\n📦 Unique object types: {len(object_types)}")
 
+    # GATE 4 library report (validated once per library version): corrupted blobs are not meshed
+    gate = check_object_types(object_types, database_path)
+    corrupted = set(gate.corrupted)
+    if corrupted:
+        print(f"⚠️  Corrupted library geometry (skipped): {', '.join(gate.corrupted)}")
+        object_types = [t for t in object_types if t not in corrupted]
+
     # Fetch all geometries from database
     fetcher = DatabaseGeometryFetcher(database_path)
     geometries = fetcher.fetch_all_geometries(object_types)
@@ -336,6 +272,7 @@ def import_lod300_geometry(json_file, database_path):
 
     # Create objects in Blender
     print(f"\n🏗️  Creating {len(objects)} objects in Blender...")
+    mesh_cache = MeshInstanceCache(create_mesh_from_geometry, enabled=instancing)
 
     for i, obj_data in enumerate(objects, 1):
         try:
@@ -364,7 +301,7 @@ def import_lod300_geometry(json_file, database_path):
             elif 'roof' in obj_type.lower() and 'end_point' in obj_data and 'tile' in obj_type.lower():
                 end_point = obj_data['end_point']
                 dimensions = obj_data.get('dimensions', [11.2, 4.69, 0.02])  # [width, slope_length, thickness]
-                obj = create_roof_from_geometry(obj_name, geometry, position, end_point, dimensions)
+                obj = create_roof_from_geometry(obj_name, geometry, position, end_point, dimensions, mesh_cache)
                 stats['structure'] += 1
 
             else:
@@ -376,8 +313,8 @@ def import_lod300_geometry(json_file, database_path):
                 if base_rotation[0] != 0 or base_rotation[1] != 0 or base_rotation[2] != 0:
                     print(f"   🔧 {obj_name} ({obj_type}): base_rotation=({math.degrees(base_rotation[0]):.0f}°, {math.degrees(base_rotation[1]):.0f}°, {math.degrees(base_rotation[2]):.0f}°)")
 
-                # Create mesh with vertices already rotated by base_rotation
-                mesh = create_mesh_from_geometry(obj_name, geometry, base_rotation)
+                # Shared mesh with vertices already rotated by base_rotation
+                mesh = mesh_cache.get(obj_type, geometry, base_rotation, name=obj_name)
 
                 # Scale mesh to actual dimensions if needed
                 dims = geometry.get('dimensions', {})
@@ -422,10 +359,10 @@ def import_lod300_geometry(json_file, database_path):
     print(f"   - Electrical: {stats['electrical']}")
     print(f"   - Furniture: {stats['furniture']}")
     print(f"   - Other: {stats['other']}")
+    print(f"   Meshes: {mesh_cache.summary()}")
 
-    # Mark objects as placed in JSON (for hash total verification)
-    for obj in objects:
-        obj['placed'] = True
+    # Mark objects as placed in JSON (for hash total verification, applied while writing)
+    data['objects'] = (dict(obj, placed=True) for obj in objects)
 
     # Save updated JSON with pattern: <PDFname>OUTPUT<timestamp>.json
     # Extract PDF name from metadata if available, otherwise use generic name
@@ -442,8 +379,7 @@ def import_lod300_geometry(json_file, database_path):
     os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, output_filename)
 
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    dump_final_json(data, output_file, sidecar=False)
     print(f"\n✅ Updated JSON saved: {output_file}")
 
     # Verify hash total
@@ -465,8 +401,11 @@ if __name__ == "__main__":
     if "--" in argv:
         argv = argv[argv.index("--") + 1:]
 
+    instancing = "--unique-meshes" not in argv
+    argv = [a for a in argv if a != "--unique-meshes"]
+
     if len(argv) < 2:
-        print("Usage: blender --python blender_lod300_import.py -- <extraction_output.json> <database_path> [output.blend]")
+        print("Usage: blender --python blender_lod300_import.py -- <extraction_output.json> <database_path> [output.blend] [--unique-meshes]")
         print("Example: blender --python blender_lod300_import.py -- output.json DatabaseFiles/Ifc_Object_Library.db model.blend")
         sys.exit(1)
 
@@ -475,7 +414,7 @@ if __name__ == "__main__":
     output_file = argv[2] if len(argv) > 2 else 'output.blend'
 
     # Import with LOD300 geometry
-    stats = import_lod300_geometry(json_file, database_path)
+    stats = import_lod300_geometry(json_file, database_path, instancing=instancing)
 
     # Save Blender file
     bpy.ops.wm.save_as_mainfile(filepath=output_file)
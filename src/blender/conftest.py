@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Shared setup for the headless importer tests (src/blender/headless/bpy.py)
+
+headless_import runs an importer on a fresh synthetic library + FINAL:
+
+    def test_something(headless_import):
+        run = headless_import('v2', object_count=60, type_count=8)
+        run.result['calls'], run.objects, run.db_path
+
+The test modules' __main__ blocks use make_headless_import() directly.
+"""
+
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+from import_benchmark import build_library, run_importer, synthetic_final
+from final_json_stream import dump_final_json
+
+
+class HeadlessImport(NamedTuple):
+    objects: List[Dict]     # FINAL objects as written
+    db_path: Path           # synthetic library (kept until the test ends)
+    result: Dict            # run_importer() result: exit_code, calls, meshes, ...
+
+
+def make_headless_import(root: Path) -> Callable[..., HeadlessImport]:
+    """Importer runner writing each run's library, FINAL and .blend under root"""
+    runs = 0
+
+    def run(importer: str, object_count: int, type_count: int, seed: int = 0,
+            select_types: Optional[Callable[[Dict], bool]] = None,
+            edit_objects: Optional[Callable[[List[Dict]], None]] = None,
+            args: Sequence[str] = ()) -> HeadlessImport:
+        """
+        Args:
+            importer: Key of import_benchmark.IMPORTERS ('v2', 'bin')
+            object_count: FINAL objects
+            type_count: Library object_types (FAMILIES round-robin)
+            seed: synthetic_final seed
+            select_types: Keep only library types it accepts for the FINAL
+            edit_objects: Called on the objects before the FINAL is written
+            args: Extra importer flags (e.g. --unique-meshes)
+        """
+        nonlocal runs
+        runs += 1
+        tmp = root / f"run_{runs}"
+        # bin importer writes its updated JSON to <json dir>/../output_artifacts
+        (tmp / 'inputs').mkdir(parents=True)
+
+        db_path = tmp / 'Ifc_Object_Library.db'
+        types = build_library(db_path, type_count)
+        if select_types is not None:
+            types = [t for t in types if select_types(t)]
+        data = synthetic_final(object_count, types, seed=seed)
+        if edit_objects is not None:
+            edit_objects(data['objects'])
+        json_path = tmp / 'inputs' / 'HEADLESS_FINAL.json'
+        dump_final_json(data, json_path)
+
+        result = run_importer(importer, json_path, db_path, tmp / 'headless.blend', args)
+        assert result['exit_code'] == 0, f"{importer} importer exited with {result['exit_code']}"
+        return HeadlessImport(data['objects'], db_path, result)
+
+    return run
+
+
+@pytest.fixture
+def headless_import(tmp_path):
+    """make_headless_import() under the test's tmp_path"""
+    return make_headless_import(tmp_path)
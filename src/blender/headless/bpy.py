@@ -0,0 +1,438 @@
+"""
+Headless bpy
+============
+Stand-in for Blender's bpy module covering the subset the importers use
+(src/blender/import_to_blender.py, bin/blender_lod300_import.py), so they
+run under plain python for benchmarks and CI.
+
+Implemented:
+    bpy.data.meshes / objects / collections / materials
+        new(), get(), [], in, len(), iteration, remove(do_unlink=...)
+    Mesh        vertices/loops/polygons .add() + .foreach_set(), from_pydata(),
+                update(), validate(), materials
+    Object      location, rotation_euler, scale, material_slots, ID properties
+    Collection  objects.link/unlink, children.link
+    bpy.context scene.collection, collection, view_layer
+    bpy.ops     object.select_all / object.delete / wm.save_as_mainfile,
+                any other operator is recorded and returns {'FINISHED'}
+
+Every call into the module is counted and timed in STATS.
+
+Usage:
+    sys.path.insert(0, "src/blender/headless")
+    import bpy
+    ...run importer...
+    print(bpy.STATS.report())
+    bpy.reset()                  # empty scene + zeroed STATS
+"""
+
+import functools
+import time
+import types as _types
+from collections import Counter, defaultdict
+from typing import Dict
+
+import numpy as np
+
+
+#===============================================================================
+# CALL RECORDING
+#===============================================================================
+
+class CallStats:
+    """Call counts and cumulative seconds per bpy entry point"""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.seconds = defaultdict(float)
+
+    def reset(self):
+        self.calls.clear()
+        self.seconds.clear()
+
+    def add(self, name: str, seconds: float = 0.0):
+        self.calls[name] += 1
+        self.seconds[name] += seconds
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.seconds.values())
+
+    def as_dict(self) -> Dict:
+        return {name: {'calls': count, 'seconds': self.seconds[name]}
+                for name, count in sorted(self.calls.items())}
+
+    def report(self, top: int = 15) -> str:
+        lines = [f"{'call':<36} {'count':>10} {'ms':>10}"]
+        for name, count in self.calls.most_common(top):
+            lines.append(f"{name:<36} {count:>10} {self.seconds[name] * 1000:>10.1f}")
+        return '\n'.join(lines)
+
+
+STATS = CallStats()
+
+
+def _recorded(name: str):
+    """Count + time every call of the wrapped function under name"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                STATS.add(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+#===============================================================================
+# ID BLOCKS
+#===============================================================================
+
+class ID:
+    """Datablock with a name, user count and custom (ID) properties"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.users = 0
+        self._props = {}
+
+    @property
+    def name_full(self) -> str:
+        return self.name
+
+    @_recorded('ID.__getitem__')
+    def __getitem__(self, key):
+        return self._props[key]
+
+    @_recorded('ID.__setitem__')
+    def __setitem__(self, key, value):
+        self._props[key] = value
+
+    def __contains__(self, key):
+        return key in self._props
+
+    @_recorded('ID.get')
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+    def keys(self):
+        return self._props.keys()
+
+    @_recorded('ID.id_properties_ensure')
+    def id_properties_ensure(self) -> Dict:
+        return self._props
+
+    def __repr__(self):
+        return f"bpy.data.{type(self).__name__.lower()}s['{self.name}']"
+
+
+class _MeshElements:
+    """vertices / loops / polygons: add() then foreach_set() flat buffers"""
+
+    def __init__(self, kind: str, widths: Dict[str, int], readonly=()):
+        self.kind = kind
+        self.widths = widths
+        self.readonly = set(readonly)
+        self.count = 0
+        self.attributes = {}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, count: int):
+        STATS.add(f'Mesh.{self.kind}.add')
+        self.count += count
+
+    def foreach_set(self, attr: str, seq):
+        start = time.perf_counter()
+        try:
+            if attr in self.readonly:
+                raise AttributeError(f"bpy_prop_collection: attribute \"{attr}\" is read-only")
+            if attr not in self.widths:
+                raise AttributeError(f"bpy_prop_collection: attribute \"{attr}\" not found")
+            values = np.asarray(seq)
+            expected = self.count * self.widths[attr]
+            if values.size != expected:
+                raise RuntimeError(f"internal error setting the array: expected {expected} items, got {values.size}")
+            self.attributes[attr] = values.reshape(self.count, -1).copy()
+        finally:
+            STATS.add(f'Mesh.{self.kind}.foreach_set', time.perf_counter() - start)
+
+
+class _DataMaterials(list):
+    """mesh.materials"""
+
+    def append(self, material):
+        STATS.add('Mesh.materials.append')
+        super().append(material)
+
+
+class Mesh(ID):
+    def __init__(self, name: str):
+        super().__init__(name)
+        # Blender 4.x: loop_total is derived from loop_start
+        self.vertices = _MeshElements('vertices', {'co': 3})
+        self.loops = _MeshElements('loops', {'vertex_index': 1})
+        self.polygons = _MeshElements('polygons', {'loop_start': 1, 'loop_total': 1}, readonly=('loop_total',))
+        self.materials = _DataMaterials()
+
+    @_recorded('Mesh.from_pydata')
+    def from_pydata(self, vertices, edges, faces):
+        self.vertices.add(len(vertices))
+        self.vertices.attributes['co'] = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+        self.polygons.add(len(faces))
+        self.loops.add(sum(len(face) for face in faces))
+
+    @_recorded('Mesh.update')
+    def update(self, calc_edges=False, calc_edges_loose=False):
+        pass
+
+    @_recorded('Mesh.validate')
+    def validate(self, verbose=False, clean_customdata=True) -> bool:
+        return False
+
+
+class MaterialSlot:
+    def __init__(self, data):
+        self._data = data
+        self._material = None
+        self.link = 'DATA'
+
+    @property
+    def material(self):
+        if self.link == 'OBJECT':
+            return self._material
+        materials = getattr(self._data, 'materials', [])
+        return materials[0] if materials else None
+
+    @material.setter
+    def material(self, value):
+        self._material = value
+
+
+class Object(ID):
+    def __init__(self, name: str, object_data):
+        super().__init__(name)
+        self.data = object_data
+        if object_data is not None:
+            object_data.users += 1
+        self.type = 'MESH' if isinstance(object_data, Mesh) else 'EMPTY'
+        self.location = (0.0, 0.0, 0.0)
+        self.rotation_euler = (0.0, 0.0, 0.0)
+        self.scale = (1.0, 1.0, 1.0)
+        self.users_collection = []
+        self.select = False
+        self.material_slots = [MaterialSlot(object_data)] if self.type == 'MESH' else []
+
+    def select_set(self, state: bool):
+        self.select = state
+
+
+class Material(ID):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.diffuse_color = (0.8, 0.8, 0.8, 1.0)
+        self.use_nodes = False
+
+
+class _CollectionObjects(list):
+    """collection.objects"""
+
+    def __init__(self, owner):
+        super().__init__()
+        self.owner = owner
+
+    @_recorded('Collection.objects.link')
+    def link(self, obj):
+        if obj in self.owner.users_of:
+            raise RuntimeError(f"Object '{obj.name}' already in collection '{self.owner.name}'")
+        self.append(obj)
+        self.owner.users_of.add(obj)
+        obj.users_collection.append(self.owner)
+        obj.users += 1
+
+    @_recorded('Collection.objects.unlink')
+    def unlink(self, obj):
+        self.remove(obj)
+        self.owner.users_of.discard(obj)
+        obj.users_collection.remove(self.owner)
+        obj.users -= 1
+
+
+class _CollectionChildren(list):
+    """collection.children"""
+
+    @_recorded('Collection.children.link')
+    def link(self, collection):
+        self.append(collection)
+        collection.users += 1
+
+    def unlink(self, collection):
+        self.remove(collection)
+        collection.users -= 1
+
+
+class Collection(ID):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.users_of = set()
+        self.objects = _CollectionObjects(self)
+        self.children = _CollectionChildren()
+
+
+#===============================================================================
+# bpy.data
+#===============================================================================
+
+class BlendDataCollection:
+    """bpy.data.<kind>: name-keyed datablocks, Blender-style .001 renaming"""
+
+    def __init__(self, kind: str, cls):
+        self.kind = kind
+        self.cls = cls
+        self._items = {}
+
+    def new(self, name: str, *args, **kwargs):
+        start = time.perf_counter()
+        unique, n = name, 0
+        while unique in self._items:
+            n += 1
+            unique = f"{name}.{n:03d}"
+        item = self.cls(unique, *args, **kwargs)
+        self._items[unique] = item
+        STATS.add(f'data.{self.kind}.new', time.perf_counter() - start)
+        return item
+
+    def remove(self, item, do_unlink: bool = True):
+        STATS.add(f'data.{self.kind}.remove')
+        if self._items.get(item.name) is not item:
+            raise ReferenceError(f"{item!r} not in bpy.data.{self.kind}")
+        if isinstance(item, Object):
+            for collection in list(item.users_collection):
+                collection.objects.unlink(item)
+            if item.data is not None:
+                item.data.users -= 1
+        elif isinstance(item, Collection):
+            for parent in [_scene.collection, *self._items.values()]:
+                if item in parent.children:
+                    parent.children.unlink(item)
+        del self._items[item.name]
+
+    def get(self, name: str, default=None):
+        STATS.add(f'data.{self.kind}.get')
+        return self._items.get(name, default)
+
+    def __getitem__(self, name: str):
+        STATS.add(f'data.{self.kind}.__getitem__')
+        return self._items[name]
+
+    def __contains__(self, name: str) -> bool:
+        STATS.add(f'data.{self.kind}.__contains__')
+        return name in self._items
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self):
+        return list(self._items)
+
+    def values(self):
+        return list(self._items.values())
+
+
+data = _types.SimpleNamespace()
+context = _types.SimpleNamespace()
+_scene = None
+
+
+def reset():
+    """Empty bpy.data, fresh scene, zeroed STATS"""
+    global _scene
+    data.meshes = BlendDataCollection('meshes', Mesh)
+    data.objects = BlendDataCollection('objects', Object)
+    data.materials = BlendDataCollection('materials', Material)
+    data.collections = BlendDataCollection('collections', Collection)
+    data.filepath = ''
+
+    _scene = _types.SimpleNamespace(name='Scene', collection=Collection('Scene Collection'))
+    context.scene = _scene
+    context.collection = _scene.collection
+    context.active_object = None
+    context.view_layer = _types.SimpleNamespace(objects=_types.SimpleNamespace(active=None))
+    STATS.reset()
+
+
+reset()
+
+
+#===============================================================================
+# bpy.ops
+#===============================================================================
+
+def _select_all(action='TOGGLE', **kwargs):
+    for obj in data.objects:
+        obj.select = action != 'DESELECT'
+
+
+def _delete(**kwargs):
+    for obj in data.objects:
+        if obj.select:
+            data.objects.remove(obj, do_unlink=True)
+
+
+def _save_as_mainfile(filepath='', **kwargs):
+    # Nothing is written; the path is kept for inspection
+    data.filepath = filepath
+
+
+_OPERATORS = {
+    'object.select_all': _select_all,
+    'object.delete': _delete,
+    'wm.save_as_mainfile': _save_as_mainfile,
+}
+
+
+class _Operator:
+    def __init__(self, idname: str):
+        self.idname = idname
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        handler = _OPERATORS.get(self.idname)
+        if handler:
+            handler(**kwargs)
+        STATS.add(f'ops.{self.idname}', time.perf_counter() - start)
+        return {'FINISHED'}
+
+    def poll(self) -> bool:
+        return True
+
+
+class _OperatorModule:
+    def __init__(self, module: str):
+        self.module = module
+
+    def __getattr__(self, name: str) -> _Operator:
+        return _Operator(f"{self.module}.{name}")
+
+
+class _Ops:
+    def __getattr__(self, module: str) -> _OperatorModule:
+        return _OperatorModule(module)
+
+
+ops = _Ops()
+
+types = _types.SimpleNamespace(ID=ID, Mesh=Mesh, Object=Object, Material=Material,
+                               Collection=Collection, MaterialSlot=MaterialSlot)
+
+app = _types.SimpleNamespace(version=(4, 2, 0), version_string='4.2.0 (headless)', background=True)
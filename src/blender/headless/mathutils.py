@@ -0,0 +1,81 @@
+"""
+Headless mathutils
+==================
+Vector and Euler as used by the importers (see bpy.py in this directory).
+"""
+
+import math
+
+
+class Vector:
+    """Float vector with x/y/z access, arithmetic and length (mutable like Blender's)"""
+
+    def __init__(self, values=(0.0, 0.0, 0.0)):
+        self._values = [float(v) for v in values]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __setitem__(self, index, value):
+        self._values[index] = float(value)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def _axis(index):
+        return property(lambda self: self._values[index],
+                        lambda self, value: self.__setitem__(index, value))
+
+    x, y, z = _axis(0), _axis(1), _axis(2)
+    del _axis
+
+    def __add__(self, other):
+        return Vector(a + b for a, b in zip(self, other))
+
+    def __sub__(self, other):
+        return Vector(a - b for a, b in zip(self, other))
+
+    def __mul__(self, k):
+        return Vector(a * k for a in self)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, k):
+        return Vector(a / k for a in self)
+
+    def __neg__(self):
+        return Vector(-a for a in self)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"Vector(({', '.join(f'{v:.4f}' for v in self)}))"
+
+    @property
+    def length(self) -> float:
+        return math.sqrt(sum(a * a for a in self))
+
+    def normalized(self) -> 'Vector':
+        length = self.length
+        return self.copy() if length == 0 else self / length
+
+    def dot(self, other) -> float:
+        return sum(a * b for a, b in zip(self, other))
+
+    def copy(self) -> 'Vector':
+        return Vector(self)
+
+
+class Euler(Vector):
+    """Rotation angles in radians with an order string"""
+
+    def __init__(self, angles=(0.0, 0.0, 0.0), order='XYZ'):
+        super().__init__(angles)
+        self.order = order
+
+    def __repr__(self):
+        return f"Euler(({', '.join(f'{v:.4f}' for v in self)}), '{self.order}')"
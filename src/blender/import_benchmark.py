@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Import Benchmark - Blender importers timed without Blender
+
+Runs import_to_blender.py and bin/blender_lod300_import.py end to end
+against the headless bpy/mathutils in src/blender/headless/, on synthetic
+FINAL JSONs (1k / 10k / 100k objects by default) and a synthetic library
+built from db/schema/ifc_object_library.sql.
+
+Reported per run:
+    seconds, µs per object, bpy calls per object, meshes created,
+    the most frequent bpy calls
+
+bpy call counts are deterministic, so --baseline comparisons catch
+per-object regressions (an extra bpy.data lookup in the loop) exactly;
+wall time is compared with a tolerance.
+
+Usage:
+    python3 src/blender/import_benchmark.py
+    python3 src/blender/import_benchmark.py --sizes 1000,10000 --importer v2
+    python3 src/blender/import_benchmark.py --save bench.json
+    python3 src/blender/import_benchmark.py --baseline bench.json --tolerance 0.25
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import runpy
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+HEADLESS_DIR = Path(__file__).resolve().parent / 'headless'
+SCHEMA_PATH = REPO_ROOT / 'db' / 'schema' / 'ifc_object_library.sql'
+
+IMPORTERS = {
+    'v2': REPO_ROOT / 'src' / 'blender' / 'import_to_blender.py',
+    'bin': REPO_ROOT / 'bin' / 'blender_lod300_import.py',
+}
+
+sys.path.insert(0, str(HEADLESS_DIR))
+sys.path.insert(0, str(REPO_ROOT / 'src' / 'core'))
+sys.path.insert(0, str(REPO_ROOT / 'src' / 'tools'))
+import bpy  # headless
+from final_json_stream import dump_final_json
+from geometry_generators import OrientedBoxGenerator
+
+# (discipline, group, _phase, ifc_class, category) per synthetic type family
+FAMILIES = [
+    ('ARC', 'Doors', '4_openings', 'IfcDoor', 'door'),
+    ('ARC', 'Windows', '4_openings', 'IfcWindow', 'window'),
+    ('ARC', 'Furniture', '6_furniture', 'IfcFurnishingElement', 'furniture'),
+    ('MEP', 'Lighting', '5_electrical', 'IfcLightFixture', 'mep'),
+    ('MEP', 'Switches', '5_electrical', 'IfcSwitchingDevice', 'mep'),
+    ('PLUM', 'Fixtures', '5_plumbing', 'IfcSanitaryTerminal', 'plumbing'),
+    ('STR', 'Slabs', '1_structure', 'IfcSlab', 'structure'),
+]
+
+
+#===============================================================================
+# SYNTHETIC INPUTS
+#===============================================================================
+
+def build_library(db_path: Path, type_count: int, seed: int = 0) -> List[Dict]:
+    """
+    Library DB with type_count box geometries (every 7th one with a base_rotation)
+
+    Returns:
+        [{'object_type', 'family'}, ...]
+    """
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA_PATH.read_text())
+
+    types = []
+    for i in range(type_count):
+        family = FAMILIES[i % len(FAMILIES)]
+        width, depth, height = (round(rng.uniform(0.2, 2.0), 3) for _ in range(3))
+        box = OrientedBoxGenerator.generate(width, depth, height, 0.0, 0.0, 0.0, 0.0)
+        vertices = np.asarray(box.vertices, dtype='<f4')
+        faces = np.asarray(box.faces, dtype='<u4')
+        geometry_hash = f"bench{i:05d}"
+        base_rotation = (math.pi / 2, 0.0, 0.0) if i % 7 == 6 else (0.0, 0.0, 0.0)
+        object_type = f"bench_{family[4]}_{i:03d}_lod300"
+
+        conn.execute(
+            "INSERT INTO base_geometries (geometry_hash, vertices, faces, normals, vertex_count, face_count,"
+            " bbox_width, bbox_depth, bbox_height) VALUES (?, ?, ?, NULL, ?, ?, ?, ?, ?)",
+            (geometry_hash, vertices.tobytes(), faces.tobytes(), len(vertices), len(faces), width, depth, height))
+        conn.execute(
+            "INSERT INTO object_catalog (geometry_hash, ifc_class, object_type, object_name, category,"
+            " width_mm, depth_mm, height_mm, base_rotation_x, base_rotation_y, base_rotation_z)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (geometry_hash, family[3], object_type, object_type, family[4],
+             int(width * 1000), int(depth * 1000), int(height * 1000), *base_rotation))
+        types.append({'object_type': object_type, 'family': family})
+
+    conn.commit()
+    conn.close()
+    return types
+
+
+def synthetic_final(count: int, types: List[Dict], seed: int = 0) -> Dict:
+    """FINAL JSON dict with count placed-object records spread over a grid"""
+    rng = random.Random(seed)
+    side = max(1, int(math.sqrt(count)))
+    objects = []
+    for i in range(count):
+        entry = types[rng.randrange(len(types))]
+        discipline, group, phase, ifc_class, _ = entry['family']
+        obj = {
+            'name': f"{entry['object_type']}_{i}",
+            'object_type': entry['object_type'],
+            'position': [round((i % side) * 1.5, 3), round((i // side) * 1.5, 3), round(rng.uniform(0, 3), 3)],
+            'orientation': rng.choice([0.0, 90.0, 180.0, 270.0]),
+            'discipline': discipline,
+            'group': group,
+            'ifc_class': ifc_class,
+            'room': f"room_{i % 12}",
+            '_phase': phase,
+            'placed': False,
+        }
+        objects.append(obj)
+
+    return {
+        'extraction_metadata': {'pdf_source': 'BENCHMARK.pdf', 'generator': 'import_benchmark'},
+        'summary': {'total_objects': count},
+        'objects': objects,
+    }
+
+
+#===============================================================================
+# RUN
+#===============================================================================
+
+def run_importer(name: str, json_path: Path, db_path: Path, blend_path: Path, args: Sequence[str] = ()) -> Dict:
+    """Run one importer script headless (args: extra flags, e.g. --unique-meshes); returns timing + bpy call stats"""
+    bpy.reset()
+    argv = sys.argv
+    sys.argv = [str(IMPORTERS[name]), '--', str(json_path), str(db_path), str(blend_path), *args]
+    exit_code = 0
+    start = time.perf_counter()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            runpy.run_path(str(IMPORTERS[name]), run_name='__main__')
+    except SystemExit as e:
+        exit_code = e.code or 0
+    finally:
+        sys.argv = argv
+    seconds = time.perf_counter() - start
+
+    return {
+        'seconds': seconds,
+        'bpy_seconds': bpy.STATS.total_seconds,
+        'bpy_calls': bpy.STATS.total_calls,
+        'calls': dict(bpy.STATS.calls),
+        'objects': len(bpy.data.objects),
+        'meshes': len(bpy.data.meshes),
+        'saved': bpy.data.filepath == str(blend_path),
+        'exit_code': exit_code,
+        'top_calls': bpy.STATS.calls.most_common(5),
+    }
+
+
+def run_benchmark(sizes: List[int], importers: List[str], type_count: int, seed: int = 0) -> List[Dict]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix='import_bench_') as tmp:
+        tmp = Path(tmp)
+        # bin importer writes its updated JSON to <json dir>/../output_artifacts
+        (tmp / 'inputs').mkdir()
+        db_path = tmp / 'Ifc_Object_Library.db'
+        types = build_library(db_path, type_count, seed)
+
+        for size in sizes:
+            json_path = tmp / 'inputs' / f"BENCH_{size}_FINAL.json"
+            dump_final_json(synthetic_final(size, types, seed), json_path)
+
+            for name in importers:
+                result = run_importer(name, json_path, db_path, tmp / f"{name}_{size}.blend")
+                result.update(importer=name, size=size,
+                              us_per_object=result['seconds'] / size * 1e6,
+                              calls_per_object=result['bpy_calls'] / size)
+                results.append(result)
+                print(format_result(result))
+    return results
+
+
+def format_result(r: Dict) -> str:
+    status = '✅' if r['exit_code'] == 0 and r['objects'] >= r['size'] else '❌'
+    top = ', '.join(f"{call}×{count}" for call, count in r['top_calls'][:3])
+    return (f"{status} {r['importer']:<4} {r['size']:>7,} objects  {r['seconds']:7.2f}s  "
+            f"{r['us_per_object']:7.1f}µs/obj  {r['calls_per_object']:5.2f} bpy calls/obj  "
+            f"{r['meshes']:>4} meshes  ({top})")
+
+
+def compare_baseline(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    """Regressions against a saved run (same importer + size)"""
+    previous = {(r['importer'], r['size']): r for r in baseline}
+    regressions = []
+    for r in results:
+        before = previous.get((r['importer'], r['size']))
+        if not before:
+            continue
+        label = f"{r['importer']} @ {r['size']:,}"
+        if r['us_per_object'] > before['us_per_object'] * (1 + tolerance):
+            regressions.append(f"{label}: {r['us_per_object']:.1f}µs/obj vs {before['us_per_object']:.1f}µs/obj")
+        for call, count in r['calls'].items():
+            if count > before['calls'].get(call, 0):
+                regressions.append(f"{label}: {call} {before['calls'].get(call, 0)} → {count}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Blender importers without Blender")
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help="Comma-separated object counts (default: 1000,10000,100000)")
+    parser.add_argument('--importer', choices=['v2', 'bin', 'both'], default='both',
+                        help="v2 = src/blender/import_to_blender.py, bin = bin/blender_lod300_import.py")
+    parser.add_argument('--types', type=int, default=40, help="Library object_types (default: 40)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', help="Write results JSON (use as a later --baseline)")
+    parser.add_argument('--baseline', help="Results JSON to compare against; exit 1 on regression")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed µs/object slowdown vs baseline (default: 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    importers = ['v2', 'bin'] if args.importer == 'both' else [args.importer]
+
+    print(f"🔷 Headless import benchmark: sizes={sizes}, importers={importers}, types={args.types}")
+    results = run_benchmark(sizes, importers, args.types, args.seed)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results saved: {args.save}")
+
+    failed = [r for r in results if r['exit_code'] != 0 or r['objects'] < r['size']]
+    if failed:
+        print(f"❌ {len(failed)} run(s) did not place every object")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_baseline(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) vs {args.baseline}:")
+            for line in regressions:
+                print(f"   {line}")
+            sys.exit(1)
+        print(f"✅ No regressions vs {args.baseline}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,12 +21,22 @@ Flow:
 7. Position objects at extracted coordinates
 8. Verify and report results
 
+Steps 5-7 are compiled into a bpy-free ScenePlan (scene_plan.py) first;
+execute_scene_plan() then only creates datablocks from flat arrays.
+
 Usage:
-    blender --python blender_lod300_import_v2.py -- <input.json> <database.db> [output.blend]
+    blender --python blender_lod300_import_v2.py -- <input.json> <database.db> [output.blend] [--unique-meshes] [--sync]
+
+Instancing:
+    Objects of the same object_type share one mesh datablock (linked
+    duplicates); --unique-meshes restores one mesh per placed object.
+
+Sync:
+    --sync re-imports into an already opened .blend: objects are matched by
+    name + content hash and only added/changed/removed ones are touched.
 """
 
 import bpy
-import json
 import sys
 import os
 import math
@@ -37,6 +47,16 @@ from typing import Dict, List, Tuple, Optional, Any
 
 # Add core directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'core'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mesh_builder import BlenderMeshBackend, build_mesh
+from mesh_instancing import MeshInstanceCache, instance_key
+from scene_plan import (COLLECTION_HIERARCHY, PLAN_COLLECTION_PROP, PLAN_HASH_PROP, PLAN_KEY_PROP, PLAN_MESH_PROP,
+                        SceneDiff, ScenePlan, compile_scene_plan, diff_scene)
+
+from final_json_stream import read_final_json
+from library_gate import check_object_types
+from preflight import check_library_geometries, preflight_scan
 
 try:
     from database_geometry_fetcher import DatabaseGeometryFetcher
@@ -65,9 +85,8 @@ DEFAULT_WALL_HEIGHT = 3.0
 DEFAULT_WALL_THICKNESS = 0.1
 DEFAULT_CEILING_HEIGHT = 3.0
 
-# Geometry validation thresholds
-MAX_OBJECT_DIMENSION = 50.0  # meters - flag objects larger than this
-MIN_OBJECT_DIMENSION = 0.01  # meters - flag objects smaller than this
+# Bulk mesh writer (foreach_set from NumPy buffers)
+MESH_BACKEND = BlenderMeshBackend(bpy)
 
 
 #===============================================================================
@@ -102,6 +121,13 @@ class DebugLogger:
         """Log geometry-specific issue"""
         self.geometry_issues.append((obj_name, issue))
         print(f"🔺 GEOMETRY [{obj_name}]: {issue}")
+    
+    def geometry_batch(self, issues):
+        """Log many (obj_name, issue) pairs with a single write"""
+        issues = list(issues)
+        self.geometry_issues.extend(issues)
+        if issues:
+            print('\n'.join(f"🔺 GEOMETRY [{obj_name}]: {issue}" for obj_name, issue in issues))
         
     def section(self, title):
         print(f"\n{'='*60}")
@@ -165,6 +191,9 @@ def create_discipline_collections() -> Dict[str, bpy.types.Collection]:
             ├── Roofs
             └── ...
     
+    Collections tagged by a previous import (sync) are reused rather
+    than duplicated.
+    
     Returns:
         Dict mapping "DISCIPLINE/Group" to collection
     """
@@ -172,229 +201,93 @@ def create_discipline_collections() -> Dict[str, bpy.types.Collection]:
     
     scene_collection = bpy.context.scene.collection
     collections = {}
+    existing = {coll.get(PLAN_COLLECTION_PROP): coll for coll in bpy.data.collections}
     
-    # Define hierarchy
-    hierarchy = {
-        'ARC': {
-            'name': 'ARC_Architecture',
-            'groups': ['Doors', 'Windows', 'Walls', 'Furniture', 'Bedroom', 'Kitchen', 'Bathroom']
-        },
-        'MEP': {
-            'name': 'MEP_Electrical', 
-            'groups': ['Lighting', 'Electrical', 'Switches', 'Outlets', 'Fans']
-        },
-        'PLUM': {
-            'name': 'PLUM_Plumbing',
-            'groups': ['Fixtures', 'Drainage', 'Sanitary']
-        },
-        'STR': {
-            'name': 'STR_Structure',
-            'groups': ['Slabs', 'Roofs', 'Ceilings', 'Foundations']
-        },
-        'UNKNOWN': {
-            'name': 'UNKNOWN_Uncategorized',
-            'groups': ['Other']
-        }
-    }
-    
-    for discipline, config in hierarchy.items():
+    for discipline, config in COLLECTION_HIERARCHY.items():
         # Create discipline collection
-        disc_coll = bpy.data.collections.new(config['name'])
-        scene_collection.children.link(disc_coll)
+        disc_coll = existing.get(discipline)
+        if disc_coll is None:
+            disc_coll = bpy.data.collections.new(config['name'])
+            disc_coll[PLAN_COLLECTION_PROP] = discipline
+            scene_collection.children.link(disc_coll)
         collections[discipline] = disc_coll
         
         # Create group sub-collections
         for group in config['groups']:
-            group_coll = bpy.data.collections.new(f"{discipline}_{group}")
-            disc_coll.children.link(group_coll)
-            collections[f"{discipline}/{group}"] = group_coll
+            key = f"{discipline}/{group}"
+            group_coll = existing.get(key)
+            if group_coll is None:
+                group_coll = bpy.data.collections.new(f"{discipline}_{group}")
+                group_coll[PLAN_COLLECTION_PROP] = key
+                disc_coll.children.link(group_coll)
+            collections[key] = group_coll
             
         LOG.log(f"Created {config['name']} with {len(config['groups'])} groups")
     
     return collections
 
 
-def get_collection_for_object(collections: Dict, obj_data: Dict) -> bpy.types.Collection:
-    """
-    Get appropriate collection for an object based on discipline and group
-    
-    Args:
-        collections: Collection hierarchy dict
-        obj_data: Object data from JSON
-        
-    Returns:
-        Target collection for this object
-    """
-    discipline = obj_data.get('discipline', 'UNKNOWN')
-    group = obj_data.get('group', 'Other')
-    
-    # Try specific group first
-    key = f"{discipline}/{group}"
-    if key in collections:
-        return collections[key]
-    
-    # Fall back to discipline
-    if discipline in collections:
-        return collections[discipline]
-    
-    # Ultimate fallback
-    return collections.get('UNKNOWN', bpy.context.scene.collection)
+def resolve_collection(collections: Dict, key: str) -> bpy.types.Collection:
+    """Collection for a "DISCIPLINE/Group" key (plain dict lookups, scene collection last)"""
+    coll = collections.get(key)
+    if coll is None:
+        coll = collections.get('UNKNOWN')
+    return coll if coll is not None else bpy.context.scene.collection
 
 
 #===============================================================================
 # IFC PROPERTY ASSIGNMENT
 #===============================================================================
 
-def assign_ifc_properties(obj: bpy.types.Object, obj_data: Dict):
-    """
-    Assign IFC-related custom properties to Blender object
-    
-    Properties assigned:
-        - ifc_class: IfcDoor, IfcWall, etc.
-        - ifc_predefined_type: DOOR, SOLIDWALL, etc.
-        - discipline: ARC, MEP, PLUM, STR
-        - group: Doors, Walls, Lighting, etc.
-        - room: Room assignment
-        - room_id: Room identifier
-        - phase: Construction phase
-        - blender_name: Naming convention
-    
-    Args:
-        obj: Blender object
-        obj_data: Object data from JSON
-    """
-    # Core IFC properties
-    obj['ifc_class'] = obj_data.get('ifc_class', 'IfcBuildingElement')
-    obj['ifc_predefined_type'] = obj_data.get('ifc_predefined_type', 'NOTDEFINED')
-    
-    # Organization properties
-    obj['discipline'] = obj_data.get('discipline', 'UNKNOWN')
-    obj['group'] = obj_data.get('group', 'Other')
-    
-    # Spatial properties
-    obj['room'] = obj_data.get('room', 'unknown')
-    obj['room_id'] = obj_data.get('room_id', '')
-    
-    # Phase and naming
-    obj['phase'] = obj_data.get('phase', obj_data.get('_phase', ''))
-    obj['blender_name'] = obj_data.get('blender_name', obj.name)
-    
-    # Source tracking
-    obj['object_type'] = obj_data.get('object_type', '')
-    obj['source'] = obj_data.get('source', obj_data.get('_generation_method', 'unknown'))
-    
-    # Dimensions if available
-    if 'width' in obj_data:
-        obj['width'] = obj_data['width']
-    if 'height' in obj_data:
-        obj['height'] = obj_data['height']
-    if 'length' in obj_data:
-        obj['length'] = obj_data['length']
+def set_id_properties(obj: bpy.types.Object, props: Dict, extra: Optional[Dict] = None):
+    """Write props (+ blender_name default, + extra) with a single update()"""
+    if 'blender_name' not in props or extra:
+        props = dict(props)
+        props.setdefault('blender_name', obj.name)
+        if extra:
+            props.update(extra)
+    obj.id_properties_ensure().update(props)
 
 
-def set_object_color_by_discipline(obj: bpy.types.Object, discipline: str):
-    """
-    Set viewport display color based on discipline
-    
-    Args:
-        obj: Blender object
-        discipline: ARC, MEP, PLUM, STR
-    """
-    color = DISCIPLINE_COLORS.get(discipline, DISCIPLINE_COLORS['UNKNOWN'])
-    
-    # Create or get material
+def get_discipline_material(discipline: str) -> bpy.types.Material:
+    """Create or get the MAT_<discipline> viewport material"""
     mat_name = f"MAT_{discipline}"
-    if mat_name not in bpy.data.materials:
+    mat = bpy.data.materials.get(mat_name)
+    if mat is None:
         mat = bpy.data.materials.new(name=mat_name)
-        mat.diffuse_color = color
+        mat.diffuse_color = DISCIPLINE_COLORS.get(discipline, DISCIPLINE_COLORS['UNKNOWN'])
         mat.use_nodes = False
-    else:
-        mat = bpy.data.materials[mat_name]
-    
-    # Assign to object
-    if obj.data and hasattr(obj.data, 'materials'):
-        if len(obj.data.materials) == 0:
-            obj.data.materials.append(mat)
+    return mat
+
+
+def assign_material(obj: bpy.types.Object, mat: bpy.types.Material):
+    """Put material in slot 0 (object-linked when the mesh is shared)"""
+    data = obj.data
+    if data and hasattr(data, 'materials'):
+        materials = data.materials
+        if len(materials) == 0:
+            materials.append(mat)
+        elif data.users > 1:
+            # Shared (instanced) mesh: override per object, leave the mesh slot alone
+            if materials[0] != mat:
+                slot = obj.material_slots[0]
+                slot.link = 'OBJECT'
+                slot.material = mat
         else:
-            obj.data.materials[0] = mat
+            materials[0] = mat
 
 
 #===============================================================================
 # GEOMETRY VALIDATION (Pre-flight)
 #===============================================================================
 
-def validate_object_geometry(obj_data: Dict, building_envelope: Dict) -> List[str]:
-    """
-    Validate object geometry before import
-    
-    Checks:
-        1. Position within building bounds
-        2. Reasonable dimensions
-        3. Valid rotation values
-        4. Required fields present
-    
-    Args:
-        obj_data: Object data from JSON
-        building_envelope: Building bounds
-        
-    Returns:
-        List of warning/error messages
-    """
-    issues = []
-    name = obj_data.get('name', 'unnamed')
-    
-    # Check position
-    pos = obj_data.get('position', [0, 0, 0])
-    if len(pos) != 3:
-        issues.append(f"Invalid position format: {pos}")
-        return issues
-    
-    x, y, z = pos
-    
-    # Check bounds (with margin for porch, etc.)
-    margin = 5.0
-    x_min = building_envelope.get('x_min', 0) - margin
-    x_max = building_envelope.get('x_max', 20) + margin
-    y_min = building_envelope.get('y_min', 0) - margin
-    y_max = building_envelope.get('y_max', 20) + margin
-    
-    if not (x_min <= x <= x_max):
-        issues.append(f"X position {x:.2f} outside bounds [{x_min:.2f}, {x_max:.2f}]")
-    if not (y_min <= y <= y_max):
-        issues.append(f"Y position {y:.2f} outside bounds [{y_min:.2f}, {y_max:.2f}]")
-    if z < -1.0 or z > 10.0:
-        issues.append(f"Z position {z:.2f} unusual (expected 0-10m)")
-    
-    # Check rotation
-    orientation = obj_data.get('orientation', 0)
-    if not isinstance(orientation, (int, float)):
-        issues.append(f"Invalid orientation type: {type(orientation)}")
-    elif orientation < 0 or orientation > 360:
-        issues.append(f"Orientation {orientation}° outside 0-360 range")
-    
-    # Check for walls with end_point
-    if 'wall' in obj_data.get('object_type', '').lower():
-        if 'end_point' not in obj_data:
-            issues.append("Wall missing end_point")
-        else:
-            end = obj_data['end_point']
-            if len(end) != 3:
-                issues.append(f"Invalid end_point format: {end}")
-            else:
-                # Check wall length
-                length = math.sqrt((end[0]-x)**2 + (end[1]-y)**2 + (end[2]-z)**2)
-                if length < 0.1:
-                    issues.append(f"Wall too short: {length:.3f}m")
-                if length > 20.0:
-                    issues.append(f"Wall unusually long: {length:.2f}m")
-    
-    return issues
-
-
 def preflight_validation(data: Dict) -> Tuple[bool, Dict]:
     """
     Run pre-flight validation on all objects
     
+    Same checks as preflight.validate_object_geometry, run over all objects in one
+    NumPy pass (see preflight.py).
+    
     Args:
         data: Full JSON data
         
@@ -406,35 +299,19 @@ def preflight_validation(data: Dict) -> Tuple[bool, Dict]:
     objects = data.get('objects', [])
     envelope = data.get('building_envelope', {})
     
+    result = preflight_scan(objects, envelope)
+    LOG.geometry_batch((name, issue) for name, issues in result.issues for issue in issues)
+    
     stats = {
-        'total': len(objects),
-        'valid': 0,
-        'warnings': 0,
+        'total': result.total,
+        'valid': result.valid,
+        'warnings': result.warning_count,
         'errors': 0,
-        'by_discipline': {},
-        'by_group': {},
+        'by_discipline': result.by_discipline,
+        'by_group': result.by_group,
         'missing_geometry_types': set()
     }
     
-    for obj_data in objects:
-        name = obj_data.get('name', 'unnamed')
-        discipline = obj_data.get('discipline', 'UNKNOWN')
-        group = obj_data.get('group', 'Other')
-        
-        # Count by category
-        stats['by_discipline'][discipline] = stats['by_discipline'].get(discipline, 0) + 1
-        stats['by_group'][group] = stats['by_group'].get(group, 0) + 1
-        
-        # Validate geometry
-        issues = validate_object_geometry(obj_data, envelope)
-        
-        if issues:
-            for issue in issues:
-                LOG.geometry(name, issue)
-            stats['warnings'] += len(issues)
-        else:
-            stats['valid'] += 1
-    
     # Report statistics
     LOG.subsection("Object Distribution")
     print(f"   Total objects: {stats['total']}")
@@ -471,7 +348,7 @@ def create_mesh_from_geometry(name: str, geometry_data: Dict,
     Returns:
         bpy.types.Mesh object
     """
-    vertices = geometry_data['vertices'].copy()
+    vertices = geometry_data['vertices']
     faces = geometry_data['faces']
     
     # Debug: Log geometry stats
@@ -484,64 +361,18 @@ def create_mesh_from_geometry(name: str, geometry_data: Dict,
     if len(faces) == 0:
         LOG.warn(f"Mesh '{name}' has no faces (point cloud?)")
     
-    # Apply base rotation if needed
+    # Base rotation is baked into the vertex buffer by the builder
     if any(r != 0.0 for r in base_rotation):
         LOG.log(f"   Applying base rotation: ({math.degrees(base_rotation[0]):.0f}°, "
                 f"{math.degrees(base_rotation[1]):.0f}°, {math.degrees(base_rotation[2]):.0f}°)")
-        vertices = apply_rotation_to_vertices(vertices, base_rotation)
     
-    # Create mesh
-    mesh = bpy.data.meshes.new(name=f"{name}_mesh")
-    verts = [tuple(v) for v in vertices]
-    face_indices = [tuple(f) for f in faces]
-    
-    mesh.from_pydata(verts, [], face_indices)
-    mesh.update()
-    mesh.validate()
-    
-    # Debug: Verify mesh dimensions
-    if mesh.vertices:
-        xs = [v.co.x for v in mesh.vertices]
-        ys = [v.co.y for v in mesh.vertices]
-        zs = [v.co.z for v in mesh.vertices]
-        
-        dims = (max(xs)-min(xs), max(ys)-min(ys), max(zs)-min(zs))
-        
-        # Flag unusual dimensions
-        if max(dims) > MAX_OBJECT_DIMENSION:
-            LOG.geometry(name, f"Very large: {dims[0]:.2f} x {dims[1]:.2f} x {dims[2]:.2f}m")
-        if max(dims) < MIN_OBJECT_DIMENSION and max(dims) > 0:
-            LOG.geometry(name, f"Very small: {dims[0]:.4f} x {dims[1]:.4f} x {dims[2]:.4f}m")
+    # Create mesh (foreach_set bulk write); dimension sanity is checked once
+    # per object_type by check_library_geometries before import
+    mesh, _ = build_mesh(MESH_BACKEND, f"{name}_mesh", vertices, faces, base_rotation)
     
     return mesh
 
 
-def apply_rotation_to_vertices(vertices: List, rotation: Tuple[float, float, float]) -> List:
-    """Apply rotation to vertices using numpy"""
-    verts_array = np.array(vertices)
-    rx, ry, rz = rotation
-    
-    # X-axis rotation
-    if rx != 0.0:
-        c, s = math.cos(rx), math.sin(rx)
-        rot = np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
-        verts_array = verts_array @ rot.T
-    
-    # Y-axis rotation
-    if ry != 0.0:
-        c, s = math.cos(ry), math.sin(ry)
-        rot = np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
-        verts_array = verts_array @ rot.T
-    
-    # Z-axis rotation
-    if rz != 0.0:
-        c, s = math.cos(rz), math.sin(rz)
-        rot = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
-        verts_array = verts_array @ rot.T
-    
-    return verts_array.tolist()
-
-
 def create_geometry_from_bounding_box(name: str, position: List, bounding_box: Dict,
                                       facing: str = '+Z', pivot: str = 'center') -> bpy.types.Object:
     """
@@ -711,156 +542,111 @@ def create_wall_geometry(name: str, position: List, end_point: List,
     return obj
 
 
-def create_object_from_geometry(name: str, geometry_data: Dict, obj_data: Dict) -> Optional[bpy.types.Object]:
+def execute_scene_plan(plan: ScenePlan, geometries: Dict, collections: Dict,
+                       mesh_cache: MeshInstanceCache, stats: Dict,
+                       indices: Optional[List[int]] = None) -> Dict:
     """
-    Create Blender object from geometry data
-    
-    Handles:
-        - Regular objects (from database geometry)
-        - Walls (from position + end_point)
-        - Scaled objects (gutters, etc.)
-    
+    Create Blender objects from a compiled ScenePlan
+
+    Materials and target collections are resolved once per table entry;
+    the per-object loop only creates the object, sets its transform,
+    writes its custom properties in one batch and links it - no name
+    lookups into bpy.data.
+
     Args:
-        name: Object name
-        geometry_data: Geometry from database (or None for walls)
-        obj_data: Full object data from JSON
-        
+        plan: Compiled plan (see scene_plan.compile_scene_plan)
+        geometries: {object_type: geometry dict} the plan was compiled from
+        collections: Collection hierarchy dict
+        mesh_cache: Shared meshes per (object_type, base_rotation)
+        stats: Import statistics dict (updated in place)
+        indices: Plan objects to create (None = all; sync passes only changed ones)
+
     Returns:
-        Blender object or None if failed
+        stats
     """
-    obj_type = obj_data.get('object_type', '')
-    position = obj_data.get('position', [0, 0, 0])
-    orientation = obj_data.get('orientation', 0.0)
-    
-    # PER BIM5D SPEC: ALL objects MUST have database geometry - no procedural fallbacks allowed!
-
-    # Mandatory geometry check
-    if not geometry_data:
-        LOG.error(f"⛔ MISSING DATABASE GEOMETRY: '{name}' ({obj_type})")
-        LOG.error(f"   Position: {position}")
-        LOG.error(f"   BIM5D spec requires: ALL object_types must exist in Ifc_Object_Library.db")
-        LOG.error(f"")
-        LOG.error(f"   FIX REQUIRED:")
-        LOG.error(f"   1. Add '{obj_type}' to object_catalog table")
-        LOG.error(f"   2. Add corresponding geometry to base_geometries table")
-        LOG.error(f"   3. Or update JSON to use existing object_type from database")
-        raise RuntimeError(f"Missing database geometry for '{obj_type}' - database must be fixed")
-
-    # Linear objects (walls, roofs, gutters): position → end_point
-    if 'end_point' in obj_data:
-        # DATABASE GEOMETRY EXISTS - IMPLEMENT LINEAR PLACEMENT!
-        geo_dims = geometry_data.get('dimensions', {})
-        geo_meta = geometry_data.get('metadata', {})
-        LOG.error(f"⛔ LINEAR OBJECT NOT YET IMPLEMENTED: '{name}'")
-        LOG.error(f"   Object type: {obj_type}")
-        LOG.error(f"   Database has: {geo_meta.get('vertex_count', 0)} verts, {geo_meta.get('face_count', 0)} faces")
-        LOG.error(f"   Database dims: {geo_dims}")
-        LOG.error(f"   Position: {position} → End: {obj_data['end_point']}")
-        LOG.error(f"")
-        LOG.error(f"   IMPLEMENTATION NEEDED: Linear placement for database geometry")
-        LOG.error(f"   - Fetch geometry from database ✓ (already done)")
-        LOG.error(f"   - Calculate object length from position→end_point")
-        LOG.error(f"   - Scale geometry along length axis")
-        LOG.error(f"   - Rotate to align with position→end_point vector")
-        LOG.error(f"   - Position at midpoint or start point based on pivot")
-        raise RuntimeError(f"Linear placement not implemented for '{obj_type}' - must use database geometry with linear transform")
-    
-    # Get base rotation from geometry (inherent orientation)
-    base_rotation = geometry_data.get('base_rotation', (0.0, 0.0, 0.0))
-    
-    # Create mesh
-    mesh = create_mesh_from_geometry(name, geometry_data, base_rotation)
-    if not mesh:
-        return None
-    
-    # Create object
-    obj = bpy.data.objects.new(name, mesh)
-    
-    # Position
-    obj.location = (position[0], position[1], position[2])
-    
-    # Rotation (Z-axis only, base already applied to vertices)
-    if orientation != 0:
-        obj.rotation_euler = Euler((0, 0, math.radians(orientation)), 'XYZ')
-    
-    # Scale for objects with length parameter (gutters, etc.)
-    if 'length' in obj_data:
-        geo_dims = geometry_data.get('dimensions', {})
-        base_width = geo_dims.get('width', 1.0)
-        if base_width > 0:
-            scale_x = obj_data['length'] / base_width
-            obj.scale = (scale_x, 1.0, 1.0)
-
-    # Scale for objects with dimensions dict (slabs, roofs, etc.)
-    elif 'dimensions' in obj_data and geometry_data:
-        target_dims = obj_data['dimensions']
-        geo_dims = geometry_data.get('dimensions', {})
-
-        # Handle both dict and list formats for dimensions
-        if isinstance(target_dims, list):
-            # List format: [length, width, thickness]
-            target_length = target_dims[0] if len(target_dims) > 0 else None
-            target_width = target_dims[1] if len(target_dims) > 1 else None
-            target_thickness = target_dims[2] if len(target_dims) > 2 else None
-        elif isinstance(target_dims, dict):
-            # Dict format: {"length": 9.7, "width": 7.0, "thickness": 0.15}
-            target_length = target_dims.get('length', target_dims.get('width', None))
-            target_width = target_dims.get('width', target_dims.get('depth', None))
-            target_thickness = target_dims.get('thickness', target_dims.get('height', None))
-        else:
-            LOG.warn(f"Unknown dimensions format for {name}: {type(target_dims)}")
-            return obj
-
-        # Get base dimensions from database geometry
-        # Note: Geometry may have 90° Y rotation applied, swapping X/Z axes
-        base_width_db = geo_dims.get('width', 1.0)
-        base_depth_db = geo_dims.get('depth', 1.0)
-        base_height_db = geo_dims.get('height', 1.0)
-
-        # Check for base rotation to determine axis mapping
-        base_rotation = geometry_data.get('base_rotation', (0.0, 0.0, 0.0))
-        has_y_rotation = abs(base_rotation[1]) > 0.1  # 90° Y rotation?
-
-        if has_y_rotation:
-            # After 90° Y rotation: X←height, Y←depth, Z←width
-            # Target: length(9.7m) × width(7.0m) × thickness(0.15m)
-            # Maps to: Z × Y × X in rotated mesh
-            scale_x = target_thickness / base_height_db if target_thickness and base_height_db > 0 else 1.0
-            scale_y = target_width / base_depth_db if target_width and base_depth_db > 0 else 1.0
-            scale_z = target_length / base_width_db if target_length and base_width_db > 0 else 1.0
-        else:
-            # No rotation: Standard mapping
-            scale_x = target_length / base_width_db if target_length and base_width_db > 0 else 1.0
-            scale_y = target_width / base_depth_db if target_width and base_depth_db > 0 else 1.0
-            scale_z = target_thickness / base_height_db if target_thickness and base_height_db > 0 else 1.0
+    # Per-import caches: one bpy.data lookup per discipline / collection key
+    materials = [get_discipline_material(discipline) for discipline in plan.material_keys]
+    targets = [resolve_collection(collections, key) for key in plan.collection_keys]
+    locations, rotations_z, scales = plan.decompose()
+    scaled = np.any(np.abs(scales - 1.0) > 1e-6, axis=1)
+    keys, hashes = plan.object_keys(), plan.content_hashes()
+    if indices is None:
+        indices = range(len(plan))
+
+    for done, i in enumerate(indices, 1):
+        name = plan.names[i]
+        obj_type, base_rotation = plan.mesh_keys[plan.mesh_ids[i]]
+        mesh = mesh_cache.get(obj_type, geometries[obj_type], base_rotation, name=name)
+        if not mesh:
+            stats['skipped'] += 1
+            continue
+
+        obj = bpy.data.objects.new(name, mesh)
+        obj.location = tuple(locations[i])
+        if rotations_z[i] != 0:
+            obj.rotation_euler = Euler((0, 0, float(rotations_z[i])), 'XYZ')
+        if scaled[i]:
+            obj.scale = tuple(scales[i])
 
-        obj.scale = (scale_x, scale_y, scale_z)
-        LOG.log(f"   Scaled {name}: ({scale_x:.2f}, {scale_y:.2f}, {scale_z:.2f}) to match {target_length}m × {target_width}m × {target_thickness}m")
+        props = plan.properties[i]
+        set_id_properties(obj, props, {PLAN_KEY_PROP: keys[i], PLAN_HASH_PROP: hashes[i]})
 
-    # Scale for objects with bounding_box (furniture, fixtures, etc.)
-    elif 'bounding_box' in obj_data and geometry_data:
-        bb = obj_data['bounding_box']
-        geo_dims = geometry_data.get('dimensions', {})
+        assign_material(obj, materials[plan.material_ids[i]])
+        targets[plan.collection_ids[i]].objects.link(obj)
+
+        # Update stats
+        stats['placed'] += 1
+        discipline, group = props['discipline'], props['group']
+        stats['by_discipline'][discipline] = stats['by_discipline'].get(discipline, 0) + 1
+        stats['by_group'][group] = stats['by_group'].get(group, 0) + 1
 
-        # Get database geometry native dimensions
-        base_width = geo_dims.get('width', geo_dims.get('length', 1.0))
-        base_depth = geo_dims.get('depth', geo_dims.get('width', 1.0))
-        base_height = geo_dims.get('height', 1.0)
+        # Progress
+        if done % 20 == 0:
+            LOG.log(f"Progress: {done}/{len(indices)} ({stats['placed']} placed)")
 
-        # Get target dimensions from bounding_box
-        target_length = bb.get('length', 1.0)
-        target_width = bb.get('width', 1.0)
-        target_height = bb.get('height', 1.0)
+    # Tag shared meshes so a later sync can reuse them
+    if mesh_cache.enabled:
+        for mesh_id, (obj_type, base_rotation) in enumerate(plan.mesh_keys):
+            mesh = mesh_cache.meshes.get(instance_key(obj_type, base_rotation))
+            if mesh:
+                mesh[PLAN_MESH_PROP] = plan.mesh_signature(mesh_id)
 
-        # Calculate scale factors
-        scale_x = target_length / base_width if base_width > 0 else 1.0
-        scale_y = target_width / base_depth if base_depth > 0 else 1.0
-        scale_z = target_height / base_height if base_height > 0 else 1.0
+    return stats
 
-        obj.scale = (scale_x, scale_y, scale_z)
-        LOG.log(f"   Scaled {name} from bbox: ({scale_x:.2f}, {scale_y:.2f}, {scale_z:.2f}) to match {target_length:.2f}m × {target_width:.2f}m × {target_height:.2f}m")
 
-    return obj
+def prepare_scene_sync(plan: ScenePlan, mesh_cache: MeshInstanceCache) -> SceneDiff:
+    """
+    Diff plan against plan-managed objects in the open .blend
+
+    Removes objects that are gone or changed, then offers the remaining
+    tagged meshes to mesh_cache so unchanged geometry is not rebuilt.
+
+    Returns:
+        SceneDiff (create diff.changed afterwards)
+    """
+    LOG.subsection("Syncing with Existing Scene")
+    managed = {obj[PLAN_KEY_PROP]: obj for obj in bpy.data.objects if obj.get(PLAN_KEY_PROP) is not None}
+    diff = diff_scene(plan, {key: obj.get(PLAN_HASH_PROP, '') for key, obj in managed.items()})
+    LOG.log(f"Diff: {diff.summary()}")
+    
+    keys = plan.object_keys()
+    stale = diff.removed + [keys[i] for i in diff.updated]
+    for key in stale:
+        bpy.data.objects.remove(managed[key], do_unlink=True)
+    
+    # Drop tagged meshes nothing uses any more, reuse the rest
+    signatures = {plan.mesh_signature(m): m for m in range(len(plan.mesh_keys))}
+    for mesh in list(bpy.data.meshes):
+        signature = mesh.get(PLAN_MESH_PROP)
+        if signature is None:
+            continue
+        if mesh.users == 0 and signature not in signatures:
+            bpy.data.meshes.remove(mesh)
+        elif signature in signatures and mesh_cache.enabled:
+            obj_type, base_rotation = plan.mesh_keys[signatures[signature]]
+            mesh_cache.adopt(obj_type, base_rotation, mesh)
+    
+    return diff
 
 
 #===============================================================================
@@ -881,13 +667,17 @@ def clear_scene():
     LOG.log("Scene cleared")
 
 
-def import_lod300_geometry(json_file: str, database_path: str) -> Dict:
+def import_lod300_geometry(json_file: str, database_path: str, instancing: bool = True,
+                           sync: bool = False) -> Dict:
     """
     Main import function with full IFC organization
     
     Args:
         json_file: Path to extraction output JSON
         database_path: Path to Ifc_Object_Library.db
+        instancing: Share one mesh per (object_type, base_rotation)
+        sync: Update the open .blend in place (only added/changed/removed
+              objects) instead of clearing the scene
         
     Returns:
         Import statistics dict
@@ -896,9 +686,8 @@ def import_lod300_geometry(json_file: str, database_path: str) -> Dict:
     LOG.log(f"Input JSON: {json_file}")
     LOG.log(f"Database: {database_path}")
     
-    # Load JSON
-    with open(json_file) as f:
-        data = json.load(f)
+    # Load JSON (header now, objects streamed from disk on each pass)
+    data = read_final_json(json_file)
     
     objects = data.get('objects', [])
     summary = data.get('summary', {})
@@ -926,10 +715,16 @@ def import_lod300_geometry(json_file: str, database_path: str) -> Dict:
     
     if os.path.exists(database_path):
         try:
+            # GATE 4 library report (validated once per library version): corrupted blobs are not meshed
+            corrupted = set(check_object_types(object_types, database_path).corrupted)
+            for obj_type in sorted(corrupted):
+                LOG.geometry(obj_type, "Corrupted library geometry (blob size != vertex/face count) - skipped")
             fetcher = DatabaseGeometryFetcher(database_path)
-            geometries = fetcher.fetch_all_geometries(object_types)
+            geometries = fetcher.fetch_all_geometries([t for t in object_types if t not in corrupted])
             fetcher.close()
             LOG.log(f"Fetched {len(geometries)} geometries from database")
+            for obj_type, issue in check_library_geometries(geometries):
+                LOG.geometry(obj_type, issue)
         except Exception as e:
             LOG.error(f"Database error: {e}")
     else:
@@ -949,8 +744,9 @@ def import_lod300_geometry(json_file: str, database_path: str) -> Dict:
         if len(missing_types) > 10:
             LOG.log(f"   ... and {len(missing_types) - 10} more")
     
-    # Clear scene and create collections
-    clear_scene()
+    # Clear scene (full import) and create collections
+    if not sync:
+        clear_scene()
     collections = create_discipline_collections()
     
     # Import statistics
@@ -964,60 +760,44 @@ def import_lod300_geometry(json_file: str, database_path: str) -> Dict:
         'errors': []
     }
     
-    # Create objects
-    LOG.section("CREATING OBJECTS IN BLENDER")
+    # Compile scene plan (no bpy), then create objects from it
+    plan = compile_scene_plan(data, geometries)
+    LOG.log(f"Scene plan: {plan.summary()}")
+    for name, obj_type, message in plan.warnings:
+        LOG.warn(f"{message} ({name})")
+    for name, obj_type, message in plan.errors:
+        LOG.error(f"Failed to create {name}: {message}")
+        stats['errors'].append((name, message))
+    stats['skipped'] += len(plan.errors)
+    if any(obj_type not in geometries for _, obj_type, _ in plan.errors):
+        LOG.error("⛔ MISSING DATABASE GEOMETRY - BIM5D spec requires ALL object_types in Ifc_Object_Library.db")
+        LOG.error("   FIX REQUIRED: add them to object_catalog + base_geometries, or use existing object_types")
+    
+    mesh_cache = MeshInstanceCache(create_mesh_from_geometry, enabled=instancing)
+    indices = None
+    if sync:
+        diff = prepare_scene_sync(plan, mesh_cache)
+        indices = diff.changed
+        stats['sync'] = diff._asdict()
+        # Unchanged objects stay in the scene and count as placed
+        for i in diff.unchanged:
+            props = plan.properties[i]
+            stats['placed'] += 1
+            stats['by_discipline'][props['discipline']] = stats['by_discipline'].get(props['discipline'], 0) + 1
+            stats['by_group'][props['group']] = stats['by_group'].get(props['group'], 0) + 1
     
-    for i, obj_data in enumerate(objects, 1):
-        name = obj_data.get('name', f'object_{i}')
-        obj_type = obj_data.get('object_type', '')
-        discipline = obj_data.get('discipline', 'UNKNOWN')
-        group = obj_data.get('group', 'Other')
-        
-        try:
-            # Get geometry (None for walls, they're created procedurally)
-            geometry = geometries.get(obj_type)
-            
-            # Create object
-            obj = create_object_from_geometry(name, geometry, obj_data)
-            
-            if obj:
-                # Assign IFC properties
-                assign_ifc_properties(obj, obj_data)
-                
-                # Set color by discipline
-                set_object_color_by_discipline(obj, discipline)
-                
-                # Link to appropriate collection
-                target_collection = get_collection_for_object(collections, obj_data)
-                
-                # Unlink from default collection if linked there
-                if obj.name in bpy.context.scene.collection.objects:
-                    bpy.context.scene.collection.objects.unlink(obj)
-                
-                # Link to target collection
-                target_collection.objects.link(obj)
-                
-                # Update stats
-                stats['placed'] += 1
-                stats['by_discipline'][discipline] = stats['by_discipline'].get(discipline, 0) + 1
-                stats['by_group'][group] = stats['by_group'].get(group, 0) + 1
-            else:
-                stats['skipped'] += 1
-                
-        except Exception as e:
-            LOG.error(f"Failed to create {name}: {e}")
-            stats['errors'].append((name, str(e)))
-            stats['skipped'] += 1
-        
-        # Progress
-        if i % 20 == 0:
-            LOG.log(f"Progress: {i}/{len(objects)} ({stats['placed']} placed)")
+    LOG.section("CREATING OBJECTS IN BLENDER")
+    execute_scene_plan(plan, geometries, collections, mesh_cache, stats, indices)
     
     # Final report
     LOG.section("IMPORT COMPLETE")
     print(f"   Total objects: {stats['total']}")
     print(f"   Placed: {stats['placed']}")
     print(f"   Skipped: {stats['skipped']}")
+    print(f"   Meshes: {mesh_cache.summary()}")
+    if sync:
+        print(f"   Sync: {diff.summary()}")
+    stats['unique_meshes'] = mesh_cache.unique_meshes
     
     print(f"\n   By Discipline:")
     for disc, count in sorted(stats['by_discipline'].items()):
@@ -1051,15 +831,26 @@ if __name__ == "__main__":
     # Blender arguments come after "--"
     if "--" in argv:
         argv = argv[argv.index("--") + 1:]
+
+    instancing = "--unique-meshes" not in argv
+    sync = "--sync" in argv
+    argv = [a for a in argv if a not in ("--unique-meshes", "--sync")]
     
     if len(argv) < 2:
         print("""
-Usage: blender --python blender_lod300_import_v2.py -- <input.json> <database.db> [output.blend]
+Usage: blender --python blender_lod300_import_v2.py -- <input.json> <database.db> [output.blend] [--unique-meshes] [--sync]
 
 Arguments:
     input.json      Extraction output JSON file
     database.db     Path to Ifc_Object_Library.db
     output.blend    Output Blender file (optional, default: output.blend)
+    --unique-meshes One mesh datablock per object (default: shared per object_type)
+    --sync          Update objects of a previous import in the opened .blend
+                    (only added/changed/removed ones) instead of clearing it
+
+Incremental re-import:
+    blender terrace_house.blend --python blender_lod300_import_v2.py -- \\
+        <input.json> <database.db> terrace_house.blend --sync
 
 Example:
     blender --python blender_lod300_import_v2.py -- \\
@@ -1074,7 +865,7 @@ Example:
     output_file = argv[2] if len(argv) > 2 else 'output.blend'
     
     # Run import
-    stats = import_lod300_geometry(json_file, database_path)
+    stats = import_lod300_geometry(json_file, database_path, instancing=instancing, sync=sync)
     
     if stats.get('success', False):
         # Save Blender file
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Mesh Builder - Bulk mesh construction from library buffers
+
+Replaces from_pydata tuple lists with flat NumPy buffers written through
+foreach_set:
+
+    vertices.foreach_set('co', float32[3V])
+    loops.foreach_set('vertex_index', int32[3F])
+    polygons.foreach_set('loop_start', int32[F])
+
+All NumPy work (base rotation, flattening, bounds) happens in
+prepare_mesh_buffers(); the Blender side is a thin MeshBackend adapter so a
+fake backend can exercise and benchmark the same path without Blender.
+
+Usage:
+    backend = BlenderMeshBackend(bpy)
+    mesh, buffers = build_mesh(backend, "door_single_900_lod300",
+                               geometry['vertices'], geometry['faces'],
+                               geometry.get('base_rotation', (0, 0, 0)))
+    print(buffers.dimensions)
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Tuple
+import numpy as np
+
+
+class MeshBuffers(NamedTuple):
+    """Flat, Blender-ready arrays for one triangle mesh"""
+    co: np.ndarray              # float32 (3V,) vertex coordinates
+    vertex_index: np.ndarray    # int32 (3F,) loop → vertex
+    loop_start: np.ndarray      # int32 (F,) first loop of each triangle
+    loop_total: np.ndarray      # int32 (F,) always 3
+    bounds_min: np.ndarray      # float64 (3,)
+    bounds_max: np.ndarray      # float64 (3,)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.co) // 3
+
+    @property
+    def face_count(self) -> int:
+        return len(self.loop_start)
+
+    @property
+    def dimensions(self) -> Tuple[float, float, float]:
+        """(x, y, z) extent in meters, computed on the NumPy side"""
+        dims = self.bounds_max - self.bounds_min
+        return float(dims[0]), float(dims[1]), float(dims[2])
+
+
+def rotation_matrix(rotation: Tuple[float, float, float]) -> np.ndarray:
+    """
+    Combined XYZ rotation matrix
+
+    Same order as applying X, then Y, then Z rotation to the vertices.
+    """
+    rx, ry, rz = rotation
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    rot_x = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    rot_y = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rot_z = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return rot_z @ rot_y @ rot_x
+
+
+def prepare_mesh_buffers(vertices, faces, base_rotation=(0.0, 0.0, 0.0)) -> MeshBuffers:
+    """
+    Convert library vertices/faces into foreach_set buffers
+
+    Args:
+        vertices: (V, 3) array-like (float32 from the library, any float accepted)
+        faces: (F, 3) triangle indices
+        base_rotation: (rx, ry, rz) radians baked into the vertices
+
+    Returns:
+        MeshBuffers
+    """
+    verts = np.asarray(vertices).reshape(-1, 3)
+    if any(r != 0.0 for r in base_rotation):
+        verts = verts.astype(np.float64) @ rotation_matrix(base_rotation).T
+
+    co = np.ascontiguousarray(verts, dtype=np.float32).ravel()
+    vertex_index = np.ascontiguousarray(np.asarray(faces).reshape(-1, 3), dtype=np.int32).ravel()
+    face_count = len(vertex_index) // 3
+    loop_start = np.arange(0, 3 * face_count, 3, dtype=np.int32)
+    loop_total = np.full(face_count, 3, dtype=np.int32)
+
+    if len(verts):
+        bounds_min = verts.min(axis=0).astype(np.float64)
+        bounds_max = verts.max(axis=0).astype(np.float64)
+    else:
+        bounds_min = bounds_max = np.zeros(3)
+
+    return MeshBuffers(co, vertex_index, loop_start, loop_total, bounds_min, bounds_max)
+
+
+class MeshBackend(ABC):
+    """Adapter interface: where mesh datablocks come from and how buffers are written"""
+
+    @abstractmethod
+    def new_mesh(self, name: str):
+        pass
+
+    @abstractmethod
+    def fill_mesh(self, mesh, buffers: MeshBuffers):
+        pass
+
+
+class BlenderMeshBackend(MeshBackend):
+    """Writes buffers into bpy meshes with foreach_set"""
+
+    def __init__(self, bpy_module):
+        self.bpy = bpy_module
+
+    def new_mesh(self, name: str):
+        return self.bpy.data.meshes.new(name=name)
+
+    def fill_mesh(self, mesh, buffers: MeshBuffers):
+        mesh.vertices.add(buffers.vertex_count)
+        mesh.loops.add(len(buffers.vertex_index))
+        mesh.polygons.add(buffers.face_count)
+
+        mesh.vertices.foreach_set('co', buffers.co)
+        mesh.loops.foreach_set('vertex_index', buffers.vertex_index)
+        mesh.polygons.foreach_set('loop_start', buffers.loop_start)
+        try:
+            # Required before Blender 4.0, read-only (derived from loop_start) after
+            mesh.polygons.foreach_set('loop_total', buffers.loop_total)
+        except (AttributeError, TypeError):
+            pass
+
+        mesh.update(calc_edges=True)
+        mesh.validate()
+
+
+def build_mesh(backend: MeshBackend, name: str, vertices, faces,
+               base_rotation=(0.0, 0.0, 0.0)):
+    """
+    Create and fill one mesh datablock
+
+    Returns:
+        (mesh, MeshBuffers) - buffers carry the NumPy-side bounds
+    """
+    buffers = prepare_mesh_buffers(vertices, faces, base_rotation)
+    mesh = backend.new_mesh(name)
+    backend.fill_mesh(mesh, buffers)
+    return mesh, buffers
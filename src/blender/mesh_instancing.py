@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Mesh Instancing - Shared mesh datablocks per library object_type
+
+Placed objects of the same object_type (and base_rotation) reference one
+mesh datablock instead of each building their own. Position, orientation
+and scale stay on the object transform, so .blend size, import time and
+RAM scale with unique types rather than placed objects.
+
+No bpy import here: the cache only calls the mesh builder it is given, so
+it runs unchanged against a recording bpy stub.
+
+Usage:
+    cache = MeshInstanceCache(create_mesh_from_geometry)
+    mesh = cache.get(obj_type, geometry, base_rotation)
+    obj = bpy.data.objects.new(name, mesh)
+"""
+
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+def instance_key(object_type: str, base_rotation=(0.0, 0.0, 0.0)) -> Tuple[str, Tuple[float, float, float]]:
+    """
+    Cache key for a shared mesh
+
+    base_rotation is baked into the mesh vertices, so it is part of the key
+    (rounded to absorb float noise from the database).
+    """
+    return (object_type, tuple(round(float(r), 6) for r in base_rotation))
+
+
+class MeshInstanceCache:
+    """One mesh per (object_type, base_rotation), built on first request"""
+
+    def __init__(self, build_mesh: Callable[[str, Dict, Tuple], Any], enabled: bool = True):
+        """
+        Args:
+            build_mesh: (name, geometry_data, base_rotation) -> mesh or None,
+                        e.g. create_mesh_from_geometry
+            enabled: False = build a new mesh every call (legacy behaviour)
+        """
+        self.build_mesh = build_mesh
+        self.enabled = enabled
+        self.meshes: Dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, object_type: str, geometry_data: Dict, base_rotation=(0.0, 0.0, 0.0),
+            name: str = None):
+        """
+        Shared mesh for object_type, building it on first use
+
+        Args:
+            object_type: Library object_type (mesh is named after it)
+            geometry_data: Geometry dict from DatabaseGeometryFetcher
+            base_rotation: (rx, ry, rz) radians baked into the vertices
+            name: Mesh name when instancing is disabled (defaults to object_type)
+
+        Returns:
+            Mesh datablock (None if the builder rejected the geometry)
+        """
+        if not self.enabled:
+            self.misses += 1
+            return self.build_mesh(name or object_type, geometry_data, base_rotation)
+
+        key = instance_key(object_type, base_rotation)
+        if key in self.meshes:
+            self.hits += 1
+            return self.meshes[key]
+
+        self.misses += 1
+        mesh = self.build_mesh(object_type, geometry_data, base_rotation)
+        self.meshes[key] = mesh
+        return mesh
+
+    def adopt(self, object_type: str, base_rotation, mesh):
+        """Register an existing mesh (e.g. from a previous import) for reuse"""
+        self.meshes[instance_key(object_type, base_rotation)] = mesh
+
+    @property
+    def unique_meshes(self) -> int:
+        return self.misses
+
+    def summary(self) -> str:
+        """One-line report: unique meshes vs objects served"""
+        served = self.hits + self.misses
+        return f"{self.unique_meshes} mesh datablocks for {served} objects ({self.hits} shared)"
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Preflight - Pre-import geometry checks in one NumPy pass, without bpy
+
+validate_object_geometry() is the per-object reference check (envelope
+bounds, Z range, orientation, wall end_point/length). preflight_scan()
+applies the same rules to a whole FINAL objects list or stream at once:
+fields are gathered into columns in one pass, the bounds and length tests
+run as array expressions, and messages are only formatted for flagged
+objects.
+Objects whose fields are not plain numbers go through
+validate_object_geometry(), so results match it exactly.
+
+check_library_geometries() flags library meshes outside MIN/MAX_OBJECT_
+DIMENSION once per object_type instead of once per created mesh.
+
+Usage:
+    result = preflight_scan(data['objects'], data.get('building_envelope', {}))
+    for name, issues in result.issues: ...
+    for obj_type, issue in check_library_geometries(geometries): ...
+"""
+
+import math
+from collections import Counter
+from itertools import chain, islice, repeat
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+import numpy as np
+
+from mesh_builder import rotation_matrix
+
+
+# Object checks
+ENVELOPE_MARGIN = 5.0        # meters beyond the envelope (porch, etc.)
+Z_RANGE = (-1.0, 10.0)
+ORIENTATION_RANGE = (0, 360)
+WALL_LENGTH_RANGE = (0.1, 20.0)
+
+# Library mesh checks
+MAX_OBJECT_DIMENSION = 50.0  # meters - flag objects larger than this
+MIN_OBJECT_DIMENSION = 0.01  # meters - flag objects smaller than this
+
+# Streamed objects are read this many at a time; only their columns are kept
+SCAN_CHUNK = 10000
+
+_NUMBER = (int, float)
+_ARRAY_TYPES = {int, float, bool}   # isinstance(True, int): the scalar check treats bools as numbers
+_ORIGIN = [0, 0, 0]
+_MISSING = object()
+
+
+def envelope_bounds(building_envelope: Dict) -> Tuple[float, float, float, float]:
+    """(x_min, x_max, y_min, y_max) including ENVELOPE_MARGIN"""
+    return (building_envelope.get('x_min', 0) - ENVELOPE_MARGIN,
+            building_envelope.get('x_max', 20) + ENVELOPE_MARGIN,
+            building_envelope.get('y_min', 0) - ENVELOPE_MARGIN,
+            building_envelope.get('y_max', 20) + ENVELOPE_MARGIN)
+
+
+def validate_object_geometry(obj_data: Dict, building_envelope: Dict) -> List[str]:
+    """
+    Validate object geometry before import
+
+    Checks:
+        1. Position within building bounds
+        2. Reasonable dimensions
+        3. Valid rotation values
+        4. Required fields present
+
+    Args:
+        obj_data: Object data from JSON
+        building_envelope: Building bounds
+
+    Returns:
+        List of warning/error messages
+    """
+    issues = []
+
+    # Check position
+    pos = obj_data.get('position', [0, 0, 0])
+    if len(pos) != 3:
+        issues.append(f"Invalid position format: {pos}")
+        return issues
+
+    x, y, z = pos
+
+    # Check bounds (with margin for porch, etc.)
+    x_min, x_max, y_min, y_max = envelope_bounds(building_envelope)
+
+    if not (x_min <= x <= x_max):
+        issues.append(f"X position {x:.2f} outside bounds [{x_min:.2f}, {x_max:.2f}]")
+    if not (y_min <= y <= y_max):
+        issues.append(f"Y position {y:.2f} outside bounds [{y_min:.2f}, {y_max:.2f}]")
+    if z < Z_RANGE[0] or z > Z_RANGE[1]:
+        issues.append(f"Z position {z:.2f} unusual (expected 0-10m)")
+
+    # Check rotation
+    orientation = obj_data.get('orientation', 0)
+    if not isinstance(orientation, _NUMBER):
+        issues.append(f"Invalid orientation type: {type(orientation)}")
+    elif orientation < ORIENTATION_RANGE[0] or orientation > ORIENTATION_RANGE[1]:
+        issues.append(f"Orientation {orientation}° outside 0-360 range")
+
+    # Check for walls with end_point
+    if 'wall' in obj_data.get('object_type', '').lower():
+        if 'end_point' not in obj_data:
+            issues.append("Wall missing end_point")
+        else:
+            end = obj_data['end_point']
+            if len(end) != 3:
+                issues.append(f"Invalid end_point format: {end}")
+            else:
+                # Check wall length
+                length = math.sqrt((end[0]-x)**2 + (end[1]-y)**2 + (end[2]-z)**2)
+                if length < WALL_LENGTH_RANGE[0]:
+                    issues.append(f"Wall too short: {length:.3f}m")
+                if length > WALL_LENGTH_RANGE[1]:
+                    issues.append(f"Wall unusually long: {length:.2f}m")
+
+    return issues
+
+
+def _is_point(value) -> bool:
+    return type(value) is list and len(value) == 3 and all(type(v) in _ARRAY_TYPES for v in value)
+
+
+def _all_points(values: List) -> bool:
+    """Every value a list of 3 plain numbers (type checks run in C via map)"""
+    return (set(map(type, values)) <= {list} and set(map(len, values)) <= {3}
+            and set(map(type, chain.from_iterable(values))) <= _ARRAY_TYPES)
+
+
+def _column(objects: List[Dict], key: str, default) -> List:
+    """[obj.get(key, default) for obj in objects], looped in C"""
+    return list(map(dict.get, objects, repeat(key), repeat(default)))
+
+
+class _Columns:
+    """Fields preflight_scan reads, gathered in one pass over a list or stream"""
+
+    def __init__(self, objects: Iterable[Dict]):
+        self.names, self.positions, self.orientations, self.obj_types = [], [], [], []
+        self.by_discipline, self.by_group = Counter(), Counter()
+        self.walls, self.wall_ends = [], []     # row index and end_point (or _MISSING) of wall rows
+        self.raw_types = {}                     # row → non-str object_type (checked by the scalar path)
+        self._ends_by_row = None
+
+        if isinstance(objects, list):
+            chunks = [objects]
+        else:
+            stream = iter(objects)
+            chunks = iter(lambda: list(islice(stream, SCAN_CHUNK)), [])
+        for chunk in chunks:
+            self._add(chunk)
+
+    def _add(self, chunk: List[Dict]):
+        start = len(self.names)
+        self.names += _column(chunk, 'name', 'unnamed')
+        self.positions += _column(chunk, 'position', _ORIGIN)
+        self.orientations += _column(chunk, 'orientation', 0)
+        self.by_discipline.update(_column(chunk, 'discipline', 'UNKNOWN'))
+        self.by_group.update(_column(chunk, 'group', 'Other'))
+
+        obj_types = _column(chunk, 'object_type', '')
+        if not set(map(type, obj_types)) <= {str}:
+            self.raw_types.update((start + j, t) for j, t in enumerate(obj_types) if type(t) is not str)
+            obj_types = [t if type(t) is str else '' for t in obj_types]
+        self.obj_types += obj_types
+
+        wall_types = {obj_type for obj_type in set(obj_types) if 'wall' in obj_type.lower()}
+        walls = [j for j, obj_type in enumerate(obj_types) if obj_type in wall_types]
+        self.walls += [start + j for j in walls]
+        self.wall_ends += [chunk[j].get('end_point', _MISSING) for j in walls]
+
+    def row(self, i: int) -> Dict:
+        """The fields validate_object_geometry() reads, for one row"""
+        if self._ends_by_row is None:
+            self._ends_by_row = dict(zip(self.walls, self.wall_ends))
+        obj = {'name': self.names[i], 'position': self.positions[i], 'orientation': self.orientations[i],
+               'object_type': self.raw_types.get(i, self.obj_types[i])}
+        end = self._ends_by_row.get(i, _MISSING)
+        if end is not _MISSING:
+            obj['end_point'] = end
+        return obj
+
+
+class PreflightResult(NamedTuple):
+    total: int
+    by_discipline: Dict[str, int]
+    by_group: Dict[str, int]
+    issues: List[Tuple[str, List[str]]]     # (name, messages) in object order
+
+    @property
+    def valid(self) -> int:
+        return self.total - len(self.issues)
+
+    @property
+    def warning_count(self) -> int:
+        return sum(len(messages) for _, messages in self.issues)
+
+
+def preflight_scan(objects: Iterable[Dict], building_envelope: Dict) -> PreflightResult:
+    """
+    validate_object_geometry() over all objects, vectorised
+
+    A stream is read once, SCAN_CHUNK objects at a time, and only the
+    checked fields are kept - not the object dicts.
+
+    Args:
+        objects: FINAL objects (list or stream; iterated once)
+        building_envelope: Building bounds
+
+    Returns:
+        PreflightResult
+    """
+    columns = _Columns(objects)
+    total = len(columns.names)
+    names, positions, orientations = columns.names, columns.positions, columns.orientations
+    walls, wall_ends = columns.walls, columns.wall_ends
+
+    # Rows the array path cannot represent go through the scalar check
+    irregular = set(columns.raw_types)
+    if not _all_points(positions):
+        irregular.update(i for i, pos in enumerate(positions) if not _is_point(pos))
+    if not set(map(type, orientations)) <= _ARRAY_TYPES:
+        irregular.update(i for i, o in enumerate(orientations) if type(o) not in _ARRAY_TYPES)
+
+    present = [end for end in wall_ends if end is not _MISSING]
+    if not _all_points(present):
+        irregular.update(i for i, end in zip(walls, wall_ends) if end is not _MISSING and not _is_point(end))
+    if irregular:
+        kept = [(i, end) for i, end in zip(walls, wall_ends) if i not in irregular]
+        walls, wall_ends = [i for i, _ in kept], [end for _, end in kept]
+        positions, orientations = positions[:], orientations[:]
+        for i in irregular:
+            positions[i], orientations[i] = _ORIGIN, 0
+
+    P = np.fromiter(chain.from_iterable(positions), dtype=np.float64, count=3 * total).reshape(total, 3)
+    O = np.fromiter(orientations, dtype=np.float64, count=total)
+    x_min, x_max, y_min, y_max = envelope_bounds(building_envelope)
+
+    # One boolean column per check, in validate_object_geometry order
+    checks = np.zeros((7, total), dtype=bool)
+    checks[0] = ~((x_min <= P[:, 0]) & (P[:, 0] <= x_max))
+    checks[1] = ~((y_min <= P[:, 1]) & (P[:, 1] <= y_max))
+    checks[2] = (P[:, 2] < Z_RANGE[0]) | (P[:, 2] > Z_RANGE[1])
+    checks[3] = (O < ORIENTATION_RANGE[0]) | (O > ORIENTATION_RANGE[1])
+
+    wall_length = np.zeros(total)
+    if walls:
+        walls = np.array(walls)
+        missing = np.array([end is _MISSING for end in wall_ends])
+        ends = np.array([_ORIGIN if end is _MISSING else end for end in wall_ends], dtype=np.float64)
+        d = ends - P[walls]
+        length = np.sqrt(d[:, 0]**2 + d[:, 1]**2 + d[:, 2]**2)
+        present = walls[~missing]
+        checks[4, walls[missing]] = True
+        wall_length[present] = length[~missing]
+        checks[5, present] = length[~missing] < WALL_LENGTH_RANGE[0]
+        checks[6, present] = length[~missing] > WALL_LENGTH_RANGE[1]
+
+    if irregular:
+        checks[:, list(irregular)] = False
+
+    # Messages only for flagged rows, formatted from the original values,
+    # one check at a time so each object's messages keep the scalar order
+    x_bounds = f"[{x_min:.2f}, {x_max:.2f}]"
+    y_bounds = f"[{y_min:.2f}, {y_max:.2f}]"
+    wall_length = wall_length.tolist()
+    formats = (
+        lambda i: f"X position {positions[i][0]:.2f} outside bounds {x_bounds}",
+        lambda i: f"Y position {positions[i][1]:.2f} outside bounds {y_bounds}",
+        lambda i: f"Z position {positions[i][2]:.2f} unusual (expected 0-10m)",
+        lambda i: f"Orientation {orientations[i]}° outside 0-360 range",
+        lambda i: "Wall missing end_point",
+        lambda i: f"Wall too short: {wall_length[i]:.3f}m",
+        lambda i: f"Wall unusually long: {wall_length[i]:.2f}m",
+    )
+    issues = [None] * total
+    for check, format_message in zip(checks, formats):
+        for i in np.flatnonzero(check).tolist():
+            messages = issues[i]
+            if messages is None:
+                issues[i] = [format_message(i)]
+            else:
+                messages.append(format_message(i))
+
+    for i in irregular:
+        issues[i] = validate_object_geometry(columns.row(i), building_envelope)
+
+    return PreflightResult(total, dict(columns.by_discipline), dict(columns.by_group),
+                           [(name, messages) for name, messages in zip(names, issues) if messages])
+
+
+def library_mesh_dimensions(geometry_data: Dict, base_rotation=(0.0, 0.0, 0.0)) -> Tuple[float, float, float]:
+    """(x, y, z) extent of a library mesh after base_rotation (as built by mesh_builder)"""
+    verts = np.asarray(geometry_data['vertices']).reshape(-1, 3)
+    if not len(verts):
+        return 0.0, 0.0, 0.0
+    if any(r != 0.0 for r in base_rotation):
+        verts = verts.astype(np.float64) @ rotation_matrix(base_rotation).T
+    dims = verts.max(axis=0).astype(np.float64) - verts.min(axis=0).astype(np.float64)
+    return float(dims[0]), float(dims[1]), float(dims[2])
+
+
+def check_library_geometries(geometries: Dict[str, Dict]) -> List[Tuple[str, str]]:
+    """
+    Flag library meshes outside MIN/MAX_OBJECT_DIMENSION
+
+    Checked once per fetched object_type, however many objects use it.
+
+    Returns:
+        [(object_type, message), ...]
+    """
+    issues = []
+    for obj_type, geometry_data in geometries.items():
+        base_rotation = geometry_data.get('base_rotation', (0.0, 0.0, 0.0))
+        dims = library_mesh_dimensions(geometry_data, base_rotation)
+        if max(dims) > MAX_OBJECT_DIMENSION:
+            issues.append((obj_type, f"Very large: {dims[0]:.2f} x {dims[1]:.2f} x {dims[2]:.2f}m"))
+        if max(dims) < MIN_OBJECT_DIMENSION and max(dims) > 0:
+            issues.append((obj_type, f"Very small: {dims[0]:.4f} x {dims[1]:.4f} x {dims[2]:.4f}m"))
+    return issues
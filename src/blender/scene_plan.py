@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Scene Plan - Blender import compiled to flat arrays, without bpy
+
+Compiles a FINAL JSON plus fetched library geometry into a ScenePlan:
+
+    mesh table        (object_type, base_rotation) per unique mesh
+    objects           name, mesh id, N×4×4 float32 transform
+    collection ids    into a table of "DISCIPLINE/Group" keys
+    material ids      into a table of disciplines (one MAT_<discipline> each)
+    properties        IFC custom properties per object
+
+import_to_blender.py then applies the plan in one short loop. Because the
+plan is plain NumPy + Python it can be produced, cached (save/load .npz),
+compared and benchmarked on machines without Blender.
+
+Incremental sync:
+    Every object gets a stable key (name, #n suffix for repeats) and a
+    content hash of mesh, transform, collection, material and properties.
+    diff_scene() compares those against what an existing .blend carries
+    (custom properties _plan_key / _plan_hash) so only added, changed and
+    removed objects are touched. Meshes and collections are tagged too
+    (_plan_mesh, _plan_collection) so they are reused, not duplicated.
+
+Usage:
+    plan = compile_scene_plan(data, geometries)
+    plan.save("output_artifacts/house.plan.npz")
+    plan = ScenePlan.load("output_artifacts/house.plan.npz")
+    diff = diff_scene(plan, {key: hash for objects already in the .blend})
+"""
+
+import hashlib
+import json
+import math
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+
+
+# Outliner hierarchy: discipline → (collection name, groups)
+COLLECTION_HIERARCHY = {
+    'ARC': {
+        'name': 'ARC_Architecture',
+        'groups': ['Doors', 'Windows', 'Walls', 'Furniture', 'Bedroom', 'Kitchen', 'Bathroom']
+    },
+    'MEP': {
+        'name': 'MEP_Electrical',
+        'groups': ['Lighting', 'Electrical', 'Switches', 'Outlets', 'Fans']
+    },
+    'PLUM': {
+        'name': 'PLUM_Plumbing',
+        'groups': ['Fixtures', 'Drainage', 'Sanitary']
+    },
+    'STR': {
+        'name': 'STR_Structure',
+        'groups': ['Slabs', 'Roofs', 'Ceilings', 'Foundations']
+    },
+    'UNKNOWN': {
+        'name': 'UNKNOWN_Uncategorized',
+        'groups': ['Other']
+    }
+}
+
+NO_ROTATION = (0.0, 0.0, 0.0)
+
+# Custom properties that tie Blender datablocks back to a plan (hidden in UI: leading _)
+PLAN_KEY_PROP = '_plan_key'
+PLAN_HASH_PROP = '_plan_hash'
+PLAN_MESH_PROP = '_plan_mesh'
+PLAN_COLLECTION_PROP = '_plan_collection'
+
+
+#===============================================================================
+# PER-OBJECT RULES (shared with the direct import path)
+#===============================================================================
+
+def resolve_collection_key(discipline: str, group: str) -> str:
+    """
+    Collection key for an object: "DISCIPLINE/Group", else "DISCIPLINE", else "UNKNOWN"
+    """
+    config = COLLECTION_HIERARCHY.get(discipline)
+    if config is not None:
+        if group in config['groups']:
+            return f"{discipline}/{group}"
+        return discipline
+    return 'UNKNOWN'
+
+
+def ifc_properties(obj_data: Dict) -> Dict:
+    """
+    IFC custom properties for one object
+
+    'blender_name' is only present when the JSON sets it; the executor
+    falls back to the final Blender object name.
+    """
+    props = {
+        # Core IFC properties
+        'ifc_class': obj_data.get('ifc_class', 'IfcBuildingElement'),
+        'ifc_predefined_type': obj_data.get('ifc_predefined_type', 'NOTDEFINED'),
+        # Organization properties
+        'discipline': obj_data.get('discipline', 'UNKNOWN'),
+        'group': obj_data.get('group', 'Other'),
+        # Spatial properties
+        'room': obj_data.get('room', 'unknown'),
+        'room_id': obj_data.get('room_id', ''),
+        # Phase
+        'phase': obj_data.get('phase', obj_data.get('_phase', '')),
+        # Source tracking
+        'object_type': obj_data.get('object_type', ''),
+        'source': obj_data.get('source', obj_data.get('_generation_method', 'unknown')),
+    }
+    if 'blender_name' in obj_data:
+        props['blender_name'] = obj_data['blender_name']
+
+    # Dimensions if available
+    for key in ('width', 'height', 'length'):
+        if key in obj_data:
+            props[key] = obj_data[key]
+    return props
+
+
+def compute_object_scale(obj_data: Dict, geometry_data: Dict) -> Optional[Tuple[float, float, float]]:
+    """
+    Object scale that fits library geometry to the JSON size
+
+    Rules (first match wins):
+        length      → stretch X (gutters etc.)
+        dimensions  → list [length, width, thickness] or dict (slabs, roofs)
+        bounding_box → fit width/depth/height (furniture, fixtures)
+
+    Returns:
+        (sx, sy, sz) or None to keep (1, 1, 1)
+
+    Raises:
+        ValueError: dimensions in an unknown format
+    """
+    geo_dims = geometry_data.get('dimensions', {})
+
+    # Scale for objects with length parameter (gutters, etc.)
+    if 'length' in obj_data:
+        base_width = geo_dims.get('width', 1.0)
+        if base_width > 0:
+            return (obj_data['length'] / base_width, 1.0, 1.0)
+        return None
+
+    # Scale for objects with dimensions dict (slabs, roofs, etc.)
+    if 'dimensions' in obj_data:
+        target_dims = obj_data['dimensions']
+
+        # Handle both dict and list formats for dimensions
+        if isinstance(target_dims, list):
+            # List format: [length, width, thickness]
+            target_length = target_dims[0] if len(target_dims) > 0 else None
+            target_width = target_dims[1] if len(target_dims) > 1 else None
+            target_thickness = target_dims[2] if len(target_dims) > 2 else None
+        elif isinstance(target_dims, dict):
+            # Dict format: {"length": 9.7, "width": 7.0, "thickness": 0.15}
+            target_length = target_dims.get('length', target_dims.get('width', None))
+            target_width = target_dims.get('width', target_dims.get('depth', None))
+            target_thickness = target_dims.get('thickness', target_dims.get('height', None))
+        else:
+            raise ValueError(f"Unknown dimensions format: {type(target_dims)}")
+
+        # Get base dimensions from database geometry
+        # Note: Geometry may have 90° Y rotation applied, swapping X/Z axes
+        base_width_db = geo_dims.get('width', 1.0)
+        base_depth_db = geo_dims.get('depth', 1.0)
+        base_height_db = geo_dims.get('height', 1.0)
+
+        # Check for base rotation to determine axis mapping
+        base_rotation = geometry_data.get('base_rotation', NO_ROTATION)
+        has_y_rotation = abs(base_rotation[1]) > 0.1  # 90° Y rotation?
+
+        if has_y_rotation:
+            # After 90° Y rotation: X←height, Y←depth, Z←width
+            scale_x = target_thickness / base_height_db if target_thickness and base_height_db > 0 else 1.0
+            scale_y = target_width / base_depth_db if target_width and base_depth_db > 0 else 1.0
+            scale_z = target_length / base_width_db if target_length and base_width_db > 0 else 1.0
+        else:
+            # No rotation: Standard mapping
+            scale_x = target_length / base_width_db if target_length and base_width_db > 0 else 1.0
+            scale_y = target_width / base_depth_db if target_width and base_depth_db > 0 else 1.0
+            scale_z = target_thickness / base_height_db if target_thickness and base_height_db > 0 else 1.0
+        return (scale_x, scale_y, scale_z)
+
+    # Scale for objects with bounding_box (furniture, fixtures, etc.)
+    if 'bounding_box' in obj_data:
+        bb = obj_data['bounding_box']
+
+        # Get database geometry native dimensions
+        base_width = geo_dims.get('width', geo_dims.get('length', 1.0))
+        base_depth = geo_dims.get('depth', geo_dims.get('width', 1.0))
+        base_height = geo_dims.get('height', 1.0)
+
+        scale_x = bb.get('length', 1.0) / base_width if base_width > 0 else 1.0
+        scale_y = bb.get('width', 1.0) / base_depth if base_depth > 0 else 1.0
+        scale_z = bb.get('height', 1.0) / base_height if base_height > 0 else 1.0
+        return (scale_x, scale_y, scale_z)
+
+    return None
+
+
+def compose_transforms(locations: np.ndarray, rotations_z: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """
+    T · Rz · S for all objects at once
+
+    Args:
+        locations: (N, 3)
+        rotations_z: (N,) radians
+        scales: (N, 3)
+
+    Returns:
+        (N, 4, 4) float32
+    """
+    n = len(locations)
+    cos_r, sin_r = np.cos(rotations_z), np.sin(rotations_z)
+    transforms = np.zeros((n, 4, 4), dtype=np.float32)
+    transforms[:, 0, 0] = cos_r * scales[:, 0]
+    transforms[:, 0, 1] = -sin_r * scales[:, 1]
+    transforms[:, 1, 0] = sin_r * scales[:, 0]
+    transforms[:, 1, 1] = cos_r * scales[:, 1]
+    transforms[:, 2, 2] = scales[:, 2]
+    transforms[:, :3, 3] = locations
+    transforms[:, 3, 3] = 1.0
+    return transforms
+
+
+#===============================================================================
+# PLAN
+#===============================================================================
+
+class PlanIssue(NamedTuple):
+    """Object that could not be planned, or planned with a caveat"""
+    name: str
+    object_type: str
+    message: str
+
+
+class SceneDiff(NamedTuple):
+    """Plan vs existing scene (indices into the plan, keys of scene objects)"""
+    added: List[int]
+    updated: List[int]
+    unchanged: List[int]
+    removed: List[str]
+
+    @property
+    def changed(self) -> List[int]:
+        """Plan objects that must be (re)created"""
+        return sorted(self.added + self.updated)
+
+    def summary(self) -> str:
+        return (f"{len(self.added)} added, {len(self.updated)} updated, "
+                f"{len(self.removed)} removed, {len(self.unchanged)} unchanged")
+
+
+class ScenePlan:
+    """Flat, array-backed description of a Blender scene"""
+
+    def __init__(self, mesh_keys, names, mesh_ids, transforms, collection_keys, collection_ids,
+                 material_keys, material_ids, properties, errors=(), warnings=(), mesh_hashes=None):
+        self.mesh_keys: List[Tuple[str, Tuple[float, float, float]]] = [
+            (object_type, tuple(float(r) for r in rotation)) for object_type, rotation in mesh_keys]
+        # Library geometry_hash per mesh ('' if unknown) - part of the content hash
+        self.mesh_hashes: List[str] = list(mesh_hashes) if mesh_hashes is not None else [''] * len(self.mesh_keys)
+        self.names: List[str] = list(names)
+        self.mesh_ids = np.asarray(mesh_ids, dtype=np.int32)
+        self.transforms = np.asarray(transforms, dtype=np.float32).reshape(-1, 4, 4)
+        self.collection_keys: List[str] = list(collection_keys)
+        self.collection_ids = np.asarray(collection_ids, dtype=np.int32)
+        self.material_keys: List[str] = list(material_keys)
+        self.material_ids = np.asarray(material_ids, dtype=np.int32)
+        self.properties: List[Dict] = list(properties)
+        self.errors: List[PlanIssue] = [PlanIssue(*e) for e in errors]
+        self.warnings: List[PlanIssue] = [PlanIssue(*w) for w in warnings]
+
+    def __len__(self):
+        return len(self.names)
+
+    def decompose(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Split transforms back into object channels
+
+        Returns:
+            locations (N, 3), rotations_z (N,), scales (N, 3)
+        """
+        t = self.transforms.astype(np.float64)
+        locations = t[:, :3, 3]
+        scales = np.stack([np.hypot(t[:, 0, 0], t[:, 1, 0]),
+                           np.hypot(t[:, 0, 1], t[:, 1, 1]),
+                           t[:, 2, 2]], axis=1)
+        rotations_z = np.arctan2(t[:, 1, 0], t[:, 0, 0])
+        return locations, rotations_z, scales
+
+    def object_keys(self) -> List[str]:
+        """Stable per-object keys: name, then name#1, name#2... for repeated names"""
+        seen = {}
+        keys = []
+        for name in self.names:
+            n = seen.get(name, 0)
+            seen[name] = n + 1
+            keys.append(name if n == 0 else f"{name}#{n}")
+        return keys
+
+    def mesh_signature(self, mesh_id: int) -> str:
+        """Identity of a mesh datablock: object_type, base rotation, library geometry"""
+        object_type, rotation = self.mesh_keys[mesh_id]
+        return f"{object_type}|{','.join(f'{r:.6f}' for r in rotation)}|{self.mesh_hashes[mesh_id]}"
+
+    def content_hashes(self) -> List[str]:
+        """SHA1 per object over mesh, transform, collection, material and properties"""
+        signatures = [self.mesh_signature(m).encode('utf-8') for m in range(len(self.mesh_keys))]
+        hashes = []
+        for i, props in enumerate(self.properties):
+            h = hashlib.sha1(signatures[self.mesh_ids[i]])
+            h.update(self.transforms[i].tobytes())
+            h.update(self.collection_keys[self.collection_ids[i]].encode('utf-8'))
+            h.update(self.material_keys[self.material_ids[i]].encode('utf-8'))
+            h.update(json.dumps(props, sort_keys=True, default=str).encode('utf-8'))
+            hashes.append(h.hexdigest())
+        return hashes
+
+    def counts_by(self, prop: str) -> Dict[str, int]:
+        """Object counts per custom property value (e.g. 'discipline')"""
+        counts = {}
+        for props in self.properties:
+            value = props.get(prop)
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        return (f"{len(self)} objects, {len(self.mesh_keys)} meshes, "
+                f"{len(self.collection_keys)} collections, {len(self.material_keys)} materials, "
+                f"{len(self.errors)} errors")
+
+    def save(self, path):
+        """Write plan as .npz (arrays + JSON string tables)"""
+        tables = {
+            'mesh_keys': self.mesh_keys,
+            'mesh_hashes': self.mesh_hashes,
+            'names': self.names,
+            'collection_keys': self.collection_keys,
+            'material_keys': self.material_keys,
+            'properties': self.properties,
+            'errors': self.errors,
+            'warnings': self.warnings,
+        }
+        np.savez_compressed(
+            path,
+            mesh_ids=self.mesh_ids,
+            transforms=self.transforms,
+            collection_ids=self.collection_ids,
+            material_ids=self.material_ids,
+            tables=np.frombuffer(json.dumps(tables).encode('utf-8'), dtype=np.uint8),
+        )
+
+    @classmethod
+    def load(cls, path) -> 'ScenePlan':
+        """Read a plan written by save()"""
+        with np.load(path) as archive:
+            tables = json.loads(archive['tables'].tobytes().decode('utf-8'))
+            return cls(
+                mesh_keys=tables['mesh_keys'],
+                names=tables['names'],
+                mesh_ids=archive['mesh_ids'],
+                transforms=archive['transforms'],
+                collection_keys=tables['collection_keys'],
+                collection_ids=archive['collection_ids'],
+                material_keys=tables['material_keys'],
+                material_ids=archive['material_ids'],
+                properties=tables['properties'],
+                errors=tables['errors'],
+                warnings=tables['warnings'],
+                mesh_hashes=tables.get('mesh_hashes'),
+            )
+
+
+class _Table:
+    """Insertion-ordered value → id table"""
+
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def id(self, value) -> int:
+        i = self.ids.get(value)
+        if i is None:
+            i = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+
+def compile_scene_plan(data: Dict, geometries: Dict[str, Dict]) -> ScenePlan:
+    """
+    Compile FINAL JSON + library geometry into a ScenePlan
+
+    Same rules as the per-object importer: every object needs database
+    geometry, linear (end_point) objects are not placed yet, only the Z
+    orientation goes on the object (base_rotation is baked into the mesh).
+
+    Args:
+        data: FINAL JSON dict (uses 'objects')
+        geometries: {object_type: geometry dict} from DatabaseGeometryFetcher
+
+    Returns:
+        ScenePlan (unplaceable objects listed in plan.errors)
+    """
+    meshes, collections, materials = _Table(), _Table(), _Table()
+    mesh_hashes = []
+    names, mesh_ids, collection_ids, material_ids, properties = [], [], [], [], []
+    locations, rotations_z, scales = [], [], []
+    errors, warnings = [], []
+
+    for i, obj_data in enumerate(data.get('objects', []), 1):
+        name = obj_data.get('name', f'object_{i}')
+        obj_type = obj_data.get('object_type', '')
+        geometry = geometries.get(obj_type)
+
+        # PER BIM5D SPEC: ALL objects MUST have database geometry
+        if not geometry:
+            errors.append((name, obj_type, f"Missing database geometry for '{obj_type}' - database must be fixed"))
+            continue
+        if 'end_point' in obj_data:
+            errors.append((name, obj_type, f"Linear placement not implemented for '{obj_type}' - must use database geometry with linear transform"))
+            continue
+
+        try:
+            scale = compute_object_scale(obj_data, geometry)
+        except ValueError as e:
+            warnings.append((name, obj_type, str(e)))
+            scale = None
+
+        position = obj_data.get('position', [0, 0, 0])
+        discipline = obj_data.get('discipline', 'UNKNOWN')
+        base_rotation = tuple(float(r) for r in geometry.get('base_rotation', NO_ROTATION))
+
+        mesh_id = meshes.id((obj_type, base_rotation))
+        if mesh_id == len(mesh_hashes):
+            mesh_hashes.append(str(geometry.get('metadata', {}).get('geometry_hash', '')))
+
+        names.append(name)
+        mesh_ids.append(mesh_id)
+        collection_ids.append(collections.id(resolve_collection_key(discipline, obj_data.get('group', 'Other'))))
+        material_ids.append(materials.id(discipline))
+        properties.append(ifc_properties(obj_data))
+        locations.append(position[:3])
+        rotations_z.append(math.radians(obj_data.get('orientation', 0.0)))
+        scales.append(scale or (1.0, 1.0, 1.0))
+
+    transforms = compose_transforms(np.array(locations, dtype=np.float64).reshape(-1, 3),
+                                    np.array(rotations_z, dtype=np.float64),
+                                    np.array(scales, dtype=np.float64).reshape(-1, 3))
+
+    return ScenePlan(meshes.values, names, mesh_ids, transforms, collections.values, collection_ids,
+                     materials.values, material_ids, properties, errors, warnings, mesh_hashes)
+
+
+def diff_scene(plan: ScenePlan, existing: Dict[str, str]) -> SceneDiff:
+    """
+    Compare a plan with the objects already in a scene
+
+    Args:
+        plan: Freshly compiled plan
+        existing: {_plan_key: _plan_hash} of plan-managed objects in the .blend
+
+    Returns:
+        SceneDiff
+    """
+    added, updated, unchanged = [], [], []
+    keys = plan.object_keys()
+    for i, (key, content_hash) in enumerate(zip(keys, plan.content_hashes())):
+        previous = existing.get(key)
+        if previous is None:
+            added.append(i)
+        elif previous != content_hash:
+            updated.append(i)
+        else:
+            unchanged.append(i)
+    planned = set(keys)
+    removed = sorted(key for key in existing if key not in planned)
+    return SceneDiff(added, updated, unchanged, removed)
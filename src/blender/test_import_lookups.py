@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test per-import datablock lookups in the v2 importer (headless bpy)
+
+N objects across k disciplines/groups are imported with
+src/blender/import_to_blender.py on src/blender/headless/bpy.py:
+1. bpy.data.materials / bpy.data.collections calls depend on k, not on N
+2. Each object gets its ID properties in exactly one update
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import make_headless_import
+from import_benchmark import bpy
+
+SIZES = (50, 200)
+TYPE_COUNT = 14         # every FAMILY twice
+
+
+def _import(headless_import, count: int, disciplines):
+    """Import count objects whose types belong to the given disciplines; returns (calls, FINAL objects)"""
+    run = headless_import('v2', count, TYPE_COUNT, seed=5,
+                          select_types=lambda t: t['family'][0] in disciplines)
+    return run.result['calls'], run.objects
+
+
+def _lookups(calls, kind: str) -> int:
+    return sum(n for call, n in calls.items() if call.startswith(f"data.{kind}."))
+
+
+def test_lookups_grow_with_groups_not_objects(headless_import):
+    """Same k, 4x the objects: identical materials/collections call counts"""
+    per_k = {}
+    for disciplines in (('ARC',), ('ARC', 'MEP', 'PLUM', 'STR')):
+        counts = []
+        for size in SIZES:
+            calls, objects = _import(headless_import, size, disciplines)
+            groups = {(obj['discipline'], obj['group']) for obj in objects}
+            counts.append((_lookups(calls, 'materials'), _lookups(calls, 'collections')))
+            print(f"✅ {size} objects, {len(groups)} groups: materials {counts[-1][0]}, collections {counts[-1][1]}")
+        assert counts[0] == counts[-1], f"lookups grew with N: {counts}"
+
+        materials, collections = counts[0]
+        # get + new of MAT_<discipline>, once per discipline
+        assert materials <= 2 * len(disciplines)
+        assert collections <= len(bpy.data.collections)
+        per_k[len(disciplines)] = counts[0]
+
+    assert per_k[1][0] < per_k[4][0]
+
+
+def test_one_id_property_update_per_object(headless_import):
+    """One id_properties_ensure().update() per object; no per-key obj[...] = writes"""
+    setitems = []
+    for size in SIZES:
+        calls, objects = _import(headless_import, size, ('ARC', 'MEP', 'PLUM', 'STR'))
+        print(f"✅ {size} objects: {calls.get('ID.id_properties_ensure', 0)} property updates")
+        assert calls.get('ID.id_properties_ensure', 0) == size
+        setitems.append(calls.get('ID.__setitem__', 0))
+
+        by_name = {obj['name']: obj for obj in objects}
+        for obj in bpy.data.objects:
+            if obj.name in by_name:
+                props = obj.id_properties_ensure()
+                assert props['object_type'] == by_name[obj.name]['object_type']
+                assert props['discipline'] == by_name[obj.name]['discipline']
+
+    # Remaining __setitem__ calls are scene/collection-level, independent of N
+    assert setitems[0] == setitems[-1], f"ID.__setitem__ grew with N: {setitems}"
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        headless_import = make_headless_import(Path(tmp))
+        test_lookups_grow_with_groups_not_objects(headless_import)
+        test_one_id_property_update_per_object(headless_import)
+    print("\n✅ All import lookup tests passed")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test shared mesh datablocks in the Blender importers (headless bpy)
+
+Both importers run against src/blender/headless/bpy.py on a small FINAL
+with repeated object_types:
+1. One mesh per unique (object_type, base_rotation)
+2. Objects of the same type reference the same mesh
+3. Mesh vertices are the library geometry (base_rotation baked in);
+   position, orientation and scale live only on the object
+"""
+
+import math
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import make_headless_import
+from import_benchmark import bpy
+
+TYPE_COUNT = 8          # type 6 has a base_rotation of (90°, 0, 0)
+OBJECT_COUNT = 60
+SCALED_EVERY = 5        # every 5th object gets a 'length' (X scale in the v2 importer)
+
+
+def _library(db_path: Path):
+    """{object_type: (vertices (N, 3), base_rotation, width in m)} from the test library"""
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("""
+        SELECT c.object_type, g.vertices, c.base_rotation_x, c.base_rotation_y, c.base_rotation_z, c.width_mm
+        FROM object_catalog c JOIN base_geometries g ON g.geometry_hash = c.geometry_hash
+    """).fetchall()
+    conn.close()
+    return {object_type: (np.frombuffer(blob, dtype='<f4').reshape(-1, 3), (rx, ry, rz), width_mm / 1000.0)
+            for object_type, blob, rx, ry, rz, width_mm in rows}
+
+
+def _rotate_x(vertices: np.ndarray, angle: float) -> np.ndarray:
+    c, s = math.cos(angle), math.sin(angle)
+    return vertices @ np.array([[1, 0, 0], [0, c, -s], [0, s, c]]).T
+
+
+def _add_lengths(objects):
+    for obj in objects[::SCALED_EVERY]:
+        obj['length'] = 2.5
+
+
+def _import(headless_import, importer: str, args=()):
+    """Run one importer on a fresh library + FINAL; returns (FINAL objects, library)"""
+    run = headless_import(importer, OBJECT_COUNT, TYPE_COUNT, seed=3, edit_objects=_add_lengths, args=args)
+    return run.objects, _library(run.db_path)
+
+
+def _check_instancing(headless_import, importer: str, scales_length: bool):
+    objects, library = _import(headless_import, importer)
+    by_name = {obj['name']: obj for obj in objects}
+    placed = [o for o in bpy.data.objects if o.name in by_name]
+    assert len(placed) == len(objects), f"{len(placed)}/{len(objects)} objects placed"
+
+    # 1. One mesh per unique (object_type, base_rotation)
+    pairs = {(obj['object_type'], library[obj['object_type']][1]) for obj in objects}
+    print(f"✅ {importer}: {len(bpy.data.meshes)} meshes for {len(placed)} objects, {len(pairs)} unique types")
+    assert len(pairs) < len(objects)
+    assert len(bpy.data.meshes) == len(pairs)
+
+    # 2. Objects of one type share one mesh, and types do not share
+    meshes_by_type = {}
+    for obj in placed:
+        meshes_by_type.setdefault(by_name[obj.name]['object_type'], set()).add(id(obj.data))
+    assert all(len(meshes) == 1 for meshes in meshes_by_type.values())
+    assert len(set.union(*meshes_by_type.values())) == len(meshes_by_type)
+
+    # 3. Mesh = library vertices (+ base_rotation); transform only on the object
+    for obj in placed:
+        spec = by_name[obj.name]
+        vertices, (rx, ry, rz), width = library[spec['object_type']]
+        assert (ry, rz) == (0.0, 0.0)
+        expected = _rotate_x(vertices, rx) if rx else vertices
+        np.testing.assert_allclose(obj.data.vertices.attributes['co'], expected, atol=1e-6)
+
+        np.testing.assert_allclose(tuple(obj.location), spec['position'], atol=1e-6)
+        rx_obj, ry_obj, rz_obj = obj.rotation_euler
+        assert (rx_obj, ry_obj) == (0.0, 0.0)
+        # -90° and 270° are the same placement
+        turn = (rz_obj - math.radians(spec['orientation'])) % math.tau
+        assert min(turn, math.tau - turn) < 1e-6, f"{obj.name}: rotation {rz_obj} != {spec['orientation']}°"
+        scale_x = spec['length'] / width if scales_length and 'length' in spec else 1.0
+        np.testing.assert_allclose(tuple(obj.scale), (scale_x, 1.0, 1.0), rtol=1e-6)
+
+
+def test_shared_meshes_v2_importer(headless_import):
+    """src/blender/import_to_blender.py (scales objects with a 'length')"""
+    _check_instancing(headless_import, 'v2', scales_length=True)
+
+
+def test_shared_meshes_bin_importer(headless_import):
+    """bin/blender_lod300_import.py (scales only gutters, none here)"""
+    _check_instancing(headless_import, 'bin', scales_length=False)
+
+
+def test_unique_meshes_flag(headless_import):
+    """--unique-meshes turns sharing off: one mesh per object"""
+    objects, _ = _import(headless_import, 'v2', ['--unique-meshes'])
+    print(f"✅ v2 --unique-meshes: {len(bpy.data.meshes)} meshes for {len(objects)} objects")
+    assert len(bpy.data.meshes) == len(objects)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        headless_import = make_headless_import(Path(tmp))
+        test_shared_meshes_v2_importer(headless_import)
+        test_shared_meshes_bin_importer(headless_import)
+        test_unique_meshes_flag(headless_import)
+    print("\n✅ All mesh instancing tests passed")
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Batch Runner - Many PDFs through the complete pipeline on a worker pool
+
+Each PDF is one job: pipeline_runner.py in its own process, with its own
+working directory, so the output_artifacts/ paths the stages use (annotation
+DB, OUTPUT/FINAL JSONs, last_run_backup) never collide between jobs:
+
+    <batch dir>/
+        001_TB-LKTN_HOUSE/
+            pipeline.log                full stdout/stderr of the job
+            timings.json                per-stage timings + exit code
+            output_artifacts/           FINAL JSON, provenance, annotation DB, ...
+        002_.../
+        batch_summary.json              status, timings, object counts per job
+
+Up to --jobs pipelines run at once (default: CPU count). A job that fails,
+crashes or times out is recorded and the rest of the batch carries on. The
+stage cache is shared by all jobs (entries are published atomically), so a
+nightly re-run only re-extracts PDFs that changed.
+
+Inputs are a directory (*.pdf, --recursive for subfolders) and/or manifest
+files (one PDF path per line, # comments; or a JSON list of paths), relative
+paths in a manifest being relative to the manifest.
+
+Exit codes:
+    0  every job completed
+    1  at least one job failed (see batch_summary.json), or no PDFs found
+
+Usage:
+    python3 src/core/batch_runner.py drawings/
+    python3 src/core/batch_runner.py drawings/ --recursive --jobs 8 --out nightly/
+    python3 src/core/batch_runner.py --manifest tonight.txt --timeout 1800
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'src' / 'core'))
+
+from stage_cache import DEFAULT_CACHE_DIR
+
+RUNNER = REPO_ROOT / 'src' / 'core' / 'pipeline_runner.py'
+LIBRARY_DB = 'LocalLibrary/Ifc_Object_Library.db'
+BATCH_ROOT = Path('output_artifacts') / 'batch'
+BANNER = '=' * 80
+
+
+def collect_pdfs(directories: List[str], manifests: List[str], recursive: bool = False) -> List[Path]:
+    """PDF paths from directories and manifests (absolute, de-duplicated, in input order)"""
+    pdfs = []
+    for directory in directories:
+        pattern = '**/*.pdf' if recursive else '*.pdf'
+        matches = [p for p in Path(directory).glob(pattern) if p.is_file()]
+        matches += [p for p in Path(directory).glob(pattern.replace('.pdf', '.PDF')) if p.is_file()]
+        pdfs.extend(sorted(set(matches)))
+
+    for manifest in manifests:
+        manifest = Path(manifest)
+        text = manifest.read_text()
+        if manifest.suffix.lower() == '.json':
+            entries = json.loads(text)
+        else:
+            entries = [line.strip() for line in text.splitlines()]
+            entries = [line for line in entries if line and not line.startswith('#')]
+        for entry in entries:
+            path = Path(entry)
+            pdfs.append(path if path.is_absolute() else manifest.parent / path)
+
+    seen, unique = set(), []
+    for pdf in pdfs:
+        pdf = pdf.resolve()
+        if pdf not in seen:
+            seen.add(pdf)
+            unique.append(pdf)
+    return unique
+
+
+def job_dir_name(index: int, pdf: Path) -> str:
+    """001_<stem> (index keeps same-named PDFs from different folders apart)"""
+    stem = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in pdf.stem)
+    return f"{index:03d}_{stem}"
+
+
+def find_final(job_dir: Path) -> Optional[Path]:
+    """The job's FINAL JSON (None if the pipeline did not get that far)"""
+    finals = sorted((job_dir / 'output_artifacts').glob('*_FINAL.json'))
+    return finals[-1] if finals else None
+
+
+def count_objects(final_path: Path) -> int:
+    with open(final_path) as f:
+        return len(json.load(f).get('objects', []))
+
+
+def run_job(index: int, pdf: Path, job_dir: Path, library_db: Path, cache_dir: Optional[Path],
+            timeout: Optional[float]) -> Dict:
+    """
+    Run one PDF through pipeline_runner.py in job_dir
+
+    Never raises: failures are returned in the job record.
+    """
+    job_dir.mkdir(parents=True, exist_ok=True)
+    command = [sys.executable, str(RUNNER), str(pdf), '--library', str(library_db),
+               '--timings', 'timings.json', '--jobs', '1']
+    command += ['--cache-dir', str(cache_dir)] if cache_dir else ['--no-cache']
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(REPO_ROOT), str(REPO_ROOT / 'src'),
+                                                      env.get('PYTHONPATH')]))
+
+    record = {'index': index, 'pdf': str(pdf), 'job_dir': str(job_dir), 'status': 'failed',
+              'exit_code': None, 'seconds': 0.0, 'objects': None, 'final': None, 'stages': {}, 'error': None}
+    start = time.perf_counter()
+    try:
+        with open(job_dir / 'pipeline.log', 'w') as log:
+            result = subprocess.run(command, cwd=job_dir, env=env, stdout=log, stderr=subprocess.STDOUT,
+                                    timeout=timeout)
+        record['exit_code'] = result.returncode
+        record['status'] = 'ok' if result.returncode == 0 else 'failed'
+    except subprocess.TimeoutExpired:
+        record['status'] = 'timeout'
+        record['error'] = f"Timed out after {timeout:.0f}s"
+    except OSError as e:
+        record['error'] = str(e)
+    record['seconds'] = time.perf_counter() - start
+
+    timings_path = job_dir / 'timings.json'
+    if timings_path.is_file():
+        with open(timings_path) as f:
+            timings = json.load(f)
+        record['stages'] = {t['stage']: round(t['seconds'], 3) for t in timings.get('stages', [])}
+    final_path = find_final(job_dir)
+    if final_path is not None:
+        record['final'] = str(final_path)
+        try:
+            record['objects'] = count_objects(final_path)
+        except (OSError, ValueError) as e:
+            record['error'] = record['error'] or f"Unreadable FINAL: {e}"
+    if record['status'] == 'failed' and not record['error']:
+        record['error'] = _last_error_line(job_dir / 'pipeline.log')
+    return record
+
+
+def _last_error_line(log_path: Path) -> Optional[str]:
+    """Last ❌/Error/Traceback line of a job log, as the one-line reason"""
+    try:
+        lines = log_path.read_text(errors='replace').splitlines()
+    except OSError:
+        return None
+    for line in reversed(lines):
+        if '❌' in line or 'Error' in line:
+            return line.strip()
+    return lines[-1].strip() if lines else None
+
+
+def run_batch(pdfs: List[Path], batch_dir: Path, jobs: int, library_db: Path,
+              cache_dir: Optional[Path], timeout: Optional[float] = None) -> Dict:
+    """Run every PDF (up to `jobs` at once); returns the summary written to batch_summary.json"""
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    started = datetime.now()
+    start = time.perf_counter()
+    records = []
+
+    print(BANNER)
+    print(f"🚀 BATCH PIPELINE: {len(pdfs)} PDFs, {jobs} concurrent jobs")
+    print(BANNER)
+    print(f"Batch directory: {batch_dir}")
+    print()
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_job, index, pdf, batch_dir / job_dir_name(index, pdf), library_db,
+                               cache_dir, timeout)
+                   for index, pdf in enumerate(pdfs, 1)]
+        for done, future in enumerate(as_completed(futures), 1):
+            record = future.result()
+            records.append(record)
+            mark = '✅' if record['status'] == 'ok' else '❌'
+            objects = f"{record['objects']} objects" if record['objects'] is not None else 'no FINAL'
+            print(f"{mark} [{done}/{len(pdfs)}] {Path(record['pdf']).name}: {record['status']} "
+                  f"in {record['seconds']:.1f}s, {objects}")
+            if record['status'] != 'ok':
+                print(f"   {record['error'] or 'see pipeline.log'} ({record['job_dir']}/pipeline.log)")
+
+    wall = time.perf_counter() - start
+    records.sort(key=lambda r: r['index'])
+    ok = [r for r in records if r['status'] == 'ok']
+    summary = {
+        'started': started.isoformat(timespec='seconds'),
+        'finished': datetime.now().isoformat(timespec='seconds'),
+        'batch_dir': str(batch_dir),
+        'jobs': jobs,
+        'library': str(library_db),
+        'stage_cache': str(cache_dir) if cache_dir else None,
+        'total': len(records),
+        'succeeded': len(ok),
+        'failed': len(records) - len(ok),
+        'wall_seconds': round(wall, 3),
+        'job_seconds': round(sum(r['seconds'] for r in records), 3),
+        'objects': sum(r['objects'] or 0 for r in ok),
+        'results': records,
+    }
+    with open(batch_dir / 'batch_summary.json', 'w') as f:
+        json.dump(summary, f, indent=2)
+    print_summary(summary)
+    return summary
+
+
+def print_summary(summary: Dict):
+    print()
+    print(BANNER)
+    print("🎯 BATCH SUMMARY")
+    print(BANNER)
+    print(f"{'#':>4}  {'status':<8} {'seconds':>8} {'objects':>8}  pdf")
+    for r in summary['results']:
+        objects = '-' if r['objects'] is None else r['objects']
+        print(f"{r['index']:>4}  {r['status']:<8} {r['seconds']:>8.1f} {objects:>8}  {Path(r['pdf']).name}")
+    print()
+    wall = summary['wall_seconds']
+    print(f"Succeeded:      {summary['succeeded']}/{summary['total']}")
+    print(f"Objects:        {summary['objects']}")
+    print(f"Wall time:      {wall:.1f}s (sum of jobs {summary['job_seconds']:.1f}s, "
+          f"{summary['job_seconds'] / wall if wall else 0:.1f}x concurrency)")
+    if wall:
+        print(f"Throughput:     {summary['total'] / wall * 3600:.0f} PDFs/hour")
+    print(f"Summary:        {Path(summary['batch_dir']) / 'batch_summary.json'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the complete pipeline over many PDFs on a worker pool")
+    parser.add_argument('directories', nargs='*', help="Directories of PDFs")
+    parser.add_argument('--manifest', action='append', default=[],
+                        help="File listing PDFs (one per line, or a JSON list); repeatable")
+    parser.add_argument('--recursive', action='store_true', help="Also search subdirectories")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Pipelines run at once (default: CPU count)")
+    parser.add_argument('--out', help=f"Batch directory (default: {BATCH_ROOT}/<timestamp>)")
+    parser.add_argument('--library', default=LIBRARY_DB, help=f"Library database (default: {LIBRARY_DB})")
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                        help=f"Stage cache shared by all jobs (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--no-cache', action='store_true', help="Re-run every stage of every job")
+    parser.add_argument('--timeout', type=float, help="Seconds before a job is killed and marked 'timeout'")
+    args = parser.parse_args()
+
+    pdfs = collect_pdfs(args.directories, args.manifest, args.recursive)
+    if not pdfs:
+        print("❌ Error: no PDFs found")
+        parser.print_usage()
+        sys.exit(1)
+    missing = [pdf for pdf in pdfs if not pdf.is_file()]
+    if missing:
+        print(f"⚠️  {len(missing)} listed PDFs do not exist (they will be reported as failed jobs)")
+
+    library_db = Path(args.library).resolve()
+    if not library_db.is_file():
+        print(f"❌ Error: Library database not found: {args.library}")
+        sys.exit(1)
+
+    batch_dir = Path(args.out or BATCH_ROOT / datetime.now().strftime('%Y%m%d_%H%M%S')).resolve()
+    cache_dir = None if args.no_cache else Path(args.cache_dir).resolve()
+    summary = run_batch(pdfs, batch_dir, max(1, args.jobs), library_db, cache_dir, args.timeout)
+    sys.exit(0 if summary['failed'] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark - Per-stage time and memory on synthetic plans at 1×/10×/100×
+
+Each scale is a synthetic TB-LKTN-style drawing set (src/core/synthetic_plan.py,
+N dwelling units per sheet) run through the pipeline stages one after another:
+
+    primitive extraction    EnhancedPrimitiveExtractor → annotation DB
+    tier-2 extraction       extraction_engine.run_extraction
+    template augmentation   augment_with_room_templates
+    wall combining          wall_combiner.process_walls
+    post-processing         post_processor.automated_post_process (+ FINAL written)
+    G3 / G4                 structural + library gates
+    3.1-3.4                 the validators
+
+Every scale runs in a fresh interpreter with its own working directory
+(<out dir>/work/scale_<N>/: plan PDF, output_artifacts/, benchmark.log,
+trace.jsonl), so peak RSS is that scale's and imports are paid equally.
+Stage output is discarded (tracing.quiet_output) so print cost does not
+dominate large runs; per-stage wall/CPU time, peak RSS (+ growth during
+the stage) and row/object counts come from the stage tracing spans.
+A gate or validator that fails is recorded ('failed') and the run goes
+on; a stage that crashes ends that scale ('error', later stages 'skipped').
+
+Results are one JSON file per run (commit, machine, plan sizes, stages per
+scale) that --compare checks against an earlier one: a stage is a
+regression when it got slower (or its peak RSS grew) by more than
+--tolerance and by more than the --min-seconds / --min-mb noise floor.
+The scaling table shows each stage's time per scale and its exponent
+(log t / log scale between the smallest and largest scale; ≈1 = linear).
+
+Before the scales, the startup of every entry point is profiled
+(import_profile.py, `-X importtime`) and stored with the results; an
+entry point over its startup budget, or one importing NumPy/pdfplumber/
+cv2 it does not need, fails the run like a crashed scale, and --compare
+also checks startup times (with the --min-startup-seconds noise floor).
+
+Exit codes:
+    0  every scale ran, startup within budget (and no regression against --compare)
+    1  a scale crashed or timed out, an entry point is over its startup
+       budget, or --compare found regressions
+
+Usage:
+    python3 src/core/benchmark_pipeline.py                              # 1, 10, 100
+    python3 src/core/benchmark_pipeline.py --scales 1 10 --out bench/head.json
+    python3 src/core/benchmark_pipeline.py --scales 1 10 --compare bench/main.json
+    python3 src/core/benchmark_pipeline.py --load bench/head.json --compare bench/main.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+for _path in (REPO_ROOT / 'src' / 'validators', REPO_ROOT / 'src' / 'core', REPO_ROOT / 'src', REPO_ROOT):
+    sys.path.insert(0, str(_path))
+
+import import_profile
+try:
+    from src.core import tracing
+except ImportError:
+    import tracing
+from synthetic_plan import PlanSpec, generate_plan
+
+LIBRARY_DB = 'LocalLibrary/Ifc_Object_Library.db'
+BENCH_ROOT = Path('output_artifacts') / 'benchmarks'
+MASTER_TEMPLATE = REPO_ROOT / 'src' / 'core' / 'master_reference_template.json'
+DEFAULT_SCALES = [1, 10, 100]
+BANNER = '=' * 80
+
+
+#===============================================================================
+# ONE SCALE (child process)
+#===============================================================================
+
+class StageRunner:
+    """Runs stages in tracing spans; records ok / failed (gate verdict) / error / skipped"""
+
+    def __init__(self):
+        self.status: Dict[str, str] = {}
+        self.broken: Optional[str] = None
+
+    def __call__(self, name: str, func, *args, fatal: bool = True):
+        if self.broken:
+            self.status[name] = 'skipped'
+            return None
+        from pipeline_runner import PipelineFailed
+        result = None
+        with tracing.span(name, cat='stage') as span:
+            try:
+                result = func(*args)
+                status = 'ok'
+            except PipelineFailed as e:
+                status = 'failed'
+                span.set(error=e.lines[0] if e.lines else str(e))
+            except Exception as e:
+                status = 'error'
+                span.set(error=f"{type(e).__name__}: {e}")
+                traceback.print_exc()
+                if fatal:
+                    self.broken = name
+            span.set(status=status)
+        self.status[name] = status
+        return result
+
+
+def _primitives(pdf_path: str, db_path: Path):
+    from primitive_extractor_enhanced import EnhancedPrimitiveExtractor
+    EnhancedPrimitiveExtractor(str(db_path)).extract_to_database(pdf_path)
+    with sqlite3.connect(db_path) as conn:
+        tracing.annotate(**{table: conn.execute(f"SELECT COUNT(*) FROM primitives_{table}").fetchone()[0]
+                            for table in ('text', 'lines', 'curves', 'rects')})
+
+
+def _extraction(pdf_path: str) -> Dict:
+    from src.core.extraction_engine import run_extraction
+    output_json, _ = run_extraction(pdf_path, save=False)
+    if not output_json:
+        raise RuntimeError("Extraction produced no output")
+    output_json['extraction_metadata']['pdf_source'] = pdf_path
+    tracing.annotate(objects=len(output_json['objects']))
+    return output_json
+
+
+def _augmentation(output_json: Dict) -> Dict:
+    from room_inference.integrate_room_templates import augment_with_room_templates
+    augmented = augment_with_room_templates(output_json)
+    tracing.annotate(objects=len(augmented['objects']))
+    return augmented
+
+
+def _wall_combining(augmented: Dict) -> Dict:
+    from wall_combiner import process_walls
+    augmented['objects'] = process_walls(augmented['objects'], augmented.get('building_envelope', {}))
+    tracing.annotate(objects=len(augmented['objects']))
+    return augmented
+
+
+def _post_processing(augmented: Dict, final_path: str) -> str:
+    from post_processor import automated_post_process
+    from room_inference.integrate_room_templates import save_final
+    fixed = automated_post_process(augmented, MASTER_TEMPLATE)
+    save_final(fixed, final_path)
+    tracing.annotate(objects=len(fixed['objects']))
+    return final_path
+
+
+def run_scale(scale: int, spec: PlanSpec, library_db: str, result_path: Path, quiet: bool = True) -> Dict:
+    """Generate the plan and run every stage in this process (cwd = the scale's work dir)"""
+    from pipeline_runner import VALIDATORS, library_gate, load_final, run_validator, structural_gate
+
+    pdf_path = f"synthetic_{scale}x.pdf"
+    plan = generate_plan(spec, pdf_path)
+    db_path = Path('output_artifacts') / f"synthetic_{scale}x_ANNOTATION_FROM_2D.db"
+    db_path.parent.mkdir(exist_ok=True)
+    final_path = str(Path('output_artifacts') / f"synthetic_{scale}x_OUTPUT_FINAL.json")
+
+    run = StageRunner()
+    tracing.start()
+    start = time.perf_counter()
+    with tracing.quiet_output(quiet):
+        run('primitive extraction', _primitives, pdf_path, db_path)
+        output_json = run('tier-2 extraction', _extraction, pdf_path)
+        augmented = run('template augmentation', _augmentation, output_json)
+        augmented = run('wall combining', _wall_combining, augmented)
+        run('post-processing', _post_processing, augmented, final_path)
+        final, objects = run('load FINAL', load_final, final_path) or (None, None)
+        run('G3 structural gate', structural_gate, objects, fatal=False)
+        run('G4 library gate', library_gate, objects, library_db, fatal=False)
+        for index, (name, _, _) in enumerate(VALIDATORS):
+            run(f"3.{index + 1} {name}", run_validator, index, library_db, final_path, final, fatal=False)
+    seconds = time.perf_counter() - start
+    spans = tracing.stop()
+    tracing.write_jsonl('trace.jsonl', spans)
+
+    stages = {}
+    for record in spans:
+        if record['cat'] == 'stage' and record['depth'] == 0:
+            attrs = dict(record['attrs'])
+            stages[record['name']] = {
+                'status': attrs.pop('status', 'ok'),
+                'wall_s': round(record['wall_s'], 4),
+                'cpu_s': round(record['cpu_s'], 4),
+                'peak_rss_mb': record['peak_rss_mb'],
+                'rss_growth_mb': record['rss_growth_mb'],
+                **attrs,
+            }
+    for name, status in run.status.items():
+        stages.setdefault(name, {'status': status})
+    result = {
+        'scale': scale,
+        'status': 'error' if run.broken else 'ok',
+        'error': stages.get(run.broken, {}).get('error') if run.broken else None,
+        'seconds': round(seconds, 3),
+        'peak_rss_mb': max((s.get('peak_rss_mb') or 0 for s in stages.values()), default=None),
+        'objects': (stages.get('post-processing') or {}).get('objects'),
+        'plan': plan,
+        'stages': stages,
+        'trace': str(Path('trace.jsonl').resolve()),
+    }
+    with open(result_path, 'w') as f:
+        json.dump(result, f, indent=2)
+    return result
+
+
+#===============================================================================
+# DRIVER
+#===============================================================================
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def spawn_scale(scale: int, spec_args: List[str], work_dir: Path, library_db: Path,
+                timeout: Optional[float]) -> Dict:
+    """Run one scale in a fresh interpreter; never raises"""
+    work_dir.mkdir(parents=True, exist_ok=True)
+    result_path = work_dir / 'result.json'
+    if result_path.exists():
+        result_path.unlink()
+    command = [sys.executable, str(Path(__file__).resolve()), '--run-scale', str(scale),
+               '--library', str(library_db), *spec_args]
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(REPO_ROOT), str(REPO_ROOT / 'src'),
+                                                      env.get('PYTHONPATH')]))
+    start = time.perf_counter()
+    error = None
+    try:
+        with open(work_dir / 'benchmark.log', 'w') as log:
+            code = subprocess.run(command, cwd=work_dir, env=env, stdout=log, stderr=subprocess.STDOUT,
+                                  timeout=timeout).returncode
+        if code != 0:
+            error = f"exit code {code} (see {work_dir / 'benchmark.log'})"
+    except subprocess.TimeoutExpired:
+        error = f"timed out after {timeout:.0f}s"
+    if result_path.is_file():
+        with open(result_path) as f:
+            return json.load(f)
+    return {'scale': scale, 'status': 'error', 'error': error or 'no result written',
+            'seconds': round(time.perf_counter() - start, 3), 'stages': {}}
+
+
+def run_benchmark(scales: List[int], spec_args: List[str], out_path: Path, library_db: Path,
+                  timeout: Optional[float], verbose: bool = False, startup: bool = True) -> Dict:
+    commit = _git('rev-parse', 'HEAD')
+    results = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'spec_args': spec_args,
+        'scales': [],
+    }
+    print(BANNER)
+    print(f"⏱️  PIPELINE BENCHMARK: scales {', '.join(f'{s}×' for s in scales)} @ {(commit or 'unknown')[:10]}")
+    print(BANNER)
+    if startup:
+        print("▶️  startup profile ...", flush=True)
+        results['startup'] = import_profile.profile_entries()
+        import_profile.print_profile(results['startup'])
+    work_root = out_path.with_suffix('') / 'work'
+    for scale in scales:
+        print(f"▶️  {scale}× ...", flush=True)
+        child_args = spec_args + (['--verbose'] if verbose else [])
+        result = spawn_scale(scale, child_args, work_root / f"scale_{scale}", library_db, timeout)
+        results['scales'].append(result)
+        mark = '✅' if result['status'] == 'ok' else '❌'
+        primitives = (result.get('plan') or {}).get('primitives', {})
+        print(f"{mark} {scale}×: {result['seconds']:.1f}s, peak {result.get('peak_rss_mb') or 0:.0f} MB, "
+              f"{sum(primitives.values())} primitives, {result.get('objects')} objects"
+              + (f" - {result['error']}" if result.get('error') else ''))
+        # Written after every scale so a long run leaves partial results
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+#===============================================================================
+# REPORTS
+#===============================================================================
+
+def _stage_names(results: Dict) -> List[str]:
+    names = []
+    for scale in results['scales']:
+        names += [name for name in scale['stages'] if name not in names]
+    return names
+
+
+def print_scaling(results: Dict):
+    """Seconds (and peak MB) per stage and scale, with the scaling exponent"""
+    scales = [s for s in results['scales'] if s['stages']]
+    if not scales:
+        return
+    print()
+    print("📈 Stage seconds by scale (exponent: log t / log scale, smallest → largest; ≈1 = linear)")
+    header = f"{'stage':<24}" + ''.join(f"{str(s['scale']) + '×':>10}" for s in scales) + f"{'exp':>7}"
+    print(header)
+    for name in _stage_names(results):
+        row = [s['stages'].get(name, {}) for s in scales]
+        cells = ''.join(f"{r['wall_s']:>10.3f}" if 'wall_s' in r else f"{r.get('status', '-'):>10}" for r in row)
+        exponent = ''
+        timed = [(s['scale'], r['wall_s']) for s, r in zip(scales, row) if r.get('wall_s')]
+        if len(timed) >= 2 and timed[-1][0] > timed[0][0] and timed[0][1] >= 0.005:
+            value = math.log(timed[-1][1] / timed[0][1]) / math.log(timed[-1][0] / timed[0][0])
+            exponent = f"{value:>6.2f}" + ('⚠️' if value > 1.3 else '')
+        failed = [f"{s['scale']}×" for s, r in zip(scales, row) if r.get('status') not in (None, 'ok')]
+        print(f"{name[:24]:<24}{cells}{exponent:>7}" + (f"  ({', '.join(failed)} not ok)" if failed else ''))
+    print(f"{'peak RSS MB':<24}" + ''.join(f"{s.get('peak_rss_mb') or 0:>10.0f}" for s in scales))
+    print(f"{'total seconds':<24}" + ''.join(f"{s['seconds']:>10.1f}" for s in scales))
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float, min_seconds: float, min_mb: float,
+            min_startup_seconds: float = 0.02) -> List[str]:
+    """Print stage time/RSS changes per scale and startup changes; returns the regressions"""
+    print()
+    print(f"🔀 Compared with {(baseline.get('commit') or '?')[:10]} ({baseline.get('created', '?')})")
+    if baseline.get('spec_args') != current.get('spec_args'):
+        print(f"⚠️  Different plan options: {baseline.get('spec_args')} vs {current.get('spec_args')}")
+    before = {s['scale']: s for s in baseline['scales']}
+    regressions = []
+    print(f"{'scale':>6}  {'stage':<24} {'before s':>9} {'after s':>9} {'change':>8} {'Δ peak MB':>10}")
+    for scale in current['scales']:
+        old_scale = before.get(scale['scale'])
+        if old_scale is None:
+            continue
+        for name, new in scale['stages'].items():
+            old = old_scale['stages'].get(name)
+            if not old or 'wall_s' not in old or 'wall_s' not in new:
+                continue
+            change = (new['wall_s'] - old['wall_s']) / old['wall_s'] if old['wall_s'] else 0.0
+            rss = (new.get('peak_rss_mb') or 0) - (old.get('peak_rss_mb') or 0)
+            slower = change > tolerance and new['wall_s'] - old['wall_s'] > min_seconds
+            bigger = old.get('peak_rss_mb') and rss > min_mb and rss / old['peak_rss_mb'] > tolerance
+            mark = ''
+            if slower or bigger:
+                mark = '  ❌ regression'
+                regressions.append(f"{scale['scale']}× {name}: {old['wall_s']:.3f}s → {new['wall_s']:.3f}s, "
+                                   f"peak {rss:+.0f} MB")
+            print(f"{str(scale['scale']) + '×':>6}  {name[:24]:<24} {old['wall_s']:>9.3f} {new['wall_s']:>9.3f} "
+                  f"{change * 100:>+7.0f}% {rss:>+10.0f}{mark}")
+
+    before_startup = {entry['script']: entry for entry in baseline.get('startup', []) if 'wall_s' in entry}
+    after_startup = [entry for entry in current.get('startup', [])
+                     if 'wall_s' in entry and entry['script'] in before_startup]
+    if after_startup:
+        print()
+        print(f"{'startup':<44} {'before s':>9} {'after s':>9} {'change':>8}")
+        for new in after_startup:
+            old = before_startup[new['script']]
+            change = (new['wall_s'] - old['wall_s']) / old['wall_s'] if old['wall_s'] else 0.0
+            mark = ''
+            if change > tolerance and new['wall_s'] - old['wall_s'] > min_startup_seconds:
+                mark = '  ❌ regression'
+                regressions.append(f"startup {new['script']}: {old['wall_s']:.3f}s → {new['wall_s']:.3f}s")
+            print(f"{new['script'].split('/', 1)[-1][:44]:<44} {old['wall_s']:>9.3f} {new['wall_s']:>9.3f} "
+                  f"{change * 100:>+7.0f}%{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline stages on synthetic plans of growing size")
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help=f"Units per sheet to run (default: {' '.join(map(str, DEFAULT_SCALES))})")
+    parser.add_argument('--rooms', type=int, help="Rooms per unit")
+    parser.add_argument('--mep', type=int, help="MEP symbols per room")
+    parser.add_argument('--hatch', type=int, help="Hatch lines per room")
+    parser.add_argument('--extra-pages', type=int, help="Extra floor-plan sheets")
+    parser.add_argument('--out', help=f"Results JSON (default: {BENCH_ROOT}/bench_<timestamp>_<commit>.json)")
+    parser.add_argument('--library', default=LIBRARY_DB, help=f"Library database (default: {LIBRARY_DB})")
+    parser.add_argument('--timeout', type=float, help="Seconds before a scale is killed")
+    parser.add_argument('--load', help="Report on an existing results JSON instead of running")
+    parser.add_argument('--compare', help="Baseline results JSON to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Relative slow-down / RSS growth that counts as a regression (default: 0.25)")
+    parser.add_argument('--min-seconds', type=float, default=0.1, help="Ignore time changes below this (default: 0.1)")
+    parser.add_argument('--min-mb', type=float, default=20.0, help="Ignore peak RSS changes below this (default: 20)")
+    parser.add_argument('--min-startup-seconds', type=float, default=0.02,
+                        help="Ignore startup time changes below this (default: 0.02)")
+    parser.add_argument('--no-startup', action='store_true', help="Skip the entry point startup profile")
+    parser.add_argument('--verbose', action='store_true', help="Keep stage output in benchmark.log")
+    parser.add_argument('--run-scale', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    spec_args = []
+    for option in ('rooms', 'mep', 'hatch', 'extra_pages'):
+        if getattr(args, option) is not None:
+            spec_args += [f"--{option.replace('_', '-')}", str(getattr(args, option))]
+
+    if args.run_scale is not None:
+        overrides = {'rooms': args.rooms, 'mep_per_room': args.mep, 'hatch': args.hatch,
+                     'extra_pages': args.extra_pages}
+        spec = PlanSpec.scaled(args.run_scale, **{k: v for k, v in overrides.items() if v is not None})
+        result = run_scale(args.run_scale, spec, args.library, Path('result.json'), quiet=not args.verbose)
+        sys.exit(0 if result['status'] == 'ok' else 1)
+
+    if args.load:
+        with open(args.load) as f:
+            results = json.load(f)
+    else:
+        library_db = Path(args.library).resolve()
+        if not library_db.is_file():
+            print(f"⚠️  Library database not found: {args.library} (G4 and library validators will report errors)")
+        commit = (_git('rev-parse', '--short', 'HEAD') or 'nogit')
+        out_path = Path(args.out or BENCH_ROOT / f"bench_{datetime.now():%Y%m%d_%H%M%S}_{commit}.json").resolve()
+        results = run_benchmark(args.scales, spec_args, out_path, library_db, args.timeout, args.verbose,
+                                startup=not args.no_startup)
+        print(f"💾 Results: {out_path}")
+
+    print_scaling(results)
+    failed = [s for s in results['scales'] if s['status'] != 'ok']
+    over_budget = import_profile.check_budget(results.get('startup', []))
+    if over_budget:
+        print()
+        print(f"❌ {len(over_budget)} entry points over their startup budget:")
+        for line in over_budget:
+            print(f"   {line}")
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.tolerance, args.min_seconds, args.min_mb,
+                              args.min_startup_seconds)
+        print()
+        if regressions:
+            print(f"❌ {len(regressions)} regressions (> {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"   {line}")
+        else:
+            print("✅ No regressions")
+    sys.exit(1 if failed or over_budget or regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
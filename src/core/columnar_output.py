@@ -0,0 +1,341 @@
+"""
+Columnar Output Module
+======================
+Binary interchange format for OUTPUT / AUGMENTED / FINAL pipeline files.
+
+Stores the 'objects' list as typed NumPy columns in one .npz next to the
+JSON (X_FINAL.json → X_FINAL.npz):
+
+    str__<field>    int32 ids into a shared string table (-1 = absent)
+                    name, object_type, discipline, group, room, ifc_class, _phase
+    num__<field>    float64 values, code__<field> int8 type codes
+                    position, end_point, dimensions (N, 3); orientation,
+                    width, height, length, thickness, placed (N,)
+    layout_id       int32 key order of each object (layouts table)
+    extras_id       int32 JSON of remaining/irregular fields (string table)
+    header          JSON of all other top-level sections, plus the size and
+                    sha256 of the JSON the file was written from ('source')
+
+Lists of 3 numbers and scalars that fit a typed column go there; anything
+else (dict dimensions, strings in numeric fields, extra keys) is kept
+verbatim in extras, so JSON → .npz → JSON is lossless, key order included.
+
+Usage:
+    write_columnar(data, "output_artifacts/X_FINAL.npz")
+    output = ColumnarOutput("output_artifacts/X_FINAL.npz")
+    output.positions()           # (N, 3) float64, NaN where absent
+    output.strings('object_type')
+    data = output.to_dict()      # same dict json.load would return
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+import numpy as np
+
+try:
+    from .final_json_stream import source_matches, source_stamp
+except ImportError:
+    from final_json_stream import source_matches, source_stamp
+
+
+COLUMNAR_SUFFIX = '.npz'
+
+STRING_FIELDS = ('name', 'object_type', 'discipline', 'group', 'room', 'ifc_class', '_phase')
+NUMERIC_FIELDS = {
+    'position': 3,
+    'end_point': 3,
+    'dimensions': 3,
+    'orientation': 0,
+    'width': 0,
+    'height': 0,
+    'length': 0,
+    'thickness': 0,
+    'placed': 0,
+}
+
+# Type codes for numeric columns
+ABSENT, INT, FLOAT, BOOL = 0, 1, 2, 3
+_MAX_EXACT_INT = 2 ** 53
+
+_DECODE = {INT: int, FLOAT: float, BOOL: bool}
+_STRING_SET = frozenset(STRING_FIELDS)
+
+
+def columnar_path(json_path: Union[str, Path]) -> Path:
+    """X_FINAL.json → X_FINAL.npz"""
+    json_path = Path(json_path)
+    return json_path.with_suffix(COLUMNAR_SUFFIX)
+
+
+def columnar_fresh(json_path: Union[str, Path]) -> bool:
+    """Columnar file exists and was written from the JSON as it is now (size + sha256, not mtime)"""
+    json_path = Path(json_path)
+    npz = columnar_path(json_path)
+    if not npz.exists():
+        return False
+    if not json_path.exists():
+        return True
+    try:
+        with np.load(npz) as archive:
+            stamp = _from_json_bytes(archive['header']).get('source')
+    except (OSError, ValueError, KeyError):
+        return False
+    return source_matches(json_path, stamp)
+
+
+def _encode_number(value):
+    """(float, code) for a JSON number/bool, None if it does not fit a column"""
+    if value is True or value is False:
+        return float(value), BOOL
+    if type(value) is int and -_MAX_EXACT_INT < value < _MAX_EXACT_INT:
+        return float(value), INT
+    if type(value) is float:
+        return value, FLOAT
+    return None
+
+
+def _json_bytes(value) -> np.ndarray:
+    return np.frombuffer(json.dumps(value).encode('utf-8'), dtype=np.uint8)
+
+
+def _from_json_bytes(array: np.ndarray):
+    return json.loads(array.tobytes().decode('utf-8'))
+
+
+#===============================================================================
+# WRITER
+#===============================================================================
+
+class ColumnarBuilder:
+    """Append objects one at a time, then write()"""
+
+    def __init__(self):
+        self._string_ids = {}
+        self.strings: List[str] = []
+        self._layout_ids = {}
+        self.layouts: List[List[str]] = []
+        # Sparse while building: only present values are recorded
+        self.rows = {field: [] for field in (*STRING_FIELDS, *NUMERIC_FIELDS)}
+        self.values = {field: [] for field in (*STRING_FIELDS, *NUMERIC_FIELDS)}
+        self.codes = {field: [] for field in NUMERIC_FIELDS}
+        self.layout_id = []
+        self.extras_id = []
+
+    def _string(self, value: str) -> int:
+        i = self._string_ids.get(value)
+        if i is None:
+            i = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return i
+
+    def add(self, obj: Dict):
+        row = len(self.layout_id)
+        extras = {}
+
+        for key, value in obj.items():
+            if key in _STRING_SET:
+                if type(value) is str:
+                    self.rows[key].append(row)
+                    self.values[key].append(self._string(value))
+                    continue
+            elif key in NUMERIC_FIELDS:
+                width = NUMERIC_FIELDS[key]
+                if width == 0:
+                    encoded = _encode_number(value)
+                    if encoded is not None:
+                        self.rows[key].append(row)
+                        self.values[key].append(encoded[0])
+                        self.codes[key].append(encoded[1])
+                        continue
+                elif type(value) is list and len(value) == width:
+                    parts = [_encode_number(v) for v in value]
+                    if None not in parts:
+                        self.rows[key].append(row)
+                        self.values[key].append([p[0] for p in parts])
+                        self.codes[key].append([p[1] for p in parts])
+                        continue
+            extras[key] = value
+
+        keys = tuple(obj)
+        layout = self._layout_ids.get(keys)
+        if layout is None:
+            layout = self._layout_ids[keys] = len(self.layouts)
+            self.layouts.append(list(keys))
+        self.layout_id.append(layout)
+        self.extras_id.append(self._string(json.dumps(extras)) if extras else -1)
+
+    def write(self, path: Union[str, Path], header: Dict, keys: List[str], compress: bool = False,
+              source: Optional[Dict] = None):
+        """
+        Write .npz (columns no object uses are left out)
+
+        Args:
+            path: Target .npz
+            header: Top-level sections other than 'objects'
+            keys: Top-level key order (including 'objects')
+            compress: zip-deflate arrays (smaller, slower)
+            source: {'size', 'sha256'} of the matching JSON (None = not usable in its place)
+        """
+        n = len(self.layout_id)
+        arrays = {
+            'header': _json_bytes({'header': header, 'keys': keys, 'source': source}),
+            'strings': _json_bytes(self.strings),
+            'layouts': _json_bytes(self.layouts),
+            'layout_id': np.asarray(self.layout_id, dtype=np.int32),
+            'extras_id': np.asarray(self.extras_id, dtype=np.int32),
+        }
+        for field in STRING_FIELDS:
+            if self.rows[field]:
+                ids = np.full(n, -1, dtype=np.int32)
+                ids[self.rows[field]] = self.values[field]
+                arrays[f'str__{field}'] = ids
+        for field, width in NUMERIC_FIELDS.items():
+            if self.rows[field]:
+                shape = (n, width) if width else (n,)
+                values = np.full(shape, np.nan)
+                codes = np.full(shape, ABSENT, dtype=np.int8)
+                values[self.rows[field]] = self.values[field]
+                codes[self.rows[field]] = self.codes[field]
+                arrays[f'num__{field}'] = values
+                arrays[f'code__{field}'] = codes
+
+        with open(path, 'wb') as f:
+            (np.savez_compressed if compress else np.savez)(f, **arrays)
+
+
+def write_columnar(data: Dict, path: Union[str, Path], compress: bool = False, source: Optional[Dict] = None):
+    """Write a pipeline output dict (JSON layout) as .npz (source: stamp of the JSON it mirrors)"""
+    builder = ColumnarBuilder()
+    for obj in data.get('objects', []):
+        builder.add(obj)
+    header = {key: value for key, value in data.items() if key != 'objects'}
+    builder.write(path, header, list(data), compress=compress, source=source)
+
+
+#===============================================================================
+# READER
+#===============================================================================
+
+class ColumnarOutput:
+    """Typed column access + lossless reconstruction of the JSON dict"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with np.load(self.path) as archive:
+            self.arrays = {name: archive[name] for name in archive.files}
+        top = _from_json_bytes(self.arrays.pop('header'))
+        self.header: Dict = top['header']
+        self.keys: List[str] = top['keys']
+        self.source: Optional[Dict] = top.get('source')
+        self.string_table: List[str] = _from_json_bytes(self.arrays.pop('strings'))
+        self.layouts: List[List[str]] = _from_json_bytes(self.arrays.pop('layouts'))
+
+    def __len__(self):
+        return len(self.arrays['layout_id'])
+
+    def string_ids(self, field: str) -> np.ndarray:
+        """int32 ids into string_table (-1 = absent or not a string)"""
+        ids = self.arrays.get(f'str__{field}')
+        return np.full(len(self), -1, dtype=np.int32) if ids is None else ids
+
+    def strings(self, field: str) -> np.ndarray:
+        """Object array of field values (None where absent)"""
+        table = np.array(self.string_table + [None], dtype=object)
+        return table[self.string_ids(field)]     # -1 → trailing None
+
+    def numeric(self, field: str) -> np.ndarray:
+        """float64 column, NaN where absent or not columnar"""
+        values = self.arrays.get(f'num__{field}')
+        if values is None:
+            width = NUMERIC_FIELDS[field]
+            return np.full((len(self), width) if width else len(self), np.nan)
+        return values
+
+    def positions(self) -> np.ndarray:
+        return self.numeric('position')
+
+    def _rows(self) -> Iterator[Dict]:
+        strings = self.string_table
+        layout_id, extras_id = self.arrays['layout_id'].tolist(), self.arrays['extras_id'].tolist()
+        string_columns = [(field, self.arrays[f'str__{field}'].tolist()) for field in STRING_FIELDS
+                          if f'str__{field}' in self.arrays]
+        numeric_columns = [(field, width, self.arrays[f'num__{field}'].tolist(), self.arrays[f'code__{field}'].tolist())
+                           for field, width in NUMERIC_FIELDS.items() if f'num__{field}' in self.arrays]
+
+        for i in range(len(layout_id)):
+            values = {}
+            for field, ids in string_columns:
+                if ids[i] >= 0:
+                    values[field] = strings[ids[i]]
+            for field, width, column, codes in numeric_columns:
+                code = codes[i]
+                if width == 0:
+                    if code:
+                        values[field] = _DECODE[code](column[i])
+                elif code[0]:
+                    values[field] = [_DECODE[c](v) for v, c in zip(column[i], code)]
+            if extras_id[i] >= 0:
+                values.update(json.loads(strings[extras_id[i]]))
+            yield {key: values[key] for key in self.layouts[layout_id[i]]}
+
+    def iter_objects(self) -> Iterator[Dict]:
+        """Rebuild object dicts one at a time"""
+        return self._rows()
+
+    def to_dict(self) -> Dict:
+        """Full output dict (as json.load on the matching JSON)"""
+        return {key: (list(self._rows()) if key == 'objects' else self.header[key]) for key in self.keys}
+
+
+def load_output(json_path: Union[str, Path]) -> Dict:
+    """
+    Load a pipeline output, preferring a fresh .npz over the JSON
+
+    Returns:
+        Output dict (objects as a list)
+    """
+    if columnar_fresh(json_path):
+        return ColumnarOutput(columnar_path(json_path)).to_dict()
+    with open(json_path) as f:
+        return json.load(f)
+
+
+def main():
+    """Convert JSON ⇄ .npz and report size/time"""
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="Convert pipeline output JSON ⇄ columnar .npz")
+    parser.add_argument('path', type=Path, help='output.json or output.npz')
+    parser.add_argument('-o', '--output', type=Path,
+                        help='Target file (default: X.npz for a JSON, X.roundtrip.json for an .npz)')
+    parser.add_argument('--compress', action='store_true', help='Compressed .npz')
+    parser.add_argument('--force', action='store_true', help='Overwrite an existing JSON target')
+    args = parser.parse_args()
+
+    path = args.path
+    start = time.perf_counter()
+    if path.suffix == COLUMNAR_SUFFIX:
+        # Never replace the pipeline's JSON (e.g. X_FINAL.json) by accident
+        target = args.output or path.with_suffix('.roundtrip.json')
+        if target.exists() and not args.force:
+            print(f"❌ {target} exists (use --force to overwrite, or -o for another target)")
+            sys.exit(1)
+        data = ColumnarOutput(path).to_dict()
+        with open(target, 'w') as f:
+            json.dump(data, f, indent=2)
+    else:
+        with open(path) as f:
+            data = json.load(f)
+        target = args.output or columnar_path(path)
+        write_columnar(data, target, compress=args.compress, source=source_stamp(path))
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {path.name} → {target.name}: {len(data.get('objects', []))} objects, "
+          f"{os.path.getsize(path) / 1e6:.2f}MB → {os.path.getsize(target) / 1e6:.2f}MB ({elapsed:.2f}s)")
+
+if __name__ == "__main__":
+    main()
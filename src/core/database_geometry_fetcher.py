@@ -18,9 +18,10 @@ No AI - pure binary blob parsing and mesh construction
 """
 
 import sqlite3
-import struct
 import numpy as np
 
+from library_index import LibraryIndex
+
 
 class DatabaseGeometryFetcher:
     """Fetch LOD300 geometry from Ifc_Object_Library.db"""
@@ -35,8 +36,27 @@ class DatabaseGeometryFetcher:
         self.db_path = database_path
         self.connection = sqlite3.connect(database_path)
         self.cursor = self.connection.cursor()
+        self._index = None
         print(f"✅ Connected to geometry database: {database_path}")
 
+    @property
+    def index(self):
+        """Catalogue index (LibraryIndex), built on first use"""
+        if self._index is None:
+            self._index = LibraryIndex.from_database(self.connection)
+        return self._index
+
+    def find_nearest(self, ifc_class, width_mm=None, depth_mm=None, height_mm=None, category=None):
+        """
+        Nearest LOD300 object_type by dimensions (no per-call SQL)
+
+        Returns:
+            object_type string or None
+        """
+        match = self.index.nearest(ifc_class, category=category, width_mm=width_mm,
+                                   depth_mm=depth_mm, height_mm=height_mm)
+        return match.object_type if match else None
+
     def fetch_geometry(self, object_type):
         """
         Fetch LOD300 geometry for object_type
@@ -166,12 +186,8 @@ class DatabaseGeometryFetcher:
         if len(blob) != expected_size:
             print(f"⚠️  Vertex blob size mismatch: expected {expected_size}, got {len(blob)}")
 
-        # Unpack as float32 array
-        float_count = len(blob) // 4
-        floats = struct.unpack(f'<{float_count}f', blob)  # Little-endian float32
-
-        # Reshape to (N, 3)
-        vertices = np.array(floats).reshape(-1, 3)
+        # View as little-endian float32 (no copy, read-only), reshape to (N, 3)
+        vertices = np.frombuffer(blob, dtype='<f4', count=len(blob) // 4).reshape(-1, 3)
         return vertices
 
     def _parse_faces_blob(self, blob, face_count):
@@ -193,12 +209,8 @@ class DatabaseGeometryFetcher:
         if len(blob) != expected_size:
             print(f"⚠️  Face blob size mismatch: expected {expected_size}, got {len(blob)}")
 
-        # Unpack as uint32 array
-        uint_count = len(blob) // 4
-        indices = struct.unpack(f'<{uint_count}I', blob)  # Little-endian uint32
-
-        # Reshape to (N, 3)
-        faces = np.array(indices).reshape(-1, 3)
+        # View as little-endian uint32 (no copy, read-only), reshape to (N, 3)
+        faces = np.frombuffer(blob, dtype='<u4', count=len(blob) // 4).reshape(-1, 3)
         return faces
 
     def _parse_normals_blob(self, blob, face_count):
@@ -220,12 +232,8 @@ class DatabaseGeometryFetcher:
         if len(blob) != expected_size:
             print(f"⚠️  Normal blob size mismatch: expected {expected_size}, got {len(blob)}")
 
-        # Unpack as float32 array
-        float_count = len(blob) // 4
-        floats = struct.unpack(f'<{float_count}f', blob)
-
-        # Reshape to (N, 3)
-        normals = np.array(floats).reshape(-1, 3)
+        # View as little-endian float32 (no copy, read-only), reshape to (N, 3)
+        normals = np.frombuffer(blob, dtype='<f4', count=len(blob) // 4).reshape(-1, 3)
         return normals
 
     def fetch_all_geometries(self, object_types):
@@ -246,7 +254,15 @@ class DatabaseGeometryFetcher:
         print(f"\n📦 Fetching {len(object_types)} unique geometries from database...")
         print(f"🔍 DEBUG: Requested types: {object_types}")
 
+        # Bulk pre-check: types absent from the catalog/geometry table skip the per-type queries
+        coverage = self.index.coverage(object_types)
+        unavailable = set(coverage.missing) | set(coverage.no_geometry)
+
         for obj_type in object_types:
+            if obj_type in unavailable:
+                failed_types.append(obj_type)
+                print(f"❌ FAILED: {obj_type} (not in library)")
+                continue
             geometry = self.fetch_geometry(obj_type)
             if geometry:
                 geometries[obj_type] = geometry
@@ -6,19 +6,36 @@ Orchestrator for PDF extraction pipeline.
 Imports modular components from separate files.
 """
 
+import importlib
 import math
 import re
 from datetime import datetime
 
-# Import modular components
+# Import modular components (the ones extraction itself uses)
 from src.core.calibration import CalibrationEngine
-from src.core.geometry_validator import GeometryValidator
-from src.core.wall_detection import WallDetector, WallValidator
-from src.core.inference_chain import InferenceChain
-from src.core.schedule_extractor import ScheduleExtractor
-from src.core.opening_detector import OpeningDetector
-from src.core.room_detector import RoomBoundaryDetector, RoomLabelExtractor
-from src.core.elevation_extractor import ElevationExtractor
+from src.core.wall_detection import WallDetector
+from src.core import tracing
+
+# The other detectors are still importable from here, but only loaded when
+# asked for (the two-tier extraction reaches them through vector_patterns)
+_LAZY_EXPORTS = {
+    'GeometryValidator': 'src.core.geometry_validator',
+    'WallValidator': 'src.core.wall_detection',
+    'InferenceChain': 'src.core.inference_chain',
+    'ScheduleExtractor': 'src.core.schedule_extractor',
+    'OpeningDetector': 'src.core.opening_detector',
+    'RoomBoundaryDetector': 'src.core.room_detector',
+    'RoomLabelExtractor': 'src.core.room_detector',
+    'ElevationExtractor': 'src.core.elevation_extractor',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -87,6 +104,7 @@ def infer_window_sill_heights(windows, elevations, window_schedule):
 # MAIN ORCHESTRATOR - TWO-TIER EXTRACTION PIPELINE
 # =============================================================================
 
+@tracing.traced()
 def complete_pdf_extraction(pdf_path, building_width=9.8, building_length=8.0, building_height=3.0):
     """
     Complete PDF → OUTPUT.json extraction pipeline (Two-Tier Architecture)
@@ -134,9 +152,9 @@ def complete_pdf_extraction(pdf_path, building_width=9.8, building_length=8.0, b
     print("\n🔧 STEP 2: Initializing extraction components...")
 
     # [FIFTH-D] Load IFC naming layer (discipline, ifc_class, groups)
-    from src.core.ifc_naming_util import IfcNamingLayer
+    from src.core.ifc_naming_util import load_naming_layer
     naming_layer_path = os.path.join(os.path.dirname(__file__), 'ifc_naming_layer.json')
-    naming_layer = IfcNamingLayer(naming_layer_path)
+    naming_layer = load_naming_layer(naming_layer_path)
 
     with pdfplumber.open(pdf_path) as pdf:
         # Initialize calibration engine (needed for all coordinate transforms)
@@ -175,8 +193,9 @@ def complete_pdf_extraction(pdf_path, building_width=9.8, building_length=8.0, b
         found_lod300_objects = []
         failed_lod300_objects = []
 
-        # Iterate through extraction sequence
-        for idx, item in enumerate(extraction_sequence, 1):
+        # Iterate through extraction sequence (one trace span per item, 'added' = objects found)
+        for idx, item in tracing.iter_spans(enumerate(extraction_sequence, 1), name=lambda entry: entry[1]['item'],
+                                            cat='template_item', count=lambda: len(objects)):
             phase = item.get('_phase', 'unknown')
             item_name = item['item']
             detection_id = item['detection_id']
@@ -542,34 +561,50 @@ def complete_pdf_extraction(pdf_path, building_width=9.8, building_length=8.0, b
         print(f"  1. Validate library references (validate_library_references.py)")
         print(f"  2. Place in Blender (mark 'placed': true)")
         print(f"  3. Verify hash total (summary.total_objects == count(placed))")
+        tracing.annotate(objects_out=len(objects), template_items=len(extraction_sequence))
 
         return output_json
 
 
 # =============================================================================
-# COMMAND LINE INTERFACE
+# STAGE ENTRY POINT (CLI + in-process pipeline runner)
 # =============================================================================
 
-if __name__ == "__main__":
-    import sys
-    import json
+def default_output_path(pdf_path):
+    """output_artifacts/<PDFname>_OUTPUT_<timestamp>.json (folder created if missing)"""
     import os
 
-    if len(sys.argv) < 2:
-        print("Usage: python3 extraction_engine.py <pdf_path> [output_json] [--building-width W] [--building-length L]")
-        print("\nExample:")
-        print("  python3 extraction_engine.py 'TB-LKTN HOUSE.pdf'")
-        print("  python3 extraction_engine.py 'TB-LKTN HOUSE.pdf' --building-width 9.8 --building-length 8.0")
-        print("  python3 extraction_engine.py 'TB-LKTN HOUSE.pdf' custom_output.json")
-        sys.exit(1)
+    # Create output_artifacts folder if it doesn't exist
+    os.makedirs("output_artifacts", exist_ok=True)
 
-    pdf_path = sys.argv[1]
+    # Generate timestamped filename following pattern: <PDFname>_OUTPUT_<timestamp>.json
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    pdf_name = os.path.basename(pdf_path).replace('.pdf', '').replace(' ', '_')
+    return f"output_artifacts/{pdf_name}_OUTPUT_{timestamp}.json"
+
+
+def run_extraction(pdf_path, output_path=None, building_width=None, building_length=None,
+                   building_height=None, columnar=False, save=True):
+    """
+    PDF → OUTPUT.json stage: derive building dimensions, extract, canvas-validate, save
+
+    Args:
+        pdf_path: Source PDF
+        output_path: Target JSON (default: output_artifacts/<PDFname>_OUTPUT_<timestamp>.json)
+        building_width/length/height: Overrides for the dimensions derived from the Annotations DB
+        columnar: Also write the .npz columnar copy
+        save: Write output_path (False = caller keeps the dict in memory)
+
+    Returns:
+        (output_json, output_path) - output_json is None if extraction failed
+    """
+    import os
 
     # [THIRD-D] Derive building dimensions from Annotations DB (Rule 0: extracted from PDF)
     # Replaces manual GridTruth.json with automated derivation
-    building_width = 9.7   # Fallback default (overridden by derived data if available)
-    building_length = 7.0  # Fallback default (overridden by derived data if available)
-    building_height = 3.0  # Fallback default (overridden by derived data if available)
+    derived_width = 9.7   # Fallback default (overridden by derived data if available)
+    derived_length = 7.0  # Fallback default (overridden by derived data if available)
+    derived_height = 3.0  # Fallback default (overridden by derived data if available)
 
     try:
         # Construct annotation database path from PDF filename
@@ -588,13 +623,13 @@ if __name__ == "__main__":
             elevations = derive_elevations(str(annotation_db))
 
             # Extract dimensions
-            building_width = envelope.get('width', building_width)
-            building_length = envelope.get('depth', building_length)
-            building_height = elevations.get('ceiling', building_height)
+            derived_width = envelope.get('width', derived_width)
+            derived_length = envelope.get('depth', derived_length)
+            derived_height = elevations.get('ceiling', derived_height)
 
             print(f"📐 [THIRD-D] Derived building dimensions from Annotations DB:")
-            print(f"   Width: {building_width}m, Depth: {building_length}m")
-            print(f"   Height: {building_height}m (from elevations.ceiling)")
+            print(f"   Width: {derived_width}m, Depth: {derived_length}m")
+            print(f"   Height: {derived_height}m (from elevations.ceiling)")
         else:
             print(f"⚠️  Annotation DB not found - using defaults")
             print(f"   Expected: {annotation_db}")
@@ -603,34 +638,13 @@ if __name__ == "__main__":
         print(f"⚠️  Could not derive dimensions from Annotations DB: {e}")
         print(f"   Using defaults")
 
-    output_path = None
-
-    i = 2
-    while i < len(sys.argv):
-        if sys.argv[i] == '--building-width' and i + 1 < len(sys.argv):
-            building_width = float(sys.argv[i + 1])
-            i += 2
-        elif sys.argv[i] == '--building-length' and i + 1 < len(sys.argv):
-            building_length = float(sys.argv[i + 1])
-            i += 2
-        elif sys.argv[i] == '--building-height' and i + 1 < len(sys.argv):
-            building_height = float(sys.argv[i + 1])
-            i += 2
-        elif not sys.argv[i].startswith('--'):
-            output_path = sys.argv[i]
-            i += 1
-        else:
-            i += 1
+    building_width = derived_width if building_width is None else building_width
+    building_length = derived_length if building_length is None else building_length
+    building_height = derived_height if building_height is None else building_height
 
     # Default output to output_artifacts folder with timestamp
     if not output_path:
-        # Create output_artifacts folder if it doesn't exist
-        os.makedirs("output_artifacts", exist_ok=True)
-
-        # Generate timestamped filename following pattern: <PDFname>_OUTPUT_<timestamp>.json
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        pdf_name = os.path.basename(pdf_path).replace('.pdf', '').replace(' ', '_')
-        output_path = f"output_artifacts/{pdf_name}_OUTPUT_{timestamp}.json"
+        output_path = default_output_path(pdf_path)
 
     # Run complete two-tier extraction
     output_json = complete_pdf_extraction(pdf_path, building_width, building_length, building_height)
@@ -661,17 +675,63 @@ if __name__ == "__main__":
         else:
             print(f"\n⚠️  Skipping 3D canvas validation (GridTruth.json or validation_rules.json not found)")
 
-    if output_json:
-        # Save to JSON
-        with open(output_path, 'w') as f:
-            json.dump(output_json, f, indent=2)
+    if output_json and save:
+        # Save to JSON (+ columnar .npz for the next stage)
+        from src.core.final_json_stream import dump_final_json
+        dump_final_json(output_json, output_path, sidecar=False, columnar=columnar)
 
         print(f"\n💾 Saved to: {output_path}")
+        if columnar:
+            print(f"💾 Columnar copy: {os.path.splitext(output_path)[0]}.npz")
         print(f"📁 Full path: {os.path.abspath(output_path)}")
         print(f"\n✅ Output JSON structure:")
         print(f"   • extraction_metadata: calibration data + timestamps")
         print(f"   • summary: hash total ({output_json['summary']['total_objects']} objects)")
         print(f"   • objects: all found items with 'placed': false")
-    else:
+
+    return output_json, output_path
+
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python3 extraction_engine.py <pdf_path> [output_json] [--building-width W] [--building-length L] [--columnar]")
+        print("\nExample:")
+        print("  python3 extraction_engine.py 'TB-LKTN HOUSE.pdf'")
+        print("  python3 extraction_engine.py 'TB-LKTN HOUSE.pdf' --building-width 9.8 --building-length 8.0")
+        print("  python3 extraction_engine.py 'TB-LKTN HOUSE.pdf' custom_output.json")
+        print("  python3 extraction_engine.py 'TB-LKTN HOUSE.pdf' --columnar   # + OUTPUT_*.npz")
+        sys.exit(1)
+
+    pdf_path = sys.argv[1]
+    output_path = None
+    building_width = building_length = building_height = None
+    columnar = '--columnar' in sys.argv[2:]
+
+    i = 2
+    while i < len(sys.argv):
+        if sys.argv[i] == '--building-width' and i + 1 < len(sys.argv):
+            building_width = float(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--building-length' and i + 1 < len(sys.argv):
+            building_length = float(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--building-height' and i + 1 < len(sys.argv):
+            building_height = float(sys.argv[i + 1])
+            i += 2
+        elif not sys.argv[i].startswith('--'):
+            output_path = sys.argv[i]
+            i += 1
+        else:
+            i += 1
+
+    output_json, output_path = run_extraction(pdf_path, output_path, building_width, building_length,
+                                              building_height, columnar=columnar)
+    if not output_json:
         print("\n❌ Extraction failed - see errors above")
         sys.exit(1)
@@ -0,0 +1,481 @@
+"""
+Final JSON Stream Module
+========================
+Bounded-memory access to *_FINAL.json pipeline outputs.
+
+The header sections (extraction_metadata, summary, building_envelope, ...)
+are small; the 'objects' list is what grows to 100k+ entries. This module
+reads the header up front and hands out 'objects' as a re-iterable stream
+that parses one object at a time.
+
+Sources (first that applies):
+    <name>.objects.jsonl   JSON Lines sidecar written next to the FINAL JSON
+                           (line 1 = header, then one object per line); used
+                           when it was written from the JSON as it is now
+    <name>.npz             Columnar copy (src/core/columnar_output.py), same
+                           freshness rule
+    <name>.json            Incremental parse of the JSON itself
+
+Companions record the size and sha256 of the JSON they were written from
+('source'); they are used only while the JSON still has that size and
+hash. mtimes are not trusted - cp -p, touch -r and restores keep them
+while the contents change. Hash checks are remembered per process while
+the JSON's inode, size, mtime and ctime are unchanged.
+
+Usage:
+    final = FinalJson("output_artifacts/X_OUTPUT_..._FINAL.json")
+    summary = final.header.get('summary', {})
+    for obj in final.objects:          # can be iterated repeatedly
+        ...
+
+    data = read_final_json(path)       # dict with lazy 'objects' (len(), iteration)
+    dump_final_json(data, path)        # same layout as json.dump(indent=2) + sidecar
+    dump_final_json(data, path, columnar=True)   # ... + .npz in the same pass
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+
+OBJECTS_KEY = 'objects'
+SIDECAR_SUFFIX = '.objects.jsonl'
+CHUNK_SIZE = 1 << 16
+HASH_CHUNK = 1 << 20
+
+# Fixed-width start of the sidecar header line; the stamp is filled in once the JSON is written
+_SOURCE_PREFIX = '{{"source": {{"size": {size:<20d}, "sha256": "{sha256}"}}, '
+
+_verified: Dict[Tuple, bool] = {}     # (json, inode, size, mtime_ns, ctime_ns, sha256) → match
+
+_WHITESPACE = ' \t\n\r'
+
+
+def sidecar_path(json_path: Union[str, Path]) -> Path:
+    """X_FINAL.json → X_FINAL.objects.jsonl"""
+    json_path = Path(json_path)
+    return json_path.with_name(json_path.stem + SIDECAR_SUFFIX)
+
+
+def source_stamp(json_path: Union[str, Path]) -> Dict:
+    """{'size', 'sha256'} of a JSON file, as recorded in its companions"""
+    h = hashlib.sha256()
+    with open(json_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            h.update(chunk)
+    return {'size': os.path.getsize(json_path), 'sha256': h.hexdigest()}
+
+
+def source_matches(json_path: Union[str, Path], stamp: Optional[Dict]) -> bool:
+    """
+    A companion with this source stamp mirrors the JSON as it is now
+
+    True when the JSON does not exist (companion-only output); False for
+    companions without a stamp (written before stamps existed).
+    """
+    json_path = Path(json_path)
+    if not json_path.exists():
+        return True
+    if not stamp or 'sha256' not in stamp:
+        return False
+    stat = json_path.stat()
+    if stat.st_size != stamp.get('size'):
+        return False
+    # ctime changes on every write and cannot be set back (unlike mtime)
+    key = (str(json_path.resolve()), stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns,
+           stamp['sha256'])
+    if key not in _verified:
+        _verified[key] = source_stamp(json_path)['sha256'] == stamp['sha256']
+    return _verified[key]
+
+
+def read_sidecar_header(sidecar: Union[str, Path]) -> Dict:
+    """First line of a .objects.jsonl sidecar: {'source', 'header', 'keys'}"""
+    with open(sidecar) as f:
+        return json.loads(f.readline())
+
+
+def _columnar_module():
+    """columnar_output pulls in NumPy - only imported when a .npz is involved"""
+    if __package__:
+        from . import columnar_output
+    else:
+        import columnar_output
+    return columnar_output
+
+
+#===============================================================================
+# INCREMENTAL PARSER
+#===============================================================================
+
+class _Scanner:
+    """Chunked reader that decodes one JSON value at a time"""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.offset = 0     # Characters dropped from the front of buf
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.pos:
+            self.offset += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def _error(self, message, pos=None):
+        """JSONDecodeError positioned in the file, not the buffer"""
+        pos = self.pos if pos is None else pos
+        error = json.JSONDecodeError(message, self.buf, pos)
+        error.pos = self.offset + pos
+        error.args = (f"{message}: char {error.pos}",)
+        return error
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input)"""
+        while True:
+            n = len(self.buf)
+            while self.pos < n and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < n:
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise self._error(f"Expecting one of {chars!r}, got {ch!r}")
+        self.pos += 1
+        return ch
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                error_at = self.offset + e.pos
+                if not self._fill():
+                    raise self._error(e.msg, error_at - self.offset) from None
+                continue
+            # A number or literal ending exactly at the buffer edge may continue
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def _iter_document(f, objects_key: str = OBJECTS_KEY) -> Iterator[Tuple[str, Optional[str], Any]]:
+    """
+    Walk a top-level JSON object
+
+    Yields:
+        ('key', name, value)    header entry
+        ('objects', name, None) position of the objects list (before its items)
+        ('object', None, obj)   one element of the objects list
+    """
+    scanner = _Scanner(f)
+    scanner.expect('{')
+    if scanner.peek() == '}':
+        scanner.pos += 1
+    else:
+        while True:
+            key = scanner.value()
+            if not isinstance(key, str):
+                raise scanner._error("Expecting property name")
+            scanner.expect(':')
+            if key == objects_key and scanner.peek() == '[':
+                yield 'objects', key, None
+                scanner.expect('[')
+                if scanner.peek() == ']':
+                    scanner.pos += 1
+                else:
+                    while True:
+                        yield 'object', None, scanner.value()
+                        if scanner.expect(',]') == ']':
+                            break
+            else:
+                yield 'key', key, scanner.value()
+            if scanner.expect(',}') == '}':
+                break
+    if scanner.peek():
+        raise scanner._error("Extra data")
+
+
+#===============================================================================
+# READER
+#===============================================================================
+
+class ObjectStream:
+    """Re-iterable, lazily parsed 'objects' list"""
+
+    def __init__(self, final: 'FinalJson'):
+        self._final = final
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self._final.iter_objects()
+
+    def __len__(self) -> int:
+        return self._final.object_count
+
+
+class FinalJson:
+    """Header up front, objects on demand"""
+
+    def __init__(self, path: Union[str, Path], use_sidecar: bool = True, use_columnar: bool = True):
+        self.path = Path(path)
+        self.sidecar = sidecar_path(self.path)
+        self.columnar = self.path.with_suffix('.npz')
+        self.use_sidecar = use_sidecar and self._fresh(self.sidecar)
+        self.use_columnar = use_columnar and not self.use_sidecar and self._fresh(self.columnar)
+        self._columnar_output = None
+        self._header = None
+        self._keys = None
+        self._count = None
+
+    def _fresh(self, companion: Path) -> bool:
+        """Companion file exists and was written from the JSON as it is now"""
+        if not companion.exists():
+            return False
+        if not self.path.exists():
+            return True
+        if companion == self.columnar:
+            return _columnar_module().columnar_fresh(self.path)
+        try:
+            stamp = read_sidecar_header(companion).get('source')
+        except (OSError, ValueError):
+            return False
+        return source_matches(self.path, stamp)
+
+    @property
+    def source(self) -> Path:
+        """File objects are actually read from"""
+        if self.use_sidecar:
+            return self.sidecar
+        return self.columnar if self.use_columnar else self.path
+
+    def _columnar(self):
+        if self._columnar_output is None:
+            self._columnar_output = _columnar_module().ColumnarOutput(self.columnar)
+        return self._columnar_output
+
+    def _load_header(self):
+        if self.use_columnar:
+            output = self._columnar()
+            self._header, self._keys, self._count = output.header, output.keys, len(output)
+            return
+
+        if self.use_sidecar:
+            first = read_sidecar_header(self.sidecar)
+            self._header = first['header']
+            self._keys = first.get('keys', list(self._header) + [OBJECTS_KEY])
+            return
+
+        # One pass over the JSON; objects are decoded and dropped (also validates syntax)
+        header, keys, count = {}, [], 0
+        with open(self.path) as f:
+            for kind, key, value in _iter_document(f):
+                if kind == 'object':
+                    count += 1
+                else:
+                    keys.append(key)
+                    if kind == 'key':
+                        header[key] = value
+        self._header, self._keys, self._count = header, keys, count
+
+    @property
+    def header(self) -> Dict:
+        """All top-level sections except 'objects'"""
+        if self._header is None:
+            self._load_header()
+        return self._header
+
+    @property
+    def object_count(self) -> int:
+        if self._count is None:
+            if self.use_sidecar:
+                with open(self.sidecar, 'rb') as f:
+                    self._count = sum(1 for line in f if line.strip()) - 1
+            else:
+                self._load_header()
+        return self._count
+
+    @property
+    def objects(self) -> ObjectStream:
+        return ObjectStream(self)
+
+    def iter_objects(self) -> Iterator[Dict]:
+        """Parse and yield objects one at a time"""
+        if self.use_columnar:
+            yield from self._columnar().iter_objects()
+            return
+
+        if self.use_sidecar:
+            with open(self.sidecar) as f:
+                f.readline()
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            return
+
+        # Header sections and count come for free on a full pass
+        header, keys, count = {}, [], 0
+        with open(self.path) as f:
+            for kind, key, value in _iter_document(f):
+                if kind == 'object':
+                    count += 1
+                    yield value
+                else:
+                    keys.append(key)
+                    if kind == 'key':
+                        header[key] = value
+        if self._header is None:
+            self._header, self._keys, self._count = header, keys, count
+
+    def as_dict(self) -> Dict:
+        """Header sections plus lazy 'objects', in file order"""
+        self.header
+        return {key: (self.objects if key == OBJECTS_KEY else self._header[key]) for key in self._keys}
+
+
+def read_final_json(path: Union[str, Path], use_sidecar: bool = True, use_columnar: bool = True) -> Dict:
+    """
+    Drop-in for json.load on FINAL outputs
+
+    Returns a dict whose 'objects' supports len() and repeated iteration
+    but is never held in memory. Raises FileNotFoundError /
+    json.JSONDecodeError like json.load. Pass use_sidecar=False,
+    use_columnar=False to read (and syntax-check) the JSON itself.
+    """
+    final = FinalJson(path, use_sidecar=use_sidecar, use_columnar=use_columnar)
+    if not final.source.exists():
+        raise FileNotFoundError(f"No such file: '{path}'")
+    return final.as_dict()
+
+
+#===============================================================================
+# WRITER
+#===============================================================================
+
+def _indent_block(text: str, indent: str) -> str:
+    return text.replace('\n', '\n' + indent)
+
+
+def dump_final_json(data: Dict, path: Union[str, Path], indent: int = 2, sidecar: bool = True,
+                    columnar: bool = False):
+    """
+    Write a FINAL output without materialising 'objects'
+
+    Produces the same bytes as json.dump(data, f, indent=indent); 'objects'
+    may be a list, an ObjectStream or any iterable. The JSON Lines sidecar
+    and the columnar .npz are filled in the same pass and stamped with the
+    size and sha256 of the JSON bytes written.
+
+    Args:
+        data: Output dict
+        path: Target .json path
+        indent: JSON indent (as json.dump)
+        sidecar: Also write <name>.objects.jsonl
+        columnar: Also write <name>.npz
+    """
+    path = Path(path)
+    pad = ' ' * indent
+    keys = list(data)
+    header = {key: value for key, value in data.items() if key != OBJECTS_KEY}
+    builder = _columnar_module().ColumnarBuilder() if columnar else None
+    digest = hashlib.sha256()
+    size = 0
+
+    side = open(sidecar_path(path), 'w') if sidecar else None
+    try:
+        if side:
+            # Placeholder stamp of the final width, overwritten below
+            side.write(_SOURCE_PREFIX.format(size=0, sha256='0' * 64)
+                       + json.dumps({'header': header, 'keys': keys})[1:] + '\n')
+
+        with open(path, 'w') as f:
+            def write(text: str):
+                nonlocal size
+                encoded = text.encode('utf-8')
+                digest.update(encoded)
+                size += len(encoded)
+                f.write(text)
+
+            if not keys:
+                write('{}')
+            else:
+                write('{')
+                for n, key in enumerate(keys):
+                    write(('\n' if n == 0 else ',\n') + pad + json.dumps(key) + ': ')
+                    if key != OBJECTS_KEY or isinstance(data[key], (dict, str)):
+                        write(_indent_block(json.dumps(data[key], indent=indent), pad))
+                        continue
+
+                    # Stream objects list
+                    empty = True
+                    for obj in data[key]:
+                        write(('[' if empty else ',') + '\n' + pad * 2)
+                        write(_indent_block(json.dumps(obj, indent=indent), pad * 2))
+                        if side:
+                            side.write(json.dumps(obj) + '\n')
+                        if builder:
+                            builder.add(obj)
+                        empty = False
+                    write('[]' if empty else '\n' + pad + ']')
+                write('\n}')
+
+        stamp = {'size': size, 'sha256': digest.hexdigest()}
+        if side:
+            side.seek(0)
+            side.write(_SOURCE_PREFIX.format(**stamp))
+    finally:
+        if side:
+            side.close()
+    if builder and not isinstance(data.get(OBJECTS_KEY, []), (dict, str)):
+        builder.write(path.with_suffix('.npz'), header, keys, source=stamp)
+
+
+def write_sidecar(path: Union[str, Path]) -> Path:
+    """Build the JSON Lines sidecar for an existing FINAL JSON (one streaming pass)"""
+    final = FinalJson(path, use_sidecar=False, use_columnar=False)
+    side = sidecar_path(path)
+    with open(side, 'w') as f:
+        f.write(json.dumps({'source': source_stamp(path), 'header': final.header,
+                            'keys': list(final.as_dict())}) + '\n')
+        for obj in final.iter_objects():
+            f.write(json.dumps(obj) + '\n')
+    return side
+
+
+def main():
+    """Print header sections and object count of a FINAL JSON"""
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Usage: python3 final_json_stream.py <output_FINAL.json> [--write-sidecar]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    start = time.perf_counter()
+    final = FinalJson(path)
+    print(f"✅ {final.object_count} objects, sections: {', '.join(final.header)} "
+          f"({final.source.name}, {(time.perf_counter() - start) * 1000:.0f}ms)")
+
+    if '--write-sidecar' in sys.argv[2:]:
+        print(f"💾 Sidecar written: {write_sidecar(path)}")
+
+if __name__ == "__main__":
+    main()
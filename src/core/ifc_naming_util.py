@@ -14,6 +14,9 @@ Usage:
     
     # Apply to entire output JSON
     output = apply_naming_to_output(output_data, naming)
+
+    # Parsed once per process (re-read if the file changes)
+    naming = load_naming_layer("ifc_naming_layer.json")
 """
 
 import json
@@ -197,6 +200,25 @@ class IfcNamingLayer:
         return [discipline, group]
 
 
+_loaded_layers: Dict[tuple, IfcNamingLayer] = {}
+
+
+def load_naming_layer(config_path: str) -> IfcNamingLayer:
+    """
+    IfcNamingLayer(config_path), memoised on path + mtime
+
+    Long-running processes (job service workers) parse the naming layer
+    once; an edited file is picked up on the next call.
+    """
+    path = Path(config_path).resolve()
+    memo_key = (str(path), path.stat().st_mtime_ns)
+    naming = _loaded_layers.get(memo_key)
+    if naming is None:
+        _loaded_layers.clear()
+        naming = _loaded_layers[memo_key] = IfcNamingLayer(str(path))
+    return naming
+
+
 def apply_naming_to_output(output_data: Dict, naming: IfcNamingLayer) -> Dict:
     """
     Apply IFC naming layer to output JSON.
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Import Profile - Startup time of the pipeline entry points, with a budget
+
+Each entry point is imported in a fresh interpreter under `-X importtime`,
+the way its script starts (script directory first on sys.path, the repo
+and src/ on PYTHONPATH like RUN_COMPLETE_PIPELINE.sh), without running
+its main(). Per entry point:
+
+    wall_s     process start → imports done (best of --repeat runs)
+    import_s   total import time reported by -X importtime
+    heavy      heavy dependencies it pulled in (NumPy, pdfplumber, cv2, ...)
+    top        the entry module's slowest direct imports
+
+The budget check fails an entry point that starts slower than its budget
+or imports a heavy module it should not need: post-processing and
+validation commands only touch JSON/SQLite, and the OCR/OpenCV
+extractors load cv2/pytesseract on first use (lazy_import.py).
+benchmark_pipeline.py records this profile with every run.
+
+Usage:
+    python3 src/core/import_profile.py                         # all entry points
+    python3 src/core/import_profile.py src/core/post_processor.py --repeat 5
+    python3 src/core/import_profile.py --json startup.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+HEAVY_MODULES = ('numpy', 'pdfplumber', 'pdfminer', 'cv2', 'pytesseract', 'pdf2image', 'PIL')
+DEFAULT_BUDGET_S = 0.5
+
+# (script, startup budget in seconds, heavy modules it may import)
+ENTRY_POINTS: List[Tuple[str, float, Tuple[str, ...]]] = [
+    ('src/core/pipeline_runner.py', DEFAULT_BUDGET_S, ()),
+    ('src/core/extraction_engine.py', DEFAULT_BUDGET_S, ()),    # pdfplumber once extraction starts
+    ('src/core/post_processor.py', DEFAULT_BUDGET_S, ()),
+    ('src/core/wall_combiner.py', DEFAULT_BUDGET_S, ()),
+    ('src/core/final_json_stream.py', DEFAULT_BUDGET_S, ()),
+    ('src/validators/validate_output_json.py', DEFAULT_BUDGET_S, ()),
+    ('src/validators/validate_spatial_logic.py', DEFAULT_BUDGET_S, ()),
+    ('src/validators/validate_room_walls.py', DEFAULT_BUDGET_S, ()),
+    ('src/core/vector_extractor.py', DEFAULT_BUDGET_S, ()),
+    ('src/core/tesseract_opencv_extractor.py', DEFAULT_BUDGET_S, ()),
+    ('src/core/enhanced_vector_extractor.py', DEFAULT_BUDGET_S, ()),
+    ('src/tools/verify_output_library_coverage.py', 1.0, ('numpy',)),
+]
+
+
+#===============================================================================
+# PROFILE
+#===============================================================================
+
+def parse_importtime(stderr: str, module: str, top: int = 5) -> Dict:
+    """Totals from -X importtime output (children are listed before their parent)"""
+    total_us = 0
+    count = 0
+    heavy: Dict[str, float] = {}
+    children: List[Tuple[str, int]] = []
+    direct: List[Tuple[str, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        cumulative = int(cumulative)
+        count += 1
+        if name in HEAVY_MODULES:
+            heavy[name] = round(heavy.get(name, 0) + cumulative / 1e6, 4)
+        if depth == 1:
+            children.append((name, cumulative))
+        elif depth == 0:
+            total_us += cumulative
+            if name == module:
+                direct = children
+            children = []
+    direct.sort(key=lambda item: -item[1])
+    return {
+        'import_s': round(total_us / 1e6, 4),
+        'modules': count,
+        'heavy': heavy,
+        'top': [[name, round(us / 1e6, 4)] for name, us in direct[:top]],
+    }
+
+
+def profile_script(script: str, repeat: int = 3, timeout: float = 60) -> Dict:
+    """Import one script in fresh interpreters; the fastest run is kept"""
+    path = (REPO_ROOT / script).resolve()
+    module = path.stem
+    code = (f"import sys; sys.argv = [{str(path)!r}]; sys.path.insert(0, {str(path.parent)!r}); "
+            f"import {module}")
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(REPO_ROOT), str(REPO_ROOT / 'src'),
+                                                      env.get('PYTHONPATH')]))
+    best = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        try:
+            done = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=REPO_ROOT, env=env,
+                                  capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return {'script': script, 'status': 'error', 'error': f"timed out after {timeout:.0f}s"}
+        wall = time.perf_counter() - start
+        if done.returncode != 0:
+            lines = [line for line in done.stderr.splitlines() if not line.startswith('import time:')]
+            return {'script': script, 'status': 'error', 'error': (lines or ['exit code %d' % done.returncode])[-1]}
+        if best is None or wall < best['wall_s']:
+            best = {'script': script, 'wall_s': round(wall, 4), **parse_importtime(done.stderr, module)}
+    return best
+
+
+def profile_entries(entries: Sequence[Tuple[str, float, Tuple[str, ...]]] = ENTRY_POINTS,
+                    repeat: int = 3) -> List[Dict]:
+    """profile_script() for each entry point, with its budget verdict"""
+    results = []
+    for script, budget, allowed in entries:
+        result = profile_script(script, repeat)
+        result['budget_s'] = budget
+        if result.get('status') != 'error':
+            banned = sorted(name for name in result['heavy'] if name not in allowed)
+            if result['wall_s'] > budget:
+                result['status'] = 'over budget'
+            elif banned:
+                result['status'] = 'heavy import'
+            else:
+                result['status'] = 'ok'
+            result['banned'] = banned
+        results.append(result)
+    return results
+
+
+def check_budget(results: List[Dict]) -> List[str]:
+    """One line per entry point that is not 'ok'"""
+    problems = []
+    for result in results:
+        if result['status'] == 'ok':
+            continue
+        if result['status'] == 'error':
+            problems.append(f"{result['script']}: import failed - {result['error']}")
+        elif result['status'] == 'over budget':
+            problems.append(f"{result['script']}: starts in {result['wall_s']:.3f}s "
+                            f"(budget {result['budget_s']:.2f}s)")
+        else:
+            problems.append(f"{result['script']}: imports {', '.join(result['banned'])}")
+    return problems
+
+
+def print_profile(results: List[Dict]):
+    print(f"{'entry point':<44} {'start s':>8} {'import s':>9} {'mods':>5}  {'heavy / slowest imports'}")
+    for result in results:
+        name = result['script'].split('/', 1)[-1]
+        if result['status'] == 'error':
+            print(f"{name[:44]:<44} {'-':>8} {'-':>9} {'-':>5}  ❌ {result['error']}")
+            continue
+        mark = '' if result['status'] == 'ok' else f"  ❌ {result['status']}"
+        heavy = ', '.join(f"{n} {s:.3f}" for n, s in result['heavy'].items())
+        slowest = ', '.join(f"{n} {s:.3f}" for n, s in result['top'][:3])
+        print(f"{name[:44]:<44} {result['wall_s']:>8.3f} {result['import_s']:>9.3f} {result['modules']:>5}  "
+              f"{heavy or slowest}{mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup (import) time of the pipeline entry points")
+    parser.add_argument('scripts', nargs='*', help="Scripts to profile, relative to the repo (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per script, fastest kept (default: 3)")
+    parser.add_argument('--budget', type=float, help="Override every budget (seconds)")
+    parser.add_argument('--json', help="Write the profile to this file")
+    args = parser.parse_args()
+
+    entries = ENTRY_POINTS
+    if args.scripts:
+        known = {script: (budget, allowed) for script, budget, allowed in ENTRY_POINTS}
+        entries = [(script, *known.get(script, (DEFAULT_BUDGET_S, ()))) for script in args.scripts]
+    if args.budget is not None:
+        entries = [(script, args.budget, allowed) for script, _, allowed in entries]
+
+    print(f"⏱️  Startup profile ({sys.executable}, best of {args.repeat})")
+    results = profile_entries(entries, args.repeat)
+    print_profile(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 {args.json}")
+
+    problems = check_budget(results)
+    if problems:
+        print(f"\n❌ {len(problems)} entry points over budget:")
+        for line in problems:
+            print(f"   {line}")
+        sys.exit(1)
+    print("\n✅ All entry points within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,606 @@
+#!/usr/bin/env python3
+"""
+Job Service - Local queue + warm worker pool for pipeline runs
+
+A long-running process that accepts PDFs over a local HTTP API (127.0.0.1
+or a Unix socket), queues them in SQLite and runs them on worker processes
+that stay up between drawings. Each worker imports the pipeline modules
+(NumPy, pdfplumber, extraction, room templates, validators) and parses the
+IFC naming layer once at start, then runs pipeline_runner.run_pipeline()
+for one job after another, so the per-drawing cold start of a fresh
+interpreter is paid once per worker. Nothing leaves the machine.
+
+    <service dir>/                  (default output_artifacts/job_service)
+        jobs.db                     queue: status, timings, exit code per job
+        jobs/<id>/                  job working directory (isolated output_artifacts/)
+            pipeline.log            full pipeline output
+            output_artifacts/...    FINAL JSON, provenance, annotation DB, ...
+
+Jobs left 'running' by a stopped service are queued again at start. A
+worker that dies marks its job failed and is replaced.
+
+API (JSON unless noted):
+    POST   /jobs                          {"pdf": path, "columnar": bool, "validate": bool} → job
+    GET    /jobs[?status=queued]          jobs, newest first
+    GET    /jobs/<id>                     job
+    DELETE /jobs/<id>                     cancel a queued job
+    GET    /jobs/<id>/log                 pipeline.log (text)
+    GET    /jobs/<id>/artifacts           files in the job directory
+    GET    /jobs/<id>/artifacts/<path>    one file (bytes)
+    GET    /health                        queue counts + workers
+
+Usage:
+    python3 src/core/job_service.py serve --workers 4
+    python3 src/core/job_service.py serve --socket /tmp/pipeline.sock
+    python3 src/core/job_service.py submit "examples/TB-LKTN_House/TB-LKTN HOUSE.pdf"
+    python3 src/core/job_service.py status 1
+    python3 src/core/job_service.py list
+"""
+
+import argparse
+import contextlib
+import fcntl
+import http.client
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+for _path in (REPO_ROOT / 'src' / 'validators', REPO_ROOT / 'src' / 'core', REPO_ROOT / 'src', REPO_ROOT):
+    sys.path.insert(0, str(_path))
+
+from batch_runner import count_objects, find_final
+from stage_cache import DEFAULT_CACHE_DIR
+
+SERVICE_DIR = Path('output_artifacts') / 'job_service'
+LIBRARY_DB = 'LocalLibrary/Ifc_Object_Library.db'
+DEFAULT_PORT = 8765
+POLL_SECONDS = 0.5
+STATUSES = ('queued', 'running', 'done', 'failed', 'cancelled')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    pdf         TEXT NOT NULL,
+    options     TEXT NOT NULL DEFAULT '{}',
+    status      TEXT NOT NULL DEFAULT 'queued',
+    submitted   TEXT NOT NULL,
+    started     TEXT,
+    finished    TEXT,
+    seconds     REAL,
+    worker      INTEGER,
+    exit_code   INTEGER,
+    objects     INTEGER,
+    final       TEXT,
+    error       TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, id);
+'''
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+#===============================================================================
+# QUEUE
+#===============================================================================
+
+class JobQueue:
+    """SQLite-backed job table (one connection per process, shared by the API threads)"""
+
+    def __init__(self, service_dir: Path):
+        self.service_dir = Path(service_dir)
+        self.jobs_dir = self.service_dir / 'jobs'
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.service_dir / 'jobs.db', timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.RLock()
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self.lock:
+            return self.conn.execute(sql, params)
+
+    def job_dir(self, job_id: int) -> Path:
+        return self.jobs_dir / str(job_id)
+
+    def submit(self, pdf: str, options: Optional[Dict] = None) -> Dict:
+        with self.lock:
+            cursor = self.conn.execute('INSERT INTO jobs (pdf, options, submitted) VALUES (?, ?, ?)',
+                                       (pdf, json.dumps(options or {}), _now()))
+            return self.get(cursor.lastrowid)
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        row = self._execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._as_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[Dict]:
+        if status:
+            rows = self._execute('SELECT * FROM jobs WHERE status = ? ORDER BY id DESC LIMIT ?',
+                                 (status, limit)).fetchall()
+        else:
+            rows = self._execute('SELECT * FROM jobs ORDER BY id DESC LIMIT ?', (limit,)).fetchall()
+        return [self._as_dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys(STATUSES, 0)
+        counts.update(self._execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall())
+        return counts
+
+    def cancel(self, job_id: int) -> bool:
+        cursor = self._execute("UPDATE jobs SET status = 'cancelled', finished = ? "
+                               "WHERE id = ? AND status = 'queued'", (_now(), job_id))
+        return cursor.rowcount == 1
+
+    def claim(self, worker: int) -> Optional[Dict]:
+        """Atomically take the oldest queued job"""
+        with self.lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self.conn.execute("SELECT id FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1").fetchone()
+                if row:
+                    self.conn.execute("UPDATE jobs SET status = 'running', worker = ?, started = ? WHERE id = ?",
+                                      (worker, _now(), row['id']))
+                self.conn.execute('COMMIT')
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+        return self.get(row['id']) if row else None
+
+    def finish(self, job_id: int, status: str, seconds: float, exit_code: Optional[int] = None,
+               objects: Optional[int] = None, final: Optional[str] = None, error: Optional[str] = None):
+        self._execute('UPDATE jobs SET status = ?, finished = ?, seconds = ?, exit_code = ?, objects = ?, '
+                      'final = ?, error = ? WHERE id = ?',
+                      (status, _now(), round(seconds, 3), exit_code, objects, final, error, job_id))
+
+    def fail_running(self, worker: int, error: str):
+        """Jobs of a worker that died"""
+        self._execute("UPDATE jobs SET status = 'failed', finished = ?, error = ? "
+                      "WHERE worker = ? AND status = 'running'", (_now(), error, worker))
+
+    def requeue_running(self) -> int:
+        """Jobs interrupted by a service stop go back to the queue"""
+        cursor = self._execute("UPDATE jobs SET status = 'queued', worker = NULL, started = NULL "
+                               "WHERE status = 'running'")
+        return cursor.rowcount
+
+    @staticmethod
+    def _as_dict(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job['options'] = json.loads(job['options'])
+        return job
+
+
+#===============================================================================
+# WORKERS
+#===============================================================================
+
+def warm_up():
+    """Import every pipeline stage module and parse the naming layer once"""
+    import numpy                                            # noqa: F401
+    import pdfplumber                                       # noqa: F401
+    import pipeline_runner                                  # noqa: F401
+    import primitive_extractor_enhanced                     # noqa: F401
+    import src.core.extraction_engine                       # noqa: F401
+    import src.core.post_processor                          # noqa: F401
+    import src.core.building_canvas                         # noqa: F401
+    import room_inference.integrate_room_templates          # noqa: F401
+    import structural_validator                             # noqa: F401
+    for validator in ('validate_ubbl_compliance', 'comprehensive_test', 'validate_spatial_logic',
+                      'validate_room_walls'):
+        __import__(validator)
+    from src.core.ifc_naming_util import load_naming_layer
+    load_naming_layer(REPO_ROOT / 'src' / 'core' / 'ifc_naming_layer.json')
+
+
+def run_job(queue: JobQueue, job: Dict, library_db: Path, cache_dir: Optional[Path]):
+    """Run one claimed job in its directory; records the outcome in the queue"""
+    import pipeline_runner
+    from stage_cache import StageCache
+
+    job_dir = queue.job_dir(job['id'])
+    job_dir.mkdir(parents=True, exist_ok=True)
+    options = job['options']
+    cache = StageCache(cache_dir or DEFAULT_CACHE_DIR, enabled=cache_dir is not None, source_root=REPO_ROOT)
+    start = time.perf_counter()
+    exit_code, error = None, None
+    previous_dir = os.getcwd()
+    try:
+        os.chdir(job_dir)
+        with open('pipeline.log', 'w') as log, contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            try:
+                exit_code = pipeline_runner.run_pipeline(
+                    job['pdf'], columnar=bool(options.get('columnar')), library_db=str(library_db),
+                    validate=options.get('validate', True), cache=cache, jobs=1)
+            except BaseException as e:
+                traceback.print_exc()
+                error = f"{type(e).__name__}: {e}"
+    finally:
+        os.chdir(previous_dir)
+
+    final_path = find_final(job_dir)
+    objects = None
+    if final_path is not None:
+        with contextlib.suppress(OSError, ValueError):
+            objects = count_objects(final_path)
+    status = 'done' if exit_code == 0 else 'failed'
+    if status == 'failed' and error is None:
+        error = f"Pipeline exit code {exit_code} (see pipeline.log)"
+    queue.finish(job['id'], status, time.perf_counter() - start, exit_code, objects,
+                 str(final_path) if final_path else None, error)
+
+
+def worker_main(worker: int, service_dir: Path, library_db: Path, cache_dir: Optional[Path], stop, service_pid: int):
+    """Worker process: warm up once, then claim and run jobs until stopped (or the service is gone)"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)    # the service stops workers via `stop`
+    warm_up()
+    queue = JobQueue(service_dir)
+    while not stop.value and os.getppid() == service_pid:
+        job = queue.claim(worker)
+        if job is None:
+            time.sleep(POLL_SECONDS)
+            continue
+        run_job(queue, job, library_db, cache_dir)
+
+
+class WorkerPool:
+    """Long-lived worker processes; dead workers are replaced"""
+
+    def __init__(self, size: int, service_dir: Path, library_db: Path, cache_dir: Optional[Path]):
+        self.size = size
+        self.args = (service_dir, library_db, cache_dir)
+        self.context = multiprocessing.get_context('spawn')
+        # Lock-free flag: a killed worker cannot leave it locked (unlike an Event)
+        self.stop = self.context.Value('b', 0, lock=False)
+        self.workers: Dict[int, multiprocessing.Process] = {}
+
+    def _spawn(self, worker: int):
+        process = self.context.Process(target=worker_main, args=(worker, *self.args, self.stop, os.getpid()),
+                                       name=f"pipeline-worker-{worker}", daemon=True)
+        process.start()
+        self.workers[worker] = process
+
+    def start(self):
+        for worker in range(1, self.size + 1):
+            self._spawn(worker)
+
+    def supervise(self, queue: JobQueue):
+        """Replace workers that exited (their running job is marked failed)"""
+        for worker, process in list(self.workers.items()):
+            if not process.is_alive() and not self.stop.value:
+                queue.fail_running(worker, f"Worker exited with code {process.exitcode}")
+                print(f"   ⚠️  Worker {worker} exited ({process.exitcode}) - restarting")
+                self._spawn(worker)
+
+    def alive(self) -> int:
+        return sum(process.is_alive() for process in self.workers.values())
+
+    def shutdown(self, timeout: float = 10.0):
+        self.stop.value = 1
+        for process in self.workers.values():
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+
+
+#===============================================================================
+# HTTP API
+#===============================================================================
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = 'PipelineJobService/1'
+
+    @property
+    def queue(self) -> JobQueue:
+        return self.server.queue
+
+    def address_string(self):
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body, content_type: str = 'application/json'):
+        data = body if isinstance(body, bytes) else json.dumps(body, indent=2).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status: int, message: str):
+        self._send(status, {'error': message})
+
+    def _job_or_404(self, job_id: str) -> Optional[Dict]:
+        job = self.queue.get(int(job_id)) if job_id.isdigit() else None
+        if job is None:
+            self._error(404, f"No job {job_id}")
+        return job
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [unquote(p) for p in url.path.strip('/').split('/') if p]
+
+        if parts == ['health']:
+            self._send(200, {'status': 'ok', 'workers': self.server.pool.alive(), 'jobs': self.queue.counts()})
+        elif parts == ['jobs']:
+            status = parse_qs(url.query).get('status', [None])[0]
+            self._send(200, self.queue.list(status))
+        elif len(parts) >= 2 and parts[0] == 'jobs':
+            job = self._job_or_404(parts[1])
+            if job is None:
+                return
+            job_dir = self.queue.job_dir(job['id'])
+            if len(parts) == 2:
+                self._send(200, job)
+            elif parts[2:] == ['log']:
+                log = job_dir / 'pipeline.log'
+                self._send(200, log.read_bytes() if log.is_file() else b'', 'text/plain; charset=utf-8')
+            elif parts[2:] == ['artifacts']:
+                files = sorted(p for p in job_dir.rglob('*') if p.is_file()) if job_dir.is_dir() else []
+                self._send(200, [{'path': str(p.relative_to(job_dir)), 'bytes': p.stat().st_size} for p in files])
+            elif len(parts) > 3 and parts[2] == 'artifacts':
+                path = (job_dir / '/'.join(parts[3:])).resolve()
+                if job_dir.resolve() not in path.parents or not path.is_file():
+                    self._error(404, f"No artifact {'/'.join(parts[3:])}")
+                    return
+                content_type = 'application/json' if path.suffix == '.json' else 'application/octet-stream'
+                self._send(200, path.read_bytes(), content_type)
+            else:
+                self._error(404, f"Unknown path: {url.path}")
+        else:
+            self._error(404, f"Unknown path: {url.path}")
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip('/') != '/jobs':
+            self._error(404, f"Unknown path: {self.path}")
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            pdf = Path(request['pdf']).expanduser().resolve()
+        except (ValueError, KeyError, TypeError) as e:
+            self._error(400, f"Expected JSON {{\"pdf\": path, ...}}: {e}")
+            return
+        if not pdf.is_file():
+            self._error(400, f"PDF not found on the service host: {pdf}")
+            return
+        options = {'columnar': bool(request.get('columnar', False)),
+                   'validate': bool(request.get('validate', True))}
+        self._send(201, self.queue.submit(str(pdf), options))
+
+    def do_DELETE(self):
+        parts = [p for p in urlparse(self.path).path.strip('/').split('/') if p]
+        if len(parts) != 2 or parts[0] != 'jobs':
+            self._error(404, f"Unknown path: {self.path}")
+            return
+        job = self._job_or_404(parts[1])
+        if job is None:
+            return
+        if not self.queue.cancel(job['id']):
+            self._error(409, f"Job {job['id']} is {job['status']}, only queued jobs can be cancelled")
+            return
+        self._send(200, self.queue.get(job['id']))
+
+
+class TcpApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class UnixApiServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(service_dir: Path, workers: int, library_db: Path, cache_dir: Optional[Path],
+          port: int = DEFAULT_PORT, socket_path: Optional[str] = None, verbose: bool = False) -> int:
+    """Run the API + worker pool until SIGINT/SIGTERM"""
+    queue = JobQueue(service_dir)
+
+    # One service per queue: 'running' jobs are only stale if nobody else owns them
+    lock_file = open(service_dir / 'service.lock', 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        print(f"❌ Error: a job service is already running on {service_dir}")
+        return 1
+    requeued = queue.requeue_running()
+
+    try:
+        if socket_path:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(socket_path)
+            server = UnixApiServer(socket_path, ApiHandler)
+            address = f"unix:{socket_path}"
+        else:
+            server = TcpApiServer(('127.0.0.1', port), ApiHandler)
+            address = f"http://127.0.0.1:{server.server_address[1]}"
+    except OSError as e:
+        print(f"❌ Error: cannot listen on {socket_path or port}: {e}")
+        lock_file.close()
+        return 1
+    server.queue = queue
+    server.verbose = verbose
+
+    pool = WorkerPool(workers, service_dir, library_db, cache_dir)
+    server.pool = pool
+    pool.start()
+
+    print("=" * 80)
+    print("🚀 PIPELINE JOB SERVICE")
+    print("=" * 80)
+    print(f"API:        {address}")
+    print(f"Workers:    {workers}")
+    print(f"Queue:      {service_dir / 'jobs.db'}")
+    print(f"Library:    {library_db}")
+    if requeued:
+        print(f"♻️  Re-queued {requeued} jobs interrupted by the last stop")
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)     # also when started in the background (SIGINT ignored)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        while True:
+            time.sleep(1.0)
+            pool.supervise(queue)
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping (running jobs are re-queued at next start)...")
+    finally:
+        server.shutdown()
+        server.server_close()
+        pool.shutdown()
+        if socket_path:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(socket_path)
+        lock_file.close()
+    return 0
+
+
+#===============================================================================
+# CLIENT
+#===============================================================================
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float = 30):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def request(method: str, path: str, body: Optional[Dict] = None, port: int = DEFAULT_PORT,
+            socket_path: Optional[str] = None):
+    """Call the service API; returns (status, parsed JSON or text)"""
+    conn = UnixHTTPConnection(socket_path) if socket_path else http.client.HTTPConnection('127.0.0.1', port,
+                                                                                         timeout=30)
+    try:
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        conn.request(method, path, body=data, headers={'Content-Type': 'application/json'} if data else {})
+        response = conn.getresponse()
+        payload = response.read()
+        if response.getheader('Content-Type', '').startswith('application/json'):
+            return response.status, json.loads(payload)
+        return response.status, payload.decode('utf-8', errors='replace')
+    finally:
+        conn.close()
+
+
+def print_job(job: Dict):
+    marks = {'done': '✅', 'failed': '❌', 'running': '⏳', 'queued': '🕒', 'cancelled': '🚫'}
+    mark = marks.get(job['status'], '')
+    seconds = f" in {job['seconds']:.1f}s" if job.get('seconds') is not None else ''
+    objects = f", {job['objects']} objects" if job.get('objects') is not None else ''
+    print(f"{mark} Job {job['id']}: {job['status']}{seconds}{objects}  {Path(job['pdf']).name}")
+    if job.get('error'):
+        print(f"   {job['error']}")
+    if job.get('final'):
+        print(f"   FINAL: {job['final']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local job queue service for pipeline runs")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"127.0.0.1 port (default: {DEFAULT_PORT})")
+    parser.add_argument('--socket', help="Unix socket path instead of TCP")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', help="Run the service")
+    serve_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                              help="Worker processes (default: CPU count)")
+    serve_parser.add_argument('--dir', default=str(SERVICE_DIR), help=f"Queue + job directory (default: {SERVICE_DIR})")
+    serve_parser.add_argument('--library', default=LIBRARY_DB, help=f"Library database (default: {LIBRARY_DB})")
+    serve_parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                              help=f"Stage cache (default: {DEFAULT_CACHE_DIR})")
+    serve_parser.add_argument('--no-cache', action='store_true', help="Run every stage of every job")
+    serve_parser.add_argument('--verbose', action='store_true', help="Log every API request")
+
+    submit_parser = commands.add_parser('submit', help="Queue PDFs")
+    submit_parser.add_argument('pdfs', nargs='+')
+    submit_parser.add_argument('--columnar', action='store_true', help="Also write .npz copies of the outputs")
+    submit_parser.add_argument('--no-validators', action='store_true', help="Skip the report-only validators")
+    submit_parser.add_argument('--wait', action='store_true', help="Wait until the jobs finish")
+
+    status_parser = commands.add_parser('status', help="Show jobs")
+    status_parser.add_argument('ids', nargs='+', type=int)
+    list_parser = commands.add_parser('list', help="List recent jobs")
+    list_parser.add_argument('--status', choices=STATUSES)
+    cancel_parser = commands.add_parser('cancel', help="Cancel queued jobs")
+    cancel_parser.add_argument('ids', nargs='+', type=int)
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        library_db = Path(args.library).resolve()
+        if not library_db.is_file():
+            print(f"❌ Error: Library database not found: {args.library}")
+            sys.exit(1)
+        cache_dir = None if args.no_cache else Path(args.cache_dir).resolve()
+        sys.exit(serve(Path(args.dir).resolve(), max(1, args.workers), library_db, cache_dir,
+                       args.port, args.socket, args.verbose))
+
+    api = {'port': args.port, 'socket_path': args.socket}
+    try:
+        if args.command == 'submit':
+            jobs = []
+            for pdf in args.pdfs:
+                status, job = request('POST', '/jobs', {'pdf': str(Path(pdf).resolve()), 'columnar': args.columnar,
+                                                         'validate': not args.no_validators}, **api)
+                if status != 201:
+                    print(f"❌ {pdf}: {job.get('error', job)}")
+                    continue
+                jobs.append(job)
+                print_job(job)
+            while args.wait and jobs:
+                time.sleep(1.0)
+                jobs = [request('GET', f"/jobs/{job['id']}", **api)[1] for job in jobs]
+                if all(job['status'] not in ('queued', 'running') for job in jobs):
+                    print()
+                    for job in jobs:
+                        print_job(job)
+                    sys.exit(0 if all(job['status'] == 'done' for job in jobs) else 1)
+        elif args.command == 'status':
+            for job_id in args.ids:
+                status, job = request('GET', f"/jobs/{job_id}", **api)
+                if status == 200:
+                    print_job(job)
+                else:
+                    print(f"❌ {job.get('error', job)}")
+        elif args.command == 'list':
+            path = f"/jobs?status={args.status}" if args.status else '/jobs'
+            for job in request('GET', path, **api)[1]:
+                print_job(job)
+        elif args.command == 'cancel':
+            for job_id in args.ids:
+                status, job = request('DELETE', f"/jobs/{job_id}", **api)
+                if status == 200:
+                    print_job(job)
+                else:
+                    print(f"❌ {job.get('error', job)}")
+    except (ConnectionRefusedError, ConnectionResetError, FileNotFoundError, socket.timeout) as e:
+        print(f"❌ Error: job service not reachable ({e}) - start it with: job_service.py serve")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Lazy Imports - Heavy optional dependencies loaded on first use
+
+    cv2 = lazy_module('cv2')        # nothing imported yet
+    ...
+    cv2.Canny(...)                  # imported here (ImportError here if missing)
+
+The OpenCV/Tesseract extractors use this for cv2, pytesseract, pdf2image
+and NumPy, so importing them (or anything that imports them) costs
+nothing and works without those packages; only the code paths that
+actually rasterise a page need them. Annotations such as np.ndarray are
+kept unevaluated with `from __future__ import annotations`.
+
+import_profile.py checks that entry points stay free of these imports.
+"""
+
+import importlib
+import sys
+import threading
+import types
+from typing import Dict
+
+# pip package name when it differs from the module name
+INSTALL_HINTS: Dict[str, str] = {
+    'cv2': 'opencv-python',
+    'pytesseract': 'pytesseract (and the tesseract binary)',
+    'pdf2image': 'pdf2image (and poppler)',
+    'numpy': 'numpy',
+    'pdfplumber': 'pdfplumber',
+}
+
+_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in; the first attribute access imports the real module"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            with _lock:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    try:
+                        module = importlib.import_module(self.__name__)
+                    except ImportError as exc:
+                        hint = INSTALL_HINTS.get(self.__name__.split('.')[0], self.__name__)
+                        raise ImportError(f"{self.__name__} is needed here: pip install {hint}") from exc
+                    self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_module'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """The module itself if already imported, else a LazyModule for it"""
+    return sys.modules.get(name) or LazyModule(name)
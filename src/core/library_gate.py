@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Library Gate Module
+===================
+GATE 4 (library geometry availability) as a reusable check.
+
+The whole library is validated with one joined query - every catalog
+entry, whether its geometry_hash resolves to base_geometries and whether
+the blobs have the sizes their counts promise:
+
+    LENGTH(vertices) = vertex_count * 12     (3 × float32 per vertex)
+    LENGTH(faces)    = face_count * 12       (3 × uint32 per triangle)
+
+The resulting report depends only on the library file, so it is cached in
+a sidecar next to it (Ifc_Object_Library.db.validity.json) keyed by the
+sha256 of the file's bytes. Size and mtime are not trusted: an in-place
+rewrite or a restored backup keeps them. Checking a run's object_types is
+then a hash of the library plus a set lookup; the library itself is
+validated once per library version.
+
+Used by pipeline_runner (Gate 4), the Blender importers and
+src/tools/verify_output_library_coverage.py.
+
+Usage:
+    result = check_object_types(object_types, 'LocalLibrary/Ifc_Object_Library.db')
+    if not result.passed:
+        print(result.missing, result.corrupted)
+
+    python3 src/core/library_gate.py LocalLibrary/Ifc_Object_Library.db
+    python3 src/core/library_gate.py LocalLibrary/Ifc_Object_Library.db --final output_artifacts/X_FINAL.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+REPORT_VERSION = 1
+REPORT_SUFFIX = '.validity.json'
+
+_CHUNK = 1 << 20
+
+LIBRARY_QUERY = '''
+    SELECT c.object_type,
+           g.geometry_hash IS NOT NULL,
+           COALESCE(LENGTH(g.vertices) = g.vertex_count * 12, 0),
+           COALESCE(LENGTH(g.faces) = g.face_count * 12, 0)
+    FROM object_catalog c
+    LEFT JOIN base_geometries g ON g.geometry_hash = c.geometry_hash
+'''
+
+
+class LibraryReport(NamedTuple):
+    """Validity of every catalog entry of one library file"""
+    library: str
+    sha256: str
+    catalog: frozenset          # every object_type in object_catalog
+    invalid: Dict[str, str]     # object_type → 'no_geometry' | 'bad_vertices' | 'bad_faces'
+    checked: str                # when the library was validated
+    seconds: float              # how long validation took
+    cached: bool                # loaded from the sidecar / this process instead of re-validated
+
+    @property
+    def valid(self) -> bool:
+        return not self.invalid
+
+
+class GateResult(NamedTuple):
+    """GATE 4 verdict for a set of object_types"""
+    checked: int
+    missing: List[str]          # not in the catalog, or no base_geometries row
+    corrupted: List[str]        # blob sizes do not match vertex/face counts
+    report: LibraryReport
+
+    @property
+    def passed(self) -> bool:
+        return not (self.missing or self.corrupted)
+
+
+_reports: Dict[Tuple[str, str], LibraryReport] = {}    # (path, sha256) → report, per process
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def report_path(library_db: Union[str, Path]) -> Path:
+    """Ifc_Object_Library.db → Ifc_Object_Library.db.validity.json"""
+    library_db = Path(library_db)
+    return library_db.with_name(library_db.name + REPORT_SUFFIX)
+
+
+def build_report(library_db: Union[str, Path], sha256: Optional[str] = None) -> LibraryReport:
+    """Validate every catalog entry with one query (no cache)"""
+    library_db = Path(library_db)
+    start = time.perf_counter()
+    conn = sqlite3.connect(f"{library_db.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(LIBRARY_QUERY).fetchall()
+    finally:
+        conn.close()
+    invalid = {}
+    for object_type, has_geometry, vertices_ok, faces_ok in rows:
+        if not has_geometry:
+            invalid[object_type] = 'no_geometry'
+        elif not vertices_ok:
+            invalid[object_type] = 'bad_vertices'
+        elif not faces_ok:
+            invalid[object_type] = 'bad_faces'
+    return LibraryReport(str(library_db.resolve()), sha256 or _sha256(library_db),
+                         frozenset(row[0] for row in rows), invalid,
+                         datetime.now().isoformat(timespec='seconds'),
+                         round(time.perf_counter() - start, 4), False)
+
+
+def _load_sidecar(path: Path) -> Optional[Dict]:
+    try:
+        with open(path) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return stored if stored.get('version') == REPORT_VERSION else None
+
+
+def _save_sidecar(path: Path, report: LibraryReport):
+    """Atomic write; a read-only library directory just means no cache"""
+    scratch = path.with_name(f".{path.name}-{uuid.uuid4().hex[:8]}")
+    try:
+        with open(scratch, 'w') as f:
+            json.dump({
+                'version': REPORT_VERSION,
+                'library': report.library,
+                'sha256': report.sha256,
+                'checked': report.checked,
+                'seconds': report.seconds,
+                'catalog': sorted(report.catalog),
+                'invalid': report.invalid,
+            }, f, indent=1)
+        os.replace(scratch, path)
+    except OSError:
+        scratch.unlink(missing_ok=True)
+
+
+def library_report(library_db: Union[str, Path], use_cache: bool = True) -> LibraryReport:
+    """
+    Validity report of the library, re-validated only when its contents change
+
+    Args:
+        library_db: Ifc_Object_Library.db
+        use_cache: Reuse the sidecar / in-process report (False always re-validates)
+
+    Returns:
+        LibraryReport (cached=True when validation was skipped)
+    """
+    library_db = Path(library_db)
+    sha256 = _sha256(library_db)
+    memo_key = (str(library_db.resolve()), sha256)
+    if use_cache and memo_key in _reports:
+        return _reports[memo_key]
+
+    sidecar = report_path(library_db)
+    stored = _load_sidecar(sidecar) if use_cache else None
+    if stored is not None and stored.get('sha256') == sha256:
+        report = LibraryReport(memo_key[0], sha256, frozenset(stored['catalog']), stored['invalid'],
+                               stored['checked'], stored['seconds'], True)
+    else:
+        report = build_report(library_db, sha256)
+        _save_sidecar(sidecar, report)
+    _reports[memo_key] = report
+    return report
+
+
+def check_object_types(object_types: Iterable[str], library_db: Union[str, Path],
+                       use_cache: bool = True) -> GateResult:
+    """GATE 4 for these object_types (None/empty entries are ignored)"""
+    report = library_report(library_db, use_cache)
+    unique_types = sorted(set(t for t in object_types if t))
+    missing, corrupted = [], []
+    for object_type in unique_types:
+        problem = report.invalid.get(object_type)
+        if object_type not in report.catalog or problem == 'no_geometry':
+            missing.append(object_type)
+        elif problem:
+            corrupted.append(object_type)
+    return GateResult(len(unique_types), missing, corrupted, report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate library geometry (GATE 4)")
+    parser.add_argument('library', nargs='?', default='LocalLibrary/Ifc_Object_Library.db',
+                        help="Library database (default: LocalLibrary/Ifc_Object_Library.db)")
+    parser.add_argument('--final', help="Also check the object_types of this FINAL JSON")
+    parser.add_argument('--no-cache', action='store_true', help="Re-validate even if the library is unchanged")
+    args = parser.parse_args()
+
+    if not Path(args.library).is_file():
+        print(f"❌ Library database not found: {args.library}")
+        sys.exit(1)
+    report = library_report(args.library, use_cache=not args.no_cache)
+    source = f"cached, validated {report.checked}" if report.cached else f"validated in {report.seconds:.3f}s"
+    print(f"📚 {args.library}: {len(report.catalog)} object_types, {len(report.invalid)} invalid ({source})")
+    for object_type, problem in sorted(report.invalid.items()):
+        print(f"   ❌ {object_type}: {problem}")
+
+    if args.final:
+        from final_json_stream import read_final_json
+        result = check_object_types((obj.get('object_type') for obj in read_final_json(args.final)['objects']),
+                                    args.library)
+        print(f"🔍 {args.final}: {result.checked} object_types, "
+              f"{len(result.missing)} missing, {len(result.corrupted)} corrupted")
+        for object_type in result.missing:
+            print(f"   ❌ missing: {object_type}")
+        for object_type in result.corrupted:
+            print(f"   ❌ corrupted: {object_type}")
+        sys.exit(0 if result.passed else 1)
+    sys.exit(0 if report.valid else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Library Index Module
+====================
+In-memory catalogue index for Ifc_Object_Library.db.
+
+Loads object_catalog (+ base_geometries bbox columns when present) once into
+NumPy arrays so nearest-size lookups and bulk coverage checks run without
+per-call SQL.
+
+Lookups:
+    nearest_door(width_mm, height_mm)        → IfcDoor by width/height
+    nearest_window(width_mm, height_mm)      → IfcWindow by width/height
+    nearest_furniture(width_mm, depth_mm)    → furniture by footprint
+    nearest(ifc_class=..., category=..., width_mm=..., ...)  → generic
+
+Distance is the L1 sum of the requested dimensions (same ordering as the old
+ORDER BY ABS(width_mm - ?) + ABS(height_mm - ?) queries); ties resolve to the
+first catalog row.
+
+Usage:
+    index = LibraryIndex.from_database("LocalLibrary/Ifc_Object_Library.db")
+    match = index.nearest_door(900, 2100)
+    report = index.coverage(object_types)
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+import numpy as np
+
+
+BBOX_COLUMNS = ('bbox_width', 'bbox_depth', 'bbox_height')
+
+# IFC classes treated as furniture for footprint lookups
+FURNITURE_IFC_CLASSES = ('IfcFurnishingElement', 'IfcFurniture')
+
+
+class IndexMatch(NamedTuple):
+    """Result of a nearest-size lookup."""
+    object_type: str
+    distance: float     # L1 distance in mm over the requested dimensions (0 = exact)
+    width_mm: float
+    depth_mm: float
+    height_mm: float
+
+    @property
+    def exact(self) -> bool:
+        return self.distance == 0
+
+
+class CoverageReport(NamedTuple):
+    """Bulk presence check of object_types against the library."""
+    found: List[str]          # In catalog with geometry and normals
+    no_normals: List[str]     # In catalog with geometry, normals BLOB missing
+    no_geometry: List[str]    # In catalog, geometry_hash not in base_geometries
+    missing: List[str]        # Not in catalog
+
+    @property
+    def complete(self) -> bool:
+        return not (self.no_normals or self.no_geometry or self.missing)
+
+
+class LibraryIndex:
+    """NumPy-backed index over object_catalog"""
+
+    def __init__(self, object_types, ifc_classes, categories, dimensions_mm,
+                 bbox_m=None, has_geometry=None, has_normals=None):
+        """
+        Args:
+            object_types: Sequence of object_type strings (catalog order)
+            ifc_classes: Sequence of IFC class names
+            categories: Sequence of categories
+            dimensions_mm: (N, 3) width/depth/height in mm (NaN if unknown)
+            bbox_m: (N, 3) base_geometries bbox in meters (NaN if unknown)
+            has_geometry: (N,) geometry_hash resolves to base_geometries
+            has_normals: (N,) normals BLOB present
+        """
+        n = len(object_types)
+        self.object_types = np.asarray(object_types, dtype=object)
+        self.ifc_classes = np.asarray(ifc_classes, dtype=object)
+        self.categories = np.asarray(categories, dtype=object)
+        self.dimensions_mm = np.asarray(dimensions_mm, dtype=np.float64).reshape(n, 3)
+        self.bbox_m = (np.full((n, 3), np.nan) if bbox_m is None
+                       else np.asarray(bbox_m, dtype=np.float64).reshape(n, 3))
+        self.has_geometry = np.ones(n, dtype=bool) if has_geometry is None else np.asarray(has_geometry, dtype=bool)
+        self.has_normals = np.ones(n, dtype=bool) if has_normals is None else np.asarray(has_normals, dtype=bool)
+
+        self._position = {object_type: i for i, object_type in enumerate(object_types)}
+        self._candidates = {}
+
+    @classmethod
+    def from_database(cls, database: Union[str, Path, sqlite3.Connection]) -> 'LibraryIndex':
+        """
+        Build index with one query over object_catalog ⟕ base_geometries.
+
+        Args:
+            database: Path to Ifc_Object_Library.db or an open connection
+
+        Returns:
+            LibraryIndex
+        """
+        conn = database if isinstance(database, sqlite3.Connection) else sqlite3.connect(str(database))
+        try:
+            geometry_columns = {row[1] for row in conn.execute("PRAGMA table_info(base_geometries)")}
+            bbox_select = (', '.join(f'bg.{c}' for c in BBOX_COLUMNS)
+                           if set(BBOX_COLUMNS) <= geometry_columns else 'NULL, NULL, NULL')
+            rows = conn.execute(f"""
+                SELECT oc.object_type, oc.ifc_class, oc.category,
+                       oc.width_mm, oc.depth_mm, oc.height_mm,
+                       {bbox_select},
+                       bg.geometry_hash IS NOT NULL,
+                       bg.normals IS NOT NULL
+                FROM object_catalog oc
+                LEFT JOIN base_geometries bg ON oc.geometry_hash = bg.geometry_hash
+                ORDER BY oc.rowid
+            """).fetchall()
+        finally:
+            if not isinstance(database, sqlite3.Connection):
+                conn.close()
+
+        if not rows:
+            return cls([], [], [], np.empty((0, 3)), np.empty((0, 3)), [], [])
+
+        columns = list(zip(*rows))
+        numeric = np.array([columns[3:9]], dtype=np.float64).reshape(6, -1).T  # None → NaN
+        return cls(
+            object_types=columns[0],
+            ifc_classes=columns[1],
+            categories=columns[2],
+            dimensions_mm=numeric[:, :3],
+            bbox_m=numeric[:, 3:],
+            has_geometry=columns[9],
+            has_normals=columns[10],
+        )
+
+    def __len__(self):
+        return len(self.object_types)
+
+    def __contains__(self, object_type):
+        return object_type in self._position
+
+    def dimensions(self, object_type: str) -> Optional[Dict[str, float]]:
+        """Catalog dimensions in meters (bbox fallback when catalog value is NULL)."""
+        i = self._position.get(object_type)
+        if i is None:
+            return None
+        dims_m = self.dimensions_mm[i] / 1000.0
+        dims_m = np.where(np.isnan(dims_m), self.bbox_m[i], dims_m)
+        return {'width': float(dims_m[0]), 'depth': float(dims_m[1]), 'height': float(dims_m[2])}
+
+    def _candidate_rows(self, ifc_class, category, lod):
+        """Row indices matching the filters (cached per filter combination)."""
+        key = (ifc_class, category, lod)
+        rows = self._candidates.get(key)
+        if rows is None:
+            mask = np.ones(len(self), dtype=bool)
+            if ifc_class is not None:
+                classes = (ifc_class,) if isinstance(ifc_class, str) else tuple(ifc_class)
+                mask &= np.isin(self.ifc_classes, classes)
+            if category is not None:
+                mask &= self.categories == category
+            if lod is not None:
+                # Case-insensitive, like SQL LIKE '%lod300%'
+                mask &= np.array([lod.lower() in t.lower() for t in self.object_types], dtype=bool)
+            rows = np.flatnonzero(mask)
+            self._candidates[key] = rows
+        return rows
+
+    def nearest(self, ifc_class=None, category=None, lod: Optional[str] = 'lod300',
+                width_mm=None, depth_mm=None, height_mm=None) -> Optional[IndexMatch]:
+        """
+        Nearest catalog entry by the given dimensions.
+
+        Args:
+            ifc_class: IFC class name or sequence of names (None = any)
+            category: Catalog category (None = any)
+            lod: Substring required in object_type, e.g. 'lod300' (None = any)
+            width_mm, depth_mm, height_mm: Target dimensions; None = not compared
+
+        Returns:
+            IndexMatch or None if no candidate has all requested dimensions
+        """
+        rows = self._candidate_rows(ifc_class, category, lod)
+        target = np.array([width_mm, depth_mm, height_mm], dtype=np.float64)  # None → NaN
+        axes = ~np.isnan(target)
+        if rows.size == 0:
+            return None
+
+        dims = self.dimensions_mm[rows]
+        distance = np.abs(dims[:, axes] - target[axes]).sum(axis=1)
+        distance[np.isnan(distance)] = np.inf
+        best = int(np.argmin(distance))
+        if not np.isfinite(distance[best]):
+            return None
+
+        i = rows[best]
+        width, depth, height = self.dimensions_mm[i]
+        return IndexMatch(self.object_types[i], float(distance[best]), float(width), float(depth), float(height))
+
+    def nearest_door(self, width_mm, height_mm, lod='lod300') -> Optional[IndexMatch]:
+        """IfcDoor closest in width/height"""
+        return self.nearest('IfcDoor', lod=lod, width_mm=width_mm, height_mm=height_mm)
+
+    def nearest_window(self, width_mm, height_mm, lod='lod300') -> Optional[IndexMatch]:
+        """IfcWindow closest in width/height"""
+        return self.nearest('IfcWindow', lod=lod, width_mm=width_mm, height_mm=height_mm)
+
+    def nearest_furniture(self, width_mm, depth_mm, category=None, lod='lod300') -> Optional[IndexMatch]:
+        """Furniture closest in footprint (width/depth)"""
+        return self.nearest(FURNITURE_IFC_CLASSES, category=category, lod=lod,
+                            width_mm=width_mm, depth_mm=depth_mm)
+
+    def coverage(self, object_types: Iterable[str]) -> CoverageReport:
+        """
+        Classify object_types by library availability in one pass.
+
+        Args:
+            object_types: object_types referenced by a template/output JSON
+
+        Returns:
+            CoverageReport (lists sorted by object_type)
+        """
+        found, no_normals, no_geometry, missing = [], [], [], []
+        for object_type in sorted(set(object_types)):
+            i = self._position.get(object_type)
+            if i is None:
+                missing.append(object_type)
+            elif not self.has_geometry[i]:
+                no_geometry.append(object_type)
+            elif not self.has_normals[i]:
+                no_normals.append(object_type)
+            else:
+                found.append(object_type)
+        return CoverageReport(found, no_normals, no_geometry, missing)
+
+
+def main():
+    """Print index summary and sample lookups"""
+    import sys
+    import time
+
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "LocalLibrary/Ifc_Object_Library.db"
+
+    start = time.perf_counter()
+    index = LibraryIndex.from_database(db_path)
+    print(f"✅ Indexed {len(index)} catalog entries in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    for label, lookup in [("Door 900x2100", lambda: index.nearest_door(900, 2100)),
+                          ("Window 1200x1000", lambda: index.nearest_window(1200, 1000)),
+                          ("Furniture 1800x600", lambda: index.nearest_furniture(1800, 600))]:
+        start = time.perf_counter()
+        match = lookup()
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        if match:
+            print(f"  {label}: {match.object_type} (Δ{match.distance:.0f}mm, {elapsed_us:.0f}µs)")
+        else:
+            print(f"  {label}: ✗ Not found")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple
 import numpy as np
 
+from library_index import LibraryIndex
+
 
 class LibraryQuery:
     """Query IFC object library for LOD300 geometry"""
@@ -22,6 +24,14 @@ class LibraryQuery:
 
         self.conn = sqlite3.connect(self.library_path)
         self.cursor = self.conn.cursor()
+        self._index = None
+
+    @property
+    def index(self) -> LibraryIndex:
+        """Catalogue index, built on first dimension lookup"""
+        if self._index is None:
+            self._index = LibraryIndex.from_database(self.conn)
+        return self._index
 
     def get_object_by_type(self, object_type: str) -> Optional[Dict]:
         """
@@ -81,72 +91,23 @@ class LibraryQuery:
         Returns:
             Dict with geometry or None if not found
         """
-        # Try exact match first
-        self.cursor.execute("""
-            SELECT object_type
-            FROM object_catalog
-            WHERE ifc_class = 'IfcDoor'
-              AND width_mm = ?
-              AND height_mm = ?
-              AND object_type LIKE '%lod300%'
-            LIMIT 1
-        """, (width_mm, height_mm))
-
-        row = self.cursor.fetchone()
-        if row:
-            return self.get_object_by_type(row[0])
-
-        # Fallback: find closest match
-        self.cursor.execute("""
-            SELECT object_type,
-                   ABS(width_mm - ?) + ABS(height_mm - ?) as diff
-            FROM object_catalog
-            WHERE ifc_class = 'IfcDoor'
-              AND object_type LIKE '%lod300%'
-            ORDER BY diff
-            LIMIT 1
-        """, (width_mm, height_mm))
-
-        row = self.cursor.fetchone()
-        if row:
-            print(f"⚠️  Door {width_mm}x{height_mm} not found, using closest: {row[0]}")
-            return self.get_object_by_type(row[0])
+        match = self.index.nearest_door(width_mm, height_mm)
+        if not match:
+            return None
 
-        return None
+        if not match.exact:
+            print(f"⚠️  Door {width_mm}x{height_mm} not found, using closest: {match.object_type}")
+        return self.get_object_by_type(match.object_type)
 
     def get_window_geometry(self, width_mm: int, height_mm: int) -> Optional[Dict]:
         """Get window geometry by dimensions"""
-        self.cursor.execute("""
-            SELECT object_type
-            FROM object_catalog
-            WHERE ifc_class = 'IfcWindow'
-              AND width_mm = ?
-              AND height_mm = ?
-              AND object_type LIKE '%lod300%'
-            LIMIT 1
-        """, (width_mm, height_mm))
-
-        row = self.cursor.fetchone()
-        if row:
-            return self.get_object_by_type(row[0])
-
-        # Fallback
-        self.cursor.execute("""
-            SELECT object_type,
-                   ABS(width_mm - ?) + ABS(height_mm - ?) as diff
-            FROM object_catalog
-            WHERE ifc_class = 'IfcWindow'
-              AND object_type LIKE '%lod300%'
-            ORDER BY diff
-            LIMIT 1
-        """, (width_mm, height_mm))
-
-        row = self.cursor.fetchone()
-        if row:
-            print(f"⚠️  Window {width_mm}x{height_mm} not found, using closest: {row[0]}")
-            return self.get_object_by_type(row[0])
+        match = self.index.nearest_window(width_mm, height_mm)
+        if not match:
+            return None
 
-        return None
+        if not match.exact:
+            print(f"⚠️  Window {width_mm}x{height_mm} not found, using closest: {match.object_type}")
+        return self.get_object_by_type(match.object_type)
 
     def get_wall_geometry(self) -> Optional[Dict]:
         """Get standard wall geometry"""
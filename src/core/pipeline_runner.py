@@ -0,0 +1,759 @@
+#!/usr/bin/env python3
+"""
+Pipeline Runner - Complete PDF → FINAL JSON pipeline in one Python process
+
+Runs the same steps, gates and exit codes as bin/RUN_COMPLETE_PIPELINE.sh
+used to run as separate interpreters:
+
+    0A  Rolling backup of the last run (output_artifacts/last_run_backup)
+    0B  Clean slate (Rule 0: annotation DB + outputs deleted)
+    0C  Primitive extraction → <PDF>_ANNOTATION_FROM_2D.db
+    1   TIER-2 extraction (extraction_engine.run_extraction)
+    2   Room templates + post-processing (integrate_room_templates.run_integration)
+    G3  Structural completeness (structural_validator)
+    G4  Library geometry availability (library_gate.py, validated once per library version)
+    3   Validators (UBBL, comprehensive, spatial logic, room/wall) - report only
+
+NumPy/pdfplumber are imported once, the extraction output is handed to
+the next stage in memory (OUTPUT/AUGMENTED JSONs are only written with
+--keep-intermediate), and the FINAL JSON is parsed once for both gates,
+all validators and the summary. Per-stage wall times are printed at the
+end (--timings saves them as JSON).
+
+The steps are a DAG of stages with declared inputs/outputs
+(build_stage_dag, scheduled by src/core/stage_dag.py). G3, G4 and the
+validators only read FINAL, so they run concurrently on a process pool
+(--jobs, default CPU count) with their output prefixed "[stage]"; the
+critical path after FINAL is the slowest of them instead of their sum.
+--jobs 1 runs every stage in this process, one after another.
+
+Stages 0C-2 are cached by content (src/core/stage_cache.py): each key
+hashes the PDF bytes, the templates and source files the stage reads and
+the upstream keys, so an unchanged PDF is restored instead of
+re-extracted and a template tweak only re-runs the stages reading it.
+Every run writes <X>_FINAL.provenance.json with each stage's inputs,
+code hashes, key and whether it came from the cache (Rule 0).
+
+Each stage of the chain 0C → provenance is checkpointed when it finishes
+(src/core/run_checkpoint.py: output_artifacts/checkpoints/<PDF>/manifest.json,
+atomic writes). --resume continues a run that died (e.g. at Gate 3 or 4)
+after its last good stage: the annotation DB, OUTPUT/AUGMENTED data and
+FINAL are reused once their hashes, stage keys and upstream fingerprints
+check out, and Steps 0A/0B are skipped so nothing is deleted. Without a
+valid checkpoint --resume runs from Step 0. The 0A rolling backup
+hardlinks files instead of copying them (0B unlinks the originals, so
+the backup keeps the old contents).
+
+--trace / --chrome-trace record nested spans (stage → template item →
+detection handler, stage → post-processing fixer) with wall/CPU time,
+peak RSS and object/row counts (src/core/tracing.py); --quiet drops the
+stages' progress output and keeps failures and the timing table.
+
+Exit codes:
+    0  pipeline complete (validator findings are reported, not fatal)
+    1  missing PDF/library, stage error, Gate 3 or Gate 4 failure
+
+Usage:
+    python3 src/core/pipeline_runner.py "examples/TB-LKTN_House/TB-LKTN HOUSE.pdf"
+    python3 src/core/pipeline_runner.py plan.pdf --columnar --timings timings.json
+    python3 src/core/pipeline_runner.py plan.pdf --no-cache
+    python3 src/core/pipeline_runner.py plan.pdf --jobs 1
+    python3 src/core/pipeline_runner.py plan.pdf --resume
+    python3 src/core/pipeline_runner.py plan.pdf --quiet --trace trace.jsonl --chrome-trace trace.json
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import shutil
+import sys
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+for _path in (REPO_ROOT / 'src' / 'validators', REPO_ROOT / 'src' / 'core', REPO_ROOT / 'src', REPO_ROOT):
+    sys.path.insert(0, str(_path))
+
+from run_checkpoint import DEFAULT_CHECKPOINT_DIR, RunCheckpoint, link_or_copy
+from stage_cache import DEFAULT_CACHE_DIR, StageCache, StageEntry, expand_sources
+from stage_dag import DagScheduler, Stage, StageDAG
+try:
+    from src.core import tracing
+except ImportError:
+    import tracing
+
+OUTPUT_DIR = Path('output_artifacts')
+LIBRARY_DB = 'LocalLibrary/Ifc_Object_Library.db'
+
+# Cached stages: timer label, data files and code that determine each output
+STAGE_TIMER_NAMES = {
+    'primitives': '0C primitive extraction',
+    'extraction': '1 extraction',
+    'augmentation': '2a augmentation',
+    'post_processing': '2b post-processing',
+}
+TEMPLATE_FILES = {
+    'master_template': 'src/core/master_reference_template.json',
+    'naming_layer': 'src/core/ifc_naming_layer.json',
+    'room_templates': 'src/LocalLibrary/room_templates.json',
+    'validation_rules': 'src/LocalLibrary/validation_rules.json',
+}
+STAGE_SOURCES = {
+    'primitives': ['src/core/primitive_extractor_enhanced.py'],
+    # Calibration runs inside extraction (calibration*.py are part of its key)
+    'extraction': ['src/core/*.py'],
+    'augmentation': ['src/room_inference/*.py', 'src/standards/*.py', 'src/core/annotation_derivation.py'],
+    'post_processing': ['src/core/post_processor.py', 'src/core/wall_combiner.py', 'src/core/building_canvas.py',
+                        'src/core/ifc_naming_util.py', 'src/core/annotation_derivation.py',
+                        'src/room_inference/integrate_room_templates.py'],
+}
+# src/core files extraction never imports: the driver, and post-processing-only modules
+STAGE_EXCLUDED = {
+    'extraction': ('pipeline_runner.py', 'batch_runner.py', 'job_service.py', 'stage_cache.py', 'stage_dag.py',
+                   'benchmark_pipeline.py', 'synthetic_plan.py',
+                   'import_profile.py', 'lazy_import.py', 'run_checkpoint.py', 'library_gate.py',
+                   'post_processor.py', 'wall_combiner.py'),
+}
+# Stages checkpointed for --resume, in run order: (stage, stage-cache entry, {artifact: kind})
+CHECKPOINT_CHAIN = [
+    (STAGE_TIMER_NAMES['primitives'], 'primitives', {'annotation_db': 'file'}),
+    (STAGE_TIMER_NAMES['extraction'], 'extraction', {'output_json': 'json', 'output_path': 'value'}),
+    (STAGE_TIMER_NAMES['augmentation'], 'augmentation', {'augmented': 'json'}),
+    (STAGE_TIMER_NAMES['post_processing'], 'post_processing', {'final_path': 'file'}),
+    ('provenance', None, {'provenance_path': 'file'}),
+]
+# JSON artifacts the stage cache also holds (hardlinked into the checkpoint instead of written again)
+CACHED_JSON = {'output_json': 'output.json', 'augmented': 'augmented.json'}
+RULE = '-' * 80
+BANNER = '=' * 80
+
+
+class PipelineFailed(Exception):
+    """A gate or stage failed; message lines are printed before exiting"""
+
+    def __init__(self, *lines: str, exit_code: int = 1):
+        super().__init__(lines[0] if lines else '')
+        self.lines = lines
+        self.exit_code = exit_code
+
+
+class StageTimer:
+    """Wall time per pipeline stage, in run order"""
+
+    def __init__(self):
+        self.timings: List[Dict] = []
+        self.started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Time the block; the yielded record's 'status' may be set (e.g. 'cached')"""
+        record = {'stage': name, 'seconds': 0.0, 'status': 'ok'}
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record['status'] = 'failed'
+            raise
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self.timings.append(record)
+
+    @property
+    def total_seconds(self) -> float:
+        """Sum of stage times (more than the wall time when stages ran concurrently)"""
+        return sum(t['seconds'] for t in self.timings)
+
+    @property
+    def wall_seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+    def report(self) -> str:
+        lines = [f"{'stage':<36} {'seconds':>9}"]
+        for t in self.timings:
+            mark = '' if t['status'] == 'ok' else f"  ({t['status']})"
+            lines.append(f"{t['stage']:<36} {t['seconds']:>9.2f}{mark}")
+        lines.append(f"{'TOTAL (sum of stages)':<36} {self.total_seconds:>9.2f}")
+        lines.append(f"{'WALL':<36} {self.wall_seconds:>9.2f}")
+        return '\n'.join(lines)
+
+
+def _header(title: str):
+    print(title)
+    print(RULE)
+
+
+#===============================================================================
+# STEP 0: BACKUP + CLEAN SLATE
+#===============================================================================
+
+def backup_previous_run(pdf_basename: str, db_path: Path):
+    """
+    STEP 0A: hardlink the previous annotation DB, OUTPUT JSONs and DBs into last_run_backup/
+
+    Step 0B unlinks every file backed up here before anything writes those
+    paths again, so the links keep the previous contents without copying
+    them (files are copied where hardlinks are not possible).
+    """
+    _header("💾 STEP 0A: Rolling Backup (preserving last run)...")
+    backup_dir = OUTPUT_DIR / 'last_run_backup'
+
+    # Create backup directory (overwrites previous backup)
+    shutil.rmtree(backup_dir, ignore_errors=True)
+    backup_dir.mkdir(parents=True)
+    copied = 0
+
+    if db_path.is_file():
+        copied += link_or_copy(db_path, backup_dir / db_path.name) == 'copy'
+        print(f"   ✅ Backed up: {db_path.name}")
+
+    outputs = sorted(OUTPUT_DIR.glob(f"{pdf_basename}_OUTPUT_*.json"))
+    for path in outputs:
+        copied += link_or_copy(path, backup_dir / path.name) == 'copy'
+    if outputs:
+        print("   ✅ Backed up: OUTPUT JSON files")
+
+    for db in OUTPUT_DIR.glob('*.db'):
+        if db.is_file() and db != db_path:
+            copied += link_or_copy(db, backup_dir / db.name) == 'copy'
+
+    backup_count = len(list(backup_dir.iterdir()))
+    if backup_count:
+        how = 'hardlinked' if not copied else f"{copied} copied (no hardlinks on this filesystem)"
+        print(f"   ✅ Backup complete: {backup_count} files in {backup_dir} ({how})")
+    else:
+        print("   ℹ️  No previous artifacts to backup (first run)")
+    print()
+
+
+def clean_slate(pdf_basename: str, db_path: Path):
+    """STEP 0B: delete the annotation DB, OUTPUT files (+ companions) and intermediate DBs"""
+    _header("🧹 STEP 0B: Clean Slate (Rule 0 Compliance)...")
+    print("   Deleting all artifacts to force fresh extraction from PDF...")
+
+    if db_path.is_file():
+        db_path.unlink()
+        print(f"   ✅ Deleted: {db_path.name}")
+
+    outputs = list(OUTPUT_DIR.glob(f"{pdf_basename}_OUTPUT_*.json"))
+    if outputs:
+        for pattern in ('*.json', '*.npz', '*.objects.jsonl'):
+            for path in OUTPUT_DIR.glob(f"{pdf_basename}_OUTPUT_{pattern}"):
+                path.unlink()
+        print("   ✅ Deleted: OUTPUT JSON files")
+
+    for db in OUTPUT_DIR.glob('*.db'):
+        if db.is_file():
+            db.unlink()
+            print(f"   ✅ Deleted: {db.name}")
+
+    print("   ✅ Clean slate ready - will extract fresh from PDF")
+    print("   ℹ️  Stage cache left in place: unchanged stages are restored from it (--no-cache rebuilds)")
+    print()
+
+
+#===============================================================================
+# STAGES
+#===============================================================================
+
+def stage_entries(cache: StageCache, pdf_path: str) -> Dict[str, StageEntry]:
+    """Cache keys of the cached stages, chained through their upstream keys"""
+    gridtruth = Path(pdf_path).parent / 'GridTruth.json'
+    templates = {label: REPO_ROOT / path for label, path in TEMPLATE_FILES.items()}
+    params = {'pdf_source': pdf_path}
+
+    def sources(stage):
+        return expand_sources(STAGE_SOURCES[stage], REPO_ROOT, exclude=STAGE_EXCLUDED.get(stage, ()))
+
+    entries = {}
+    entries['primitives'] = cache.entry(
+        'primitives', {'pdf': pdf_path}, sources('primitives'))
+    entries['extraction'] = cache.entry(
+        'extraction',
+        {'pdf': pdf_path, 'gridtruth': gridtruth, 'master_template': templates['master_template'],
+         'naming_layer': templates['naming_layer'], 'validation_rules': templates['validation_rules']},
+        sources('extraction'), params, {'primitives': entries['primitives'].key})
+    entries['augmentation'] = cache.entry(
+        'augmentation', {'gridtruth': gridtruth, 'room_templates': templates['room_templates']},
+        sources('augmentation'), params, {'extraction': entries['extraction'].key})
+    entries['post_processing'] = cache.entry(
+        'post_processing',
+        {'gridtruth': gridtruth, 'master_template': templates['master_template'],
+         'naming_layer': templates['naming_layer'], 'validation_rules': templates['validation_rules']},
+        sources('post_processing'), params, {'augmentation': entries['augmentation'].key})
+    return entries
+
+
+def _cache_hit(cache: StageCache, entry: StageEntry, record: Dict) -> bool:
+    if not cache.hit(entry):
+        return False
+    produced = cache.stored_provenance(entry).get('produced', {})
+    print(f"   ♻️  Stage cache hit: {entry.stage} {entry.short_key} "
+          f"(produced {produced.get('at', '?')}, {produced.get('seconds', 0):.1f}s saved)")
+    record['status'] = 'cached'
+    return True
+
+
+def extract_primitives(pdf_path: str, db_path: Path, cache: StageCache, entry: StageEntry, record: Dict) -> str:
+    """STEP 0C: fresh annotation database from the PDF; returns its path"""
+    _header("📦 STEP 0C: Creating fresh annotation database from PDF...")
+    print(f"   Source: {pdf_path}")
+    print(f"   Database: {db_path}")
+    if _cache_hit(cache, entry, record):
+        cache.restore(entry, 'annotation.db', db_path)
+    else:
+        start = time.perf_counter()
+        from primitive_extractor_enhanced import EnhancedPrimitiveExtractor
+        EnhancedPrimitiveExtractor(str(db_path)).extract_to_database(pdf_path)
+        cache.store(entry, {'annotation.db': db_path}, time.perf_counter() - start)
+    print("   ✅ Database created fresh")
+    print()
+    return str(db_path)
+
+
+def extract_objects(pdf_path: str, columnar: bool, save: bool, cache: StageCache, entry: StageEntry, record: Dict):
+    """STEP 1: TIER-2 extraction; returns (output dict, OUTPUT JSON path)"""
+    _header("📖 STEP 1: Extracting from PDF...")
+    from src.core.extraction_engine import default_output_path, run_extraction
+    if _cache_hit(cache, entry, record):
+        output_json = cache.load_json(entry, 'output.json')
+        output_path = default_output_path(pdf_path)
+        if save:
+            from final_json_stream import dump_final_json
+            dump_final_json(output_json, output_path, sidecar=False, columnar=columnar)
+    else:
+        start = time.perf_counter()
+        output_json, output_path = run_extraction(pdf_path, columnar=columnar, save=save)
+        if output_json:
+            cache.store_json(entry, 'output.json', output_json, time.perf_counter() - start)
+    if not output_json:
+        print("\n❌ Extraction failed - see errors above")
+        raise PipelineFailed("❌ Error: Extraction output not found")
+    print(f"✅ Extraction complete: {output_path}")
+    print()
+    return output_json, output_path
+
+
+def augment(output_json: Dict, output_path: str, pdf_path: str, columnar: bool, save: bool,
+            cache: StageCache, entry: StageEntry, record: Dict) -> Dict:
+    """STEP 2a: room template augmentation; returns the AUGMENTED dict"""
+    _header("🏠 STEP 2: Augmenting with room templates + Automated fixes...")
+    from room_inference.integrate_room_templates import augment_with_room_templates
+    if _cache_hit(cache, entry, record):
+        augmented = cache.load_json(entry, 'augmented.json')
+    else:
+        start = time.perf_counter()
+        output_json['extraction_metadata']['pdf_source'] = pdf_path
+        augmented = augment_with_room_templates(output_json)
+        cache.store_json(entry, 'augmented.json', augmented, time.perf_counter() - start)
+    if save:
+        from final_json_stream import dump_final_json
+        augmented_path = output_path.replace('.json', '_AUGMENTED.json')
+        dump_final_json(augmented, augmented_path, sidecar=False, columnar=columnar)
+        print(f"\n💾 Saved augmented output: {augmented_path}")
+    return augmented
+
+
+def post_process(augmented: Dict, output_path: str, pdf_path: str, columnar: bool,
+                 cache: StageCache, entry: StageEntry, record: Dict) -> str:
+    """STEP 2b: wall combining + automated fixes + canvas; returns the FINAL JSON path"""
+    from room_inference.integrate_room_templates import post_process_augmented, save_final
+    if _cache_hit(cache, entry, record):
+        fixed = cache.load_json(entry, 'final.json')
+    else:
+        start = time.perf_counter()
+        fixed = post_process_augmented(augmented, output_path, pdf_path)
+        cache.store_json(entry, 'final.json', fixed, time.perf_counter() - start)
+    final_path = output_path.replace('.json', '_FINAL.json')
+    save_final(fixed, final_path, columnar=columnar)
+    return final_path
+
+
+def write_provenance(final_path: str, pdf_path: str, entries: Dict[str, StageEntry], timer: StageTimer) -> str:
+    """<X>_FINAL.provenance.json: inputs, code and cache key of every stage that produced FINAL"""
+    status = {record['stage']: record['status'] for record in timer.timings}
+    provenance_path = final_path.replace('_FINAL.json', '_FINAL.provenance.json')
+    with open(provenance_path, 'w') as f:
+        json.dump({
+            'pdf': pdf_path,
+            'final': final_path,
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'stages': {name: {'key': entry.key,
+                              'cached': status.get(STAGE_TIMER_NAMES[name]) == 'cached',
+                              'resumed': status.get(STAGE_TIMER_NAMES[name]) == 'resumed',
+                              'inputs': entry.provenance['inputs'],
+                              'sources': entry.provenance['sources'],
+                              'params': entry.provenance['params'],
+                              'upstream': entry.provenance['upstream']}
+                       for name, entry in entries.items()},
+        }, f, indent=2)
+    print(f"📜 Provenance: {provenance_path}")
+    return provenance_path
+
+
+def structural_gate(objects: List[Dict]):
+    """GATE 3: structural completeness"""
+    print()
+    _header("🔍 GATE 3: Validating structural completeness...")
+    from structural_validator import StructuralValidator
+    validator = StructuralValidator()
+    passed = validator.validate_objects(objects)
+    validator.print_report()
+    if not passed:
+        raise PipelineFailed("❌ PIPELINE FAILED - Structural validation failed",
+                             "   Output is structurally incomplete (missing walls/roof/drains)",
+                             "   Check GridTruth.json has room_bounds and building_envelope")
+    print()
+
+
+def library_gate(objects: List[Dict], library_db: str):
+    """GATE 4: every object_type has a catalog entry and intact geometry blobs (library_gate.py)"""
+    _header("🔍 GATE 4: Validating library geometry availability...")
+    if not Path(library_db).is_file():
+        raise PipelineFailed(f"❌ PIPELINE FAILED - Library database not found: {library_db}")
+
+    from library_gate import check_object_types
+    result = check_object_types((obj.get('object_type') for obj in objects), library_db)
+    report = result.report
+    print(f"   Checking {result.checked} unique object_types in library...")
+    if report.cached:
+        print(f"   ♻️  Library validity report reused ({len(report.catalog)} entries, validated {report.checked})")
+    else:
+        print(f"   📚 Library validated: {len(report.catalog)} entries in {report.seconds:.3f}s")
+    missing, corrupted = result.missing, result.corrupted
+
+    if missing or corrupted:
+        print(f"   ❌ FAILED: {len(missing)} missing, {len(corrupted)} corrupted")
+        if missing:
+            print(f"   Missing: {', '.join(missing[:5])}")
+        if corrupted:
+            print(f"   Corrupted: {', '.join(corrupted[:5])}")
+        raise PipelineFailed("❌ PIPELINE FAILED - Library geometry validation failed",
+                             "   Some object_types are missing or have corrupted geometry in library",
+                             f"   Run: python3 db/scripts/diagnose_repair_database.py {library_db}")
+
+    print(f"   ✅ All {result.checked} object_types have valid geometry")
+    print()
+
+
+def _ubbl(final_path: str, data: Dict, library_db: str) -> bool:
+    from validate_ubbl_compliance import UBBLValidator
+    return UBBLValidator(data).run_validation()
+
+
+def _comprehensive(final_path: str, data: Dict, library_db: str) -> bool:
+    from comprehensive_test import run_comprehensive_tests
+    return run_comprehensive_tests(final_path, library_db, data=data)
+
+
+def _spatial(final_path: str, data: Dict, library_db: str) -> bool:
+    from validate_spatial_logic import run_spatial_tests
+    return run_spatial_tests(final_path, data=data)
+
+
+def _room_walls(final_path: str, data: Dict, library_db: str) -> bool:
+    from validate_room_walls import validate_room_walls
+    return validate_room_walls(data) == 0
+
+
+# (stage name, title, check) per report-only validator
+VALIDATORS = [
+    ('ubbl', 'UBBL 1984 compliance (building codes)', _ubbl),
+    ('comprehensive', 'Comprehensive structural tests + Library validation', _comprehensive),
+    ('spatial logic', 'Spatial logic validation', _spatial),
+    ('room walls', 'Room and wall validation', _room_walls),
+]
+
+
+def run_validator(index: int, library_db: str, final_path: str, data: Dict) -> bool:
+    """STEP 3.<n>: one report-only validator; findings and errors never fail the pipeline"""
+    name, title, check = VALIDATORS[index]
+    print(f"📊 Test {index + 1}/{len(VALIDATORS)}: {title}...")
+    try:
+        return bool(check(final_path, data, library_db))
+    except SystemExit as e:
+        return not e.code
+    except Exception:
+        traceback.print_exc()
+        return False
+
+
+def print_summary(final_path: str, data: Dict):
+    """FINAL VALIDATION SUMMARY"""
+    print()
+    print(BANNER)
+    print("🎯 FINAL VALIDATION SUMMARY")
+    print(BANNER)
+
+    objects = data['objects']
+    lod300 = [o for o in objects if '_lod300' in (o.get('object_type') or '')]
+    with_height = [o for o in objects if o.get('position', [0, 0, 0])[2] > 0]
+    names = [o['name'] for o in objects]
+    unique_names = len(set(names))
+
+    print(f'Total Objects:        {len(objects)}')
+    print(f'LOD300 Compliance:    {len(lod300)}/{len(objects)} ({len(lod300)/len(objects)*100:.1f}%)')
+    print(f'Elevated Objects:     {len(with_height)}/{len(objects)} ({len(with_height)/len(objects)*100:.1f}%)')
+    print(f'Unique Names:         {unique_names}/{len(objects)} ({unique_names/len(objects)*100:.1f}%)')
+    print()
+    print('✅ Ready for Blender import')
+    print(f'   File: {final_path}')
+
+
+#===============================================================================
+# DRIVER
+#===============================================================================
+
+def load_final(final_path: str):
+    """FINAL is parsed once for both gates, the validators and the summary"""
+    with open(final_path) as f:
+        final = json.load(f)
+    return final, final['objects']
+
+
+def build_stage_dag(pdf_path: str, columnar: bool, keep_intermediate: bool, library_db: str, validate: bool,
+                    cache: StageCache, entries: Dict[str, StageEntry], timer: StageTimer,
+                    resumed: Optional[Dict] = None) -> StageDAG:
+    """
+    The pipeline as stages with declared inputs/outputs
+
+    Stages 0A-2b form a chain (each consumes the previous output). G3, G4
+    and the validators are parallel stages reading only FINAL; 'report'
+    waits for all of them. resumed ({artifact: value} from a checkpoint)
+    leaves out the stages producing those artifacts.
+    """
+    pdf_basename = Path(pdf_path).stem.replace(' ', '_')
+    db_path = OUTPUT_DIR / f"{pdf_basename}_ANNOTATION_FROM_2D.db"
+
+    def report(final_path, final, *results):
+        print()
+        print(BANNER)
+        print("✅ PIPELINE COMPLETE")
+        print(BANNER)
+        print(f"Final output: {final_path}")
+        print()
+        if validate:
+            print_summary(final_path, final)
+
+    stages = [
+        Stage('0A backup', lambda: backup_previous_run(pdf_basename, db_path), outputs=('backup',)),
+        Stage('0B clean slate', lambda _: clean_slate(pdf_basename, db_path),
+              inputs=('backup',), outputs=('clean_slate',)),
+        Stage(STAGE_TIMER_NAMES['primitives'],
+              lambda _, record: extract_primitives(pdf_path, db_path, cache, entries['primitives'], record),
+              inputs=('clean_slate',), outputs=('annotation_db',), pass_record=True),
+        Stage(STAGE_TIMER_NAMES['extraction'],
+              lambda _, record: extract_objects(pdf_path, columnar, keep_intermediate,
+                                                cache, entries['extraction'], record),
+              inputs=('annotation_db',), outputs=('output_json', 'output_path'), pass_record=True),
+        Stage(STAGE_TIMER_NAMES['augmentation'],
+              lambda output_json, output_path, record: augment(output_json, output_path, pdf_path, columnar,
+                                                               keep_intermediate, cache, entries['augmentation'],
+                                                               record),
+              inputs=('output_json', 'output_path'), outputs=('augmented',), pass_record=True),
+        Stage(STAGE_TIMER_NAMES['post_processing'],
+              lambda augmented, output_path, record: post_process(augmented, output_path, pdf_path, columnar,
+                                                                  cache, entries['post_processing'], record),
+              inputs=('augmented', 'output_path'), outputs=('final_path',), pass_record=True),
+        Stage('provenance', lambda final_path: write_provenance(final_path, pdf_path, entries, timer),
+              inputs=('final_path',), outputs=('provenance_path',)),
+        Stage('load FINAL', load_final, inputs=('final_path',), outputs=('final', 'objects')),
+        Stage('G3 structural gate', structural_gate, inputs=('objects',), outputs=('structural_gate',),
+              parallel=True),
+        Stage('G4 library gate', functools.partial(library_gate, library_db=library_db),
+              inputs=('objects',), outputs=('library_gate',), parallel=True),
+    ]
+    checks = ['structural_gate', 'library_gate']
+    if validate:
+        for index, (name, _, _) in enumerate(VALIDATORS):
+            stages.append(Stage(f"3.{index + 1} {name}", functools.partial(run_validator, index, library_db),
+                                inputs=('final_path', 'final'), outputs=(f"validator {name}",), parallel=True))
+            checks.append(f"validator {name}")
+    stages.append(Stage('report', report, inputs=('final_path', 'final', *checks), outputs=('report',)))
+    if resumed:
+        stages = [stage for stage in stages if not set(stage.outputs) <= set(resumed)]
+    return StageDAG(stages, initial=resumed or ())
+
+
+def checkpoint_stages(checkpoint: RunCheckpoint, cache: StageCache, entries: Dict[str, StageEntry]):
+    """DagScheduler on_done callback: checkpoint each stage of CHECKPOINT_CHAIN as it finishes"""
+    chain = {name: (entry_name, kinds) for name, entry_name, kinds in CHECKPOINT_CHAIN}
+
+    def on_done(stage: Stage, artifacts: Dict, seconds: float):
+        if stage.name not in chain:
+            return
+        entry_name, kinds = chain[stage.name]
+        entry = entries.get(entry_name)
+        files, data, links, values = {}, {}, {}, {}
+        for name, kind in kinds.items():
+            if kind == 'file':
+                files[name] = artifacts[name]
+            elif kind == 'value':
+                values[name] = artifacts[name]
+            elif name in CACHED_JSON and entry is not None and cache.hit(entry):
+                links[name] = entry.artifact(CACHED_JSON[name])
+            else:
+                data[name] = artifacts[name]
+        checkpoint.save(stage.name, stage.inputs, entry.key if entry else None,
+                        files=files, data=data, links=links, values=values, seconds=seconds)
+    return on_done
+
+
+def resume_from_checkpoint(checkpoint: RunCheckpoint, entries: Dict[str, StageEntry], timer: StageTimer) -> Dict:
+    """Artifacts of the verified checkpoint prefix (+ Step 0A/0B skipped), or {} to run from Step 0"""
+    _header("♻️  RESUME: Verifying checkpoint...")
+    chain = [(name, entries[entry_name].key if entry_name else None) for name, entry_name, _ in CHECKPOINT_CHAIN]
+    done, artifacts = checkpoint.resume(chain)
+    if not done:
+        print("   ℹ️  Running from Step 0")
+        print()
+        return {}
+    for name in ('0A backup', '0B clean slate', *done):
+        timer.timings.append({'stage': name, 'seconds': 0.0, 'status': 'resumed'})
+    remaining = [name for name, _, _ in CHECKPOINT_CHAIN if name not in done]
+    print(f"   ✅ {len(done)} stages verified ({done[0]} → {done[-1]}), annotation DB kept")
+    print(f"   ▶️  Continuing at {remaining[0] if remaining else 'load FINAL'}")
+    print()
+    return {'backup': None, 'clean_slate': None, **artifacts}
+
+
+def run_pipeline(pdf_path: str, columnar: bool = False, keep_intermediate: bool = False,
+                 library_db: str = LIBRARY_DB, validate: bool = True,
+                 timer: Optional[StageTimer] = None, cache: Optional[StageCache] = None,
+                 jobs: Optional[int] = None, quiet: bool = False, resume: bool = False,
+                 checkpoint_dir: Optional[str] = None) -> int:
+    """
+    Run the complete pipeline in this process (+ a worker pool for G3/G4/validators)
+
+    Args:
+        pdf_path: Input PDF
+        columnar: Also write .npz copies of the outputs
+        keep_intermediate: Write (and keep) OUTPUT/AUGMENTED JSONs
+        library_db: Ifc_Object_Library.db for Gate 4 and the comprehensive tests
+        validate: Run the report-only validators (STEP 3)
+        timer: StageTimer to record into (a new one if None)
+        cache: StageCache for stages 0C-2 (default: output_artifacts/stage_cache)
+        jobs: Concurrent parallel stages (None = CPU count, 1 = all in this process)
+        quiet: Suppress stage output (failures and timings are still printed)
+        resume: Continue after the last good checkpointed stage (Step 0 if none)
+        checkpoint_dir: Checkpoint root (default: output_artifacts/checkpoints)
+
+    Returns:
+        Exit code (0 = complete)
+    """
+    timer = timer if timer is not None else StageTimer()
+
+    if not Path(pdf_path).is_file():
+        print(f"❌ Error: PDF file not found: {pdf_path}")
+        return 1
+
+    cache = cache if cache is not None else StageCache(source_root=REPO_ROOT)
+    entries = stage_entries(cache, pdf_path)
+    checkpoint = RunCheckpoint(pdf_path, checkpoint_dir or DEFAULT_CHECKPOINT_DIR,
+                               options={'columnar': columnar, 'keep_intermediate': keep_intermediate})
+    scheduler = None
+
+    try:
+        with tracing.quiet_output(quiet):
+            print(BANNER)
+            print("🚀 AUTOMATED 2D-TO-3D EXTRACTION PIPELINE")
+            print(BANNER)
+            print(f"Input PDF: {pdf_path}")
+            print()
+            resumed = resume_from_checkpoint(checkpoint, entries, timer) if resume else {}
+            if not resumed:
+                checkpoint.reset()
+            dag = build_stage_dag(pdf_path, columnar, keep_intermediate, library_db, validate, cache, entries,
+                                  timer, resumed)
+            scheduler = DagScheduler(dag, jobs=jobs, timer=timer, on_done=checkpoint_stages(checkpoint, cache, entries))
+            scheduler.run(resumed)
+    except PipelineFailed as e:
+        print()
+        for line in e.lines:
+            print(line)
+        _print_timings(timer, scheduler)
+        return e.exit_code
+    except SystemExit as e:
+        _print_timings(timer, scheduler)
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        _print_timings(timer, scheduler)
+        return 1
+
+    print()
+    print(BANNER)
+    print("🏆 AUTOMATED PIPELINE COMPLETE")
+    print(BANNER)
+    _print_timings(timer, scheduler)
+    return 0
+
+
+def _print_timings(timer: StageTimer, scheduler: Optional[DagScheduler] = None):
+    print()
+    print("⏱️  Stage timings:")
+    print(timer.report())
+    if scheduler is not None and scheduler.seconds:
+        path = scheduler.dag.critical_path(scheduler.seconds)
+        seconds = sum(scheduler.seconds.get(name, 0.0) for name in path)
+        print(f"   Critical path ({seconds:.2f}s): {' → '.join(path)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the complete 2D-to-3D pipeline in one process")
+    parser.add_argument('pdf', nargs='?', default='TB-LKTN HOUSE.pdf', help="Input PDF (default: TB-LKTN HOUSE.pdf)")
+    parser.add_argument('--columnar', action='store_true', help="Also write .npz copies of the outputs")
+    parser.add_argument('--keep-intermediate', action='store_true',
+                        help="Write and keep the OUTPUT / AUGMENTED JSONs")
+    parser.add_argument('--library', default=LIBRARY_DB, help=f"Library database (default: {LIBRARY_DB})")
+    parser.add_argument('--no-validators', action='store_true', help="Skip the report-only validators (STEP 3)")
+    parser.add_argument('--timings', help="Save per-stage timings as JSON")
+    parser.add_argument('--no-cache', action='store_true', help="Re-run every stage (results are not cached either)")
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                        help=f"Stage cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="Gates/validators run concurrently on this many processes "
+                             "(default: CPU count; 1 = sequential in this process)")
+    parser.add_argument('--trace', help="Save tracing spans as JSONL")
+    parser.add_argument('--chrome-trace', help="Save tracing spans in Chrome trace format (chrome://tracing, Perfetto)")
+    parser.add_argument('--quiet', action='store_true', help="Only print failures and the timing table")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue after the last good stage of the previous run (verified checkpoint)")
+    parser.add_argument('--checkpoint-dir', default=str(DEFAULT_CHECKPOINT_DIR),
+                        help=f"Checkpoint directory (default: {DEFAULT_CHECKPOINT_DIR})")
+    args = parser.parse_args()
+
+    timer = StageTimer()
+    cache = StageCache(args.cache_dir, enabled=not args.no_cache, source_root=REPO_ROOT)
+    if args.trace or args.chrome_trace:
+        tracing.start()
+    exit_code = run_pipeline(args.pdf, columnar=args.columnar, keep_intermediate=args.keep_intermediate,
+                             library_db=args.library, validate=not args.no_validators, timer=timer, cache=cache,
+                             jobs=args.jobs, quiet=args.quiet, resume=args.resume,
+                             checkpoint_dir=args.checkpoint_dir)
+
+    if tracing.enabled():
+        spans = tracing.stop()
+        print()
+        print(f"🔎 Slowest spans ({len(spans)} recorded):")
+        print(tracing.summary(spans))
+        if args.trace:
+            print(f"💾 Trace saved: {tracing.write_jsonl(args.trace, spans)}")
+        if args.chrome_trace:
+            print(f"💾 Chrome trace saved: {tracing.write_chrome_trace(args.chrome_trace, spans)}")
+
+    if args.timings:
+        with open(args.timings, 'w') as f:
+            json.dump({'pdf': args.pdf, 'exit_code': exit_code, 'finished': datetime.now().isoformat(),
+                       'stages': timer.timings, 'total_seconds': timer.total_seconds,
+                       'wall_seconds': timer.wall_seconds}, f, indent=2)
+        print(f"💾 Timings saved: {args.timings}")
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,11 @@ import math
 import os
 from pathlib import Path
 
+try:
+    from src.core import tracing
+except ImportError:
+    import tracing
+
 # Expert-verified grid coordinates from TB-LKTN HOUSE.pdf (Section 2.2)
 # Source: Architectural dimension annotations on PDF page 1
 # Rule 0 compliant: Values verified by expert, traceable to PDF
@@ -104,6 +109,7 @@ def walls_overlap(wall1, wall2, tolerance=0.15):
     return avg_dist < tolerance
 
 
+@tracing.traced(cat='fixer')
 def remove_duplicate_walls(objects, tolerance=0.15):
     """Remove duplicate wall segments"""
     walls = [o for o in objects if 'wall' in (o.get('object_type') or '').lower()]
@@ -151,6 +157,7 @@ def remove_duplicate_walls(objects, tolerance=0.15):
     return keep_walls + other_objects
 
 
+@tracing.traced(cat='fixer')
 def remove_duplicate_doors(objects, tolerance=0.1):
     """Remove true duplicate doors (same location from PDF extraction errors)
 
@@ -193,6 +200,7 @@ def remove_duplicate_doors(objects, tolerance=0.1):
     return keep_doors + other_objects
 
 
+@tracing.traced(cat='fixer')
 def remove_duplicate_windows(objects, tolerance=0.5):
     """Remove duplicate windows (same window on multiple PDF pages: floor plan, elevations)
 
@@ -233,6 +241,7 @@ def remove_duplicate_windows(objects, tolerance=0.5):
     return keep_windows + other_objects
 
 
+@tracing.traced(cat='fixer')
 def apply_height_rules(objects, master_template_path):
     """Apply height rules from master template to objects with Z=0"""
     # Load master template
@@ -279,6 +288,7 @@ def apply_height_rules(objects, master_template_path):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def snap_doors_to_walls(objects, tolerance=0.5):
     """
     Snap doors to nearest wall within tolerance
@@ -341,6 +351,7 @@ def snap_doors_to_walls(objects, tolerance=0.5):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def fix_duplicate_names(objects):
     """Add unique suffixes to duplicate names"""
     name_counts = {}
@@ -372,6 +383,7 @@ def fix_duplicate_names(objects):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def optimize_template_spacing(objects):
     """Adjust template object spacing to reduce minor collisions"""
     # Group by room
@@ -423,6 +435,7 @@ def optimize_template_spacing(objects):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def fix_towel_racks_as_walls(objects):
     """Fix towel racks that were incorrectly classified as walls"""
     fixed = []
@@ -454,6 +467,7 @@ def fix_towel_racks_as_walls(objects):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def fix_ceiling_objects_height(objects):
     """Move ceiling objects from Z=0 to ceiling height
 
@@ -490,6 +504,7 @@ def fix_ceiling_objects_height(objects):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def snap_windows_to_walls(objects, tolerance=1.0):
     """Snap windows to nearest wall within tolerance"""
     windows = [o for o in objects if 'window' in (o.get('object_type') or '').lower() or
@@ -536,6 +551,7 @@ def snap_windows_to_walls(objects, tolerance=1.0):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def fix_window_orientations(objects):
     """Fix windows to be parallel to their walls
 
@@ -621,6 +637,7 @@ def fix_window_orientations(objects):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def remove_zero_area_structures(objects):
     """Remove structural planes/slabs with zero area (but keep point fixtures)"""
     removed = []
@@ -668,7 +685,8 @@ def remove_zero_area_structures(objects):
     return keep_objects
 
 
-def assign_doors_to_rooms(objects):
+@tracing.traced(cat='fixer')
+def assign_doors_to_rooms(objects, annotation_db=None):
     """
     [THIRD-D] Assign doors to correct rooms based on spatial analysis
 
@@ -677,6 +695,9 @@ def assign_doors_to_rooms(objects):
     2. For each door, check which room(s) it's adjacent to
     3. Use door name to disambiguate (Malay → English mapping)
     4. Fallback to door orientation if name parsing fails
+
+    annotation_db: Annotations DB of the PDF being processed
+    (default: output_artifacts/TB-LKTN_HOUSE_ANNOTATION_FROM_2D.db)
     """
     doors = [o for o in objects if 'door' in (o.get('object_type') or '').lower()]
 
@@ -694,7 +715,7 @@ def assign_doors_to_rooms(objects):
 
     # Derive room bounds from Annotations DB (Rule 0: No fallbacks)
     # Find annotation database (standard location)
-    annotation_db = Path('output_artifacts/TB-LKTN_HOUSE_ANNOTATION_FROM_2D.db')
+    annotation_db = Path(annotation_db or 'output_artifacts/TB-LKTN_HOUSE_ANNOTATION_FROM_2D.db')
 
     if not annotation_db.exists():
         raise FileNotFoundError(
@@ -768,6 +789,7 @@ def assign_doors_to_rooms(objects):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def remove_phantom_rooms(objects):
     """Remove objects in phantom/zero-area rooms"""
     # Calculate room sizes
@@ -822,6 +844,7 @@ def remove_phantom_rooms(objects):
     return fixed_objects
 
 
+@tracing.traced(cat='fixer')
 def snap_isolated_walls_to_network(objects, tolerance=0.15):
     """Snap isolated wall endpoints to nearby walls to form connected network"""
     walls = [o for o in objects if 'wall' in (o.get('object_type') or '').lower()]
@@ -906,6 +929,7 @@ def snap_isolated_walls_to_network(objects, tolerance=0.15):
     return walls + other_objects
 
 
+@tracing.traced(cat='fixer')
 def remove_self_intersecting_walls(objects):
     """Remove walls that self-intersect with others"""
     walls = [o for o in objects if 'wall' in (o.get('object_type') or '').lower()]
@@ -972,6 +996,7 @@ def remove_self_intersecting_walls(objects):
     return keep_walls + other_objects
 
 
+@tracing.traced(cat='fixer')
 def fix_wall_z_positioning(objects):
     """
     DISABLED - This function had wrong logic.
@@ -992,6 +1017,7 @@ def snap_to_nearest_grid(value, grid_points):
     return min(grid_points, key=lambda g: abs(g - value))
 
 
+@tracing.traced(cat='fixer')
 def snap_coordinates_to_grid(objects):
     """
     Snap wall coordinates to nearest grid points
@@ -1085,6 +1111,7 @@ def snap_coordinates_to_grid(objects):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def fix_window_sill_heights(objects):
     """
     Set window positions to sill height (z=0.9m standard)
@@ -1107,6 +1134,7 @@ def fix_window_sill_heights(objects):
     return objects
 
 
+@tracing.traced(cat='fixer')
 def filter_degenerate_walls(objects):
     """
     Remove zero-length (degenerate) walls where position == end_point
@@ -1141,6 +1169,7 @@ def filter_degenerate_walls(objects):
     return walls + other_objects
 
 
+@tracing.traced(cat='fixer')
 def fix_null_object_types(objects):
     """Fix objects with null/missing object_type (extraction errors)"""
     fixed_count = 0
@@ -1175,6 +1204,7 @@ def fix_null_object_types(objects):
     return objects
 
 
+@tracing.traced()
 def automated_post_process(extraction_output, master_template_path):
     """
     Run all automated fixes on extraction output
@@ -1278,7 +1308,12 @@ def automated_post_process(extraction_output, master_template_path):
 
     # Fix 14: Assign doors to rooms
     print("\n🔧 Fix 14: Assigning doors to correct rooms...")
-    objects = assign_doors_to_rooms(objects)
+    pdf_source = extraction_output.get('extraction_metadata', {}).get('pdf_source')
+    annotation_db = None
+    if pdf_source:
+        from src.core.annotation_derivation import get_annotation_db_path
+        annotation_db = get_annotation_db_path(pdf_source)
+    objects = assign_doors_to_rooms(objects, annotation_db)
 
     # Fix 15: Remove phantom rooms
     print("\n🔧 Fix 15: Cleaning phantom/zero-area rooms...")
@@ -1293,9 +1328,9 @@ def automated_post_process(extraction_output, master_template_path):
 
     # [FIFTH-D] Apply IFC naming layer to ALL objects (including merged walls)
     print("\n🔧 Fix 16: Applying FIFTH-D IFC classification to all objects...")
-    from src.core.ifc_naming_util import IfcNamingLayer
+    from src.core.ifc_naming_util import load_naming_layer
     naming_layer_path = os.path.join(os.path.dirname(__file__), 'ifc_naming_layer.json')
-    naming_layer = IfcNamingLayer(naming_layer_path)
+    naming_layer = load_naming_layer(naming_layer_path)
 
     ifc_applied_count = 0
     for obj in objects:
@@ -1312,6 +1347,7 @@ def automated_post_process(extraction_output, master_template_path):
     print("="*80)
     print(f"Objects: {initial_count} → {final_count} (removed {initial_count - final_count} total)")
     print()
+    tracing.annotate(objects_in=initial_count, objects_out=final_count)
 
     return extraction_output
 
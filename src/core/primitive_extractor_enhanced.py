@@ -16,6 +16,11 @@ import sqlite3
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from src.core import tracing
+except ImportError:
+    import tracing
+
 
 # ============================================================================
 # PAGE-SPECIFIC EXTRACTION MASKS
@@ -202,6 +207,7 @@ class EnhancedPrimitiveExtractor:
             )
         """)
 
+    @tracing.traced(name='EnhancedPrimitiveExtractor.extract_to_database')
     def extract_to_database(self, pdf_path):
         """
         Extract ALL primitives to SQLite database
@@ -239,7 +245,8 @@ class EnhancedPrimitiveExtractor:
                 print(f"Processing Page {page_num}/{total_pages}...")
 
                 # Extract primitives with multiple methods
-                self._extract_page_exhaustive(page, page_num, cursor)
+                with tracing.span(f"page {page_num}", cat='page', page=page_num):
+                    self._extract_page_exhaustive(page, page_num, cursor)
 
                 print()
 
@@ -393,6 +400,7 @@ class EnhancedPrimitiveExtractor:
 
         # Store all text in database
         print(f"  Storing {len(all_text_items)} text primitives to database...")
+        tracing.annotate(text_rows=len(all_text_items))
         for idx, item in enumerate(all_text_items):
             bbox = item['bbox']
             cursor.execute("""
@@ -495,6 +503,7 @@ class EnhancedPrimitiveExtractor:
 
         # Rectangles
         rects = page.rects if hasattr(page, 'rects') else []
+        tracing.annotate(lines=len(lines), curves=len(curves), rects=len(rects))
         for rect in rects:
             width = rect['x1'] - rect['x0']
             height = rect['y1'] - rect['y0']
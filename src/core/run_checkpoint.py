@@ -0,0 +1,238 @@
+"""
+Run Checkpoint Module
+=====================
+Per-stage checkpoints of a pipeline run, so a run that died (e.g. at
+Gate 3/4) can continue from its last good stage instead of Step 0.
+
+Layout (one directory per PDF, next to the outputs):
+
+    output_artifacts/checkpoints/<pdf stem>/
+        manifest.json       PDF sha256, run options, one record per finished stage
+        <artifact>.json     in-memory stage outputs (OUTPUT / AUGMENTED dicts);
+                            hardlinked from the stage cache when it holds them
+
+A stage record lists its artifacts - a file the pipeline wrote (the
+annotation DB, FINAL) with its sha256, a JSON artifact kept here, or a
+small inline value - plus its stage-cache key (PDF, templates, code) and
+the fingerprints of the upstream artifacts it consumed. Every write is a
+temp file + rename, and the manifest is replaced after the stage's
+artifacts, so a crash leaves either the old or the new checkpoint.
+
+resume() walks the chain in order and accepts a stage only while its
+key still matches, its artifacts are present with the recorded hashes
+and its upstream fingerprints are the ones just verified; the first
+stage that fails any check (and everything after it) runs again.
+
+Usage:
+    checkpoint = RunCheckpoint(pdf_path, options={'columnar': False})
+    artifacts = checkpoint.resume([('0C primitive extraction', key), ...])    # {} → run from Step 0
+    if not artifacts:
+        checkpoint.reset()
+    ...
+    checkpoint.save('1 extraction', inputs=('annotation_db',), key=key,
+                    data={'output_json': output_json}, values={'output_path': path})
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from stage_cache import file_digest
+
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT_DIR = Path('output_artifacts') / 'checkpoints'
+MANIFEST_FILE = 'manifest.json'
+
+
+def _atomic_json(path: Path, data, fsync: bool = False):
+    """json.dump to a temp file in the same directory, then rename over path"""
+    scratch = path.parent / f".{path.name}-{uuid.uuid4().hex[:8]}"
+    try:
+        with open(scratch, 'w') as f:
+            json.dump(data, f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(scratch, path)
+    except BaseException:
+        scratch.unlink(missing_ok=True)
+        raise
+
+
+def link_or_copy(source: Union[str, Path], target: Union[str, Path]) -> str:
+    """Hardlink source to target (copy when linking is not possible); returns 'link' or 'copy'"""
+    target = Path(target)
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+        return 'link'
+    except OSError:     # other filesystem, no hardlink support
+        shutil.copy2(source, target)
+        return 'copy'
+
+
+def _value_fingerprint(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class RunCheckpoint:
+    """output_artifacts/checkpoints/<pdf stem>/ for one PDF"""
+
+    def __init__(self, pdf_path: str, root: Union[str, Path] = DEFAULT_CHECKPOINT_DIR,
+                 options: Optional[Dict] = None):
+        """
+        Args:
+            pdf_path: Input PDF (its sha256 ties the checkpoint to the drawing)
+            root: Checkpoint root directory
+            options: Run options that change the outputs (a mismatch disables resume)
+        """
+        self.pdf_path = pdf_path
+        self.dir = Path(root) / Path(pdf_path).stem.replace(' ', '_')
+        self.options = options or {}
+        self.manifest: Dict = {}
+        self.fingerprints: Dict[str, str] = {}     # artifact name → sha256, this run (saved or verified)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.dir / MANIFEST_FILE
+
+    def _write_manifest(self):
+        _atomic_json(self.manifest_path, self.manifest, fsync=True)
+
+    def reset(self):
+        """Start a fresh checkpoint (Step 0 run): previous stage records and artifacts are dropped"""
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self.dir.mkdir(parents=True)
+        self.fingerprints = {}
+        self.manifest = {
+            'version': CHECKPOINT_VERSION,
+            'pdf': self.pdf_path,
+            'pdf_sha256': file_digest(self.pdf_path),
+            'options': self.options,
+            'started': datetime.now().isoformat(timespec='seconds'),
+            'stages': {},
+        }
+        self._write_manifest()
+
+    def save(self, stage: str, inputs: Iterable[str] = (), key: Optional[str] = None,
+             files: Optional[Dict[str, Union[str, Path]]] = None, data: Optional[Dict[str, Any]] = None,
+             links: Optional[Dict[str, Union[str, Path]]] = None, values: Optional[Dict[str, Any]] = None,
+             seconds: float = 0.0):
+        """
+        Record a finished stage
+
+        Args:
+            stage: Stage name
+            inputs: Artifact names it consumed (their fingerprints become its upstream)
+            key: Stage-cache key (None for stages without one)
+            files: {artifact: path} files the stage wrote in place (hash recorded)
+            data: {artifact: JSON data} kept as <artifact>.json in the checkpoint
+            links: {artifact: file} JSON artifacts already on disk (e.g. in the stage cache), hardlinked in
+            values: {artifact: value} small JSON values kept in the manifest
+            seconds: Stage time (informational)
+        """
+        if not self.manifest:
+            return
+        artifacts = {}
+        for name, path in (files or {}).items():
+            artifacts[name] = {'kind': 'file', 'path': str(path), 'sha256': file_digest(path)}
+        for name, source in (links or {}).items():
+            target = self.dir / f"{name}.json"
+            link_or_copy(source, target)
+            artifacts[name] = {'kind': 'json', 'file': target.name, 'sha256': file_digest(target)}
+        for name, value in (data or {}).items():
+            if name in artifacts:
+                continue
+            target = self.dir / f"{name}.json"
+            _atomic_json(target, value)
+            artifacts[name] = {'kind': 'json', 'file': target.name, 'sha256': file_digest(target)}
+        for name, value in (values or {}).items():
+            artifacts[name] = {'kind': 'value', 'value': value, 'sha256': _value_fingerprint(value)}
+
+        self.manifest['stages'][stage] = {
+            'completed': datetime.now().isoformat(timespec='seconds'),
+            'seconds': round(seconds, 3),
+            'key': key,
+            'upstream': {name: self.fingerprints[name] for name in inputs if name in self.fingerprints},
+            'artifacts': artifacts,
+        }
+        self.fingerprints.update({name: item['sha256'] for name, item in artifacts.items()})
+        self._write_manifest()
+
+    def _load_manifest(self) -> Optional[Dict]:
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _verify(self, item: Dict) -> bool:
+        if item['kind'] == 'value':
+            return _value_fingerprint(item['value']) == item['sha256']
+        path = Path(item['path']) if item['kind'] == 'file' else self.dir / item['file']
+        return path.is_file() and file_digest(path) == item['sha256']
+
+    def _value(self, item: Dict):
+        if item['kind'] == 'value':
+            return item['value']
+        if item['kind'] == 'file':
+            return item['path']
+        with open(self.dir / item['file']) as f:
+            return json.load(f)
+
+    def resume(self, chain: Sequence[Tuple[str, Optional[str]]]) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Verified prefix of the stage chain
+
+        Args:
+            chain: (stage name, current stage-cache key or None) in run order
+
+        Returns:
+            (stage names that need not run again, their artifacts {name: value});
+            ([], {}) when nothing can be reused
+        """
+        manifest = self._load_manifest()
+        reason = None
+        if manifest is None:
+            reason = 'no checkpoint'
+        elif manifest.get('version') != CHECKPOINT_VERSION:
+            reason = 'checkpoint from another version'
+        elif not Path(self.pdf_path).is_file() or manifest.get('pdf_sha256') != file_digest(self.pdf_path):
+            reason = 'PDF changed since the checkpoint'
+        elif manifest.get('options') != self.options:
+            reason = f"run options changed ({manifest.get('options')} → {self.options})"
+        if reason:
+            print(f"   ℹ️  Nothing to resume: {reason}")
+            return [], {}
+
+        self.manifest = manifest
+        self.fingerprints = {}
+        done, artifacts = [], {}
+        for stage, key in chain:
+            record = manifest['stages'].get(stage)
+            if record is None:
+                break
+            if record.get('key') != key:
+                print(f"   ℹ️  {stage}: inputs or code changed since the checkpoint - re-running from here")
+                break
+            if any(self.fingerprints.get(name) != digest for name, digest in record['upstream'].items()):
+                print(f"   ℹ️  {stage}: upstream artifacts differ from the checkpoint - re-running from here")
+                break
+            if not all(self._verify(item) for item in record['artifacts'].values()):
+                print(f"   ℹ️  {stage}: checkpointed artifacts missing or modified - re-running from here")
+                break
+            done.append(stage)
+            for name, item in record['artifacts'].items():
+                self.fingerprints[name] = item['sha256']
+                artifacts[name] = self._value(item)
+
+        # Records after the verified prefix are stale; they are rewritten as those stages run
+        manifest['stages'] = {name: record for name, record in manifest['stages'].items() if name in done}
+        manifest['resumed'] = datetime.now().isoformat(timespec='seconds')
+        self._write_manifest()
+        return done, artifacts
@@ -0,0 +1,231 @@
+"""
+Stage Cache Module
+==================
+Content-addressed artifact cache for pipeline stages.
+
+A stage's key is the SHA-256 of everything that can change its output:
+
+    input files     PDF bytes, master_reference_template.json, room_templates.json, ...
+                    (optional files that do not exist are recorded as absent)
+    source files    the modules the stage runs
+    params          e.g. the pdf_source string written into metadata
+    upstream keys   keys of the stages whose output it consumes
+
+so a template tweak only invalidates the stages reading that template
+(and everything downstream of them).
+
+Layout (one directory per entry, published with an atomic rename):
+
+    output_artifacts/stage_cache/<stage>/<key>/
+        provenance.json     stage, key, every input/source with its sha256,
+                            params, upstream keys, when/how it was produced
+        <artifact files>    e.g. annotation.db, output.json
+
+provenance.json is the Rule 0 record: a cached artifact is traceable to
+the exact PDF, templates and code it was derived from.
+
+Usage:
+    cache = StageCache()
+    entry = cache.entry('extraction', inputs={'pdf': pdf_path}, sources=['src/core/*.py'],
+                        params={'pdf_source': pdf_path}, upstream={'primitives': prim.key})
+    if cache.hit(entry):
+        data = cache.load_json(entry, 'output.json')
+    else:
+        data = run_stage()
+        cache.store_json(entry, 'output.json', data, seconds=elapsed)
+"""
+
+import glob
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = Path('output_artifacts') / 'stage_cache'
+PROVENANCE_FILE = 'provenance.json'
+
+_CHUNK = 1 << 20
+_digests: Dict[tuple, str] = {}     # (path, size, mtime_ns) → sha256, per process
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """sha256 of a file's bytes (memoised on path + size + mtime)"""
+    path = Path(path)
+    stat = path.stat()
+    memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    digest = _digests.get(memo_key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK), b''):
+                h.update(chunk)
+        digest = _digests[memo_key] = h.hexdigest()
+    return digest
+
+
+def expand_sources(patterns: Iterable[Union[str, Path]], root: Union[str, Path] = '.',
+                   exclude: Iterable[str] = ()) -> List[Path]:
+    """Glob patterns (relative to root) → sorted, de-duplicated file list"""
+    root = Path(root)
+    excluded = set(exclude)
+    found = set()
+    for pattern in patterns:
+        for match in glob.glob(str(root / pattern)):
+            path = Path(match)
+            if path.is_file() and path.name not in excluded:
+                found.add(path)
+    return sorted(found)
+
+
+class StageEntry:
+    """Key + provenance of one stage invocation"""
+
+    def __init__(self, stage: str, key: str, provenance: Dict, path: Path):
+        self.stage = stage
+        self.key = key
+        self.provenance = provenance
+        self.path = path
+
+    @property
+    def short_key(self) -> str:
+        return self.key[:12]
+
+    def artifact(self, name: str) -> Path:
+        return self.path / name
+
+
+class StageCache:
+    """output_artifacts/stage_cache/<stage>/<key>/ entries"""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_CACHE_DIR, enabled: bool = True,
+                 source_root: Union[str, Path] = '.'):
+        self.root = Path(root)
+        self.enabled = enabled
+        self.source_root = Path(source_root)
+
+    def entry(self, stage: str, inputs: Optional[Dict[str, Union[str, Path, None]]] = None,
+              sources: Iterable[Union[str, Path]] = (), params: Optional[Dict] = None,
+              upstream: Optional[Dict[str, str]] = None) -> StageEntry:
+        """
+        Compute the key of a stage invocation
+
+        Args:
+            stage: Stage name (cache subdirectory)
+            inputs: {label: path} data files; None or a missing path is recorded as absent
+            sources: Source files (absolute, or relative to source_root)
+            params: JSON-serialisable parameters that affect the output
+            upstream: {stage: key} of the stages whose output is consumed
+
+        Returns:
+            StageEntry (nothing is read from or written to the cache yet)
+        """
+        recorded_inputs = {}
+        for label, path in sorted((inputs or {}).items()):
+            if path is not None and Path(path).is_file():
+                recorded_inputs[label] = {'path': str(path), 'sha256': file_digest(path)}
+            else:
+                recorded_inputs[label] = {'path': None if path is None else str(path), 'sha256': None}
+
+        recorded_sources = {}
+        for path in sources:
+            path = Path(path)
+            label = os.path.relpath(path, self.source_root) if path.is_absolute() else str(path)
+            full = path if path.is_absolute() else self.source_root / path
+            recorded_sources[label] = file_digest(full)
+
+        # Paths of inputs are not part of the key (content is); source paths are
+        keyed = {
+            'cache_version': CACHE_VERSION,
+            'stage': stage,
+            'inputs': {label: item['sha256'] for label, item in recorded_inputs.items()},
+            'sources': recorded_sources,
+            'params': params or {},
+            'upstream': upstream or {},
+        }
+        key = hashlib.sha256(json.dumps(keyed, sort_keys=True).encode('utf-8')).hexdigest()
+
+        provenance = {
+            'stage': stage,
+            'key': key,
+            'cache_version': CACHE_VERSION,
+            'inputs': recorded_inputs,
+            'sources': recorded_sources,
+            'params': params or {},
+            'upstream': upstream or {},
+        }
+        return StageEntry(stage, key, provenance, self.root / stage / key)
+
+    def hit(self, entry: StageEntry) -> bool:
+        """Entry exists (always False when the cache is disabled)"""
+        return self.enabled and (entry.path / PROVENANCE_FILE).is_file()
+
+    def stored_provenance(self, entry: StageEntry) -> Dict:
+        with open(entry.path / PROVENANCE_FILE) as f:
+            return json.load(f)
+
+    def store(self, entry: StageEntry, artifacts: Dict[str, Union[str, Path]], seconds: float = 0.0):
+        """
+        Copy artifact files into the cache and publish the entry atomically
+
+        Args:
+            entry: From entry()
+            artifacts: {artifact name: source file}
+            seconds: Time the stage took (recorded in provenance)
+        """
+        if not self.enabled or self.hit(entry):
+            return
+        entry.path.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{entry.key[:12]}-", dir=entry.path.parent))
+        try:
+            for name, source in artifacts.items():
+                shutil.copy2(source, staging / name)
+            provenance = dict(entry.provenance)
+            provenance['produced'] = {
+                'at': datetime.now().isoformat(timespec='seconds'),
+                'seconds': round(seconds, 3),
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'artifacts': {name: file_digest(staging / name) for name in artifacts},
+            }
+            with open(staging / PROVENANCE_FILE, 'w') as f:
+                json.dump(provenance, f, indent=2)
+            try:
+                os.rename(staging, entry.path)
+            except OSError:
+                # Published concurrently by another run with the same key
+                shutil.rmtree(staging, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def store_json(self, entry: StageEntry, name: str, data, seconds: float = 0.0):
+        """store() a JSON-serialisable artifact"""
+        if not self.enabled or self.hit(entry):
+            return
+        entry.path.parent.mkdir(parents=True, exist_ok=True)
+        scratch = entry.path.parent / f".{entry.key[:12]}-{uuid.uuid4().hex[:8]}-{name}"
+        try:
+            with open(scratch, 'w') as f:
+                json.dump(data, f)
+            self.store(entry, {name: scratch}, seconds)
+        finally:
+            scratch.unlink(missing_ok=True)
+
+    def load_json(self, entry: StageEntry, name: str):
+        with open(entry.artifact(name)) as f:
+            return json.load(f)
+
+    def restore(self, entry: StageEntry, name: str, target: Union[str, Path]) -> Path:
+        """Copy a cached artifact to target"""
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(entry.artifact(name), target)
+        return target
@@ -0,0 +1,336 @@
+"""
+Stage DAG Module
+================
+Pipeline stages as a DAG of named inputs/outputs, run by a scheduler that
+executes independent stages concurrently.
+
+    Stage('load_final', load, inputs=('final_path',), outputs=('final',))
+    Stage('ubbl', run_ubbl, inputs=('final_path', 'final'), outputs=('ubbl',), parallel=True)
+
+A stage becomes ready when every input has been produced (by an earlier
+stage or the initial artifacts). Ready stages with parallel=True go to a
+process pool; their stdout/stderr is streamed back line by line and
+printed with a "[stage]" prefix. Other stages run in the main process (in
+declaration order among those ready), so they can hand large in-memory
+objects to the next stage; worker output that arrives meanwhile is
+printed once the in-process stage returns. Inputs of parallel stages are
+pickled to the worker, outputs pickled back, so a parallel stage's
+function must be module-level (or a functools.partial of one).
+
+Each stage runs inside a tracing span (cat 'stage'); spans recorded in a
+worker are sent back with its result. In quiet mode (tracing.quiet_output)
+worker output is discarded instead of streamed.
+
+An on_done(stage, artifacts, seconds) callback runs in the main process
+after each stage's outputs are stored (pipeline_runner checkpoints the
+stage chain with it).
+
+The first stage that raises stops the scheduler from starting new
+stages; already running ones finish, then the exception is re-raised in
+the caller (exceptions from workers keep their type and attributes).
+
+Usage:
+    dag = StageDAG([...stages...])
+    artifacts = DagScheduler(dag, jobs=4, timer=timer).run({'pdf_path': pdf})
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import queue as queue_module
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+try:
+    from src.core import tracing
+except ImportError:
+    import tracing
+
+
+class Stage:
+    """One pipeline step: func(*inputs) → output (or a tuple for several outputs)"""
+
+    def __init__(self, name: str, func: Callable, inputs: Sequence[str] = (), outputs: Sequence[str] = (),
+                 parallel: bool = False, pass_record: bool = False):
+        """
+        Args:
+            name: Unique stage name (also the timer label and log prefix)
+            func: Called with the input artifacts, in order
+            inputs: Artifact names consumed
+            outputs: Artifact names produced (one → the return value, several → a tuple)
+            parallel: Run on the process pool (func, inputs and outputs must pickle)
+            pass_record: In-process only - func also gets record=<timer record> (e.g. to mark 'cached')
+        """
+        if parallel and pass_record:
+            raise ValueError(f"Stage '{name}': pass_record needs an in-process stage")
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.parallel = parallel
+        self.pass_record = pass_record
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, {self.inputs} → {self.outputs}{', parallel' if self.parallel else ''})"
+
+
+class StageDAG:
+    """Stages + dependency check (every input produced once, no cycles)"""
+
+    def __init__(self, stages: Iterable[Stage], initial: Iterable[str] = ()):
+        self.stages: List[Stage] = list(stages)
+        self.initial = set(initial)
+        self.producers: Dict[str, Stage] = {}
+        for stage in self.stages:
+            for output in stage.outputs:
+                if output in self.producers or output in self.initial:
+                    raise ValueError(f"Artifact '{output}' produced twice ({stage.name})")
+                self.producers[output] = stage
+        self._check()
+
+    def _check(self):
+        names = set()
+        for stage in self.stages:
+            if stage.name in names:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            names.add(stage.name)
+            for name in stage.inputs:
+                if name not in self.producers and name not in self.initial:
+                    raise ValueError(f"Stage '{stage.name}' needs '{name}', which no stage produces")
+        self.order()    # raises on cycles
+
+    def dependencies(self, stage: Stage) -> List[Stage]:
+        return [self.producers[name] for name in stage.inputs if name in self.producers]
+
+    def order(self) -> List[Stage]:
+        """Topological order (ties keep declaration order)"""
+        done, ordered = set(), []
+        remaining = list(self.stages)
+        while remaining:
+            ready = [s for s in remaining if all(d.name in done for d in self.dependencies(s))]
+            if not ready:
+                raise ValueError(f"Cycle between stages: {', '.join(s.name for s in remaining)}")
+            for stage in ready:
+                done.add(stage.name)
+                ordered.append(stage)
+                remaining.remove(stage)
+        return ordered
+
+    def critical_path(self, seconds: Dict[str, float]) -> List[str]:
+        """Longest chain of stages by the given durations"""
+        finish, previous = {}, {}
+        for stage in self.order():
+            deps = self.dependencies(stage)
+            before = max(deps, key=lambda d: finish[d.name], default=None)
+            finish[stage.name] = seconds.get(stage.name, 0.0) + (finish[before.name] if before else 0.0)
+            previous[stage.name] = before.name if before else None
+        if not finish:
+            return []
+        name, path = max(finish, key=finish.get), []
+        while name:
+            path.append(name)
+            name = previous[name]
+        return path[::-1]
+
+
+#===============================================================================
+# WORKER SIDE
+#===============================================================================
+
+_log_queue = None
+
+
+class _QueueWriter(io.TextIOBase):
+    """stdout/stderr replacement that sends complete lines to the scheduler"""
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self._partial = ''
+
+    def write(self, text: str) -> int:
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            _log_queue.put((self.stage, line))
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def close_line(self):
+        if self._partial:
+            _log_queue.put((self.stage, self._partial))
+            self._partial = ''
+
+
+def _init_worker(log_queue):
+    global _log_queue
+    _log_queue = log_queue
+
+
+def _run_stage(name: str, func: Callable, args: tuple, trace: bool = False, quiet: bool = False):
+    """Pool task: run one stage with its output streamed; returns (result, seconds, spans)"""
+    if trace:
+        tracing.start()
+    writer = _QueueWriter(name)
+    start = time.perf_counter()
+    try:
+        with contextlib.ExitStack() as stack:
+            if quiet:
+                stack.enter_context(tracing.quiet_output())
+            else:
+                stack.enter_context(contextlib.redirect_stdout(writer))
+                stack.enter_context(contextlib.redirect_stderr(writer))
+            with tracing.span(name, cat='stage'):
+                result = func(*args)
+        return result, time.perf_counter() - start, tracing.stop() if trace else []
+    finally:
+        writer.close_line()
+
+
+#===============================================================================
+# SCHEDULER
+#===============================================================================
+
+@contextlib.contextmanager
+def _untimed(name: str):
+    """StageTimer.stage() stand-in when no timer is given"""
+    record = {'stage': name, 'seconds': 0.0, 'status': 'ok'}
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record['seconds'] = time.perf_counter() - start
+
+
+class DagScheduler:
+    """Run a StageDAG; parallel stages on a process pool of up to `jobs` workers"""
+
+    def __init__(self, dag: StageDAG, jobs: Optional[int] = None, timer=None, out=None,
+                 on_done: Optional[Callable[[Stage, Dict[str, Any], float], None]] = None):
+        """
+        Args:
+            dag: Stages to run
+            jobs: Max concurrent parallel stages (None = CPU count; 1 = run everything in-process)
+            timer: Optional StageTimer (pipeline_runner) to record per-stage times into
+            out: Stream for prefixed worker output (default sys.stdout)
+            on_done: Called with (stage, artifacts, seconds) after a stage's outputs are stored
+        """
+        self.dag = dag
+        self.jobs = jobs or os.cpu_count() or 1
+        self.timer = timer
+        self.out = out
+        self.on_done = on_done
+        self.seconds: Dict[str, float] = {}
+
+    def _record(self, name: str, seconds: float, status: str = 'ok'):
+        self.seconds[name] = seconds
+        if self.timer is not None:
+            self.timer.timings.append({'stage': name, 'seconds': seconds, 'status': status})
+
+    def _store(self, stage: Stage, result, artifacts: Dict[str, Any]):
+        if len(stage.outputs) == 1:
+            artifacts[stage.outputs[0]] = result
+        elif stage.outputs:
+            artifacts.update(zip(stage.outputs, result))
+        if self.on_done is not None:
+            self.on_done(stage, artifacts, self.seconds.get(stage.name, 0.0))
+
+    def _run_local(self, stage: Stage, artifacts: Dict[str, Any]):
+        args = [artifacts[name] for name in stage.inputs]
+        timed = self.timer.stage(stage.name) if self.timer is not None else _untimed(stage.name)
+        try:
+            with tracing.span(stage.name, cat='stage') as span, timed as record:
+                kwargs = {'record': record} if stage.pass_record else {}
+                result = stage.func(*args, **kwargs)
+                span.set(status=record['status'])
+        finally:
+            self.seconds[stage.name] = record['seconds']
+        self._store(stage, result, artifacts)
+
+    def _drain(self, log_queue, timeout: float = 0.0):
+        out = self.out or sys.stdout
+        try:
+            while True:
+                stage, line = log_queue.get(timeout=timeout)
+                out.write(f"[{stage}] {line}\n")
+                timeout = 0.0
+        except queue_module.Empty:
+            out.flush()
+
+    def run(self, artifacts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run every stage once its inputs exist
+
+        Returns:
+            All artifacts (initial + produced)
+        """
+        artifacts = dict(artifacts or {})
+        remaining = self.dag.order()
+        jobs = min(self.jobs, sum(stage.parallel for stage in remaining))
+        if jobs <= 1:
+            for stage in remaining:
+                self._run_local(stage, artifacts)
+            return artifacts
+
+        context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+        log_queue = context.Queue()
+        running = {}            # future → (stage, submitted at)
+        failure = None
+
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context,
+                                 initializer=_init_worker, initargs=(log_queue,)) as pool:
+            while remaining or running:
+                launched = False
+                if failure is None:
+                    for stage in list(remaining):
+                        if not all(name in artifacts for name in stage.inputs):
+                            continue
+                        if stage.parallel:
+                            if len(running) >= jobs:
+                                continue
+                            args = tuple(artifacts[name] for name in stage.inputs)
+                            future = pool.submit(_run_stage, stage.name, stage.func, args,
+                                                 tracing.enabled(), tracing.is_quiet())
+                            running[future] = (stage, time.perf_counter())
+                            remaining.remove(stage)
+                            launched = True
+                        else:
+                            remaining.remove(stage)
+                            try:
+                                self._run_local(stage, artifacts)
+                            except BaseException as e:
+                                failure = e
+                            launched = True
+                            break
+                elif not running:
+                    break
+
+                if not running:
+                    if not launched and remaining and failure is None:
+                        blocked = ', '.join(stage.name for stage in remaining)
+                        raise RuntimeError(f"Stages can never run (inputs missing): {blocked}")
+                    continue
+
+                done, _ = wait(running, timeout=0.05, return_when=FIRST_COMPLETED)
+                self._drain(log_queue)
+                for future in done:
+                    stage, submitted = running.pop(future)
+                    try:
+                        result, seconds, spans = future.result()
+                    except BaseException as e:
+                        self._record(stage.name, time.perf_counter() - submitted, 'failed')
+                        failure = failure or e
+                        continue
+                    tracing.add_records(spans)
+                    self._record(stage.name, seconds)
+                    self._store(stage, result, artifacts)
+
+            self._drain(log_queue, timeout=0.05)
+
+        if failure is not None:
+            raise failure
+        return artifacts
@@ -14,6 +14,9 @@ import json
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from final_json_stream import FinalJson
+
 # Minimum requirements per expert guidance
 # NOTE: Reduced for MVP - Mini Bonsai GUI can work with partial extractions
 MINIMUM_REQUIREMENTS = {
@@ -57,33 +60,46 @@ class StructuralValidator:
         Returns:
             bool: True if validation passes (critical elements present)
         """
-        objects = output_json.get('objects', [])
-
-        # Count structural elements
-        self.inventory = {
-            'walls': self.count_by_type(objects, 'wall'),
-            'roof': self.count_by_type(objects, 'roof', exclude_patterns=['gutter']),  # Exclude roof gutters
-            'drains': self.count_by_type(objects, 'gutter') + self.count_by_type(objects, 'drain'),
-            'doors': self.count_by_type(objects, 'door'),
-            'windows': self.count_by_type(objects, 'window')
-        }
-
-        # LOD300 COMPLIANCE CHECK (MANDATORY - NO FALLBACK)
-        non_lod300_objects = [
-            obj for obj in objects
-            if '_lod300' not in obj.get('object_type', '').lower()
-        ]
-
-        if non_lod300_objects:
-            print(f"\n❌ LOD300 COMPLIANCE FAILED: {len(non_lod300_objects)} objects not LOD300")
+        return self.validate_objects(output_json.get('objects', []))
+
+    def validate_objects(self, objects):
+        """
+        Run Gate 3 validation in one pass over any iterable of objects
+        (e.g. FinalJson(path).objects, which is never held in memory)
+
+        Returns:
+            bool: True if validation passes (critical elements present)
+        """
+        self.inventory = {'walls': 0, 'roof': 0, 'drains': 0, 'doors': 0, 'windows': 0}
+        non_lod300_count = 0
+        non_lod300_shown = []
+
+        for obj in objects:
+            obj_type = obj.get('object_type', '').lower()
+
+            # Count structural elements
+            self.inventory['walls'] += 'wall' in obj_type
+            self.inventory['roof'] += 'roof' in obj_type and 'gutter' not in obj_type  # Exclude roof gutters
+            self.inventory['drains'] += ('gutter' in obj_type) + ('drain' in obj_type)
+            self.inventory['doors'] += 'door' in obj_type
+            self.inventory['windows'] += 'window' in obj_type
+
+            # LOD300 COMPLIANCE CHECK (MANDATORY - NO FALLBACK)
+            if '_lod300' not in obj_type:
+                non_lod300_count += 1
+                if len(non_lod300_shown) < 10:  # Show first 10
+                    non_lod300_shown.append(obj)
+
+        if non_lod300_count:
+            print(f"\n❌ LOD300 COMPLIANCE FAILED: {non_lod300_count} objects not LOD300")
             print("   Non-compliant objects:")
-            for obj in non_lod300_objects[:10]:  # Show first 10
+            for obj in non_lod300_shown:
                 self.errors.append(
                     f"LOD300 REQUIRED: {obj.get('name', 'unknown')} uses {obj.get('object_type', 'unknown')}"
                 )
                 print(f"     • {obj.get('name', 'unknown')}: {obj.get('object_type', 'unknown')}")
-            if len(non_lod300_objects) > 10:
-                print(f"     ... and {len(non_lod300_objects) - 10} more")
+            if non_lod300_count > 10:
+                print(f"     ... and {non_lod300_count - 10} more")
             print("\n   Fix: Update object types in ifc_naming_layer.json and room_templates.json")
             print("   Spec: All objects MUST use _lod300 suffix (BIM5D_SPECIFICATION.md)")
 
@@ -146,9 +162,10 @@ def main():
 
     json_path = sys.argv[1]
 
+    validator = StructuralValidator()
     try:
-        with open(json_path) as f:
-            output_json = json.load(f)
+        # Objects are streamed (JSONL sidecar if present), never loaded as a whole
+        passed = validator.validate_objects(FinalJson(json_path).objects)
     except FileNotFoundError:
         print(f"❌ Error: File not found: {json_path}")
         sys.exit(1)
@@ -156,8 +173,6 @@ def main():
         print(f"❌ Error: Invalid JSON: {e}")
         sys.exit(1)
 
-    validator = StructuralValidator()
-    passed = validator.validate(output_json)
     validator.print_report()
 
     sys.exit(0 if passed else 1)
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Synthetic Plan Generator - TB-LKTN-style drawing sets of controllable size
+
+Writes a PDF laid out like the TB-LKTN HOUSE set, so every pipeline stage
+finds what it looks for (grid bubbles A-E / 1-5 and overall dimensions on
+page 1, D/W labels on page 2, FFL/LINTEL/CEILING/SILL levels on the
+elevations, DISCHARGE on the plumbing plan, ruled door/window schedules
+on page 8):
+
+    page 1  ground floor plan    walls, rooms, doors, windows, MEP, furniture, hatching
+    page 2  door/window plan     same plan without furniture, D/W references
+    page 3  roof plan            eaves outline, ridges, 25° pitch
+    page 4  front elevations     levels + window openings per unit
+    page 5  side elevations
+    page 6  electrical plan      walls + light/switch/socket markers
+    page 7  plumbing plan        DISCHARGE perimeter drain, wc/basin/sink/FD
+    page 8  schedules            DOOR / WINDOW SCHEDULE tables
+    page 9+ extra plan sheets    (--extra-pages) copies of the floor plan
+
+Size is controlled per dwelling unit (rooms, doors/windows per room, MEP
+symbols per room, hatch lines per room) and by the number of units drawn
+side by side on each sheet (a housing row/estate; the page grows to fit).
+Unit 1 carries the grid and dimensions, so calibration and the building
+envelope come out as for a single house. PlanSpec.scaled(n) is n units
+of the default house = n× the TB-LKTN house scale.
+
+No PDF library needed: the file is written directly (Helvetica text,
+stroked lines/rectangles/Bezier arcs, Flate-compressed content streams).
+
+Usage:
+    python3 src/core/synthetic_plan.py synthetic_10x.pdf --scale 10
+    python3 src/core/synthetic_plan.py big.pdf --units 4 --rooms 12 --mep 8 --hatch 200 --extra-pages 4
+"""
+
+import argparse
+import math
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# TB-LKTN grid (metres) - same values as post_processor.GRID_X / GRID_Y
+GRID_X = [0.0, 1.3, 4.4, 8.1, 11.2]
+GRID_Y = [0.0, 2.3, 5.4, 7.0, 8.5]
+GRID_H_LABELS = ['A', 'B', 'C', 'D', 'E']
+GRID_V_LABELS = ['1', '2', '3', '4', '5']
+
+ROOM_NAMES = ['RUANG TAMU', 'DAPUR', 'BILIK 1', 'BILIK 2', 'BILIK 3', 'BILIK MANDI', 'TANDAS', 'RUANG MAKAN']
+ROOM_FURNITURE = {
+    'RUANG TAMU': ['SOFA', 'TV'],
+    'DAPUR': ['SINK', 'STOVE', 'FRIDGE', 'CABINET'],
+    'BILIK 1': ['BED', 'WARDROBE'],
+    'BILIK 2': ['BED', 'WARDROBE'],
+    'BILIK 3': ['BED'],
+    'BILIK MANDI': ['BASIN', 'SHOWER', 'FD', 'WH'],
+    'TANDAS': ['WC', 'FD'],
+    'RUANG MAKAN': ['TABLE'],
+}
+MEP_MARKERS = ['SW', 'PP', 'LC', 'CF', 'EF', 'DB']
+DOOR_TYPES = {'D1': (900, 2100), 'D2': (900, 2100), 'D3': (750, 2100)}
+WINDOW_TYPES = {'W1': (1800, 1000, 4), 'W2': (1200, 1000, 6), 'W3': (600, 500, 2)}
+
+PT_PER_M = 40.0         # drawing scale: 40 pt per metre (≈1:70 on A3)
+MARGIN = 60.0
+UNIT_GAP_M = 3.0        # space between dwelling units on a sheet
+PAGE_W, PAGE_H = 842.0, 595.0   # A3 landscape, the minimum sheet size
+
+
+@dataclass
+class PlanSpec:
+    """Size of a synthetic drawing set (defaults ≈ the TB-LKTN house)"""
+    units: int = 1                  # dwelling units drawn side by side on every sheet
+    rooms: int = 7                  # rooms per unit (grid cells, subdivided beyond 16)
+    doors_per_room: int = 1
+    windows_per_room: int = 1       # exterior rooms only
+    mep_per_room: int = 4           # SW/PP/LC/CF/... markers with symbols
+    hatch: int = 40                 # hatch lines per room (TB-LKTN's sheets are mostly hatching)
+    extra_pages: int = 0            # extra floor-plan sheets after the 8 standard ones
+
+    @classmethod
+    def scaled(cls, factor: int, **overrides) -> 'PlanSpec':
+        """factor × the default house (factor units per sheet)"""
+        return cls(units=max(1, int(factor)), **overrides)
+
+    @property
+    def pages(self) -> int:
+        return 8 + self.extra_pages
+
+
+#===============================================================================
+# PDF WRITER
+#===============================================================================
+
+def _pdf_string(text: str) -> str:
+    data = text.encode('latin-1', 'replace').decode('latin-1')
+    return '(' + data.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') + ')'
+
+
+class Canvas:
+    """One page's content stream; coordinates are top-down like pdfplumber's 'top'"""
+
+    def __init__(self, width: float, height: float):
+        self.width = width
+        self.height = height
+        self.ops: List[str] = ['0.5 w']
+        self.counts = {'text': 0, 'lines': 0, 'rects': 0, 'curves': 0}
+
+    def _y(self, top: float) -> float:
+        return self.height - top
+
+    def line(self, x0: float, y0: float, x1: float, y1: float):
+        self.ops.append(f"{x0:.2f} {self._y(y0):.2f} m {x1:.2f} {self._y(y1):.2f} l S")
+        self.counts['lines'] += 1
+
+    def rect(self, x: float, y: float, w: float, h: float):
+        self.ops.append(f"{x:.2f} {self._y(y + h):.2f} {w:.2f} {h:.2f} re S")
+        self.counts['rects'] += 1
+
+    def arc(self, cx: float, cy: float, r: float, start_deg: float):
+        """Quarter circle (door swing) as one Bezier curve"""
+        a0, a1 = math.radians(start_deg), math.radians(start_deg + 90)
+        k = 0.5523 * r
+        p0 = (cx + r * math.cos(a0), cy + r * math.sin(a0))
+        p3 = (cx + r * math.cos(a1), cy + r * math.sin(a1))
+        p1 = (p0[0] - k * math.sin(a0), p0[1] + k * math.cos(a0))
+        p2 = (p3[0] + k * math.sin(a1), p3[1] - k * math.cos(a1))
+        self.ops.append(f"{p0[0]:.2f} {self._y(p0[1]):.2f} m {p1[0]:.2f} {self._y(p1[1]):.2f} "
+                        f"{p2[0]:.2f} {self._y(p2[1]):.2f} {p3[0]:.2f} {self._y(p3[1]):.2f} c S")
+        self.counts['curves'] += 1
+
+    def circle(self, cx: float, cy: float, r: float):
+        """Closed circle (MEP symbol) from four Bezier quarters"""
+        k = 0.5523 * r
+        y = self._y(cy)
+        self.ops.append(
+            f"{cx + r:.2f} {y:.2f} m "
+            f"{cx + r:.2f} {y + k:.2f} {cx + k:.2f} {y + r:.2f} {cx:.2f} {y + r:.2f} c "
+            f"{cx - k:.2f} {y + r:.2f} {cx - r:.2f} {y + k:.2f} {cx - r:.2f} {y:.2f} c "
+            f"{cx - r:.2f} {y - k:.2f} {cx - k:.2f} {y - r:.2f} {cx:.2f} {y - r:.2f} c "
+            f"{cx + k:.2f} {y - r:.2f} {cx + r:.2f} {y - k:.2f} {cx + r:.2f} {y:.2f} c S")
+        self.counts['curves'] += 1
+
+    def text(self, x: float, y: float, text: str, size: float = 7.0):
+        """Text with its top-left at (x, y)"""
+        self.ops.append(f"BT /F1 {size:.1f} Tf {x:.2f} {self._y(y) - size * 0.8:.2f} Td {_pdf_string(text)} Tj ET")
+        self.counts['text'] += 1
+
+    def content(self) -> bytes:
+        return '\n'.join(self.ops).encode('latin-1')
+
+
+def write_pdf(pages: List[Canvas], pdf_path: str):
+    """Minimal PDF 1.4: catalog, page tree, Helvetica, one compressed stream per page"""
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b'')      # filled in once the page tree number is known
+    page_tree = add(b'')
+    font = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+    kids = []
+    for canvas in pages:
+        data = zlib.compress(canvas.content())
+        stream = add(b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(data) + data + b'\nendstream')
+        kids.append(add(('<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] '
+                         '/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>'
+                         % (page_tree, canvas.width, canvas.height, font, stream)).encode()))
+    objects[catalog - 1] = b'<< /Type /Catalog /Pages %d 0 R >>' % page_tree
+    objects[page_tree - 1] = ('<< /Type /Pages /Kids [%s] /Count %d >>'
+                              % (' '.join(f'{k} 0 R' for k in kids), len(kids))).encode()
+
+    out = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, catalog, xref)
+    Path(pdf_path).write_bytes(bytes(out))
+
+
+#===============================================================================
+# LAYOUT
+#===============================================================================
+
+def room_cells(rooms: int) -> List[Tuple[float, float, float, float]]:
+    """Room rectangles (x0, y0, x1, y1 in metres) filling the grid, largest first"""
+    cells = [(GRID_X[i], GRID_Y[j], GRID_X[i + 1], GRID_Y[j + 1])
+             for j in range(len(GRID_Y) - 1) for i in range(len(GRID_X) - 1)]
+    if rooms <= len(cells):
+        # Merge cells pairwise (smallest first) until the room count is reached
+        while len(cells) > rooms:
+            cells.sort(key=lambda c: (c[2] - c[0]) * (c[3] - c[1]))
+            small = cells.pop(0)
+            for k, other in enumerate(cells):
+                shares_x = small[0] == other[0] and small[2] == other[2] and (small[1] == other[3] or small[3] == other[1])
+                shares_y = small[1] == other[1] and small[3] == other[3] and (small[0] == other[2] or small[2] == other[0])
+                if shares_x or shares_y:
+                    cells[k] = (min(small[0], other[0]), min(small[1], other[1]),
+                                max(small[2], other[2]), max(small[3], other[3]))
+                    break
+            else:
+                cells.append(small)
+                break
+    while len(cells) < rooms:
+        # Split the largest room along its long side
+        cells.sort(key=lambda c: (c[2] - c[0]) * (c[3] - c[1]), reverse=True)
+        x0, y0, x1, y1 = cells.pop(0)
+        if x1 - x0 >= y1 - y0:
+            xm = round((x0 + x1) / 2, 2)
+            cells += [(x0, y0, xm, y1), (xm, y0, x1, y1)]
+        else:
+            ym = round((y0 + y1) / 2, 2)
+            cells += [(x0, y0, x1, ym), (x0, ym, x1, y1)]
+    return sorted(cells, key=lambda c: (c[1], c[0]))
+
+
+class PlanLayout:
+    """Unit origins (pt) and the sheet size for a spec"""
+
+    def __init__(self, spec: PlanSpec):
+        self.spec = spec
+        self.columns = max(1, math.ceil(math.sqrt(spec.units)))
+        self.rows = math.ceil(spec.units / self.columns)
+        self.unit_w = (GRID_X[-1] + UNIT_GAP_M) * PT_PER_M
+        self.unit_h = (GRID_Y[-1] + UNIT_GAP_M) * PT_PER_M
+        self.width = max(PAGE_W, 2 * MARGIN + self.columns * self.unit_w)
+        self.height = max(PAGE_H, 2 * MARGIN + self.rows * self.unit_h + 80)
+        self.cells = room_cells(spec.rooms)
+
+    def origins(self) -> List[Tuple[float, float]]:
+        return [(MARGIN + 30 + (u % self.columns) * self.unit_w, MARGIN + 40 + (u // self.columns) * self.unit_h)
+                for u in range(self.spec.units)]
+
+    def canvas(self) -> Canvas:
+        return Canvas(self.width, self.height)
+
+
+def _pt(origin: Tuple[float, float], x: float, y: float) -> Tuple[float, float]:
+    return origin[0] + x * PT_PER_M, origin[1] + y * PT_PER_M
+
+
+def _title_block(c: Canvas, title: str, sheet: int):
+    c.rect(10, 10, c.width - 20, c.height - 20)
+    c.text(20, c.height - 40, f"{title}  SYNTHETIC PLAN  WD-1/{sheet:02d}", 8)
+
+
+def _grid(c: Canvas, origin):
+    """Grid bubbles + overall dimensions (unit 1 only)"""
+    for label, gx in zip(GRID_H_LABELS, GRID_X):
+        x, y = _pt(origin, gx, 0)
+        c.line(x, y - 25, x, y + GRID_Y[-1] * PT_PER_M + 10)
+        c.circle(x, y - 32, 6)
+        c.text(x - 2.5, y - 36, label)
+    for label, gy in zip(GRID_V_LABELS, GRID_Y):
+        x, y = _pt(origin, 0, GRID_Y[-1] - gy)     # grid 1 at the bottom, as on TB-LKTN
+        c.line(x - 25, y, x + GRID_X[-1] * PT_PER_M + 10, y)
+        c.circle(x - 32, y, 6)
+        c.text(x - 34.5, y - 4, label)
+    x0, y1 = _pt(origin, 0, GRID_Y[-1])
+    x1, _ = _pt(origin, GRID_X[-1], 0)
+    c.line(x0, y1 + 18, x1, y1 + 18)
+    c.text((x0 + x1) / 2 - 10, y1 + 20, f"{round(GRID_X[-1] * 1000)}")
+    _, y0 = _pt(origin, 0, 0)
+    c.line(x1 + 18, y0, x1 + 18, y1)
+    c.text(x1 + 20, (y0 + y1) / 2, f"{round(GRID_Y[-1] * 1000)}")
+
+
+def _walls(c: Canvas, origin, cells, thickness: float = 0.1):
+    """Exterior double wall + one line per interior room edge"""
+    x0, y0 = _pt(origin, -thickness, -thickness)
+    x1, y1 = _pt(origin, GRID_X[-1] + thickness, GRID_Y[-1] + thickness)
+    c.rect(x0, y0, x1 - x0, y1 - y0)
+    c.rect(*_pt(origin, 0, 0), GRID_X[-1] * PT_PER_M, GRID_Y[-1] * PT_PER_M)
+    edges = set()
+    for cx0, cy0, cx1, cy1 in cells:
+        edges |= {(cx0, cy0, cx1, cy0), (cx0, cy1, cx1, cy1), (cx0, cy0, cx0, cy1), (cx1, cy0, cx1, cy1)}
+    for ex0, ey0, ex1, ey1 in sorted(edges):
+        on_perimeter = (ey0 == ey1 and ey0 in (GRID_Y[0], GRID_Y[-1])) or (ex0 == ex1 and ex0 in (GRID_X[0], GRID_X[-1]))
+        if not on_perimeter:
+            c.line(*_pt(origin, ex0, ey0), *_pt(origin, ex1, ey1))
+
+
+def _exterior(cell) -> bool:
+    return cell[0] == GRID_X[0] or cell[2] == GRID_X[-1] or cell[1] == GRID_Y[0] or cell[3] == GRID_Y[-1]
+
+
+def _floor_plan(c: Canvas, layout: PlanLayout, references: bool, furnish: bool, counts: Dict):
+    spec = layout.spec
+    for unit, origin in enumerate(layout.origins()):
+        if unit == 0:
+            _grid(c, origin)
+        _walls(c, origin, layout.cells)
+        if unit == 0 and furnish:
+            px, py = _pt(origin, 1.0, GRID_Y[-1] + 0.2)
+            c.rect(px, py, 2.5 * PT_PER_M, 1.2 * PT_PER_M)
+            c.text(px + 4, py + 4, 'PORCH')
+        for index, cell in enumerate(layout.cells):
+            name = ROOM_NAMES[index % len(ROOM_NAMES)]
+            x0, y0 = _pt(origin, cell[0], cell[1])
+            x1, y1 = _pt(origin, cell[2], cell[3])
+            w, h = x1 - x0, y1 - y0
+            c.text(x0 + 4, y0 + h / 2 - 4, name if index < len(ROOM_NAMES) else f"{name} {index}", 6)
+            counts['rooms'] += 1
+            for d in range(spec.doors_per_room):
+                dx = x0 + 6 + (d + 1) * w / (spec.doors_per_room + 1) - 0.45 * PT_PER_M
+                c.line(dx, y1, dx, y1 - 0.9 * PT_PER_M)
+                c.arc(dx, y1, 0.9 * PT_PER_M, -90)
+                if references:
+                    c.text(dx - 12, y1 - 26, list(DOOR_TYPES)[(index + d) % len(DOOR_TYPES)], 6)
+                counts['doors'] += 1
+            if _exterior(cell):
+                for k in range(spec.windows_per_room):
+                    wx = x0 + (k + 1) * w / (spec.windows_per_room + 1) - 0.6 * PT_PER_M
+                    wy = y0 if cell[1] == GRID_Y[0] else y1
+                    for offset in (-2.0, 0.0, 2.0):
+                        c.line(wx, wy + offset, wx + 1.2 * PT_PER_M, wy + offset)
+                    if references:
+                        c.text(wx + 6, wy + (6 if cell[1] == GRID_Y[0] else -14), list(WINDOW_TYPES)[(index + k) % len(WINDOW_TYPES)], 6)
+                    counts['windows'] += 1
+            for m in range(spec.mep_per_room):
+                columns = max(1, min(4, int((w - 16) // 16)))
+                mx = x0 + 8 + (m % columns) * (w - 16) / columns
+                my = y0 + 0.3 * h + (m // columns % 4) * 10
+                c.circle(mx + 3, my + 3, 2.5)
+                c.text(mx + 7, my, MEP_MARKERS[m % len(MEP_MARKERS)], 4)
+                counts['mep'] += 1
+            if furnish:
+                for f, label in enumerate(ROOM_FURNITURE.get(name, [])):
+                    fx = x0 + 6 + f * min(30.0, (w - 12) / 4)
+                    fy = y1 - 28
+                    c.rect(fx, fy, 24, 14)
+                    c.text(fx + 2, fy + 4, label, 4)
+                    counts['furniture'] += 1
+                for k in range(spec.hatch):
+                    hy = y0 + 2 + (k + 0.5) * (h - 4) / spec.hatch
+                    c.line(x0 + 2, hy, x0 + min(w - 4, 24), hy)
+
+
+def _roof_plan(c: Canvas, layout: PlanLayout):
+    for origin in layout.origins():
+        x0, y0 = _pt(origin, -0.6, -0.6)
+        x1, y1 = _pt(origin, GRID_X[-1] + 0.6, GRID_Y[-1] + 0.6)
+        c.rect(x0, y0, x1 - x0, y1 - y0)
+        ym = (y0 + y1) / 2
+        c.line(x0 + (ym - y0), ym, x1 - (ym - y0), ym)
+        for cx, cy in ((x0, y0), (x1, y0), (x0, y1), (x1, y1)):
+            c.line(cx, cy, x0 + (ym - y0) if cx == x0 else x1 - (ym - y0), ym)
+        c.text(x0 + 10, y0 + 10, '25°')
+
+
+def _elevations(c: Canvas, layout: PlanLayout, length: float):
+    levels = [('FFL', 0.15), ('SILL', 0.9), ('LINTEL', 2.1), ('CEILING', 3.0)]
+    for unit, origin in enumerate(layout.origins()):
+        gx, gy = _pt(origin, 0, 4.0)
+        c.line(gx - 10, gy, gx + length * PT_PER_M + 10, gy)
+        c.rect(gx, gy - 3.0 * PT_PER_M, length * PT_PER_M, 3.0 * PT_PER_M)
+        for k in range(max(1, layout.spec.windows_per_room * 3)):
+            wx = gx + (k + 0.5) * length * PT_PER_M / (layout.spec.windows_per_room * 3 + 1)
+            c.rect(wx, gy - 2.1 * PT_PER_M, 1.2 * PT_PER_M, 1.2 * PT_PER_M)
+        if unit == 0:
+            for name, level in levels:
+                ly = gy - level * PT_PER_M
+                c.line(gx + length * PT_PER_M + 12, ly, gx + length * PT_PER_M + 40, ly)
+                c.text(gx + length * PT_PER_M + 44, ly - 4, f"{name} +{level:.3f}m", 6)
+
+
+def _electrical(c: Canvas, layout: PlanLayout, counts: Dict):
+    for origin in layout.origins():
+        _walls(c, origin, layout.cells)
+        for cell in layout.cells:
+            x0, y0 = _pt(origin, cell[0], cell[1])
+            x1, y1 = _pt(origin, cell[2], cell[3])
+            c.circle((x0 + x1) / 2, (y0 + y1) / 2, 4)
+            c.text((x0 + x1) / 2 + 6, (y0 + y1) / 2 - 3, 'LC', 5)
+            c.line(x0 + 4, y0 + 4, (x0 + x1) / 2, (y0 + y1) / 2)
+            counts['mep'] += 1
+
+
+def _plumbing(c: Canvas, layout: PlanLayout):
+    labels = ['wc', 'basin', 'kitchen sink', 'FD', 'tap', 'sc']
+    for unit, origin in enumerate(layout.origins()):
+        x0, y0 = _pt(origin, -1.0, -1.0)
+        x1, y1 = _pt(origin, GRID_X[-1] + 1.0, GRID_Y[-1] + 1.0)
+        # Perimeter drain: two parallel runs on every side
+        for inset in (0.0, 4.0):
+            c.line(x0 + inset, y0 + inset, x1 - inset, y0 + inset)
+            c.line(x1 - inset, y0 + inset, x1 - inset, y1 - inset)
+            c.line(x1 - inset, y1 - inset, x0 + inset, y1 - inset)
+            c.line(x0 + inset, y1 - inset, x0 + inset, y0 + inset)
+        if unit == 0:
+            c.text(x0 + 10, y1 + 4, 'DISCHARGE TO MAIN DRAIN', 6)
+        for k, label in enumerate(labels):
+            c.text(x0 + 20 + k * 40, (y0 + y1) / 2, label, 5)
+
+
+def _table(c: Canvas, x: float, y: float, rows: List[List[str]], col_w: float = 90.0, row_h: float = 16.0):
+    """Ruled table (pdfplumber.extract_tables finds it from the lines)"""
+    n_cols = max(len(r) for r in rows)
+    for r in range(len(rows) + 1):
+        c.line(x, y + r * row_h, x + n_cols * col_w, y + r * row_h)
+    for k in range(n_cols + 1):
+        c.line(x + k * col_w, y, x + k * col_w, y + len(rows) * row_h)
+    for r, row in enumerate(rows):
+        for k, cell in enumerate(row):
+            c.text(x + k * col_w + 3, y + r * row_h + 4, cell, 6)
+
+
+def _schedules(c: Canvas):
+    c.text(40, 40, 'DOOR SCHEDULE', 9)
+    _table(c, 40, 56, [
+        ['REFERENCES'] + list(DOOR_TYPES),
+        ['SIZE'] + [f"{w}MM X {h}MM" for w, h in DOOR_TYPES.values()],
+        ['TYPE'] + ['FLUSH DOOR'] * len(DOOR_TYPES),
+    ])
+    c.text(40, 140, 'WINDOW SCHEDULE', 9)
+    _table(c, 40, 156, [
+        ['REFERENCES'] + list(WINDOW_TYPES),
+        ['SIZE'] + [f"{w}mm X {h}mm" for w, h, _ in WINDOW_TYPES.values()],
+        ['UNITS'] + [f"{q} NOS" for _, _, q in WINDOW_TYPES.values()],
+    ])
+    c.text(40, 240, 'FFL +0.150m', 6)
+
+
+def generate_plan(spec: PlanSpec, pdf_path: str) -> Dict:
+    """
+    Write the synthetic drawing set
+
+    Returns:
+        Spec + what was drawn (rooms/doors/windows/MEP/furniture of all units,
+        counted once; primitive counts per kind over all pages)
+    """
+    layout = PlanLayout(spec)
+    counts = {'rooms': 0, 'doors': 0, 'windows': 0, 'mep': 0, 'furniture': 0}
+    pages = []
+
+    def sheet(title: str) -> Canvas:
+        canvas = layout.canvas()
+        _title_block(canvas, title, len(pages) + 1)
+        pages.append(canvas)
+        return canvas
+
+    _floor_plan(sheet('GROUND FLOOR PLAN'), layout, references=False, furnish=True, counts=counts)
+    repeated = dict(counts)     # later plan sheets redraw the same units; counts are per drawing set
+    _floor_plan(sheet('DOOR AND WINDOW PLAN'), layout, references=True, furnish=False, counts=repeated)
+    _roof_plan(sheet('ROOF PLAN'), layout)
+    _elevations(sheet('FRONT ELEVATION'), layout, GRID_X[-1])
+    _elevations(sheet('SIDE ELEVATION'), layout, GRID_Y[-1])
+    _electrical(sheet('ELECTRICAL LAYOUT'), layout, counts)
+    _plumbing(sheet('PLUMBING AND DISCHARGE PLAN'), layout)
+    schedules = Canvas(PAGE_W, PAGE_H)
+    _title_block(schedules, 'SCHEDULES', 8)
+    _schedules(schedules)
+    pages.append(schedules)
+    for extra in range(spec.extra_pages):
+        _floor_plan(sheet(f'FLOOR PLAN SHEET {extra + 1}'), layout, references=False, furnish=True, counts=repeated)
+
+    Path(pdf_path).parent.mkdir(parents=True, exist_ok=True)
+    write_pdf(pages, pdf_path)
+    primitives = {kind: sum(p.counts[kind] for p in pages) for kind in ('text', 'lines', 'rects', 'curves')}
+    return {'spec': asdict(spec), 'pdf': str(pdf_path), 'pages': len(pages),
+            'page_size': [round(layout.width), round(layout.height)], 'drawn': counts, 'primitives': primitives,
+            'bytes': Path(pdf_path).stat().st_size}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic TB-LKTN-style drawing set of controllable size")
+    parser.add_argument('pdf', help="Output PDF")
+    parser.add_argument('--scale', type=int, default=1, help="Units per sheet (N× the TB-LKTN house; default 1)")
+    parser.add_argument('--units', type=int, help="Override the unit count")
+    parser.add_argument('--rooms', type=int, default=PlanSpec.rooms, help="Rooms per unit")
+    parser.add_argument('--doors', type=int, default=PlanSpec.doors_per_room, help="Doors per room")
+    parser.add_argument('--windows', type=int, default=PlanSpec.windows_per_room, help="Windows per exterior room")
+    parser.add_argument('--mep', type=int, default=PlanSpec.mep_per_room, help="MEP symbols per room")
+    parser.add_argument('--hatch', type=int, default=PlanSpec.hatch, help="Hatch lines per room")
+    parser.add_argument('--extra-pages', type=int, default=0, help="Extra floor-plan sheets")
+    args = parser.parse_args()
+
+    spec = PlanSpec.scaled(args.units or args.scale, rooms=args.rooms, doors_per_room=args.doors,
+                           windows_per_room=args.windows, mep_per_room=args.mep, hatch=args.hatch,
+                           extra_pages=args.extra_pages)
+    info = generate_plan(spec, args.pdf)
+    print(f"✅ Synthetic plan: {info['pdf']} ({info['pages']} pages, {info['bytes'] / 1024:.0f} KB)")
+    print(f"   Drawn: {', '.join(f'{v} {k}' for k, v in info['drawn'].items())}")
+    print(f"   Primitives: {', '.join(f'{v} {k}' for k, v in info['primitives'].items())}")
+
+
+if __name__ == "__main__":
+    main()
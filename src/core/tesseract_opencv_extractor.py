@@ -12,14 +12,23 @@ Features:
 4. Grid dimensions with spatial context
 """
 
-import cv2
-import numpy as np
-import pytesseract
+from __future__ import annotations
+
 import sqlite3
 import json
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import pdf2image
+
+try:
+    from src.core.lazy_import import lazy_module
+except ImportError:
+    from lazy_import import lazy_module
+
+# Loaded on first use - only the raster extraction paths need them
+cv2 = lazy_module('cv2')
+np = lazy_module('numpy')
+pytesseract = lazy_module('pytesseract')
+pdf2image = lazy_module('pdf2image')
 
 
 class TesseractOpenCVExtractor:
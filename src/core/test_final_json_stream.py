@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test FINAL JSON companions (.objects.jsonl sidecar) - stale companions must not be read
+
+A companion is used only while the JSON has the size and sha256 recorded
+in it; these edits keep the JSON's mtime (touch -r, like cp -p or a
+restore) and must still fall back to the JSON itself.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "validators"))
+from final_json_stream import FinalJson, dump_final_json, read_final_json, sidecar_path
+
+
+def _sample(count=200):
+    return {
+        'extraction_metadata': {'pdf': 'sample.pdf'},
+        'summary': {'total_objects': count},
+        'objects': [{'name': f"obj_{i}", 'object_type': 'door_single_900_lod300',
+                     'position': [i * 0.5, 1.0, 0.0], 'orientation': 0.0, 'placed': False}
+                    for i in range(count)],
+    }
+
+
+def _keep_mtime(path: Path, reference: Path):
+    stat = reference.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_sidecar_used_when_unchanged():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'X_FINAL.json'
+        data = _sample()
+        dump_final_json(data, path)
+
+        assert path.read_text() == json.dumps(data, indent=2)
+        final = FinalJson(path)
+        print(f"✅ Unchanged JSON read from {final.source.name}")
+        assert final.source == sidecar_path(path)
+        assert list(final.objects) == data['objects']
+
+
+def test_truncated_json_with_old_mtime():
+    """The sidecar must not vouch for a JSON cut short behind its back"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'X_FINAL.json'
+        dump_final_json(_sample(), path)
+        with open(path, 'r+') as f:
+            f.truncate(5000)
+        _keep_mtime(path, sidecar_path(path))
+
+        final = FinalJson(path)
+        print(f"✅ Truncated JSON read from {final.source.name}")
+        assert final.source == path
+        try:
+            read_final_json(path)
+        except json.JSONDecodeError:
+            pass
+        else:
+            raise AssertionError("truncated JSON parsed without error")
+
+
+def test_same_size_edit_with_old_mtime():
+    """Same size, same mtime, different bytes: only the hash tells"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'X_FINAL.json'
+        dump_final_json(_sample(), path)
+        assert FinalJson(path).source == sidecar_path(path)
+
+        backup = Path(tmp) / 'backup.json'
+        shutil.copy2(path, backup)
+        path.write_text(path.read_text().replace('"obj_1"', '"obj_X"', 1))
+        _keep_mtime(path, backup)
+
+        final = FinalJson(path)
+        print(f"✅ Same-size edit read from {final.source.name}")
+        assert final.source == path
+        assert [obj['name'] for obj in final.objects][:2] == ['obj_0', 'obj_X']
+
+
+def test_validator_reads_the_json_itself():
+    """validate_output_json CHECK 1 fails on a truncated FINAL even with a matching-looking sidecar"""
+    from validate_output_json import validate_output_json
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'X_FINAL.json'
+        dump_final_json(_sample(), path)
+        with open(path, 'r+') as f:
+            f.truncate(5000)
+        _keep_mtime(path, sidecar_path(path))
+
+        results = validate_output_json(str(path))
+        assert results['validations']['json_well_formed']['status'] == 'FAIL'
+        assert results['overall_status'] == 'FAIL'
+
+
+if __name__ == "__main__":
+    test_sidecar_used_when_unchanged()
+    test_truncated_json_with_old_mtime()
+    test_same_size_edit_with_old_mtime()
+    test_validator_reads_the_json_itself()
+    print("\n✅ All FINAL JSON companion tests passed")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test Gate 4 report cache - a changed library must be re-validated
+
+The cached validity report is keyed by the library's sha256; an in-place
+edit that keeps the file size and mtime (or a restored backup) must not
+reuse the old report.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from library_gate import library_report
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / 'db' / 'schema' / 'ifc_object_library.sql'
+
+
+def _library(path: Path):
+    """One door with a valid 3-vertex / 1-face geometry"""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA_PATH.read_text())
+    conn.execute("INSERT INTO base_geometries (geometry_hash, vertices, faces, vertex_count, face_count)"
+                 " VALUES ('g1', ?, ?, 3, 1)", (bytes(36), bytes(12)))
+    conn.execute("INSERT INTO object_catalog (object_type, object_name, ifc_class, category, geometry_hash)"
+                 " VALUES ('door_lod300', 'Door', 'IfcDoor', 'door', 'g1')")
+    conn.commit()
+    conn.close()
+
+
+def _edit_keeping_stat(path: Path, sql: str):
+    stat = path.stat()
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(sql)
+    conn.close()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+
+
+def test_same_size_edit_is_revalidated():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'Ifc_Object_Library.db'
+        _library(path)
+        assert library_report(path).valid
+
+        _edit_keeping_stat(path, "UPDATE base_geometries SET vertex_count = 4")
+        report = library_report(path)
+        print(f"✅ Same-size edit: invalid={report.invalid}")
+        assert report.invalid == {'door_lod300': 'bad_vertices'}
+
+
+def test_restored_backup_uses_its_own_report():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'Ifc_Object_Library.db'
+        _library(path)
+        backup = path.read_bytes()
+        stat = path.stat()
+        library_report(path)
+
+        _edit_keeping_stat(path, "UPDATE base_geometries SET face_count = 2")
+        assert library_report(path).invalid == {'door_lod300': 'bad_faces'}
+
+        path.write_bytes(backup)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        report = library_report(path)
+        print(f"✅ Restored backup: invalid={report.invalid}")
+        assert report.valid
+
+
+if __name__ == "__main__":
+    test_same_size_edit_is_revalidated()
+    test_restored_backup_uses_its_own_report()
+    print("\n✅ All library gate cache tests passed")
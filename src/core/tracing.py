@@ -0,0 +1,329 @@
+"""
+Tracing Module
+==============
+Nested timing spans for the pipeline, exported as JSONL and Chrome trace.
+
+    stage (pipeline_runner/stage_dag)
+      └─ function (complete_pdf_extraction, automated_post_process, ...)
+           └─ template_item (one master-template item)
+                └─ detection (VectorPatternExecutor handler)
+      └─ fixer (post-processor Fix N)
+
+Each span records wall time, CPU time (process), the peak RSS at its end
+and how much the peak grew during it, plus counts set by the code
+(objects in/out, rows, results). Tracing is off unless start() is
+called; span() then costs a few microseconds, and when off it returns a
+shared no-op span.
+
+Quiet mode (quiet_output) sends stdout to a null writer, so the stages'
+progress prints are formatted but never written.
+
+Usage:
+    tracing.start()
+    with tracing.span('extraction', cat='stage') as s:
+        ...
+        s.set(objects=len(objects))
+
+    @tracing.traced(cat='fixer')            # objects_in/out from list arg/result
+    def remove_duplicate_walls(objects): ...
+
+    for item in tracing.iter_spans(items, name=lambda i: i['item'], cat='template_item'): ...
+
+    tracing.write_jsonl('trace.jsonl')
+    tracing.write_chrome_trace('trace.json')    # chrome://tracing, ui.perfetto.dev
+"""
+
+import contextlib
+import functools
+import io
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
+
+try:
+    import resource
+except ImportError:     # not on Windows
+    resource = None
+
+
+class _TracerState:
+    def __init__(self):
+        self.enabled = False
+        self.quiet = False
+        self.records: List[Dict] = []
+        self.next_id = 1
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+
+_STATE = _TracerState()
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024    # bytes on macOS, KB on Linux
+
+
+def _stack() -> List['Span']:
+    stack = getattr(_STATE.local, 'stack', None)
+    if stack is None:
+        stack = _STATE.local.stack = []
+    return stack
+
+
+class Span:
+    """An open span; set() adds counts/attributes"""
+
+    def __init__(self, name: str, cat: str, attrs: Dict):
+        self.name = name
+        self.cat = cat
+        self.attrs = attrs
+        with _STATE.lock:
+            self.id = _STATE.next_id
+            _STATE.next_id += 1
+        stack = _stack()
+        self.parent = stack[-1].id if stack else None
+        self.depth = len(stack)
+        self.start = time.time()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._peak = _peak_rss_mb()
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        _stack().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        stack = _stack()
+        if self in stack:       # normally the top; a generator closed late may leave inner spans above it
+            del stack[stack.index(self):]
+        peak = _peak_rss_mb()
+        record = {
+            'name': self.name,
+            'cat': self.cat,
+            'id': self.id,
+            'parent': self.parent,
+            'depth': self.depth,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'start': self.start,
+            'wall_s': time.perf_counter() - self._wall,
+            'cpu_s': time.process_time() - self._cpu,
+            'peak_rss_mb': None if peak is None else round(peak, 1),
+            'rss_growth_mb': None if peak is None else round(peak - self._peak, 1),
+            'attrs': self.attrs,
+        }
+        if exc_type is not None:
+            record['error'] = f"{exc_type.__name__}: {exc}"
+        with _STATE.lock:
+            _STATE.records.append(record)
+        return False
+
+
+class _NullSpan:
+    """Returned by span() while tracing is off"""
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+#===============================================================================
+# CONTROL
+#===============================================================================
+
+def start():
+    """Start collecting spans (drops spans and open spans from an earlier run or a forked parent)"""
+    with _STATE.lock:
+        _STATE.records = []
+    _STATE.local = threading.local()
+    _STATE.enabled = True
+
+
+def stop() -> List[Dict]:
+    """Stop collecting; returns the spans recorded"""
+    _STATE.enabled = False
+    return records()
+
+
+def enabled() -> bool:
+    return _STATE.enabled
+
+
+def records() -> List[Dict]:
+    with _STATE.lock:
+        return list(_STATE.records)
+
+
+def take_records() -> List[Dict]:
+    """Spans recorded so far, removed from the tracer (worker → parent hand-off)"""
+    with _STATE.lock:
+        taken, _STATE.records = _STATE.records, []
+    return taken
+
+
+def add_records(spans: Iterable[Dict]):
+    """Spans recorded in another process (e.g. a stage_dag worker; ids are unique per pid)"""
+    with _STATE.lock:
+        _STATE.records.extend(spans)
+
+
+def is_quiet() -> bool:
+    return _STATE.quiet
+
+
+class _NullWriter(io.TextIOBase):
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+@contextlib.contextmanager
+def quiet_output(quiet: bool = True):
+    """Discard stdout inside the block (stderr, e.g. tracebacks, is kept)"""
+    if not quiet:
+        yield
+        return
+    previous = _STATE.quiet
+    _STATE.quiet = True
+    try:
+        with contextlib.redirect_stdout(_NullWriter()):
+            yield
+    finally:
+        _STATE.quiet = previous
+
+
+#===============================================================================
+# SPANS
+#===============================================================================
+
+def span(name: str, cat: str = 'span', **attrs):
+    """Context manager timing the block (no-op while tracing is off)"""
+    if not _STATE.enabled:
+        return _NULL_SPAN
+    return Span(name, cat, attrs)
+
+
+def current():
+    """Innermost open span of this thread (a no-op span if none)"""
+    stack = _stack() if _STATE.enabled else None
+    return stack[-1] if stack else _NULL_SPAN
+
+
+def annotate(**attrs):
+    """set() on the innermost open span"""
+    current().set(**attrs)
+
+
+def traced(name: Optional[str] = None, cat: str = 'function'):
+    """
+    Decorator: one span per call
+
+    A list first argument / list result is recorded as objects_in /
+    objects_out (the post-processor fixers take and return object lists).
+    """
+    def decorate(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _STATE.enabled:
+                return func(*args, **kwargs)
+            with Span(span_name, cat, {}) as s:
+                if args and isinstance(args[0], list):
+                    s.set(objects_in=len(args[0]))
+                result = func(*args, **kwargs)
+                if isinstance(result, list):
+                    s.set(objects_out=len(result))
+                return result
+        return wrapper
+    return decorate
+
+
+def iter_spans(iterable: Iterable, name: Callable, cat: str = 'span', count: Optional[Callable[[], int]] = None):
+    """
+    Yield items of iterable, each inside its own span
+
+    The span of an item closes when the next item is requested (so
+    `continue` needs no extra code). With `count`, the span records
+    added = count() after - count() before.
+    """
+    for item in iterable:
+        if not _STATE.enabled:
+            yield item
+            continue
+        before = count() if count else None
+        with Span(name(item), cat, {}) as s:
+            try:
+                yield item
+            finally:
+                if count:
+                    s.set(added=count() - before)
+
+
+#===============================================================================
+# EXPORT
+#===============================================================================
+
+def write_jsonl(path: str, spans: Optional[List[Dict]] = None) -> str:
+    """One span per line, in completion order"""
+    with open(path, 'w') as f:
+        for record in (records() if spans is None else spans):
+            f.write(json.dumps(record, default=str) + '\n')
+    return path
+
+
+def write_chrome_trace(path: str, spans: Optional[List[Dict]] = None) -> str:
+    """Chrome trace event format (complete events), one track per process/thread"""
+    events = []
+    for record in (records() if spans is None else spans):
+        args = dict(record['attrs'])
+        args.update(cpu_s=round(record['cpu_s'], 6), peak_rss_mb=record['peak_rss_mb'],
+                    rss_growth_mb=record['rss_growth_mb'])
+        if 'error' in record:
+            args['error'] = record['error']
+        events.append({
+            'name': record['name'],
+            'cat': record['cat'],
+            'ph': 'X',
+            'ts': round(record['start'] * 1e6),
+            'dur': round(record['wall_s'] * 1e6),
+            'pid': record['pid'],
+            'tid': record['tid'],
+            'args': args,
+        })
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+    return path
+
+
+def summary(spans: Optional[List[Dict]] = None, top: int = 15) -> str:
+    """Slowest span names by total wall time (calls, wall, CPU, max peak RSS)"""
+    totals = defaultdict(lambda: {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'peak': 0.0})
+    for record in (records() if spans is None else spans):
+        total = totals[(record['cat'], record['name'])]
+        total['calls'] += 1
+        total['wall'] += record['wall_s']
+        total['cpu'] += record['cpu_s']
+        total['peak'] = max(total['peak'], record['peak_rss_mb'] or 0.0)
+    lines = [f"{'span':<44} {'cat':<14} {'calls':>5} {'wall s':>8} {'cpu s':>8} {'peak MB':>8}"]
+    for (cat, name), total in sorted(totals.items(), key=lambda kv: -kv[1]['wall'])[:top]:
+        lines.append(f"{name[:44]:<44} {cat[:14]:<14} {total['calls']:>5} {total['wall']:>8.3f} "
+                     f"{total['cpu']:>8.3f} {total['peak']:>8.1f}")
+    return '\n'.join(lines)
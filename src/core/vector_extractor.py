@@ -6,17 +6,26 @@ Implements algorithms from VECTOR_SEMANTIC_EXTRACTION_GUIDE.md
 Rule 0 compliant - pure deterministic extraction using OpenCV.
 """
 
-import cv2
-import numpy as np
+from __future__ import annotations
+
 import sqlite3
 import json
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import pdf2image
 import math
-import pytesseract
 import re
 
+try:
+    from src.core.lazy_import import lazy_module
+except ImportError:
+    from lazy_import import lazy_module
+
+# Loaded on first use - only the raster detection paths need them
+cv2 = lazy_module('cv2')
+np = lazy_module('numpy')
+pdf2image = lazy_module('pdf2image')
+pytesseract = lazy_module('pytesseract')
+
 
 class VectorSemanticExtractor:
     """
@@ -9,6 +9,11 @@ Architecture: Two-tier system
 Think: Java bytecode → C implementation
 """
 
+try:
+    from src.core import tracing
+except ImportError:
+    import tracing
+
 # =============================================================================
 # VECTOR PATTERN EXECUTION PRIMITIVES
 # =============================================================================
@@ -828,7 +833,13 @@ class VectorPatternExecutor:
         if 'calibration' in context:
             self.calibration = context['calibration']
 
-        # Route to appropriate method
+        with tracing.span(detection_id, cat='detection', method=method) as span:
+            result = self._dispatch(method, pattern, search_text, pages, object_type, context)
+            span.set(results=len(result) if isinstance(result, list) else int(result is not None))
+        return result
+
+    def _dispatch(self, method, pattern, search_text, pages, object_type, context):
+        """Route a pattern to its _execute_* handler"""
         if method == "vector_bounding_box":
             return self._execute_calibration(pattern, pages or [6], context)
 
@@ -919,9 +930,9 @@ class VectorPatternExecutor:
 
     def _execute_schedule_extraction(self, pattern, search_text, pages):
         """Execute SCHEDULE_TABLE_EXTRACTION pattern"""
-        # POC: Use existing ScheduleExtractor from extraction_engine
+        # POC: Use existing ScheduleExtractor (schedule_extractor.py)
         # In production, this would be reimplemented here
-        from extraction_engine import ScheduleExtractor
+        from schedule_extractor import ScheduleExtractor
 
         schedule_extractor = ScheduleExtractor(self.pdf)
 
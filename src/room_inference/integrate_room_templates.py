@@ -19,6 +19,12 @@ from pathlib import Path
 
 # Add standards module to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+
+try:
+    from src.core import tracing
+except ImportError:
+    import tracing
 
 from standards.placement_engine import (
     StandardsPlacementEngine,
@@ -609,6 +615,7 @@ def calculate_position(placement_rule, bounds, center, index, spec):
         return [center[0], center[1], height]
 
 
+@tracing.traced()
 def augment_with_room_templates(extraction_output):
     """
     Augment text-based extraction with room template inference
@@ -775,38 +782,27 @@ def augment_with_room_templates(extraction_output):
     print(f"\nBreakdown by phase:")
     for phase, count in sorted(by_phase.items()):
         print(f"  {phase}: {count}")
+    tracing.annotate(objects_in=len(existing_objects), objects_out=len(all_objects),
+                     inferred=len(inferred_objects))
 
     return extraction_output
 
 
-if __name__ == "__main__":
-    import sys
-    import os
-
-    if len(sys.argv) < 2:
-        print("Usage: python3 integrate_room_templates.py <extraction_output.json> [pdf_path]")
-        sys.exit(1)
-
-    input_path = sys.argv[1]
-    pdf_path = sys.argv[2] if len(sys.argv) > 2 else None
-
-    # Load extraction output
-    with open(input_path) as f:
-        extraction_output = json.load(f)
-
-    # Add PDF path to metadata if provided
-    if pdf_path:
-        extraction_output['extraction_metadata']['pdf_source'] = pdf_path
+def post_process_augmented(augmented, input_path, pdf_path=None):
+    """
+    Wall combining, automated post-processing and 3D canvas validation
 
-    # Augment with templates
-    augmented = augment_with_room_templates(extraction_output)
+    Args:
+        augmented: Output of augment_with_room_templates() (modified in place)
+        input_path: OUTPUT JSON path (GridTruth.json is looked up next to it without pdf_path)
+        pdf_path: Source PDF
 
-    # Save augmented output
-    output_path = input_path.replace('.json', '_AUGMENTED.json')
-    with open(output_path, 'w') as f:
-        json.dump(augmented, f, indent=2)
+    Returns:
+        dict: FINAL output
+    """
+    import os
 
-    print(f"\n💾 Saved augmented output: {output_path}")
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
 
     # Run automated post-processing
     print("\n" + "="*80)
@@ -814,7 +810,6 @@ if __name__ == "__main__":
     print("="*80)
 
     # Import post-processor
-    sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
     from post_processor import automated_post_process
     from wall_combiner import process_walls
 
@@ -835,7 +830,7 @@ if __name__ == "__main__":
     from src.core.building_canvas import validate_with_canvas
 
     # Find GridTruth.json and validation_rules.json
-    pdf_dir = os.path.dirname(pdf_path) if pdf_path else os.path.dirname(input_json_path)
+    pdf_dir = os.path.dirname(pdf_path) if pdf_path else os.path.dirname(input_path)
     gridtruth_path = os.path.join(pdf_dir, 'GridTruth.json')
     validation_rules_path = os.path.join(os.path.dirname(__file__),
                                          '../LocalLibrary/validation_rules.json')
@@ -856,12 +851,77 @@ if __name__ == "__main__":
     else:
         print(f"\n⚠️  Skipping 3D canvas validation (GridTruth.json or validation_rules.json not found)")
 
-    # Save final fixed output
-    # Keep _FINAL suffix (required by RUN_COMPLETE_PIPELINE.sh)
-    final_path = output_path.replace('_AUGMENTED.json', '_FINAL.json')
-    with open(final_path, 'w') as f:
-        json.dump(fixed, f, indent=2)
+    return fixed
+
+
+def save_final(fixed, final_path, columnar=False):
+    """Write FINAL (+ .objects.jsonl sidecar for streaming consumers)"""
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+    from final_json_stream import dump_final_json
+
+    dump_final_json(fixed, final_path, columnar=columnar)
 
     print(f"\n💾 Saved final output: {final_path}")
     print("\n✅ Complete pipeline: Extraction → Augmentation → Automated Fixes")
     print(f"   Final output ready for Blender: {final_path}")
+
+
+def run_integration(extraction_output, input_path, pdf_path=None, columnar=False, save_augmented=True):
+    """
+    OUTPUT → AUGMENTED → FINAL stage: room templates, wall combining,
+    post-processing and 3D canvas validation
+
+    Args:
+        extraction_output: Output dict from extraction_engine.py (modified in place)
+        input_path: OUTPUT JSON path the AUGMENTED/FINAL names are derived from
+        pdf_path: Source PDF (recorded as extraction_metadata.pdf_source)
+        columnar: Also write .npz copies
+        save_augmented: Write the intermediate _AUGMENTED.json
+
+    Returns:
+        (fixed, final_path)
+    """
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+    from final_json_stream import dump_final_json
+
+    # Add PDF path to metadata if provided
+    if pdf_path:
+        extraction_output['extraction_metadata']['pdf_source'] = pdf_path
+
+    # Augment with templates
+    augmented = augment_with_room_templates(extraction_output)
+
+    # Save augmented output
+    output_path = input_path.replace('.json', '_AUGMENTED.json')
+    if save_augmented:
+        dump_final_json(augmented, output_path, sidecar=False, columnar=columnar)
+        print(f"\n💾 Saved augmented output: {output_path}")
+
+    fixed = post_process_augmented(augmented, input_path, pdf_path)
+
+    # Keep _FINAL suffix (required by RUN_COMPLETE_PIPELINE.sh)
+    final_path = output_path.replace('_AUGMENTED.json', '_FINAL.json')
+    save_final(fixed, final_path, columnar=columnar)
+
+    return fixed, final_path
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not args:
+        print("Usage: python3 integrate_room_templates.py <extraction_output.json> [pdf_path] [--columnar]")
+        sys.exit(1)
+
+    input_path = args[0]
+    pdf_path = args[1] if len(args) > 1 else None
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+    from columnar_output import columnar_fresh, load_output
+
+    # Keep writing .npz once the previous stage did
+    columnar = '--columnar' in sys.argv or columnar_fresh(input_path)
+
+    # Load extraction output (.npz when fresh, else JSON)
+    extraction_output = load_output(input_path)
+
+    run_integration(extraction_output, input_path, pdf_path, columnar=columnar)
@@ -5,6 +5,9 @@ Add Gutter Corner Connector to Library
 
 Creates a 90-degree gutter corner elbow and adds it to Ifc_Object_Library.db.
 
+Re-running is incremental: the entry is only regenerated when the generator
+source or catalog parameters changed (see library_fingerprints.py).
+
 Usage:
     python3 add_gutter_corner.py DatabaseFiles/Ifc_Object_Library.db
 """
@@ -13,8 +16,30 @@ import sys
 import sqlite3
 import struct
 import math
+import hashlib
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from fix_library_base_rotations import compute_geometry_metrics
+from library_fingerprints import (generator_fingerprint, source_fingerprint, plan_rebuild, record_fingerprints,
+                                  collect_orphan_geometries, print_rebuild_report)
+
+
+OBJECT_TYPE = 'roof_gutter_corner_90_lod300'
+
+# object_catalog parameters (also part of the generator fingerprint)
+CATALOG_ENTRY = {
+    'object_name': 'Roof Gutter Corner 90°',
+    'ifc_class': 'IfcPipeFitting',
+    'category': 'Drainage',
+    'sub_category': 'Roof_Drainage',
+    'width_mm': 100,
+    'depth_mm': 100,
+    'height_mm': 80,  # depth of gutter
+    'description': '90-degree gutter corner elbow connector for perimeter drainage (MS 1229 compliant)',
+    'construction_type': 'universal',
+}
+
 
 def compute_face_normal(v0, v1, v2):
     """Compute normal vector for a triangle face."""
@@ -204,7 +229,19 @@ def generate_gutter_corner_90():
 
 
 def add_to_library(db_path):
-    """Add gutter corner to library database."""
+    """Add (or refresh) gutter corner in library database."""
+
+    # How the rows are written (hash, metrics) is part of the fingerprint too
+    fingerprint = generator_fingerprint(generate_gutter_corner_90, CATALOG_ENTRY,
+                                        source_fingerprint(add_to_library, compute_geometry_metrics))
+
+    conn = sqlite3.connect(db_path)
+    plan = plan_rebuild(conn, {OBJECT_TYPE: fingerprint})
+    if not plan.to_build:
+        print("  ✅ Object unchanged since last build (fingerprint match). Skipping.")
+        print_rebuild_report(plan)
+        conn.close()
+        return
 
     print(f"Generating gutter corner geometry...")
     vertices, faces, normals = generate_gutter_corner_90()
@@ -219,61 +256,72 @@ def add_to_library(db_path):
     normals_blob = struct.pack(f'<{len(normals)*3}f',
                               *[c for n in normals for c in n])
 
-    # Compute hash (simple checksum)
-    geometry_hash = f"gutter_corner_90_{len(vertices)}v_{len(faces)}f"
-
-    # Connect to database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Check if already exists
-    cursor.execute("""
-        SELECT COUNT(*) FROM object_catalog
-        WHERE object_type = 'roof_gutter_corner_90_lod300'
-    """)
-    if cursor.fetchone()[0] > 0:
-        print("  ⚠️  Object already exists in library. Skipping.")
-        conn.close()
-        return
+    # Content hash, same as compute_geometry_hash() in generate_complete_library_lod300.py
+    geometry_hash = hashlib.sha256(vertices_blob + faces_blob).hexdigest()
+
+    # Bounding box, volume and surface area, as write_library_records() stores them
+    metrics = compute_geometry_metrics([vertices_blob], [faces_blob])
+    bbox_width, bbox_depth, bbox_height = (float(v) for v in metrics['spans'][0])
+    volume, area = (None if math.isnan(v) else float(v)
+                    for v in (metrics['volume'][0], metrics['surface_area'][0]))
+
+    entry = CATALOG_ENTRY
+    with conn:
+        # Upsert base_geometries
+        conn.execute("""
+            INSERT INTO base_geometries (
+                geometry_hash, vertices, faces, normals,
+                vertex_count, face_count,
+                bbox_width, bbox_depth, bbox_height, volume_m3, surface_area_m2
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(geometry_hash) DO UPDATE SET
+                normals = excluded.normals, vertex_count = excluded.vertex_count,
+                face_count = excluded.face_count, bbox_width = excluded.bbox_width,
+                bbox_depth = excluded.bbox_depth, bbox_height = excluded.bbox_height,
+                volume_m3 = excluded.volume_m3, surface_area_m2 = excluded.surface_area_m2
+        """, (geometry_hash, vertices_blob, faces_blob, normals_blob,
+              len(vertices), len(faces), bbox_width, bbox_depth, bbox_height, volume, area))
+
+        # Upsert object_catalog (keeps catalog_id and base_rotation columns)
+        conn.execute("""
+            INSERT INTO object_catalog (
+                object_type, object_name, ifc_class, category, sub_category,
+                width_mm, depth_mm, height_mm, description,
+                geometry_hash, construction_type
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(object_type) DO UPDATE SET
+                object_name = excluded.object_name, ifc_class = excluded.ifc_class,
+                category = excluded.category, sub_category = excluded.sub_category,
+                width_mm = excluded.width_mm, depth_mm = excluded.depth_mm,
+                height_mm = excluded.height_mm, description = excluded.description,
+                geometry_hash = excluded.geometry_hash,
+                construction_type = excluded.construction_type
+        """, (
+            OBJECT_TYPE,
+            entry['object_name'],
+            entry['ifc_class'],
+            entry['category'],
+            entry['sub_category'],
+            entry['width_mm'],
+            entry['depth_mm'],
+            entry['height_mm'],
+            entry['description'],
+            geometry_hash,
+            entry['construction_type']
+        ))
+
+        record_fingerprints(conn, {OBJECT_TYPE: fingerprint}, 'add_gutter_corner')
+        orphans_removed = collect_orphan_geometries(conn)
 
-    # Add to base_geometries
-    cursor.execute("""
-        INSERT INTO base_geometries (
-            geometry_hash, vertices, faces, normals,
-            vertex_count, face_count
-        )
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (geometry_hash, vertices_blob, faces_blob, normals_blob,
-          len(vertices), len(faces)))
-
-    # Add to object_catalog
-    cursor.execute("""
-        INSERT INTO object_catalog (
-            object_type, object_name, ifc_class, category, sub_category,
-            width_mm, depth_mm, height_mm, description,
-            geometry_hash, construction_type
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        'roof_gutter_corner_90_lod300',
-        'Roof Gutter Corner 90°',
-        'IfcPipeFitting',
-        'Drainage',
-        'Roof_Drainage',
-        100,  # width_mm
-        100,  # depth_mm
-        80,   # height_mm (depth of gutter)
-        '90-degree gutter corner elbow connector for perimeter drainage (MS 1229 compliant)',
-        geometry_hash,
-        'universal'
-    ))
-
-    conn.commit()
     conn.close()
 
-    print(f"✅ Added 'roof_gutter_corner_90_lod300' to library")
-    print(f"   IFC Class: IfcPipeFitting")
-    print(f"   Dimensions: 100mm x 100mm x 80mm")
-    print(f"   Geometry: {len(vertices)} vertices, {len(faces)} faces")
+    print(f"✅ Added '{OBJECT_TYPE}' to library")
+    print(f"   IFC Class: {entry['ifc_class']}")
+    print(f"   Dimensions: {entry['width_mm']}mm x {entry['depth_mm']}mm x {entry['height_mm']}mm")
+    print(f"   Geometry: {len(vertices)} vertices, {len(faces)} faces, "
+          f"bbox {bbox_width:.3f} x {bbox_depth:.3f} x {bbox_height:.3f}m ({geometry_hash[:12]})")
+    print_rebuild_report(plan, orphans_removed)
 
 
 if __name__ == '__main__':
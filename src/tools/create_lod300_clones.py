@@ -6,11 +6,18 @@ Strategy:
 - Keep same geometry (same geometry_hash)
 - Create new catalog entry with _lod300 suffix
 - Preserves all dimensions and metadata
+- Incremental: a clone is refreshed only when its base entry (or the clone
+  rule) changed since the last run (see library_fingerprints.py)
 """
 
 import sqlite3
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from library_fingerprints import (generator_fingerprint, plan_rebuild, record_fingerprints,
+                                  collect_orphan_geometries, print_rebuild_report)
+
 # Objects to clone
 OBJECTS_TO_CLONE = [
     'nightstand',
@@ -28,6 +35,32 @@ OBJECTS_TO_CLONE = [
     'stove_residential_lod200',
 ]
 
+def lod300_clone_name(base_name: str) -> str:
+    """Determine LOD300 name for a base object_type"""
+    if base_name.endswith('_lod200'):
+        return base_name.replace('_lod200', '_lod300')
+    return f"{base_name}_lod300"
+
+
+def build_clone_row(lod300_name: str, base_row: tuple) -> tuple:
+    """Catalog values for a LOD300 clone of base_row (same geometry_hash)"""
+    (geometry_hash, ifc_class, object_name, category, sub_category,
+     width_mm, depth_mm, height_mm, description, construction_type) = base_row
+    return (
+        geometry_hash,
+        ifc_class,
+        lod300_name,
+        object_name,  # Keep same object_name (display name)
+        category,
+        sub_category,
+        width_mm,
+        depth_mm,
+        height_mm,
+        f"{description} (LOD300 variant)" if description else "LOD300 variant",
+        construction_type
+    )
+
+
 def create_lod300_clones(db_path: Path):
     """Clone base objects as LOD300 variants"""
 
@@ -39,22 +72,12 @@ def create_lod300_clones(db_path: Path):
     print("=" * 80)
     print()
 
-    created = []
-    skipped = []
     errors = []
+    clone_rows = {}
+    fingerprints = {}
 
     for base_name in OBJECTS_TO_CLONE:
-        # Determine LOD300 name
-        if base_name.endswith('_lod200'):
-            lod300_name = base_name.replace('_lod200', '_lod300')
-        else:
-            lod300_name = f"{base_name}_lod300"
-
-        # Check if LOD300 already exists
-        cursor.execute("SELECT COUNT(*) FROM object_catalog WHERE object_type = ?", (lod300_name,))
-        if cursor.fetchone()[0] > 0:
-            skipped.append(f"{lod300_name} (already exists)")
-            continue
+        lod300_name = lod300_clone_name(base_name)
 
         # Get base object data
         cursor.execute("""
@@ -70,35 +93,46 @@ def create_lod300_clones(db_path: Path):
             errors.append(f"{base_name} (not found in catalog)")
             continue
 
-        (geometry_hash, ifc_class, object_name, category, sub_category,
-         width_mm, depth_mm, height_mm, description, construction_type) = row
+        clone_rows[lod300_name] = (base_name, build_clone_row(lod300_name, row))
+        fingerprints[lod300_name] = generator_fingerprint(build_clone_row, (base_name, row))
+
+    # Only create/refresh clones whose base entry changed
+    plan = plan_rebuild(conn, fingerprints)
 
-        # Create LOD300 clone
+    created = []
+    updated = []
+    skipped = [f"{name} (unchanged)" for name in plan.unchanged]
+    written = {}
+
+    for lod300_name in plan.to_build:
+        base_name, values = clone_rows[lod300_name]
         try:
             cursor.execute("""
                 INSERT INTO object_catalog
                 (geometry_hash, ifc_class, object_type, object_name, category, sub_category,
                  width_mm, depth_mm, height_mm, description, construction_type)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                geometry_hash,
-                ifc_class,
-                lod300_name,
-                object_name,  # Keep same object_name (display name)
-                category,
-                sub_category,
-                width_mm,
-                depth_mm,
-                height_mm,
-                f"{description} (LOD300 variant)" if description else "LOD300 variant",
-                construction_type
-            ))
-
-            created.append(f"{base_name} → {lod300_name}")
+                ON CONFLICT(object_type) DO UPDATE SET
+                    geometry_hash = excluded.geometry_hash, ifc_class = excluded.ifc_class,
+                    object_name = excluded.object_name, category = excluded.category,
+                    sub_category = excluded.sub_category, width_mm = excluded.width_mm,
+                    depth_mm = excluded.depth_mm, height_mm = excluded.height_mm,
+                    description = excluded.description,
+                    construction_type = excluded.construction_type
+            """, values)
+
+            written[lod300_name] = fingerprints[lod300_name]
+            if lod300_name in plan.changed:
+                updated.append(f"{base_name} → {lod300_name}")
+            else:
+                created.append(f"{base_name} → {lod300_name}")
 
         except sqlite3.Error as e:
             errors.append(f"{base_name} (SQL error: {e})")
 
+    record_fingerprints(conn, written, 'create_lod300_clones')
+    orphans_removed = collect_orphan_geometries(conn)
+
     conn.commit()
     conn.close()
 
@@ -107,8 +141,13 @@ def create_lod300_clones(db_path: Path):
     for item in created:
         print(f"   ✓ {item}")
 
+    if updated:
+        print(f"\n🔄 Updated: {len(updated)} (base entry changed)")
+        for item in updated:
+            print(f"   ~ {item}")
+
     if skipped:
-        print(f"\n⏭️  Skipped: {len(skipped)} (already exist)")
+        print(f"\n⏭️  Skipped: {len(skipped)} (already up to date)")
         for item in skipped:
             print(f"   - {item}")
 
@@ -117,9 +156,12 @@ def create_lod300_clones(db_path: Path):
         for item in errors:
             print(f"   ✗ {item}")
 
+    print_rebuild_report(plan, orphans_removed)
+
     print()
     print("=" * 80)
-    print(f"SUMMARY: {len(created)} created, {len(skipped)} skipped, {len(errors)} errors")
+    print(f"SUMMARY: {len(created)} created, {len(updated)} updated, "
+          f"{len(skipped)} skipped, {len(errors)} errors")
     print("=" * 80)
 
 
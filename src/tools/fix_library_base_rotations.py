@@ -18,17 +18,47 @@ USAGE:
 OUTPUTS:
     - Audit report of all objects
     - SQL updates for base_rotation
+    - bbox_width/depth/height, volume_m3, surface_area_m2 for every geometry
     - Summary statistics
 """
 
 import sqlite3
-import struct
 import numpy as np
 import argparse
 import sys
 from pathlib import Path
 
 
+# Rotation suggested per tallest axis (index 0=X, 1=Y, 2=Z)
+AXIS_NAMES = ('X', 'Y', 'Z')
+SUGGESTED_ROTATIONS = np.array([
+    (0.0, 1.5708, 0.0),  # X tallest: lying on side (X is up) → rotate 90° around Y-axis
+    (1.5708, 0.0, 0.0),  # Y tallest: lying on back (Y is up) → rotate 90° around X-axis
+    (0.0, 0.0, 0.0),     # Z tallest: upright
+])
+
+# Column sets written back to the database
+BBOX_COLUMNS = ('bbox_width', 'bbox_depth', 'bbox_height', 'volume_m3', 'surface_area_m2')
+
+
+def classify_orientation(spans):
+    """
+    Vectorised orientation rule over (G, 3) XYZ spans.
+
+    Object is considered "upright" if Z is tallest or within 20% of tallest.
+
+    Returns:
+        (tallest_axis_index, needs_rotation, suggested_rotation) arrays of
+        shape (G,), (G,), (G, 3)
+    """
+    spans = np.asarray(spans, dtype=np.float64).reshape(-1, 3)
+    tallest = np.argmax(spans, axis=1)
+    tallest_value = spans[np.arange(len(spans)), tallest]
+    upright = (tallest == 2) | (spans[:, 2] > tallest_value * 0.8)
+    suggested = np.where(upright[:, None], 0.0, SUGGESTED_ROTATIONS[tallest])
+    return tallest, ~upright, suggested
+
+
 def analyze_geometry(verts_blob):
     """
     Analyze geometry orientation.
@@ -44,53 +74,141 @@ def analyze_geometry(verts_blob):
         }
     """
     # Parse vertices
-    n_floats = len(verts_blob) // 4
-    floats = struct.unpack(f'<{n_floats}f', verts_blob)
-    verts = np.array(floats).reshape(-1, 3)
+    verts = np.frombuffer(verts_blob, dtype='<f4').reshape(-1, 3)
 
     # Calculate spans
-    x_span = verts[:,0].max() - verts[:,0].min()
-    y_span = verts[:,1].max() - verts[:,1].min()
-    z_span = verts[:,2].max() - verts[:,2].min()
-
-    # Determine tallest axis
-    spans = {'X': x_span, 'Y': y_span, 'Z': z_span}
-    tallest_axis = max(spans, key=spans.get)
-    tallest_value = spans[tallest_axis]
-
-    # Check if needs rotation
-    # Object is considered "upright" if Z is tallest or within 20% of tallest
-    upright = (tallest_axis == 'Z' or z_span > tallest_value * 0.8)
-
-    # Determine required rotation
-    if upright:
-        suggested = (0.0, 0.0, 0.0)
-    elif tallest_axis == 'Y':
-        # Lying on back (Y is up) → rotate 90° around X-axis
-        suggested = (1.5708, 0.0, 0.0)  # π/2 radians
-    elif tallest_axis == 'X':
-        # Lying on side (X is up) → rotate 90° around Y-axis
-        suggested = (0.0, 1.5708, 0.0)
-    else:
-        suggested = (0.0, 0.0, 0.0)
+    spans = verts.max(axis=0).astype(np.float64) - verts.min(axis=0)
+    tallest, needs_rotation, suggested = classify_orientation(spans)
+
+    return {
+        'x_span': spans[0],
+        'y_span': spans[1],
+        'z_span': spans[2],
+        'tallest_axis': AXIS_NAMES[tallest[0]],
+        'needs_rotation': bool(needs_rotation[0]),
+        'suggested_rotation': tuple(float(r) for r in suggested[0])
+    }
+
+
+def compute_geometry_metrics(vertex_blobs, face_blobs):
+    """
+    Batch AABB, volume and surface area for many geometries at once.
+
+    Vertices of all geometries are concatenated and reduced per geometry with
+    np.minimum.reduceat / np.maximum.reduceat; face metrics are summed per
+    geometry with np.bincount.
+
+    Args:
+        vertex_blobs: Sequence of float32 vertex BLOBs
+        face_blobs: Sequence of uint32 face BLOBs (same order)
+
+    Returns:
+        dict of arrays, one row per geometry:
+            'valid'        (G,)   vertex blob parseable and non-empty
+            'bbox_min'     (G, 3)
+            'bbox_max'     (G, 3)
+            'spans'        (G, 3) X/Y/Z extent in meters
+            'volume'       (G,)   enclosed volume (m³, NaN if faces invalid)
+            'surface_area' (G,)   triangle area sum (m², NaN if faces invalid)
+    """
+    n_geoms = len(vertex_blobs)
+    v_sizes = np.array([len(b or b'') for b in vertex_blobs], dtype=np.int64)
+    f_sizes = np.array([len(b or b'') for b in face_blobs], dtype=np.int64)
+
+    # Corrupted blobs (not whole xyz triplets) are left out of the batch
+    valid = (v_sizes > 0) & (v_sizes % 12 == 0)
+    v_counts = np.where(valid, v_sizes // 12, 0)
+    faces_ok = valid & (f_sizes % 12 == 0)
+    f_counts = np.where(faces_ok, f_sizes // 12, 0)
+
+    bbox_min = np.full((n_geoms, 3), np.nan)
+    bbox_max = np.full((n_geoms, 3), np.nan)
+    volume = np.full(n_geoms, np.nan)
+    surface_area = np.full(n_geoms, np.nan)
+
+    if valid.any():
+        verts = np.frombuffer(b''.join(b for b, ok in zip(vertex_blobs, valid) if ok),
+                              dtype='<f4').reshape(-1, 3).astype(np.float64)
+        starts = np.concatenate([[0], np.cumsum(v_counts[valid])[:-1]])
+        bbox_min[valid] = np.minimum.reduceat(verts, starts, axis=0)
+        bbox_max[valid] = np.maximum.reduceat(verts, starts, axis=0)
+
+        # Faces: local indices → global, reject geometries with out-of-range indices
+        vertex_offsets = np.concatenate([[0], np.cumsum(v_counts)[:-1]])
+        faces = np.frombuffer(b''.join(b for b, ok in zip(face_blobs, faces_ok) if ok and b),
+                              dtype='<u4').reshape(-1, 3).astype(np.int64)
+        face_geom = np.repeat(np.arange(n_geoms), f_counts)
+        in_range = np.bincount(face_geom, weights=(faces.max(axis=1) >= v_counts[face_geom]),
+                               minlength=n_geoms) == 0
+        faces_ok &= in_range
+
+        keep = faces_ok[face_geom]
+        faces, face_geom = faces[keep] + vertex_offsets[face_geom[keep], None], face_geom[keep]
+        v0, v1, v2 = verts[faces[:, 0]], verts[faces[:, 1]], verts[faces[:, 2]]
+        cross = np.cross(v1 - v0, v2 - v0)
+        tri_area = 0.5 * np.sqrt(np.einsum('ij,ij->i', cross, cross))
+        # Signed tetrahedron volumes against the origin (divergence theorem)
+        tri_volume = np.einsum('ij,ij->i', v0, np.cross(v1, v2)) / 6.0
+
+        surface_area[faces_ok] = np.bincount(face_geom, weights=tri_area, minlength=n_geoms)[faces_ok]
+        volume[faces_ok] = np.abs(np.bincount(face_geom, weights=tri_volume, minlength=n_geoms))[faces_ok]
 
     return {
-        'x_span': x_span,
-        'y_span': y_span,
-        'z_span': z_span,
-        'tallest_axis': tallest_axis,
-        'needs_rotation': not upright,
-        'suggested_rotation': suggested
+        'valid': valid,
+        'bbox_min': bbox_min,
+        'bbox_max': bbox_max,
+        'spans': bbox_max - bbox_min,
+        'volume': volume,
+        'surface_area': surface_area,
     }
 
 
-def audit_database(db_path, dry_run=False):
+def _optional(value):
+    """NaN → NULL for SQLite"""
+    return None if np.isnan(value) else float(value)
+
+
+def scan_geometry_metrics(conn, chunk_size=256):
+    """
+    Stream base_geometries in chunks and compute metrics per geometry_hash.
+
+    Only one chunk of BLOBs is held in memory at a time.
+
+    Returns:
+        dict: {geometry_hash: (x_span, y_span, z_span, volume_m3, surface_area_m2)}
+              (spans are None for unparseable geometry)
+    """
+    metrics = {}
+    cur = conn.execute("SELECT geometry_hash, vertices, faces FROM base_geometries")
+    while True:
+        rows = cur.fetchmany(chunk_size)
+        if not rows:
+            break
+        hashes, vertex_blobs, face_blobs = zip(*rows)
+        batch = compute_geometry_metrics(vertex_blobs, face_blobs)
+        for k, geom_hash in enumerate(hashes):
+            if not batch['valid'][k]:
+                metrics[geom_hash] = None
+                continue
+            spans = batch['spans'][k]
+            metrics[geom_hash] = (float(spans[0]), float(spans[1]), float(spans[2]),
+                                  _optional(batch['volume'][k]),
+                                  _optional(batch['surface_area'][k]))
+    return metrics
+
+
+def audit_database(db_path, dry_run=False, chunk_size=256):
     """
     Audit entire database and fix base_rotations.
 
+    One streaming pass over base_geometries computes AABB, volume and surface
+    area for every geometry; rotations and bbox columns are then written back
+    with one executemany each.
+
     Args:
         db_path: Path to Ifc_Object_Library.db
         dry_run: If True, only report without updating
+        chunk_size: Geometries per vectorised batch
 
     Returns:
         dict: Statistics
@@ -102,7 +220,7 @@ def audit_database(db_path, dry_run=False):
     cur.execute("""
         SELECT oc.object_type,
                oc.base_rotation_x, oc.base_rotation_y, oc.base_rotation_z,
-               bg.vertices
+               oc.geometry_hash
         FROM object_catalog oc
         JOIN base_geometries bg ON oc.geometry_hash = bg.geometry_hash
         WHERE oc.object_type LIKE '%lod300%' OR oc.object_type LIKE '%lod200%'
@@ -117,7 +235,8 @@ def audit_database(db_path, dry_run=False):
         'needs_x_rotation': 0,
         'needs_y_rotation': 0,
         'already_correct': 0,
-        'will_update': 0
+        'will_update': 0,
+        'geometries_measured': 0
     }
 
     updates_needed = []
@@ -130,43 +249,52 @@ def audit_database(db_path, dry_run=False):
     print(f"Total objects: {len(results)}")
     print()
 
-    for obj_type, cur_rx, cur_ry, cur_rz, verts_blob in results:
+    metrics = scan_geometry_metrics(conn, chunk_size)
+    stats['geometries_measured'] = sum(1 for m in metrics.values() if m)
+
+    # Classify all objects in one vectorised call
+    measured = [row for row in results if metrics.get(row[4])]
+    for obj_type, *_, geom_hash in results:
+        if not metrics.get(geom_hash):
+            stats['total'] += 1
+            print(f"⚠️  Error analyzing {obj_type}: unparseable vertex blob")
+
+    spans = np.array([metrics[row[4]][:3] for row in measured]).reshape(-1, 3)
+    tallest, needs_rotation, suggested = classify_orientation(spans)
+    # NULL rotation → schema default 0.0
+    current = np.array([[r or 0.0 for r in row[1:4]] for row in measured],
+                       dtype=np.float64).reshape(-1, 3)
+    current_matches = np.all(np.abs(current - suggested) < 0.01, axis=1)
+
+    for k, (obj_type, cur_rx, cur_ry, cur_rz, _) in enumerate(measured):
         stats['total'] += 1
+        suggested_rx, suggested_ry, suggested_rz = (float(r) for r in suggested[k])
 
-        try:
-            analysis = analyze_geometry(verts_blob)
-            suggested_rx, suggested_ry, suggested_rz = analysis['suggested_rotation']
-
-            # Check if current rotation matches suggested
-            current_matches = (
-                abs(cur_rx - suggested_rx) < 0.01 and
-                abs(cur_ry - suggested_ry) < 0.01 and
-                abs(cur_rz - suggested_rz) < 0.01
-            )
-
-            if not analysis['needs_rotation']:
-                stats['upright'] += 1
-                if current_matches:
-                    stats['already_correct'] += 1
+        if not needs_rotation[k]:
+            stats['upright'] += 1
+            if current_matches[k]:
+                stats['already_correct'] += 1
+        else:
+            if suggested_rx != 0:
+                stats['needs_x_rotation'] += 1
+            if suggested_ry != 0:
+                stats['needs_y_rotation'] += 1
+
+            if not current_matches[k]:
+                stats['will_update'] += 1
+                updates_needed.append({
+                    'object_type': obj_type,
+                    'current': (cur_rx, cur_ry, cur_rz),
+                    'suggested': (suggested_rx, suggested_ry, suggested_rz),
+                    'analysis': {
+                        'x_span': spans[k, 0],
+                        'y_span': spans[k, 1],
+                        'z_span': spans[k, 2],
+                        'tallest_axis': AXIS_NAMES[tallest[k]],
+                    }
+                })
             else:
-                if suggested_rx != 0:
-                    stats['needs_x_rotation'] += 1
-                if suggested_ry != 0:
-                    stats['needs_y_rotation'] += 1
-
-                if not current_matches:
-                    stats['will_update'] += 1
-                    updates_needed.append({
-                        'object_type': obj_type,
-                        'current': (cur_rx, cur_ry, cur_rz),
-                        'suggested': (suggested_rx, suggested_ry, suggested_rz),
-                        'analysis': analysis
-                    })
-                else:
-                    stats['already_correct'] += 1
-
-        except Exception as e:
-            print(f"⚠️  Error analyzing {obj_type}: {e}")
+                stats['already_correct'] += 1
 
     # Report objects needing updates
     if updates_needed:
@@ -186,20 +314,28 @@ def audit_database(db_path, dry_run=False):
             print()
 
     # Apply updates if not dry run
-    if not dry_run and updates_needed:
-        print(f"\n🔧 APPLYING {len(updates_needed)} UPDATES...")
-        for item in updates_needed:
-            obj_type = item['object_type']
-            rx, ry, rz = item['suggested']
-
-            cur.execute("""
-                UPDATE object_catalog
-                SET base_rotation_x = ?, base_rotation_y = ?, base_rotation_z = ?
-                WHERE object_type = ?
-            """, (rx, ry, rz, obj_type))
-
-        conn.commit()
-        print(f"✅ Updated {len(updates_needed)} objects")
+    if not dry_run:
+        geometry_columns = {row[1] for row in conn.execute("PRAGMA table_info(base_geometries)")}
+        with conn:
+            if updates_needed:
+                print(f"\n🔧 APPLYING {len(updates_needed)} UPDATES...")
+                conn.executemany("""
+                    UPDATE object_catalog
+                    SET base_rotation_x = ?, base_rotation_y = ?, base_rotation_z = ?
+                    WHERE object_type = ?
+                """, [(*item['suggested'], item['object_type']) for item in updates_needed])
+                print(f"✅ Updated {len(updates_needed)} objects")
+
+            if set(BBOX_COLUMNS) <= geometry_columns:
+                conn.executemany("""
+                    UPDATE base_geometries
+                    SET bbox_width = ?, bbox_depth = ?, bbox_height = ?,
+                        volume_m3 = ?, surface_area_m2 = ?
+                    WHERE geometry_hash = ?
+                """, [(*m, geom_hash) for geom_hash, m in metrics.items() if m])
+                print(f"✅ Stored bbox/volume/area for {stats['geometries_measured']} geometries")
+            else:
+                print(f"⚠️  base_geometries lacks {', '.join(BBOX_COLUMNS)} columns - metrics not stored")
     elif dry_run and updates_needed:
         print(f"\n💡 DRY RUN: Would update {len(updates_needed)} objects")
         print("    Run without --dry-run to apply changes")
@@ -219,6 +355,7 @@ def audit_database(db_path, dry_run=False):
         print(f"  ✅ Updated:              {stats['will_update']}")
     else:
         print(f"  💡 Would update:         {stats['will_update']}")
+    print(f"  📐 Geometries measured:  {stats['geometries_measured']}")
     print("=" * 80)
 
     return stats
@@ -233,6 +370,12 @@ def main():
         action='store_true',
         help="Analyze only, don't update database"
     )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=256,
+        help="Geometries per vectorised batch (default: 256)"
+    )
     parser.add_argument(
         '--database',
         default='LocalLibrary/Ifc_Object_Library.db',
@@ -249,7 +392,7 @@ def main():
 
     # Run audit
     try:
-        stats = audit_database(db_path, dry_run=args.dry_run)
+        stats = audit_database(db_path, dry_run=args.dry_run, chunk_size=args.chunk_size)
 
         if args.dry_run:
             print("\n💡 This was a dry run. Run without --dry-run to apply changes.")
@@ -13,19 +13,46 @@ Total: 70 new objects + 25 Phase 1 = 95 COMPLETE LIBRARY
 Usage:
     python3 generate_complete_library_lod300.py --output Ifc_Object_Library.db --phase 2
     python3 generate_complete_library_lod300.py --output Ifc_Object_Library.db --phase all
+    python3 generate_complete_library_lod300.py --output Ifc_Object_Library.db --phase all --jobs 8
+    python3 generate_complete_library_lod300.py --output Ifc_Object_Library.db --incremental
 """
 
 import sys
 import sqlite3
-import struct
 import math
+import time
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Tuple, NamedTuple
+from typing import Dict, List, Tuple, NamedTuple, Optional
+
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent))
+import geometry_generators
 from geometry_generators import compute_face_normal, GeometryResult
+from fix_library_base_rotations import compute_geometry_metrics
+from library_fingerprints import (generator_fingerprint, source_fingerprint, plan_rebuild,
+                                  record_fingerprints, collect_orphan_geometries, print_rebuild_report)
+
+# Owner tag for library_fingerprints rows written by this tool
+FINGERPRINT_SOURCE = 'generate_complete_library_lod300'
+
+# Bump when the stored BLOB layout changes without a source change in the
+# helpers below (float32 xyz vertices, uint32 triangles, one normal per face)
+GEOMETRY_FORMAT_VERSION = 1
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / 'db' / 'schema' / 'ifc_object_library.sql'
+
+# Columns the reduced schema of earlier versions of this tool did not create
+UPGRADE_COLUMNS = {
+    'base_geometries': [('vertex_count', 'INTEGER'), ('face_count', 'INTEGER'),
+                        ('bbox_width', 'REAL'), ('bbox_depth', 'REAL'), ('bbox_height', 'REAL'),
+                        ('volume_m3', 'REAL'), ('surface_area_m2', 'REAL')],
+    'object_catalog': [('base_rotation_x', 'REAL DEFAULT 0.0'), ('base_rotation_y', 'REAL DEFAULT 0.0'),
+                       ('base_rotation_z', 'REAL DEFAULT 0.0'), ('source_file', 'TEXT')],
+}
 
 
 class LibraryObject(NamedTuple):
@@ -1974,115 +2001,227 @@ GENERATOR_MAP = {
 # DATABASE FUNCTIONS
 # ============================================================================
 
-def compute_geometry_hash(vertices: List[Tuple[float, float, float]],
-                          faces: List[Tuple[int, int, int]]) -> str:
-    """Compute SHA-256 hash of geometry."""
+def compute_geometry_hash(vertices: np.ndarray, faces: np.ndarray) -> str:
+    """Compute SHA-256 hash of geometry (serialized float32 vertices + uint32 faces)."""
     import hashlib
-    content = f"{vertices}{faces}".encode('utf-8')
-    return hashlib.sha256(content).hexdigest()
+    return hashlib.sha256(vertices.tobytes() + faces.tobytes()).hexdigest()
 
 
 def serialize_geometry(geom: GeometryResult) -> Tuple[bytes, bytes, bytes]:
     """Serialize vertices, faces, and normals to binary."""
-    vertices_data = struct.pack(f'<{len(geom.vertices) * 3}f',
-                                *[coord for v in geom.vertices for coord in v])
-    faces_data = struct.pack(f'<{len(geom.faces) * 3}I',
-                            *[idx for f in geom.faces for idx in f])
-    normals_data = struct.pack(f'<{len(geom.normals) * 3}f',
-                              *[coord for n in geom.normals for coord in n])
-    return vertices_data, faces_data, normals_data
+    return geom.to_blobs()
 
 
-def insert_library_object(db_path: str, obj: LibraryObject, dry_run: bool = False):
-    """Insert object into library database."""
+class LibraryRecord(NamedTuple):
+    """Generated, hashed and serialized geometry for one library object."""
+    obj: LibraryObject
+    geometry_hash: str
+    vertices_blob: bytes
+    faces_blob: bytes
+    normals_blob: bytes
+    vertex_count: int
+    face_count: int
 
-    # Generate geometry
-    if obj.object_type not in GENERATOR_MAP:
-        print(f"  ⚠️  No generator for {obj.object_type}")
-        return
 
-    generator_func = GENERATOR_MAP[obj.object_type]
-    geom = generator_func()
+def build_library_record(obj: LibraryObject) -> Optional[LibraryRecord]:
+    """
+    Generate, hash and serialize geometry for one object.
+
+    Pure function of the object spec, so it can run in a worker process.
 
-    # Compute hash
-    geom_hash = compute_geometry_hash(geom.vertices, geom.faces)
+    Returns:
+        LibraryRecord, or None if no generator exists for the object_type
+    """
+    if obj.object_type not in GENERATOR_MAP:
+        return None
 
-    # Serialize
+    geom = GENERATOR_MAP[obj.object_type]()
     vertices_blob, faces_blob, normals_blob = serialize_geometry(geom)
 
-    vertex_count = len(geom.vertices)
-    face_count = len(geom.faces)
+    return LibraryRecord(obj, compute_geometry_hash(geom.vertices, geom.faces),
+                         vertices_blob, faces_blob, normals_blob,
+                         geom.vertex_count, geom.face_count)
+
+
+def _build_record_or_error(obj: LibraryObject) -> Tuple[Optional[LibraryRecord], Optional[str]]:
+    """Worker wrapper: report generator failures per object instead of aborting the pool."""
+    try:
+        return build_library_record(obj), None
+    except Exception as e:
+        return None, str(e)
+
+
+def generate_library_records(objects: List[LibraryObject],
+                             jobs: int = 1) -> List[Tuple[Optional[LibraryRecord], Optional[str]]]:
+    """
+    Run generators for all objects, serially or in a process pool.
+
+    Results keep the order of `objects` in both modes, so the merged
+    database is identical regardless of the number of jobs.
+
+    Returns:
+        List of (record, error) per object
+    """
+    if jobs > 1 and len(objects) > 1:
+        chunksize = max(1, len(objects) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(_build_record_or_error, objects, chunksize=chunksize))
+    return [_build_record_or_error(obj) for obj in objects]
+
+
+def compute_object_fingerprints(objects: List[LibraryObject]) -> Dict[str, str]:
+    """
+    Fingerprint per object_type with a generator: generator source (plus the
+    generators it delegates to), object spec, and the shared helpers every
+    generator goes through (geometry_generators, hashing, serialization).
+    """
+    shared = source_fingerprint(GEOMETRY_FORMAT_VERSION, geometry_generators,
+                                compute_geometry_hash, serialize_geometry, build_library_record)
+    return {obj.object_type: generator_fingerprint(GENERATOR_MAP[obj.object_type], obj, shared)
+            for obj in objects if obj.object_type in GENERATOR_MAP}
+
+
+class WriteResult(NamedTuple):
+    """Row counts of one write_library_records() transaction."""
+    objects: int                # object_catalog rows inserted or updated
+    geometries: int             # new base_geometries rows (existing hashes are kept)
+    orphans_removed: int        # geometries no catalog entry references any more
+    skipped: List[str]          # object_types left out because their geometry row is missing
+
+
+def _optional(value) -> Optional[float]:
+    """NaN → NULL for SQLite"""
+    return None if np.isnan(value) else float(value)
+
+
+def write_library_records(db_path: str, records: List[LibraryRecord],
+                          fingerprints: Optional[Dict[str, str]] = None) -> WriteResult:
+    """
+    Merge records into base_geometries/object_catalog in one transaction.
+
+    Identical geometry hashes across generators are stored once (first
+    occurrence wins, existing rows with the same hash are kept). Geometry
+    rows carry vertex/face counts, bounding box, volume and surface area.
+    Catalog rows and generator fingerprints are written only for records
+    whose geometry row exists after the insert, so a failed geometry is
+    rebuilt by the next incremental run instead of being marked current.
+    The same transaction removes geometries no catalog entry references.
+
+    Args:
+        db_path: Library database
+        records: Records to upsert
+        fingerprints: {object_type: fingerprint}, recorded for written records
+
+    Returns:
+        WriteResult
+    """
+    unique_geometries = {}
+    for rec in records:
+        unique_geometries.setdefault(rec.geometry_hash, rec)
+    geometries = list(unique_geometries.values())
+    metrics = compute_geometry_metrics([g.vertices_blob for g in geometries],
+                                       [g.faces_blob for g in geometries])
+
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            inserted = conn.executemany("""
+                INSERT INTO base_geometries
+                (geometry_hash, vertices, faces, normals, vertex_count, face_count,
+                 bbox_width, bbox_depth, bbox_height, volume_m3, surface_area_m2)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(geometry_hash) DO NOTHING
+            """, [(g.geometry_hash, g.vertices_blob, g.faces_blob, g.normals_blob,
+                   g.vertex_count, g.face_count, *(_optional(v) for v in spans),
+                   _optional(volume), _optional(area))
+                  for g, spans, volume, area in zip(geometries, metrics['spans'],
+                                                    metrics['volume'], metrics['surface_area'])]).rowcount
+
+            present = {row[0] for row in conn.execute("SELECT geometry_hash FROM base_geometries")}
+            stored = [r for r in records if r.geometry_hash in present]
+            skipped = [r.obj.object_type for r in records if r.geometry_hash not in present]
+
+            # Upsert keeps catalog_id and the base_rotation columns of existing entries
+            written = conn.executemany("""
+                INSERT INTO object_catalog
+                (object_type, object_name, ifc_class, category, sub_category,
+                 width_mm, depth_mm, height_mm, description, construction_type, geometry_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(object_type) DO UPDATE SET
+                    object_name = excluded.object_name, ifc_class = excluded.ifc_class,
+                    category = excluded.category, sub_category = excluded.sub_category,
+                    width_mm = excluded.width_mm, depth_mm = excluded.depth_mm,
+                    height_mm = excluded.height_mm, description = excluded.description,
+                    construction_type = excluded.construction_type,
+                    geometry_hash = excluded.geometry_hash
+            """, [(r.obj.object_type, r.obj.object_name, r.obj.ifc_class, r.obj.category,
+                   r.obj.sub_category, r.obj.width_mm, r.obj.depth_mm, r.obj.height_mm,
+                   r.obj.description, r.obj.construction_type, r.geometry_hash)
+                  for r in stored]).rowcount
+
+            if fingerprints:
+                current = {r.obj.object_type for r in stored}
+                record_fingerprints(conn, {t: fp for t, fp in fingerprints.items() if t in current},
+                                    FINGERPRINT_SOURCE)
+            orphans_removed = collect_orphan_geometries(conn)
+    finally:
+        conn.close()
+
+    return WriteResult(max(written, 0), max(inserted, 0), orphans_removed, skipped)
+
+
+def insert_library_object(db_path: str, obj: LibraryObject, dry_run: bool = False):
+    """Insert object into library database."""
+
+    # Generate geometry
+    record = build_library_record(obj)
+    if record is None:
+        print(f"  ⚠️  No generator for {obj.object_type}")
+        return
 
-    print(f"  ✅ {obj.object_name}: {vertex_count} vertices, {face_count} faces")
+    print(f"  ✅ {obj.object_name}: {record.vertex_count} vertices, {record.face_count} faces")
 
     if dry_run:
         print(f"     [DRY RUN - Not writing to database]")
         return
 
     # Insert into database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
     try:
-        # Insert geometry
-        cursor.execute("""
-            INSERT OR IGNORE INTO base_geometries (geometry_hash, vertices, faces, normals)
-            VALUES (?, ?, ?, ?)
-        """, (geom_hash, vertices_blob, faces_blob, normals_blob))
-
-        # Insert object
-        cursor.execute("""
-            INSERT OR REPLACE INTO object_catalog
-            (object_type, object_name, ifc_class, category, sub_category,
-             width_mm, depth_mm, height_mm, description, construction_type, geometry_hash)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (obj.object_type, obj.object_name, obj.ifc_class, obj.category, obj.sub_category,
-              obj.width_mm, obj.depth_mm, obj.height_mm, obj.description,
-              obj.construction_type, geom_hash))
-
-        conn.commit()
+        result = write_library_records(db_path, [record], compute_object_fingerprints([obj]))
+        if result.skipped:
+            print(f"     ❌ Geometry row missing - catalog entry not written")
     except Exception as e:
         print(f"     ❌ Error: {e}")
-        conn.rollback()
-    finally:
-        conn.close()
 
 
 def ensure_database_schema(db_path: str):
-    """Ensure database has correct schema."""
+    """
+    Ensure database has the library schema (db/schema/ifc_object_library.sql).
+
+    Libraries created by the reduced schema of earlier versions of this tool
+    get the missing columns added; their vertex/face counts are filled in
+    from the BLOB sizes where those are whole triplets.
+    """
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Create base_geometries table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS base_geometries (
-            geometry_hash TEXT PRIMARY KEY,
-            vertices BLOB NOT NULL,
-            faces BLOB NOT NULL,
-            normals BLOB NOT NULL
-        )
-    """)
-
-    # Create object_catalog table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS object_catalog (
-            object_type TEXT PRIMARY KEY,
-            object_name TEXT NOT NULL,
-            ifc_class TEXT NOT NULL,
-            category TEXT NOT NULL,
-            sub_category TEXT,
-            width_mm INTEGER NOT NULL,
-            depth_mm INTEGER NOT NULL,
-            height_mm INTEGER NOT NULL,
-            description TEXT,
-            construction_type TEXT DEFAULT 'universal',
-            geometry_hash TEXT NOT NULL,
-            FOREIGN KEY (geometry_hash) REFERENCES base_geometries(geometry_hash)
-        )
-    """)
-
-    conn.commit()
-    conn.close()
+    try:
+        with conn:
+            for table, columns in UPGRADE_COLUMNS.items():
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if not existing:
+                    continue    # created by the schema script below
+                for name, decl in columns:
+                    if name not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+            if 'vertex_count' in {row[1] for row in conn.execute("PRAGMA table_info(base_geometries)")}:
+                conn.execute("""
+                    UPDATE base_geometries
+                    SET vertex_count = LENGTH(vertices) / 12, face_count = LENGTH(faces) / 12
+                    WHERE vertex_count IS NULL
+                      AND LENGTH(vertices) % 12 = 0 AND LENGTH(faces) % 12 = 0
+                """)
+        conn.executescript(SCHEMA_PATH.read_text())
+    finally:
+        conn.close()
 
 
 # ============================================================================
@@ -2096,6 +2235,10 @@ def main():
                        help='Which phase to generate (2, 3, 4, or all)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Test generation without writing to database')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Worker processes for geometry generation (default 1 = serial)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only regenerate objects whose generator source or parameters changed')
 
     args = parser.parse_args()
 
@@ -2132,14 +2275,56 @@ def main():
 
     print(f"🏗️  Generating {len(objects_to_generate)} LOD300 objects...\n")
 
+    # Incremental: only regenerate objects whose generator fingerprint changed
+    fingerprints = compute_object_fingerprints(objects_to_generate)
+    plan = None
+    if args.incremental and not args.dry_run:
+        conn = sqlite3.connect(args.output)
+        plan = plan_rebuild(conn, fingerprints)
+        conn.close()
+        to_build = set(plan.to_build)
+        objects_to_generate = [obj for obj in objects_to_generate
+                               if obj.object_type in to_build or obj.object_type not in GENERATOR_MAP]
+        print(f"♻️  Incremental: {len(plan.to_build)} to rebuild, {len(plan.unchanged)} unchanged\n")
+
     # Generate all objects
+    start = time.perf_counter()
+    results = generate_library_records(objects_to_generate, jobs=args.jobs)
+
     success_count = 0
-    for obj in objects_to_generate:
-        try:
-            insert_library_object(args.output, obj, dry_run=args.dry_run)
+    records = []
+    failed = []
+    for obj, (record, error) in zip(objects_to_generate, results):
+        if error:
+            print(f"  ❌ FAILED: {obj.object_name} - {error}")
+            failed.append(obj.object_type)
+        elif record is None:
+            print(f"  ⚠️  No generator for {obj.object_type}")
             success_count += 1
+        else:
+            print(f"  ✅ {obj.object_name}: {record.vertex_count} vertices, {record.face_count} faces")
+            records.append(record)
+            success_count += 1
+
+    orphans_removed = 0
+    if not args.dry_run:
+        try:
+            result = write_library_records(args.output, records, fingerprints)
+            orphans_removed = result.orphans_removed
+            print(f"\n💾 Wrote {result.objects} objects ({result.geometries} new geometries) in one transaction")
+            if result.skipped:
+                print(f"❌ {len(result.skipped)} objects not written (geometry row missing):")
+                for object_type in result.skipped:
+                    print(f"   - {object_type}")
+                failed.extend(result.skipped)
+                success_count -= len(result.skipped)
         except Exception as e:
-            print(f"  ❌ FAILED: {obj.object_name} - {e}")
+            print(f"\n❌ Error writing library: {e}")
+            return 1
+    print(f"⏱️  Generated in {time.perf_counter() - start:.2f}s ({args.jobs} job(s))")
+
+    if plan is not None:
+        print_rebuild_report(plan, orphans_removed, failed)
 
     # Summary
     print(f"\n{'='*70}")
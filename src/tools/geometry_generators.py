@@ -7,31 +7,74 @@ Provides geometry generation functions for different element types.
 All generators produce world-positioned vertices (not centered templates).
 
 Architecture:
-    - GeometryResult: Data class for geometry output
+    - GeometryResult: Array-backed geometry output (float32/uint32)
     - Generator functions: One per element type
     - Factory function: Routes element data to appropriate generator
 
+Array Layout:
+    vertices: (N, 3) float32    faces: (F, 3) uint32    normals: (F, 3) float32
+    Matches the base_geometries BLOB layout, so to_blobs() is a plain tobytes().
+
 Usage:
     from geometry_generators import generate_element_geometry
 
     result = generate_element_geometry(element_data)
     vertices, faces, normals = result.vertices, result.faces, result.normals
+    vertices_blob, faces_blob, normals_blob = result.to_blobs()
 """
 
 import math
-from typing import List, Tuple, Dict, Optional, NamedTuple
+from typing import List, Tuple, Dict, Optional, NamedTuple, Sequence
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-class GeometryResult(NamedTuple):
-    """Result from geometry generation."""
-    vertices: List[Tuple[float, float, float]]
-    faces: List[Tuple[int, int, int]]
-    normals: List[Tuple[float, float, float]]
+# Little-endian dtypes of the base_geometries BLOB columns
+VERTEX_DTYPE = np.dtype('<f4')
+INDEX_DTYPE = np.dtype('<u4')
+
+
+class _GeometryArrays(NamedTuple):
+    vertices: np.ndarray
+    faces: np.ndarray
+    normals: np.ndarray
+
+
+class GeometryResult(_GeometryArrays):
+    """
+    Result from geometry generation.
+
+    Accepts arrays or lists of tuples and stores (N,3) float32 vertices,
+    (F,3) uint32 faces and (F,3) float32 per-face normals. Normals are
+    computed from the vertices when not supplied.
+    """
+    __slots__ = ()
+
+    def __new__(cls, vertices, faces, normals=None):
+        verts64 = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        faces_arr = np.asarray(faces, dtype=INDEX_DTYPE).reshape(-1, 3)
+        if normals is None:
+            normals_arr = compute_face_normals(verts64, faces_arr)
+        else:
+            normals_arr = np.asarray(normals, dtype=VERTEX_DTYPE).reshape(-1, 3)
+        return super().__new__(cls, verts64.astype(VERTEX_DTYPE), faces_arr, normals_arr)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.faces)
+
+    def to_blobs(self) -> Tuple[bytes, bytes, bytes]:
+        """Serialize to (vertices, faces, normals) BLOBs for base_geometries."""
+        return self.vertices.tobytes(), self.faces.tobytes(), self.normals.tobytes()
 
 
 # ============================================================================
@@ -54,6 +97,99 @@ def compute_face_normal(v0: Tuple, v1: Tuple, v2: Tuple) -> Tuple[float, float,
     return (0, 0, 1)
 
 
+def compute_face_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """
+    Vectorised compute_face_normal over all faces.
+
+    Degenerate faces get (0, 0, 1), same as the scalar version.
+
+    Returns:
+        (F, 3) float32 array of unit normals
+    """
+    verts = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    idx = np.asarray(faces, dtype=np.intp).reshape(-1, 3)
+    normals = np.zeros((len(idx), 3), dtype=np.float64)
+    normals[:, 2] = 1.0
+    if len(idx) == 0:
+        return normals.astype(VERTEX_DTYPE)
+
+    v0 = verts[idx[:, 0]]
+    cross = np.cross(verts[idx[:, 1]] - v0, verts[idx[:, 2]] - v0)
+    length = np.sqrt(np.einsum('ij,ij->i', cross, cross))
+    valid = length > 0
+    normals[valid] = cross[valid] / length[valid, None]
+    return normals.astype(VERTEX_DTYPE)
+
+
+def merge_geometry(parts: Sequence[GeometryResult]) -> GeometryResult:
+    """Concatenate geometries into one, offsetting face indices per part."""
+    offsets = np.cumsum([0] + [len(p.vertices) for p in parts[:-1]])
+    faces = np.concatenate([p.faces + INDEX_DTYPE.type(off) for p, off in zip(parts, offsets)])
+    return GeometryResult(np.concatenate([p.vertices for p in parts]),
+                          faces,
+                          np.concatenate([p.normals for p in parts]))
+
+
+# Box topology over 8 corners: 0-3 bottom ring, 4-7 top ring
+BOX_FACES = np.array([
+    (0, 1, 2), (0, 2, 3),  # Bottom
+    (4, 7, 6), (4, 6, 5),  # Top
+    (0, 4, 5), (0, 5, 1),  # Front
+    (2, 6, 7), (2, 7, 3),  # Back
+    (0, 3, 7), (0, 7, 4),  # Left
+    (1, 5, 6), (1, 6, 2),  # Right
+], dtype=INDEX_DTYPE)
+
+
+def _ring_side_faces(n: int, bottom: int, top: int,
+                     reverse: bool = False) -> np.ndarray:
+    """
+    Quad strip (two triangles per edge) between two closed rings of n vertices.
+
+    Emits (b0, b1, t1), (b0, t1, t0) per edge, or (b0, t0, t1), (b0, t1, b1)
+    when reverse is set, in ring order.
+    """
+    i = np.arange(n)
+    b0, b1 = bottom + i, bottom + (i + 1) % n
+    t0, t1 = top + i, top + (i + 1) % n
+    if reverse:
+        tris = np.stack([np.stack([b0, t0, t1], 1), np.stack([b0, t1, b1], 1)], 1)
+    else:
+        tris = np.stack([np.stack([b0, b1, t1], 1), np.stack([b0, t1, t0], 1)], 1)
+    return tris.reshape(-1, 3)
+
+
+def _fan_cap_faces(n: int, bottom: int, top: int) -> np.ndarray:
+    """
+    Fan triangulation of a bottom ring (facing down) followed by its top ring
+    (facing up), each with n vertices starting at the given offsets.
+    """
+    i = np.arange(1, n - 1)
+    bottom_cap = np.stack([np.full_like(i, bottom), bottom + i + 1, bottom + i], 1)
+    top_cap = np.stack([np.full_like(i, top), top + i, top + i + 1], 1)
+    return np.concatenate([bottom_cap, top_cap])
+
+
+def _center_fan_faces(center: int, ring: int, n: int, reverse: bool = False) -> np.ndarray:
+    """Triangle fan from a center vertex to a closed ring of n vertices."""
+    i = np.arange(n)
+    a, b = ring + i, ring + (i + 1) % n
+    if reverse:
+        a, b = b, a
+    return np.stack([np.full_like(i, center), a, b], 1)
+
+
+def _prism_vertices(outline_xy: np.ndarray, z_bottom, z_top) -> np.ndarray:
+    """Stack an (n, 2) outline at a bottom and top elevation -> (2n, 3) vertices."""
+    n = len(outline_xy)
+    verts = np.empty((2 * n, 3), dtype=np.float64)
+    verts[:n, :2] = outline_xy
+    verts[n:, :2] = outline_xy
+    verts[:n, 2] = z_bottom
+    verts[n:, 2] = z_top
+    return verts
+
+
 # ============================================================================
 # GEOMETRY GENERATORS
 # ============================================================================
@@ -74,21 +210,8 @@ class BoxGenerator:
             cx, cy, cz: World position of box center (bottom center)
         """
         hx, hy = width/2, depth/2
-        vertices = [
-            (cx-hx, cy-hy, cz), (cx+hx, cy-hy, cz), (cx+hx, cy+hy, cz), (cx-hx, cy+hy, cz),
-            (cx-hx, cy-hy, cz+height), (cx+hx, cy-hy, cz+height),
-            (cx+hx, cy+hy, cz+height), (cx-hx, cy+hy, cz+height),
-        ]
-        faces = [
-            (0, 1, 2), (0, 2, 3),  # Bottom
-            (4, 7, 6), (4, 6, 5),  # Top
-            (0, 4, 5), (0, 5, 1),  # Front
-            (2, 6, 7), (2, 7, 3),  # Back
-            (0, 3, 7), (0, 7, 4),  # Left
-            (1, 5, 6), (1, 6, 2),  # Right
-        ]
-        normals = [compute_face_normal(vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in faces]
-        return GeometryResult(vertices, faces, normals)
+        corners = np.array([(cx-hx, cy-hy), (cx+hx, cy-hy), (cx+hx, cy+hy), (cx-hx, cy+hy)])
+        return GeometryResult(_prism_vertices(corners, cz, cz + height), BOX_FACES)
 
 
 class OrientedBoxGenerator:
@@ -112,29 +235,12 @@ class OrientedBoxGenerator:
         sin_r = math.sin(rotation)
 
         # Local corners (length along X, width along Y)
-        local_corners = [(-hl, -hw), (hl, -hw), (hl, hw), (-hl, hw)]
+        local = np.array([(-hl, -hw), (hl, -hw), (hl, hw), (-hl, hw)])
 
         # Transform to world coordinates
-        vertices = []
-        for lx, ly in local_corners:
-            wx = cx + lx * cos_r - ly * sin_r
-            wy = cy + lx * sin_r + ly * cos_r
-            vertices.append((wx, wy, cz))
-        for lx, ly in local_corners:
-            wx = cx + lx * cos_r - ly * sin_r
-            wy = cy + lx * sin_r + ly * cos_r
-            vertices.append((wx, wy, cz + height))
-
-        faces = [
-            (0, 1, 2), (0, 2, 3),  # Bottom
-            (4, 7, 6), (4, 6, 5),  # Top
-            (0, 4, 5), (0, 5, 1),  # Front
-            (2, 6, 7), (2, 7, 3),  # Back
-            (0, 3, 7), (0, 7, 4),  # Left
-            (1, 5, 6), (1, 6, 2),  # Right
-        ]
-        normals = [compute_face_normal(vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in faces]
-        return GeometryResult(vertices, faces, normals)
+        corners = np.column_stack([cx + local[:, 0] * cos_r - local[:, 1] * sin_r,
+                                   cy + local[:, 0] * sin_r + local[:, 1] * cos_r])
+        return GeometryResult(_prism_vertices(corners, cz, cz + height), BOX_FACES)
 
 
 class CylinderGenerator:
@@ -152,37 +258,25 @@ class CylinderGenerator:
             cx, cy, cz: World position of cylinder center (bottom)
             segments: Number of sides (default 12)
         """
-        vertices = [(cx, cy, cz)]  # Bottom center
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            vertices.append((cx + radius * math.cos(angle),
-                           cy + radius * math.sin(angle), cz))
-
-        vertices.append((cx, cy, cz + height))  # Top center
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            vertices.append((cx + radius * math.cos(angle),
-                           cy + radius * math.sin(angle), cz + height))
+        angles = 2 * math.pi * np.arange(segments) / segments
+        ring = np.column_stack([cx + radius * np.cos(angles), cy + radius * np.sin(angles)])
 
-        faces = []
-        # Bottom cap
-        for i in range(segments):
-            faces.append((0, 1 + (i + 1) % segments, 1 + i))
-        # Top cap
+        # Bottom center, bottom ring, top center, top ring
         top_center = segments + 1
-        for i in range(segments):
-            faces.append((top_center, top_center + 1 + i, top_center + 1 + (i + 1) % segments))
-        # Side faces
-        for i in range(segments):
-            b1 = 1 + i
-            b2 = 1 + (i + 1) % segments
-            t1 = top_center + 1 + i
-            t2 = top_center + 1 + (i + 1) % segments
-            faces.append((b1, b2, t2))
-            faces.append((b1, t2, t1))
-
-        normals = [compute_face_normal(vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in faces]
-        return GeometryResult(vertices, faces, normals)
+        vertices = np.empty((2 * segments + 2, 3))
+        vertices[0] = (cx, cy, cz)
+        vertices[1:top_center, :2] = ring
+        vertices[1:top_center, 2] = cz
+        vertices[top_center] = (cx, cy, cz + height)
+        vertices[top_center + 1:, :2] = ring
+        vertices[top_center + 1:, 2] = cz + height
+
+        faces = np.concatenate([
+            _center_fan_faces(0, 1, segments, reverse=True),          # Bottom cap
+            _center_fan_faces(top_center, top_center + 1, segments),  # Top cap
+            _ring_side_faces(segments, 1, top_center + 1),            # Side faces
+        ])
+        return GeometryResult(vertices, faces)
 
 
 class ExtrudedPolylineGenerator:
@@ -205,77 +299,52 @@ class ExtrudedPolylineGenerator:
             return BoxGenerator.generate(1.0, thickness, height,
                                         points[0][0], points[0][1], cz)
 
-        vertices = []
-        n = len(points)
+        pts = np.asarray(points, dtype=np.float64)[:, :2]
+        n = len(pts)
         ht = thickness / 2
 
-        # For each point, calculate perpendicular offset
-        for i in range(n):
-            p0 = points[i]
-
-            # Get direction vectors
-            if i == 0:
-                dx = points[1][0] - points[0][0]
-                dy = points[1][1] - points[0][1]
-            elif i == n - 1:
-                dx = points[n-1][0] - points[n-2][0]
-                dy = points[n-1][1] - points[n-2][1]
-            else:
-                dx = points[i+1][0] - points[i-1][0]
-                dy = points[i+1][1] - points[i-1][1]
-
-            # Normalize and get perpendicular
-            length = math.sqrt(dx*dx + dy*dy)
-            if length > 0.001:
-                nx, ny = -dy/length, dx/length
-            else:
-                nx, ny = 0, 1
-
-            # Offset points (inner and outer)
-            vertices.append((p0[0] + nx*ht, p0[1] + ny*ht, cz))
-            vertices.append((p0[0] - nx*ht, p0[1] - ny*ht, cz))
-
-        # Add top vertices
-        bottom_count = len(vertices)
-        for v in vertices[:bottom_count]:
-            vertices.append((v[0], v[1], cz + height))
+        # Direction at each point: forward/backward difference at the ends,
+        # central difference in between
+        direction = np.empty_like(pts)
+        direction[0] = pts[1] - pts[0]
+        direction[-1] = pts[-1] - pts[-2]
+        direction[1:-1] = pts[2:] - pts[:-2]
+
+        # Normalize and get perpendicular
+        dx, dy = direction[:, 0], direction[:, 1]
+        length = np.sqrt(dx*dx + dy*dy)
+        valid = length > 0.001
+        safe_length = np.where(valid, length, 1.0)
+        perp = np.column_stack([np.where(valid, -dy / safe_length, 0.0),
+                                np.where(valid, dx / safe_length, 1.0)])
+
+        # Offset points (inner and outer), interleaved per polyline point
+        outline = np.empty((2 * n, 2))
+        outline[0::2] = pts + perp * ht
+        outline[1::2] = pts - perp * ht
+        vertices = _prism_vertices(outline, cz, cz + height)
+        bottom_count = 2 * n
+
+        b0 = 2 * np.arange(n - 1)
+        b1, b2, b3 = b0 + 1, b0 + 2, b0 + 3
+        t0, t1, t2, t3 = (b + bottom_count for b in (b0, b1, b2, b3))
+
+        def quads(*tris):
+            # Interleave per segment: all triangles of segment i, then i+1, ...
+            return np.stack([np.stack(t, 1) for t in tris], 1).reshape(-1, 3)
 
-        faces = []
-        # Bottom and top caps
-        for i in range(n - 1):
-            b0, b1 = i*2, i*2 + 1
-            b2, b3 = (i+1)*2, (i+1)*2 + 1
-            faces.append((b0, b2, b1))
-            faces.append((b1, b2, b3))
-
-            t0, t1 = bottom_count + b0, bottom_count + b1
-            t2, t3 = bottom_count + b2, bottom_count + b3
-            faces.append((t0, t1, t2))
-            faces.append((t1, t3, t2))
-
-        # Side faces
-        for i in range(n - 1):
-            # Outer side
-            b0, b2 = i*2, (i+1)*2
-            t0, t2 = bottom_count + b0, bottom_count + b2
-            faces.append((b0, t0, t2))
-            faces.append((b0, t2, b2))
-
-            # Inner side
-            b1, b3 = i*2 + 1, (i+1)*2 + 1
-            t1, t3 = bottom_count + b1, bottom_count + b3
-            faces.append((b1, b3, t3))
-            faces.append((b1, t3, t1))
-
-        # End caps
-        faces.append((0, 1, bottom_count + 1))
-        faces.append((0, bottom_count + 1, bottom_count))
         e0, e1 = (n-1)*2, (n-1)*2 + 1
-        faces.append((e0, bottom_count + e0, bottom_count + e1))
-        faces.append((e0, bottom_count + e1, e1))
-
-        normals = [compute_face_normal(vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in faces]
-        return GeometryResult(vertices, faces, normals)
+        faces = np.concatenate([
+            # Bottom and top caps
+            quads((b0, b2, b1), (b1, b2, b3), (t0, t1, t2), (t1, t3, t2)),
+            # Side faces (outer, then inner)
+            quads((b0, t0, t2), (b0, t2, b2), (b1, b3, t3), (b1, t3, t1)),
+            # End caps
+            np.array([(0, 1, bottom_count + 1), (0, bottom_count + 1, bottom_count),
+                      (e0, bottom_count + e0, bottom_count + e1),
+                      (e0, bottom_count + e1, e1)]),
+        ])
+        return GeometryResult(vertices, faces)
 
 
 class SlabGenerator:
@@ -370,8 +439,7 @@ class DomeGenerator:
             v1 = (h + 1) % h_segments
             faces.append((base_center_idx, v1, v0))
 
-        normals = [compute_face_normal(vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in faces]
-        return GeometryResult(vertices, faces, normals)
+        return GeometryResult(vertices, faces)
 
 
 class FloorSlabGenerator:
@@ -392,39 +460,19 @@ class FloorSlabGenerator:
             # Fallback to box
             return BoxGenerator.generate(10.0, 10.0, thickness, 0, 0, cz)
 
-        n = len(boundary_points)
-        vertices = []
-
-        # Bottom face vertices
-        for px, py in boundary_points:
-            vertices.append((px, py, cz))
-
-        # Top face vertices
-        for px, py in boundary_points:
-            vertices.append((px, py, cz + thickness))
-
-        faces = []
-
-        # Triangulate polygon (simple fan triangulation for convex polygons)
-        # Bottom face
-        for i in range(1, n - 1):
-            faces.append((0, i + 1, i))
+        outline = np.asarray(boundary_points, dtype=np.float64)[:, :2]
+        n = len(outline)
 
-        # Top face
-        for i in range(1, n - 1):
-            faces.append((n, n + i, n + i + 1))
+        # Bottom face vertices, then top face vertices
+        vertices = _prism_vertices(outline, cz, cz + thickness)
 
-        # Side faces
-        for i in range(n):
-            b0 = i
-            b1 = (i + 1) % n
-            t0 = n + i
-            t1 = n + (i + 1) % n
-            faces.append((b0, b1, t1))
-            faces.append((b0, t1, t0))
-
-        normals = [compute_face_normal(vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in faces]
-        return GeometryResult(vertices, faces, normals)
+        faces = np.concatenate([
+            # Triangulate polygon (simple fan triangulation for convex polygons)
+            _fan_cap_faces(n, 0, n),
+            # Side faces
+            _ring_side_faces(n, 0, n),
+        ])
+        return GeometryResult(vertices, faces)
 
 
 class RoofGenerator:
@@ -445,49 +493,25 @@ class RoofGenerator:
         if len(boundary_points) < 3:
             return BoxGenerator.generate(10.0, 10.0, thickness, 0, 0, cz)
 
-        n = len(boundary_points)
-        vertices = []
+        outline = np.asarray(boundary_points, dtype=np.float64)[:, :2]
+        n = len(outline)
 
         # Calculate centroid for slope direction
-        cx = sum(p[0] for p in boundary_points) / n
-        cy = sum(p[1] for p in boundary_points) / n
+        cx, cy = outline.mean(axis=0)
 
-        # Bottom face vertices (flat)
-        for px, py in boundary_points:
-            vertices.append((px, py, cz))
-
-        # Top face vertices (sloped toward center)
+        # Bottom face vertices (flat), top face vertices (sloped toward center)
+        vertices = _prism_vertices(outline, cz, cz)
         slope_factor = slope_percent / 100.0
-        for px, py in boundary_points:
-            # Distance from centroid
-            dist = math.sqrt((px - cx)**2 + (py - cy)**2)
-            # Lower at edges, higher at center
-            z_offset = thickness - dist * slope_factor
-            if z_offset < thickness * 0.5:
-                z_offset = thickness * 0.5
-            vertices.append((px, py, cz + z_offset))
-
-        faces = []
-
-        # Bottom face
-        for i in range(1, n - 1):
-            faces.append((0, i + 1, i))
-
-        # Top face
-        for i in range(1, n - 1):
-            faces.append((n, n + i, n + i + 1))
+        # Distance from centroid; lower at edges, higher at center
+        dist = np.sqrt((outline[:, 0] - cx)**2 + (outline[:, 1] - cy)**2)
+        z_offset = np.maximum(thickness - dist * slope_factor, thickness * 0.5)
+        vertices[n:, 2] = cz + z_offset
 
-        # Side faces
-        for i in range(n):
-            b0 = i
-            b1 = (i + 1) % n
-            t0 = n + i
-            t1 = n + (i + 1) % n
-            faces.append((b0, b1, t1))
-            faces.append((b0, t1, t0))
-
-        normals = [compute_face_normal(vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in faces]
-        return GeometryResult(vertices, faces, normals)
+        faces = np.concatenate([
+            _fan_cap_faces(n, 0, n),    # Bottom and top faces
+            _ring_side_faces(n, 0, n),  # Side faces
+        ])
+        return GeometryResult(vertices, faces)
 
 
 # ============================================================================
@@ -526,17 +550,7 @@ class SprinklerGenerator:
         )
 
         # Combine geometries
-        vertices = list(body_result.vertices) + list(deflector_result.vertices)
-
-        # Offset face indices for deflector
-        offset = len(body_result.vertices)
-        faces = list(body_result.faces) + [
-            (f[0] + offset, f[1] + offset, f[2] + offset) for f in deflector_result.faces
-        ]
-
-        normals = list(body_result.normals) + list(deflector_result.normals)
-
-        return GeometryResult(vertices, faces, normals)
+        return merge_geometry([body_result, deflector_result])
 
 
 class LightFixtureGenerator:
@@ -586,63 +600,32 @@ class PipeSegmentGenerator:
         start_x = cx - hl * cos_r
         start_y = cy - hl * sin_r
 
-        vertices = []
-        faces = []
-
-        # Generate vertices at start end
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            # Local offset perpendicular to pipe direction
-            local_x = radius * math.cos(angle)
-            local_y = radius * math.sin(angle)
-
-            # Transform to world (perpendicular to pipe)
-            # Perpendicular direction is (-sin_r, cos_r) in XY plane
-            # and (0, 0, 1) in Z
-            wx = start_x + local_x * (-sin_r) + local_y * 0
-            wy = start_y + local_x * cos_r + local_y * 0
-            wz = cz + local_y
-            vertices.append((wx, wy, wz))
-
-        # Generate vertices at end
         end_x = cx + hl * cos_r
         end_y = cy + hl * sin_r
 
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            local_x = radius * math.cos(angle)
-            local_y = radius * math.sin(angle)
-
-            wx = end_x + local_x * (-sin_r)
-            wy = end_y + local_x * cos_r
-            wz = cz + local_y
-            vertices.append((wx, wy, wz))
-
-        # Add center points for caps
-        start_center = len(vertices)
-        vertices.append((start_x, start_y, cz))
-        end_center = len(vertices)
-        vertices.append((end_x, end_y, cz))
-
-        # Start cap faces
-        for i in range(segments):
-            faces.append((start_center, (i + 1) % segments, i))
-
-        # End cap faces
-        for i in range(segments):
-            faces.append((end_center, segments + i, segments + (i + 1) % segments))
-
-        # Side faces
-        for i in range(segments):
-            b1 = i
-            b2 = (i + 1) % segments
-            t1 = segments + i
-            t2 = segments + (i + 1) % segments
-            faces.append((b1, t1, t2))
-            faces.append((b1, t2, b2))
-
-        normals = [compute_face_normal(vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in faces]
-        return GeometryResult(vertices, faces, normals)
+        # Local ring offsets; perpendicular direction is (-sin_r, cos_r) in XY
+        # plane and (0, 0, 1) in Z
+        angles = 2 * math.pi * np.arange(segments) / segments
+        local_x = radius * np.cos(angles)
+        local_y = radius * np.sin(angles)
+
+        # Start ring, end ring, start center, end center
+        vertices = np.empty((2 * segments + 2, 3))
+        for ring, (px, py) in enumerate([(start_x, start_y), (end_x, end_y)]):
+            ring_slice = slice(ring * segments, (ring + 1) * segments)
+            vertices[ring_slice, 0] = px + local_x * (-sin_r)
+            vertices[ring_slice, 1] = py + local_x * cos_r
+            vertices[ring_slice, 2] = cz + local_y
+        start_center, end_center = 2 * segments, 2 * segments + 1
+        vertices[start_center] = (start_x, start_y, cz)
+        vertices[end_center] = (end_x, end_y, cz)
+
+        faces = np.concatenate([
+            _center_fan_faces(start_center, 0, segments, reverse=True),  # Start cap
+            _center_fan_faces(end_center, segments, segments),           # End cap
+            _ring_side_faces(segments, 0, segments, reverse=True),       # Side faces
+        ])
+        return GeometryResult(vertices, faces)
 
 
 # ============================================================================
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Library Generator Fingerprints
+==============================
+
+Tracks, per object_type, a hash of the generator source code and its
+parameters so library tools can rebuild only what changed.
+
+The generator source includes every function of its own module it calls
+(Phase2ElectricalGenerator.generate_outlet_usb → generate_outlet_double),
+and tools pass a source_fingerprint() of the shared helpers (geometry
+primitives, normals, serialization) so editing one rebuilds every object
+built with it.
+
+Table (created on demand in Ifc_Object_Library.db):
+    library_fingerprints(object_type PK, fingerprint, source)
+
+    source = tool that owns the entry (e.g. 'generate_complete_library_lod300')
+
+Flow:
+    1. Tool computes current fingerprints for the objects it owns
+    2. plan_rebuild() compares them with the stored ones
+    3. Tool regenerates/upserts only added + changed object_types
+    4. record_fingerprints() + collect_orphan_geometries() in the same transaction
+    5. print_rebuild_report() summarises what changed
+
+Usage:
+    from library_fingerprints import generator_fingerprint, plan_rebuild
+
+    shared = source_fingerprint(geometry_generators, serialize_geometry)
+    fp = generator_fingerprint(Phase2DoorsGenerator.generate_bifold, obj, shared)
+    plan = plan_rebuild(conn, {obj.object_type: fp})
+"""
+
+import hashlib
+import inspect
+import re
+import sqlite3
+from typing import Callable, Dict, Iterable, List, NamedTuple
+
+# name( or Name.attr( - candidate calls into the generator's own module
+_CALL_PATTERN = re.compile(r'\b([A-Za-z_]\w*)(?:\.([A-Za-z_]\w*))?\s*\(')
+
+
+class RebuildPlan(NamedTuple):
+    """Which object_types need regeneration."""
+    added: List[str]        # No stored fingerprint, or no catalog/geometry row
+    changed: List[str]      # Generator source or parameters changed
+    unchanged: List[str]    # Fingerprint matches, skip
+
+    @property
+    def to_build(self) -> List[str]:
+        return self.added + self.changed
+
+
+def ensure_fingerprint_table(conn: sqlite3.Connection):
+    """Create library_fingerprints table if missing."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS library_fingerprints (
+            object_type TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            source TEXT
+        )
+    """)
+
+
+def _source(obj) -> str:
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        # No source available (builtins, REPL) - fall back to qualified name
+        return getattr(obj, '__qualname__', repr(obj))
+
+
+def _module_callees(func: Callable) -> List[Callable]:
+    """Functions of func's own module that its source calls (directly)."""
+    namespace = getattr(func, '__globals__', {})
+    module = getattr(func, '__module__', None)
+    callees = []
+    for name, attr in _CALL_PATTERN.findall(_source(func)):
+        target = namespace.get(name)
+        if attr:
+            target = inspect.getattr_static(target, attr, None) if inspect.isclass(target) else None
+            target = getattr(target, '__func__', target)    # staticmethod / classmethod
+        if inspect.isfunction(target) and target.__module__ == module and target is not func:
+            callees.append(target)
+    return callees
+
+
+def source_fingerprint(*objects) -> str:
+    """
+    Hash of the source of shared helpers (modules, classes, functions) or
+    version constants that generators depend on.
+
+    Returns:
+        SHA-256 hex digest, passed to generator_fingerprint(shared=...)
+    """
+    parts = [obj if isinstance(obj, (str, int, float)) else _source(obj) for obj in objects]
+    return hashlib.sha256('\n'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+
+def generator_fingerprint(func: Callable, params=None, shared: str = '') -> str:
+    """
+    Hash of a generator's source code plus its parameters.
+
+    The source covers the generator and, transitively, every function of
+    the same module it calls, so a generator delegating to another one is
+    rebuilt when the target changes.
+
+    Args:
+        func: Generator function (source read via inspect)
+        params: Anything with a stable repr (LibraryObject, tuple, dict)
+        shared: source_fingerprint() of helpers defined elsewhere
+
+    Returns:
+        SHA-256 hex digest
+    """
+    sources, seen, pending = [], set(), [func]
+    while pending:
+        current = pending.pop(0)
+        if current in seen:
+            continue
+        seen.add(current)
+        sources.append(_source(current))
+        pending.extend(_module_callees(current))
+    content = '\n'.join(sources) + f"\n{params!r}" + (f"\n{shared}" if shared else '')
+    content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_fingerprints(conn: sqlite3.Connection) -> Dict[str, str]:
+    """Stored fingerprints as {object_type: fingerprint}."""
+    ensure_fingerprint_table(conn)
+    return dict(conn.execute("SELECT object_type, fingerprint FROM library_fingerprints"))
+
+
+def plan_rebuild(conn: sqlite3.Connection, current: Dict[str, str]) -> RebuildPlan:
+    """
+    Compare current fingerprints with the stored ones.
+
+    An object_type counts as added when it has no stored fingerprint, its
+    catalog row is missing (e.g. deleted by hand) or the catalog row points
+    at a geometry that does not exist, so the library can always be
+    repaired by an incremental run.
+
+    Args:
+        conn: Library connection
+        current: {object_type: fingerprint} for the objects this tool owns
+
+    Returns:
+        RebuildPlan
+    """
+    stored = load_fingerprints(conn)
+    in_catalog = {row[0] for row in conn.execute("""
+        SELECT c.object_type FROM object_catalog c
+        JOIN base_geometries g ON g.geometry_hash = c.geometry_hash
+    """)}
+
+    added, changed, unchanged = [], [], []
+    for object_type, fingerprint in current.items():
+        if object_type not in stored or object_type not in in_catalog:
+            added.append(object_type)
+        elif stored[object_type] != fingerprint:
+            changed.append(object_type)
+        else:
+            unchanged.append(object_type)
+
+    return RebuildPlan(added, changed, unchanged)
+
+
+def record_fingerprints(conn: sqlite3.Connection, fingerprints: Dict[str, str], source: str):
+    """Upsert fingerprints for rebuilt object_types (caller owns the transaction)."""
+    ensure_fingerprint_table(conn)
+    conn.executemany("""
+        INSERT INTO library_fingerprints (object_type, fingerprint, source)
+        VALUES (?, ?, ?)
+        ON CONFLICT(object_type) DO UPDATE SET
+            fingerprint = excluded.fingerprint,
+            source = excluded.source
+    """, [(object_type, fp, source) for object_type, fp in sorted(fingerprints.items())])
+
+
+def collect_orphan_geometries(conn: sqlite3.Connection) -> int:
+    """
+    Delete base_geometries rows no object_catalog entry references.
+
+    Returns:
+        Number of geometries removed
+    """
+    cursor = conn.execute("""
+        DELETE FROM base_geometries
+        WHERE geometry_hash NOT IN (SELECT geometry_hash FROM object_catalog)
+    """)
+    return cursor.rowcount
+
+
+def print_rebuild_report(plan: RebuildPlan, orphans_removed: int = 0,
+                         failed: Iterable[str] = ()):
+    """Print what an incremental rebuild changed."""
+    failed = list(failed)
+    print(f"\n📋 REBUILD REPORT")
+    print(f"   Added:     {len(plan.added)}")
+    for object_type in plan.added:
+        print(f"      + {object_type}")
+    print(f"   Changed:   {len(plan.changed)}")
+    for object_type in plan.changed:
+        print(f"      ~ {object_type}")
+    print(f"   Unchanged: {len(plan.unchanged)}")
+    if failed:
+        print(f"   Failed:    {len(failed)}")
+        for object_type in failed:
+            print(f"      ✗ {object_type}")
+    print(f"   Orphaned geometries removed: {orphans_removed}")
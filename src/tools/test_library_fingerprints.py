@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test library generator fingerprints - edits that must trigger a rebuild
+
+1. Editing a shared helper module changes every fingerprint built on it
+2. Editing a generator changes the generators that delegate to it
+3. Catalog entries whose geometry row is missing are planned as added
+"""
+
+import importlib
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from library_fingerprints import (generator_fingerprint, source_fingerprint, plan_rebuild,
+                                  record_fingerprints)
+
+HELPERS_SOURCE = '''
+def unit_box(size):
+    return [(0, 0, 0), (size, size, size)]
+'''
+
+GENERATORS_SOURCE = '''
+from fp_helpers import unit_box
+
+
+class Generators:
+    @staticmethod
+    def generate_box():
+        return unit_box(1.0)
+
+    @staticmethod
+    def generate_alias():
+        return Generators.generate_box()
+
+    @staticmethod
+    def generate_other():
+        return [(0, 0, 0)]
+'''
+
+
+def _write(path: Path, source: str):
+    path.write_text(source)
+    # Edits within the same second must still invalidate the .pyc and inspect's line cache
+    stamp = time.time() + 2
+    os.utime(path, (stamp, stamp))
+
+
+def _fingerprints(helpers, generators):
+    shared = source_fingerprint(helpers)
+    return {name: generator_fingerprint(getattr(generators.Generators, f"generate_{name}"), name, shared)
+            for name in ('box', 'alias', 'other')}
+
+
+def _library(fingerprints):
+    """In-memory library with a catalog + geometry row per object_type and stored fingerprints"""
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE base_geometries (geometry_hash TEXT PRIMARY KEY)")
+    conn.execute("CREATE TABLE object_catalog (object_type TEXT PRIMARY KEY, geometry_hash TEXT)")
+    for object_type in fingerprints:
+        conn.execute("INSERT INTO base_geometries VALUES (?)", (f"hash_{object_type}",))
+        conn.execute("INSERT INTO object_catalog VALUES (?, ?)", (object_type, f"hash_{object_type}"))
+    record_fingerprints(conn, fingerprints, 'test')
+    return conn
+
+
+def _load_modules(root: Path):
+    sys.path.insert(0, str(root))
+    helpers = importlib.import_module('fp_helpers')
+    generators = importlib.import_module('fp_generators')
+    return helpers, generators
+
+
+def _unload(root: Path):
+    sys.path.remove(str(root))
+    for name in ('fp_helpers', 'fp_generators'):
+        sys.modules.pop(name, None)
+
+
+def test_helper_edit_triggers_rebuild():
+    """A helper module edit changes the fingerprint of every generator using it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write(root / 'fp_helpers.py', HELPERS_SOURCE)
+        _write(root / 'fp_generators.py', GENERATORS_SOURCE)
+        helpers, generators = _load_modules(root)
+        try:
+            before = _fingerprints(helpers, generators)
+            conn = _library(before)
+            assert plan_rebuild(conn, before).to_build == []
+
+            _write(root / 'fp_helpers.py', HELPERS_SOURCE.replace('(size, size, size)', '(size, size, size * 2)'))
+            importlib.reload(helpers)
+            after = _fingerprints(helpers, generators)
+
+            plan = plan_rebuild(conn, after)
+            print(f"✅ Helper edit: changed {plan.changed}")
+            assert sorted(plan.changed) == ['alias', 'box', 'other']
+        finally:
+            _unload(root)
+
+
+def test_delegating_generator_follows_target():
+    """A generator returning Class.other_generator() is rebuilt when the target changes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write(root / 'fp_helpers.py', HELPERS_SOURCE)
+        _write(root / 'fp_generators.py', GENERATORS_SOURCE)
+        helpers, generators = _load_modules(root)
+        try:
+            before = _fingerprints(helpers, generators)
+            conn = _library(before)
+
+            _write(root / 'fp_generators.py', GENERATORS_SOURCE.replace('unit_box(1.0)', 'unit_box(1.25)'))
+            importlib.reload(generators)
+            after = _fingerprints(helpers, generators)
+
+            plan = plan_rebuild(conn, after)
+            print(f"✅ Delegated generator edit: changed {plan.changed}, unchanged {plan.unchanged}")
+            assert sorted(plan.changed) == ['alias', 'box']
+            assert plan.unchanged == ['other']
+        finally:
+            _unload(root)
+
+
+def test_missing_geometry_is_rebuilt():
+    """A catalog row whose geometry row is gone is planned as added despite a matching fingerprint"""
+    fingerprints = {'box': 'fp_box', 'other': 'fp_other'}
+    conn = _library(fingerprints)
+    conn.execute("DELETE FROM base_geometries WHERE geometry_hash = 'hash_box'")
+
+    plan = plan_rebuild(conn, fingerprints)
+    print(f"✅ Missing geometry: added {plan.added}")
+    assert plan.added == ['box']
+    assert plan.unchanged == ['other']
+
+
+if __name__ == "__main__":
+    test_helper_edit_triggers_rebuild()
+    test_delegating_generator_follows_target()
+    test_missing_geometry_is_rebuilt()
+    print("\n✅ All fingerprint tests passed")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test parallel library generation - --jobs must not change the database
+
+One phase is generated with jobs=1 and jobs=2 and merged into two fresh
+library databases; the files must be byte-identical. Only the
+CURRENT_TIMESTAMP defaults (created_date, extraction_date) are pinned
+first, since the two builds may straddle a second.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from generate_complete_library_lod300 import (PHASE4_OBJECTS, compute_object_fingerprints,
+                                              ensure_database_schema, generate_library_records,
+                                              write_library_records)
+
+PINNED_TIMESTAMP = '2000-01-01 00:00:00'
+
+
+def _build(db_path: Path, jobs: int):
+    """Generate PHASE4_OBJECTS with `jobs` workers into a new library at db_path"""
+    ensure_database_schema(str(db_path))
+    results = generate_library_records(PHASE4_OBJECTS, jobs=jobs)
+    errors = [error for _, error in results if error]
+    assert not errors, f"jobs={jobs}: {errors}"
+
+    records = [record for record, _ in results]
+    result = write_library_records(str(db_path), records, compute_object_fingerprints(PHASE4_OBJECTS))
+    assert not result.skipped, f"jobs={jobs}: skipped {result.skipped}"
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("UPDATE base_geometries SET created_date = ?", (PINNED_TIMESTAMP,))
+        conn.execute("UPDATE object_catalog SET extraction_date = ?", (PINNED_TIMESTAMP,))
+    conn.close()
+    return records, result
+
+
+def test_jobs_build_identical_database():
+    with tempfile.TemporaryDirectory() as tmp:
+        serial_records, serial = _build(Path(tmp) / 'serial.db', jobs=1)
+        parallel_records, parallel = _build(Path(tmp) / 'parallel.db', jobs=2)
+        print(f"✅ Phase 4: {serial.objects} objects, {serial.geometries} geometries (jobs=1 and jobs=2)")
+
+        assert [r.geometry_hash for r in serial_records] == [r.geometry_hash for r in parallel_records]
+        assert serial == parallel
+        assert (Path(tmp) / 'serial.db').read_bytes() == (Path(tmp) / 'parallel.db').read_bytes()
+
+
+if __name__ == "__main__":
+    test_jobs_build_identical_database()
+    print("\n✅ All parallel library build tests passed")
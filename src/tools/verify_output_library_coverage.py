@@ -4,9 +4,13 @@ Verify that all object_types in output JSON exist in LocalLibrary
 """
 
 import json
-import sqlite3
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+from library_gate import check_object_types
+from library_index import LibraryIndex
+
 def verify_library_coverage(output_json_path, library_db_path):
     """Check if all object_types in output exist in library"""
 
@@ -20,9 +24,8 @@ def verify_library_coverage(output_json_path, library_db_path):
         if 'object_type' in obj:
             object_types.add(obj['object_type'])
 
-    # Connect to library
-    conn = sqlite3.connect(library_db_path)
-    cursor = conn.cursor()
+    # Index library once, classify all object_types in bulk
+    index = LibraryIndex.from_database(library_db_path)
 
     print("=" * 80)
     print("LIBRARY COVERAGE VERIFICATION")
@@ -33,35 +36,24 @@ def verify_library_coverage(output_json_path, library_db_path):
     print(f"Total unique object_types: {len(object_types)}")
     print()
 
-    found = []
-    missing = []
-    no_normals = []
+    report = index.coverage(object_types)
+    # Blob sizes vs vertex/face counts: GATE 4's library report (validated once per library version)
+    corrupted = check_object_types(object_types, library_db_path).corrupted
+    corrupted_set = set(corrupted)
+    found = [t for t in report.found if t not in corrupted_set]
+    no_normals = [t for t in report.no_normals + report.no_geometry if t not in corrupted_set]
+    missing = report.missing
 
+    missing_set, no_normals_set = set(missing), set(no_normals)
     for obj_type in sorted(object_types):
-        # Check if exists
-        cursor.execute("""
-            SELECT oc.object_type,
-                   CASE WHEN bg.normals IS NOT NULL THEN 1 ELSE 0 END as has_normals
-            FROM object_catalog oc
-            LEFT JOIN base_geometries bg ON oc.geometry_hash = bg.geometry_hash
-            WHERE oc.object_type = ?
-            LIMIT 1
-        """, (obj_type,))
-
-        row = cursor.fetchone()
-
-        if row:
-            if row[1]:  # has normals
-                found.append(obj_type)
-                print(f"✅ {obj_type}")
-            else:
-                no_normals.append(obj_type)
-                print(f"⚠️  {obj_type} (NO NORMALS)")
-        else:
-            missing.append(obj_type)
+        if obj_type in missing_set:
             print(f"❌ {obj_type} (NOT FOUND)")
-
-    conn.close()
+        elif obj_type in corrupted_set:
+            print(f"❌ {obj_type} (CORRUPTED GEOMETRY)")
+        elif obj_type in no_normals_set:
+            print(f"⚠️  {obj_type} (NO NORMALS)")
+        else:
+            print(f"✅ {obj_type}")
 
     print()
     print("=" * 80)
@@ -70,6 +62,7 @@ def verify_library_coverage(output_json_path, library_db_path):
     print(f"✅ Found with normals: {len(found)}/{len(object_types)}")
     print(f"⚠️  Found without normals: {len(no_normals)}/{len(object_types)}")
     print(f"❌ Missing: {len(missing)}/{len(object_types)}")
+    print(f"❌ Corrupted geometry: {len(corrupted)}/{len(object_types)}")
     print()
 
     if missing:
@@ -78,6 +71,12 @@ def verify_library_coverage(output_json_path, library_db_path):
             print(f"  - {obj_type}")
         print()
 
+    if corrupted:
+        print("OBJECTS WITH CORRUPTED GEOMETRY (blob size != vertex/face count):")
+        for obj_type in corrupted:
+            print(f"  - {obj_type}")
+        print()
+
     if no_normals:
         print("OBJECTS WITHOUT NORMALS:")
         for obj_type in no_normals:
@@ -92,12 +91,10 @@ def verify_library_coverage(output_json_path, library_db_path):
     else:
         print(f"⚠️  {coverage:.1f}% LIBRARY COVERAGE - SOME OBJECTS MISSING/INCOMPLETE")
 
-    return len(missing) == 0 and len(no_normals) == 0
+    return len(missing) == 0 and len(no_normals) == 0 and len(corrupted) == 0
 
 
 if __name__ == "__main__":
-    import sys
-
     script_dir = Path(__file__).parent.parent
 
     if len(sys.argv) >= 2:
@@ -435,8 +435,8 @@ def test_library_references(objects, database_path):
         return False
 
 
-def run_comprehensive_tests(json_path, database_path='LocalLibrary/Ifc_Object_Library.db'):
-    """Run all tests"""
+def run_comprehensive_tests(json_path, database_path='LocalLibrary/Ifc_Object_Library.db', data=None):
+    """Run all tests (data: already-loaded output dict, skips re-reading json_path)"""
     print("=" * 70)
     print("🧪 COMPREHENSIVE TEST SUITE")
     print("=" * 70)
@@ -444,12 +444,13 @@ def run_comprehensive_tests(json_path, database_path='LocalLibrary/Ifc_Object_Li
     print(f"Database: {database_path}")
 
     # Load data
-    try:
-        with open(json_path) as f:
-            data = json.load(f)
-    except Exception as e:
-        print(f"\n❌ FATAL: Cannot load JSON: {e}")
-        return False
+    if data is None:
+        try:
+            with open(json_path) as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"\n❌ FATAL: Cannot load JSON: {e}")
+            return False
 
     objects = data.get('objects', [])
     summary = data.get('summary', {})
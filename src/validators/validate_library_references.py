@@ -17,7 +17,12 @@ Example:
 import json
 import sqlite3
 import sys
+from collections import Counter
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+from library_index import LibraryIndex
 
 
 def validate_library_references(template_path, database_path):
@@ -137,7 +142,22 @@ def validate_library_references(template_path, database_path):
     missing = []
     errors = []
 
+    # Standard library schema: one catalogue index instead of a query per object_type
+    index = None
+    if objects_table == 'object_catalog' and lookup_column == 'object_type':
+        index = LibraryIndex.from_database(conn)
+        counts = Counter(index.object_types.tolist())   # catalogue rows per object_type
+
     for obj_type in sorted(object_types):
+        if index is not None:
+            if obj_type in index:
+                found.append(obj_type)
+                print(f"✅ {obj_type:<60} FOUND ({counts[obj_type]} instances)")
+            else:
+                missing.append(obj_type)
+                print(f"❌ {obj_type:<60} MISSING")
+            continue
+
         try:
             # Query database for this object_type (use dynamic table name)
             query = f"SELECT COUNT(*) FROM {objects_table} WHERE {lookup_column} = ?"
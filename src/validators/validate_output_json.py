@@ -15,6 +15,10 @@ Usage:
 
 import json
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+from final_json_stream import read_final_json
 
 
 def validate_output_json(json_path):
@@ -40,10 +44,11 @@ def validate_output_json(json_path):
         "overall_status": "UNKNOWN"
     }
 
-    # CHECK 1: File exists and is readable
+    # CHECK 1: File exists and is readable (full syntax pass over the JSON
+    # itself - never its .objects.jsonl/.npz companions; objects are
+    # streamed from disk by each later check, never held in memory)
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        data = read_final_json(json_path, use_sidecar=False, use_columnar=False)
         results['validations']['json_well_formed'] = {
             "status": "PASS",
             "message": "JSON is well-formed and parseable"
@@ -307,4 +312,4 @@ if __name__ == "__main__":
     json_path = sys.argv[1]
     results = validate_output_json(json_path)
 
-    sys.exit(results['return_code'])
+    sys.exit(results.get('return_code', 1))     # early FAIL returns carry no return_code
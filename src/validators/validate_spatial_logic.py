@@ -316,19 +316,20 @@ def check_window_height(objects):
         return True
 
 
-def run_spatial_tests(json_path):
-    """Run all spatial validation tests"""
+def run_spatial_tests(json_path, data=None):
+    """Run all spatial validation tests (data: already-loaded output dict, skips re-reading json_path)"""
     print("=" * 70)
     print("🧪 SPATIAL LOGIC VALIDATOR")
     print("=" * 70)
     print(f"File: {json_path}")
 
-    try:
-        with open(json_path) as f:
-            data = json.load(f)
-    except Exception as e:
-        print(f"\n❌ FATAL: Cannot load JSON: {e}")
-        return False
+    if data is None:
+        try:
+            with open(json_path) as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"\n❌ FATAL: Cannot load JSON: {e}")
+            return False
 
     objects = data.get('objects', [])
     metadata = data.get('extraction_metadata', {})